@@ -42,6 +42,7 @@ import imath
 import IECore
 
 import Gaffer
+import GafferDispatch
 
 class execute( Gaffer.Application ) :
 
@@ -97,6 +98,16 @@ class execute( Gaffer.Application ) :
 					allowEmptyList = True,
 				),
 
+				IECore.StringParameter(
+					name = "journal",
+					description = "The directory of a dispatcher's execution journal. "
+						"When specified, each successful execution is recorded in the "
+						"journal, so that subsequent dispatches may skip it. Dispatchers "
+						"which use a render farm pass this to record executions "
+						"that they can't observe themselves.",
+					defaultValue = "",
+				),
+
 				IECore.StringVectorParameter(
 					name = "context",
 					description = "The context used during execution. Note that the frames "
@@ -181,6 +192,9 @@ class execute( Gaffer.Application ) :
 					)
 					return 1
 
+				if args["journal"].value :
+					GafferDispatch.Dispatcher.recordExecution( node["task"], frames, args["journal"].value )
+
 		return 0
 
 	def __error( self, plug, source, message ) :
@@ -71,6 +71,12 @@ class stats( Gaffer.Application ) :
 			gaffer stats fileName.gfr -scene NameOfNode -performanceMonitor
 			```
 
+			To profile the translation of a scene for display in the Viewer :
+
+			```
+			gaffer stats fileName.gfr -scene NameOfNode -viewer
+			```
+
 			To run an image processing node using the performance monitor :
 
 			```
@@ -122,6 +128,15 @@ class stats( Gaffer.Application ) :
 					defaultValue = "",
 				),
 
+				IECore.BoolParameter(
+					name = "viewer",
+					description = "Profiles the translation of the scene into the OpenGL "
+						"renderer used by the Viewer, rather than traversing it directly. "
+						"The scene is fully expanded, and pending edits are processed without "
+						"drawing, so no OpenGL context is required.",
+					defaultValue = False,
+				),
+
 				IECore.StringVectorParameter(
 					name = "sets",
 					description = "The names of scene sets to be examined.",
@@ -468,6 +483,13 @@ class stats( Gaffer.Application ) :
 		if args["contextSanitiser"].value :
 			contextSanitiser = GafferSceneTest.ContextSanitiser()
 
+		if args["viewer"].value :
+			if not isinstance( scene, GafferScene.ScenePlug ) :
+				IECore.msg( IECore.Msg.Level.Error, "stats", "Viewer profiling requires a ScenePlug" )
+				return
+			self.__writeViewerScene( script, scene, args, contextSanitiser )
+			return
+
 		def computeScene() :
 
 			with self.__context( script, args ) as context :
@@ -487,6 +509,8 @@ class stats( Gaffer.Application ) :
 			computeScene()
 
 		memory = _Memory.maxRSS()
+		sceneCacheLookups = GafferScene.SceneReader.sceneCacheLookups()
+		sceneCacheHits = GafferScene.SceneReader.sceneCacheHits()
 		with _Timer() as sceneTimer :
 			with self.__performanceMonitor or _NullContextManager(), self.__contextMonitor or _NullContextManager() :
 				with contextSanitiser :
@@ -495,10 +519,70 @@ class stats( Gaffer.Application ) :
 		self.__timers["Scene generation"] = sceneTimer
 		self.__memory["Scene generation"] = _Memory.maxRSS() - memory
 
+		sceneCacheLookups = GafferScene.SceneReader.sceneCacheLookups() - sceneCacheLookups
+		sceneCacheHits = GafferScene.SceneReader.sceneCacheHits() - sceneCacheHits
+		if sceneCacheLookups :
+			self.__output.write( "\nSceneReader :\n\n" )
+			self.__writeItems( [
+				( "Scene cache lookups", sceneCacheLookups ),
+				( "Scene cache hits", sceneCacheHits ),
+				( "Scene cache hit rate", "%.1f%%" % ( 100.0 * sceneCacheHits / sceneCacheLookups ) ),
+			] )
+
 		## \todo Calculate and write scene stats
 		#  - Locations
 		#  - Unique objects, attributes etc
 
+	def __writeViewerScene( self, script, scene, args, contextSanitiser ) :
+
+		import GafferScene
+
+		updateTimer = _Timer()
+		editTimer = _Timer()
+		numEdits = []
+
+		def translateScene( updateTimer, editTimer, numEdits ) :
+
+			renderer = GafferScene.Private.IECoreScenePreview.Renderer.create(
+				"OpenGL",
+				GafferScene.Private.IECoreScenePreview.Renderer.RenderType.Interactive
+			)
+
+			with self.__context( script, args ) as context :
+
+				controller = GafferScene.RenderController( scene, context, renderer )
+				controller.setMinimumExpansionDepth( sys.maxint )
+
+				for frame in self.__frames( script, args ) :
+					context.setFrame( frame )
+					with updateTimer :
+						controller.update()
+					with editTimer :
+						numEdits.append( renderer.command( "gl:processQueue", {} ).value )
+
+			return renderer
+
+		if args["preCache"].value :
+			translateScene( _Timer(), _Timer(), [] )
+
+		memory = _Memory.maxRSS()
+		with self.__performanceMonitor or _NullContextManager(), self.__contextMonitor or _NullContextManager() :
+			with contextSanitiser :
+				renderer = translateScene( updateTimer, editTimer, numEdits )
+		self.__memory["Viewer scene translation"] = _Memory.maxRSS() - memory
+
+		self.__timers["Viewer update"] = updateTimer
+		self.__timers["Viewer edit processing"] = editTimer
+
+		items = [ ( "Edits (frame %d)" % f, n ) for f, n in zip( self.__frames( script, args ), numEdits ) ]
+		items.extend( [
+			( "", "" ),
+			( "Bound", renderer.command( "gl:queryBound", {} ) ),
+		] )
+
+		self.__output.write( "\nViewer :\n\n" )
+		self.__writeItems( items )
+
 	def __writeImage( self, script, args ) :
 
 		import GafferImage
@@ -628,17 +712,24 @@ class stats( Gaffer.Application ) :
 
 class _Timer( object ) :
 
+	# Timers may be entered multiple times, in which
+	# case they report the accumulated total.
+	def __init__( self ) :
+
+		self.__time = 0.0
+		self.__clock = 0.0
+
 	def __enter__( self ) :
 
-		self.__time = time.time()
-		self.__clock = time.clock()
+		self.__startTime = time.time()
+		self.__startClock = time.clock()
 
 		return self
 
 	def __exit__( self, type, value, traceBack ) :
 
-		self.__time = time.time() - self.__time
-		self.__clock = time.clock() - self.__clock
+		self.__time += time.time() - self.__startTime
+		self.__clock += time.clock() - self.__startClock
 
 	def __str__( self ) :
 
@@ -44,6 +44,10 @@
 #include "boost/multi_index/ordered_index.hpp"
 #include "boost/multi_index_container.hpp"
 
+#include "tbb/spin_mutex.h"
+
+#include <atomic>
+
 namespace Gaffer
 {
 
@@ -157,6 +161,11 @@ class GAFFER_API Animation : public ComputeNode
 				ConstKeyIterator end() const;
 
 				float evaluate( float time ) const;
+				/// Evaluates the curve at each of the specified times,
+				/// returning a value for each. This is considerably
+				/// quicker than multiple calls to `evaluate( time )`,
+				/// particularly when the times are in ascending order.
+				std::vector<float> evaluate( const std::vector<float> &times ) const;
 
 				/// Output plug for evaluating the curve
 				/// over time - use this as the input to
@@ -181,6 +190,23 @@ class GAFFER_API Animation : public ComputeNode
 
 				Keys m_keys;
 
+				// Compact copy of `m_keys`, stored contiguously to provide
+				// faster evaluation. This is rebuilt lazily following edits.
+				struct CompactKey
+				{
+					float time;
+					float value;
+					Type type;
+				};
+				typedef std::vector<CompactKey> CompactKeys;
+
+				void keysChanged();
+				const CompactKeys &compactKeys() const;
+
+				mutable CompactKeys m_compactKeys;
+				mutable std::atomic<bool> m_compactKeysValid;
+				mutable tbb::spin_mutex m_compactKeysMutex;
+
 		};
 
 		IE_CORE_DECLAREPTR( CurvePlug );
@@ -66,7 +66,9 @@ class GAFFER_API DependencyNode : public Node
 		/// will be affected by the specified input. It is an error to pass a compound plug
 		/// for input or to place one in outputs as computations are always performed on the
 		/// leaf level plugs only. Implementations of this method should call the base class
-		/// implementation first.
+		/// implementation first. The results must depend only on the plugs of the node
+		/// and their connections, because they are cached during dirty propagation until
+		/// a plug is added, removed or connected.
 		/// \todo Make this protected, and add an accessor on the Plug class instead.
 		/// The general principle in effect elsewhere in Gaffer is that plugs provide
 		/// the public interface to the work done by nodes.
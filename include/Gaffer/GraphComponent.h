@@ -265,14 +265,22 @@ class GAFFER_API GraphComponent : public IECore::RunTimeTyped, public boost::sig
 		void addChildInternal( GraphComponentPtr child, size_t index );
 		void removeChildInternal( GraphComponentPtr child, bool emitParentChanged );
 		size_t index() const;
+		const GraphComponent *getChildInternal( const IECore::InternedString &name ) const;
 
 		struct Signals;
 		Signals *signals();
 
+		// Index used to accelerate name lookups for components
+		// with many children. This is only created once the number
+		// of children exceeds a threshold, so that the common case
+		// of small numbers of children incurs no overhead.
+		struct ChildNameIndex;
+
 		std::unique_ptr<Signals> m_signals;
 		IECore::InternedString m_name;
 		GraphComponent *m_parent;
 		ChildContainer m_children;
+		std::unique_ptr<ChildNameIndex> m_childNameIndex;
 
 };
 
@@ -42,6 +42,8 @@
 #include "Gaffer/NumericPlug.h"
 #include "Gaffer/StringPlug.h"
 
+#include <memory>
+
 namespace Gaffer
 {
 
@@ -76,6 +78,9 @@ class IECORE_EXPORT Loop : public ComputeNode
 		StringPlug *indexVariablePlug();
 		const StringPlug *indexVariablePlug() const;
 
+		IntPlug *checkpointIntervalPlug();
+		const IntPlug *checkpointIntervalPlug() const;
+
 		Gaffer::BoolPlug *enabledPlug() override;
 		const Gaffer::BoolPlug *enabledPlug() const override;
 
@@ -102,6 +107,19 @@ class IECORE_EXPORT Loop : public ComputeNode
 		const ValuePlug *ancestorPlug( const ValuePlug *plug, std::vector<IECore::InternedString> &relativeName ) const;
 		const ValuePlug *descendantPlug( const ValuePlug *plug, const std::vector<IECore::InternedString> &relativeName ) const;
 		const ValuePlug *sourcePlug( const ValuePlug *output, const Context *context, int &sourceLoopIndex, IECore::InternedString &indexVariable ) const;
+		int checkpointInterval( const Context *context ) const;
+
+		// Iterations are evaluated in checkpointed steps, to bound
+		// the depth of recursion. See Loop.cpp for details.
+		class Checkpoints;
+		template<typename T>
+		class CheckpointScope;
+		typedef CheckpointScope<IECore::MurmurHash> HashCheckpointScope;
+		typedef CheckpointScope<IECore::ConstObjectPtr> ValueCheckpointScope;
+		std::unique_ptr<Checkpoints> m_checkpoints;
+
+		void acquireHashCheckpoints( const ValuePlug *plug, const IECore::InternedString &indexVariable, int index, int interval, HashCheckpointScope &scope ) const;
+		void acquireValueCheckpoints( const ValuePlug *plug, const IECore::InternedString &indexVariable, int index, int interval, HashCheckpointScope &hashScope, ValueCheckpointScope &valueScope ) const;
 
 };
 
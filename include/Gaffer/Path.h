@@ -61,6 +61,8 @@ void bindPath();
 namespace Gaffer
 {
 
+class Plug;
+
 IE_CORE_FORWARDDECLARE( Path )
 IE_CORE_FORWARDDECLARE( PathFilter )
 
@@ -108,6 +110,13 @@ class GAFFER_API Path : public IECore::RunTimeTyped
 		/// any unrecognised names. Returns null for unknown properties. May return null for invalid paths.
 		virtual IECore::ConstRunTimeTypedPtr property( const IECore::InternedString &name ) const;
 
+		/// Returns the plug whose computes are used to generate the
+		/// children and properties of this path, or null if there is
+		/// none. This is used as the subject for BackgroundTasks that
+		/// query the path, so that they are cancelled before the graph
+		/// is edited. The default implementation returns null.
+		virtual const Plug *cancellationSubject() const;
+
 		/// Returns the parent of this path, or None if the path
 		/// has no parent (is the root).
 		PathPtr parent() const;
@@ -137,6 +146,12 @@ class GAFFER_API Path : public IECore::RunTimeTyped
 		/// by derived classes so that the copy has the appropriate
 		/// type.
 		virtual PathPtr copy() const;
+		/// Returns a copy of this path that may be queried on a background
+		/// thread while this path continues to be used on the main thread.
+		/// Derived classes must reimplement this if `copy()` shares any state
+		/// that may be modified on the main thread. The default implementation
+		/// returns `copy()`.
+		virtual PathPtr copyForBackgroundUse() const;
 
 		/// Keeps removing names from the back of
 		/// names() until isValid() returns true.
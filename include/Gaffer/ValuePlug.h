@@ -179,6 +179,11 @@ class GAFFER_API ValuePlug : public Plug
 
 	private :
 
+		// Loop holds on to the values of checkpoint
+		// iterations explicitly, so needs access to
+		// `getObjectValue()` and `setObjectValue()`.
+		friend class Loop;
+
 		class HashProcess;
 		class ComputeProcess;
 		class SetValueAction;
@@ -42,6 +42,7 @@
 
 #include "Gaffer/CatchingSignalCombiner.h"
 #include "Gaffer/NumericPlug.h"
+#include "Gaffer/TypedPlug.h"
 
 #include "IECore/CompoundData.h"
 #include "IECore/FrameList.h"
@@ -177,6 +178,37 @@ class GAFFERDISPATCH_API Dispatcher : public Gaffer::Node
 		const std::string jobDirectory() const;
 		//@}
 
+		//! @name Execution journal
+		/// Dispatchers may optionally keep a journal of the tasks they have
+		/// executed successfully, stored in a "journal" directory alongside the
+		/// numbered job directories. Tasks whose hash is recorded in the journal,
+		/// and whose output file is unchanged since it was recorded, are skipped
+		/// by subsequent dispatches. Output files are identified by a `fileName`
+		/// StringPlug on the TaskNode, where one exists.
+		///
+		/// Batches executed via `TaskBatch::execute()` are recorded automatically.
+		/// Dispatchers which execute batches in another process must arrange for
+		/// them to be recorded once they have succeeded, otherwise the journal
+		/// has no effect. They may either call `TaskBatch::recordExecution()`
+		/// when they learn of the success, or pass `-journal` to `gaffer execute`
+		/// with the directory stored in the "dispatcher:journalDirectory" blind
+		/// data of the batch. The latter is typically the only option for farm
+		/// dispatchers, which don't wait for their jobs to complete.
+		////////////////////////////////////////////////////////////////////////
+		//@{
+		/// Enables the journal.
+		Gaffer::BoolPlug *journalPlug();
+		const Gaffer::BoolPlug *journalPlug() const;
+		/// Executes all tasks, even if the journal says they are up to date.
+		/// Executed tasks are still recorded in the journal.
+		Gaffer::BoolPlug *forceExecutionPlug();
+		const Gaffer::BoolPlug *forceExecutionPlug() const;
+		/// Records the successful execution of `plug` for the specified frames,
+		/// evaluated in the current context, in the journal stored in
+		/// `journalDirectory`.
+		static void recordExecution( const TaskNode::TaskPlug *plug, const std::vector<float> &frames, const std::string &journalDirectory );
+		//@}
+
 		/// A function which creates a Dispatcher.
 		typedef std::function<DispatcherPtr ()> Creator;
 		/// SetupPlugsFn may be registered along with a Dispatcher Creator. It will be called by setupPlugs,
@@ -235,7 +267,14 @@ class GAFFERDISPATCH_API Dispatcher : public Gaffer::Node
 
 				IE_CORE_DECLAREMEMBERPTR( TaskBatch );
 
+				/// Executes the batch and records it in the execution
+				/// journal, if the dispatch is using one.
 				void execute() const;
+				/// Records the batch in the execution journal, if the
+				/// dispatch is using one. Dispatchers which execute batches
+				/// by means other than `execute()` should call this after
+				/// execution has completed successfully.
+				void recordExecution() const;
 
 				const TaskNode::TaskPlug *plug() const;
 				/// \deprecated.
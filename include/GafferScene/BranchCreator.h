@@ -41,6 +41,8 @@
 #include "GafferScene/Filter.h"
 #include "GafferScene/SceneProcessor.h"
 
+#include "Gaffer/TypedPlug.h"
+
 #include "IECore/CompoundData.h"
 
 namespace Gaffer
@@ -140,6 +142,17 @@ class GAFFERSCENE_API BranchCreator : public SceneProcessor
 		void hashMapping( const Gaffer::Context *context, IECore::MurmurHash &h ) const;
 		IECore::ConstCompoundDataPtr computeMapping( const Gaffer::Context *context ) const;
 
+		/// Used to compute the union of the transformed bounds of a
+		/// chunk of the children at the location specified by the
+		/// context. Large numbers of children are divided into chunks,
+		/// so that when one child changes, only one chunk needs to be
+		/// recomputed, and so that the chunks can be computed in parallel.
+		Gaffer::AtomicBox3fPlug *childBoundsPlug();
+		const Gaffer::AtomicBox3fPlug *childBoundsPlug() const;
+
+		void hashChildBounds( const ScenePath &path, const Gaffer::Context *context, IECore::MurmurHash &h ) const;
+		Imath::Box3f computeChildBounds( const ScenePath &path, const Gaffer::Context *context ) const;
+
 		// Computes the relevant parent and branch paths for computing the result
 		// at the specified path. Returns a PathMatcher::Result to describe where path is
 		// relative to the parent, as follows :
@@ -64,6 +64,9 @@ class GAFFERSCENE_API DeleteCurves : public SceneElementProcessor
 		Gaffer::BoolPlug *invertPlug();
 		const Gaffer::BoolPlug *invertPlug() const;
 
+		Gaffer::BoolPlug *parallelPlug();
+		const Gaffer::BoolPlug *parallelPlug() const;
+
 		IE_CORE_DECLARERUNTIMETYPEDEXTENSION( GafferScene::DeleteCurves, DeleteCurvesTypeId, SceneElementProcessor );
 		void affects( const Gaffer::Plug *input, AffectedPlugsContainer &outputs ) const override;
 
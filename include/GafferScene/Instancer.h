@@ -77,6 +77,9 @@ class GAFFERSCENE_API Instancer : public BranchCreator
 		Gaffer::StringPlug *attributesPlug();
 		const Gaffer::StringPlug *attributesPlug() const;
 
+		Gaffer::BoolPlug *encapsulateInstanceGroupsPlug();
+		const Gaffer::BoolPlug *encapsulateInstanceGroupsPlug() const;
+
 		void affects( const Gaffer::Plug *input, AffectedPlugsContainer &outputs ) const override;
 
 	protected :
@@ -108,6 +111,7 @@ class GAFFERSCENE_API Instancer : public BranchCreator
 	private :
 
 		IE_CORE_FORWARDDECLARE( EngineData );
+		class InstancerCapsule;
 
 		Gaffer::ObjectPlug *enginePlug();
 		const Gaffer::ObjectPlug *enginePlug() const;
@@ -126,6 +130,10 @@ class GAFFERSCENE_API Instancer : public BranchCreator
 			InstanceScope( const Gaffer::Context *context, const ScenePath &branchPath );
 		};
 
+		void plugDirtied( const Gaffer::Plug *plug );
+
+		uint64_t m_dirtyCount;
+
 		static size_t g_firstPlugIndex;
 
 };
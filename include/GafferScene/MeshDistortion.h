@@ -70,6 +70,11 @@ class GAFFERSCENE_API MeshDistortion : public SceneElementProcessor
 		Gaffer::StringPlug *uvDistortionPlug();
 		const Gaffer::StringPlug *uvDistortionPlug() const;
 
+		Gaffer::BoolPlug *parallelPlug();
+		const Gaffer::BoolPlug *parallelPlug() const;
+
+		void affects( const Gaffer::Plug *input, AffectedPlugsContainer &outputs ) const override;
+
 	protected :
 
 		bool processesObject() const override;
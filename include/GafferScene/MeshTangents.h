@@ -68,6 +68,9 @@ class GAFFERSCENE_API MeshTangents : public SceneElementProcessor
 		Gaffer::BoolPlug *orthogonalPlug();
 		const Gaffer::BoolPlug *orthogonalPlug() const;
 
+		Gaffer::BoolPlug *parallelPlug();
+		const Gaffer::BoolPlug *parallelPlug() const;
+
 		IE_CORE_DECLARERUNTIMETYPEDEXTENSION( GafferScene::MeshTangents, MeshTangentsTypeId, SceneElementProcessor );
 
 		void affects( const Gaffer::Plug *input, AffectedPlugsContainer &outputs ) const override;
@@ -0,0 +1,147 @@
+//////////////////////////////////////////////////////////////////////////
+//
+//  Copyright (c) 2019, Image Engine Design Inc. All rights reserved.
+//
+//  Redistribution and use in source and binary forms, with or without
+//  modification, are permitted provided that the following conditions are
+//  met:
+//
+//      * Redistributions of source code must retain the above
+//        copyright notice, this list of conditions and the following
+//        disclaimer.
+//
+//      * Redistributions in binary form must reproduce the above
+//        copyright notice, this list of conditions and the following
+//        disclaimer in the documentation and/or other materials provided with
+//        the distribution.
+//
+//      * Neither the name of John Haddon nor the names of
+//        any other contributors to this software may be used to endorse or
+//        promote products derived from this software without specific prior
+//        written permission.
+//
+//  THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS
+//  IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+//  THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+//  PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+//  CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+//  EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+//  PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+//  PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+//  LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+//  NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+//  SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+//
+//////////////////////////////////////////////////////////////////////////
+
+#ifndef IECORESCENEPREVIEW_CAPTURINGRENDERER_H
+#define IECORESCENEPREVIEW_CAPTURINGRENDERER_H
+
+#include "GafferScene/Export.h"
+#include "GafferScene/Private/IECoreScenePreview/Renderer.h"
+
+#include "tbb/concurrent_hash_map.h"
+
+namespace IECoreScenePreview
+{
+
+/// Renderer which captures the objects it is given, so that they
+/// can be inspected by unit tests. It is not registered with
+/// `Renderer::create()`, and must be constructed directly.
+class GAFFERSCENE_API CapturingRenderer : public Renderer
+{
+
+	public :
+
+		CapturingRenderer( RenderType renderType = Batch, const std::string &fileName = "" );
+		~CapturingRenderer() override;
+
+		IE_CORE_DECLAREMEMBERPTR( CapturingRenderer )
+
+		IE_CORE_FORWARDDECLARE( CapturedAttributes );
+		IE_CORE_FORWARDDECLARE( CapturedObject );
+
+		class GAFFERSCENE_API CapturedAttributes : public AttributesInterface
+		{
+
+			public :
+
+				IE_CORE_DECLAREMEMBERPTR( CapturedAttributes );
+
+				const IECore::CompoundObject *attributes() const;
+
+			private :
+
+				friend class CapturingRenderer;
+
+				CapturedAttributes( const IECore::ConstCompoundObjectPtr &attributes );
+
+				IECore::ConstCompoundObjectPtr m_attributes;
+
+		};
+
+		class GAFFERSCENE_API CapturedObject : public ObjectInterface
+		{
+
+			public :
+
+				IE_CORE_DECLAREMEMBERPTR( CapturedObject );
+
+				const std::string &capturedName() const;
+				const std::vector<IECore::ConstObjectPtr> &capturedSamples() const;
+				const std::vector<float> &capturedSampleTimes() const;
+				const std::vector<Imath::M44f> &capturedTransforms() const;
+				const std::vector<float> &capturedTransformTimes() const;
+				const CapturedAttributes *capturedAttributes() const;
+
+				void transform( const Imath::M44f &transform ) override;
+				void transform( const std::vector<Imath::M44f> &samples, const std::vector<float> &times ) override;
+				bool attributes( const AttributesInterface *attributes ) override;
+
+			private :
+
+				friend class CapturingRenderer;
+
+				CapturedObject( const std::string &name, const std::vector<const IECore::Object *> &samples, const std::vector<float> &times, const AttributesInterface *attributes );
+
+				const std::string m_name;
+				std::vector<IECore::ConstObjectPtr> m_capturedSamples;
+				const std::vector<float> m_capturedSampleTimes;
+				std::vector<Imath::M44f> m_capturedTransforms;
+				std::vector<float> m_capturedTransformTimes;
+				ConstCapturedAttributesPtr m_capturedAttributes;
+
+		};
+
+		/// Returns the object captured with the specified name,
+		/// or null if there is no such object.
+		const CapturedObject *capturedObject( const std::string &name ) const;
+		/// Returns the names of all captured objects, in no
+		/// particular order.
+		std::vector<std::string> capturedObjectNames() const;
+
+		IECore::InternedString name() const override;
+		void option( const IECore::InternedString &name, const IECore::Object *value ) override;
+		void output( const IECore::InternedString &name, const IECoreScene::Output *output ) override;
+		AttributesInterfacePtr attributes( const IECore::CompoundObject *attributes ) override;
+		ObjectInterfacePtr camera( const std::string &name, const IECoreScene::Camera *camera, const AttributesInterface *attributes ) override;
+		ObjectInterfacePtr light( const std::string &name, const IECore::Object *object, const AttributesInterface *attributes ) override;
+		ObjectInterfacePtr object( const std::string &name, const IECore::Object *object, const AttributesInterface *attributes ) override;
+		ObjectInterfacePtr object( const std::string &name, const std::vector<const IECore::Object *> &samples, const std::vector<float> &times, const AttributesInterface *attributes ) override;
+		void render() override;
+		void pause() override;
+
+	private :
+
+		ObjectInterfacePtr capture( const std::string &name, const std::vector<const IECore::Object *> &samples, const std::vector<float> &times, const AttributesInterface *attributes );
+
+		typedef tbb::concurrent_hash_map<std::string, CapturedObjectPtr> ObjectMap;
+		ObjectMap m_capturedObjects;
+
+};
+
+IE_CORE_DECLAREPTR( CapturingRenderer )
+
+} // namespace IECoreScenePreview
+
+#endif // IECORESCENEPREVIEW_CAPTURINGRENDERER_H
@@ -0,0 +1,92 @@
+//////////////////////////////////////////////////////////////////////////
+//
+//  Copyright (c) 2019, Image Engine Design Inc. All rights reserved.
+//
+//  Redistribution and use in source and binary forms, with or without
+//  modification, are permitted provided that the following conditions are
+//  met:
+//
+//      * Redistributions of source code must retain the above
+//        copyright notice, this list of conditions and the following
+//        disclaimer.
+//
+//      * Redistributions in binary form must reproduce the above
+//        copyright notice, this list of conditions and the following
+//        disclaimer in the documentation and/or other materials provided with
+//        the distribution.
+//
+//      * Neither the name of John Haddon nor the names of
+//        any other contributors to this software may be used to endorse or
+//        promote products derived from this software without specific prior
+//        written permission.
+//
+//  THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS
+//  IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+//  THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+//  PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+//  CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+//  EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+//  PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+//  PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+//  LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+//  NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+//  SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+//
+//////////////////////////////////////////////////////////////////////////
+
+#ifndef IECORESCENEPREVIEW_MESHALGO_H
+#define IECORESCENEPREVIEW_MESHALGO_H
+
+#include "GafferScene/Export.h"
+
+#include "IECoreScene/CurvesPrimitive.h"
+#include "IECoreScene/MeshPrimitive.h"
+#include "IECoreScene/PointsPrimitive.h"
+
+namespace IECoreScenePreview
+{
+
+namespace MeshAlgo
+{
+
+/// Equivalent to `IECoreScene::MeshAlgo::deleteFaces()`, and producing
+/// identical results, but using multiple threads so that very large meshes
+/// can be processed without serialising on a single core.
+/// \todo Move to Cortex, replacing the serial implementation.
+GAFFERSCENE_API IECoreScene::MeshPrimitivePtr deleteFaces( const IECoreScene::MeshPrimitive *meshPrimitive, const IECoreScene::PrimitiveVariable &facesToDelete, bool invert = false );
+
+/// Equivalent to `IECoreScene::MeshAlgo::distributePoints()`, but dividing
+/// the mesh into chunks of faces which are distributed over in parallel.
+/// Chunks have a fixed size, so the result doesn't depend on the number of
+/// threads available.
+GAFFERSCENE_API IECoreScene::PointsPrimitivePtr distributePoints( const IECoreScene::MeshPrimitive *mesh, float density = 100.0, const Imath::V2f &offset = Imath::V2f( 0 ), const std::string &densityMask = "density" );
+
+/// Equivalent to `IECoreScene::MeshAlgo::resamplePrimitiveVariable()`, and
+/// producing identical results, but calling it on chunks of faces in parallel.
+/// Conversions which only move data between Vertex and Varying, or to or from
+/// Constant, and conversions of indexed primitive variables, are passed
+/// straight to the serial implementation.
+GAFFERSCENE_API void resamplePrimitiveVariable( const IECoreScene::MeshPrimitive *mesh, IECoreScene::PrimitiveVariable &primitiveVariable, IECoreScene::PrimitiveVariable::Interpolation interpolation );
+
+/// Equivalent to `IECoreScene::MeshAlgo::calculateTangents()`, and producing
+/// identical results, but calling it on chunks of faces in parallel. Each chunk
+/// is extended to include every face sharing a UV with it, so that the tangents
+/// for the chunk are accumulated from the same faces, in the same order, as
+/// they would be for the whole mesh.
+GAFFERSCENE_API std::pair<IECoreScene::PrimitiveVariable, IECoreScene::PrimitiveVariable> calculateTangents( const IECoreScene::MeshPrimitive *mesh, const std::string &uvSet = "uv", bool orthoTangents = true, const std::string &position = "P" );
+
+/// Equivalent to `IECoreScene::MeshAlgo::calculateDistortion()`, and producing
+/// identical results, but calling it on chunks of faces in parallel. Each chunk
+/// is extended to include every face sharing a vertex or UV with it.
+GAFFERSCENE_API std::pair<IECoreScene::PrimitiveVariable, IECoreScene::PrimitiveVariable> calculateDistortion( const IECoreScene::MeshPrimitive *mesh, const std::string &uvSet = "uv", const std::string &referencePosition = "Pref", const std::string &position = "P" );
+
+/// Returns a CurvesPrimitive containing a linear curve for each edge of the mesh,
+/// positioned using the specified primitive variable. Edges shared by several
+/// faces are only output once. Edges are found in parallel.
+GAFFERSCENE_API IECoreScene::CurvesPrimitivePtr wireframe( const IECoreScene::MeshPrimitive *mesh, const std::string &position = "P" );
+
+} // namespace MeshAlgo
+
+} // namespace IECoreScenePreview
+
+#endif // IECORESCENEPREVIEW_MESHALGO_H
@@ -254,6 +254,21 @@ class IECORESCENE_API Renderer : public IECore::RefCounted
 		/// As above, but specifying a deforming object.
 		virtual ObjectInterfacePtr object( const std::string &name, const std::vector<const IECore::Object *> &samples, const std::vector<float> &times, const AttributesInterface *attributes ) = 0;
 
+		/// Adds multiple instances of an object to the render, returning a single
+		/// handle for all of them. Instance `i` is named `instanceNames[i]` and is
+		/// positioned by `instanceTransforms[i]`. Any transform subsequently assigned
+		/// via the handle is applied in the local space of each instance.
+		/// `instanceAttributes` must either contain a single attribute block shared
+		/// by all instances, or one block per instance. Assigning new attributes via
+		/// the handle applies them to all instances.
+		///
+		/// The default implementation calls `object()` once per instance. Renderers
+		/// which support instancing natively should override it to avoid the
+		/// overhead of a separate ObjectInterface per instance.
+		virtual ObjectInterfacePtr instances( const IECore::Object *object, const std::vector<std::string> &instanceNames, const std::vector<Imath::M44f> &instanceTransforms, const std::vector<const AttributesInterface *> &instanceAttributes );
+		/// As above, but specifying a deforming object.
+		virtual ObjectInterfacePtr instances( const std::vector<const IECore::Object *> &samples, const std::vector<float> &times, const std::vector<std::string> &instanceNames, const std::vector<Imath::M44f> &instanceTransforms, const std::vector<const AttributesInterface *> &instanceAttributes );
+
 		/// Performs the render - should be called after the
 		/// entire scene has been specified using the methods
 		/// above. Batch and SceneDescripton renders will have
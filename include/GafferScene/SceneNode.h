@@ -128,8 +128,33 @@ class GAFFERSCENE_API SceneNode : public Gaffer::ComputeNode
 		/// A hash for the result of the computation in unionOfTransformedChildBounds().
 		IECore::MurmurHash hashOfTransformedChildBounds( const ScenePath &path, const ScenePlug *out, const IECore::InternedStringVectorData *childNames = nullptr ) const;
 
+		/// May be called from the constructor of a derived class to add internal
+		/// plugs which cache the results of `scene->fullTransform()` and
+		/// `scene->fullAttributes()` and their hash counterparts. Each location's
+		/// result is computed from the cached result for its parent, so that nodes
+		/// which query many locations with common ancestors share the work rather
+		/// than traversing to the root for every query. This is opt-in because it
+		/// adds plugs and cache entries that other nodes have no use for. Typically
+		/// `scene` is an input scene, as used by the Constraint nodes.
+		void cacheFullTransformAndAttributes( const ScenePlug *scene );
+
 	private :
 
+		friend class ScenePlug;
+
+		const Gaffer::M44fPlug *fullTransformPlug() const;
+		const Gaffer::CompoundObjectPlug *fullAttributesPlug() const;
+
+		void hashFullTransform( const ScenePath &path, IECore::MurmurHash &h ) const;
+		Imath::M44f computeFullTransform( const ScenePath &path ) const;
+
+		void hashFullAttributes( const ScenePath &path, IECore::MurmurHash &h ) const;
+		IECore::ConstCompoundObjectPtr computeFullAttributes( const ScenePath &path ) const;
+
+		// Set by `cacheFullTransformAndAttributes()`.
+		const ScenePlug *m_fullScene;
+		size_t m_fullPlugsIndex;
+
 		static size_t g_firstPlugIndex;
 
 };
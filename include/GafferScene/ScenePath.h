@@ -81,6 +81,10 @@ class GAFFERSCENE_API ScenePath : public Gaffer::Path
 		bool isValid() const override;
 		bool isLeaf() const override;
 		Gaffer::PathPtr copy() const override;
+		/// Returns a copy with its own snapshot of the context,
+		/// so that it is unaffected by subsequent edits to `getContext()`.
+		Gaffer::PathPtr copyForBackgroundUse() const override;
+		const Gaffer::Plug *cancellationSubject() const override;
 
 		static Gaffer::PathFilterPtr createStandardFilter( const std::vector<std::string> &setNames = std::vector<std::string>(), const std::string &setsLabel = "" );
 
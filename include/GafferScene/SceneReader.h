@@ -78,10 +78,30 @@ class GAFFERSCENE_API SceneReader : public SceneNode
 		Gaffer::TransformPlug *transformPlug();
 		const Gaffer::TransformPlug *transformPlug() const;
 
+		/// When on, the hierarchy, bounds and transforms for the whole file
+		/// are read in a single parallel pass on first access, and subsequent
+		/// queries are answered from memory. Objects and attribute values are
+		/// still loaded on demand.
+		Gaffer::BoolPlug *preloadPlug();
+		const Gaffer::BoolPlug *preloadPlug() const;
+
 		void affects( const Gaffer::Plug *input, AffectedPlugsContainer &outputs ) const override;
 
 		static size_t supportedExtensions( std::vector<std::string> &extensions );
 
+		/// Returns the number of lookups made in the cache of SceneInterfaces
+		/// used to access locations within files, and the number of those
+		/// lookups which were satisfied by a cached entry. These are shared by
+		/// all SceneReaders, and are provided for performance profiling.
+		static size_t sceneCacheLookups();
+		static size_t sceneCacheHits();
+
+		/// Returns the number of times a file has been preloaded, and the
+		/// number of queries answered from preloaded files. These are shared
+		/// by all SceneReaders, and are provided for performance profiling.
+		static size_t preloadBuilds();
+		static size_t preloadHits();
+
 	protected :
 
 		/// \todo These methods defer to SceneInterface::hash() to do most of the work, but we could go further.
@@ -117,17 +137,20 @@ class GAFFERSCENE_API SceneReader : public SceneNode
 		// the bound and then the object). We take advantage of that by storing
 		// the last accessed scene in thread local storage - we can then avoid
 		// the relatively expensive lookups necessary to find the appropriate
-		// SceneInterfacePtr for a query.
+		// SceneInterfacePtr for a query. Other lookups are made via a shared
+		// cache of SceneInterfaces, so that the SceneInterface for a location
+		// can be found from the cached SceneInterface for its parent, rather than
+		// by walking the hierarchy from the root.
 		struct LastScene
 		{
 			std::string fileName;
-			IECoreScene::ConstSceneInterfacePtr fileNameScene;
 			ScenePlug::ScenePath path;
 			IECoreScene::ConstSceneInterfacePtr pathScene;
 		};
 		mutable tbb::enumerable_thread_specific<LastScene> m_lastScene;
 		// Returns the SceneInterface for the current filename (in the current Context)
-		// and specified path, using m_lastScene to accelerate the lookups.
+		// and specified path, using m_lastScene and the shared cache to accelerate
+		// the lookups.
 		IECoreScene::ConstSceneInterfacePtr scene( const ScenePath &path ) const;
 
 		static const double g_frameRate;
@@ -40,6 +40,13 @@
 
 #include "GafferScene/BranchCreator.h"
 
+namespace GafferImage
+{
+
+IE_CORE_FORWARDDECLARE( ImagePlug )
+
+} // namespace GafferImage
+
 namespace GafferScene
 {
 
@@ -65,6 +72,12 @@ class GAFFERSCENE_API Seeds : public BranchCreator
 		Gaffer::StringPlug *pointTypePlug();
 		const Gaffer::StringPlug *pointTypePlug() const;
 
+		GafferImage::ImagePlug *densityImagePlug();
+		const GafferImage::ImagePlug *densityImagePlug() const;
+
+		Gaffer::StringPlug *densityImageChannelPlug();
+		const Gaffer::StringPlug *densityImageChannelPlug() const;
+
 		void affects( const Gaffer::Plug *input, AffectedPlugsContainer &outputs ) const override;
 
 	protected :
@@ -168,6 +168,12 @@ class GAFFERSCENE_API Shader : public Gaffer::ComputeNode
 		/// Output plug where the shader network will be generated.
 		Gaffer::CompoundObjectPlug *outAttributesPlug();
 		const Gaffer::CompoundObjectPlug *outAttributesPlug() const;
+		/// Output plug holding the IECoreScene::Shader for this node alone,
+		/// without its input connections. The NetworkBuilder uses this so that
+		/// the parameter values of unchanged shaders can be reused from the
+		/// compute cache when rebuilding a network.
+		Gaffer::ObjectPlug *outShaderPlug();
+		const Gaffer::ObjectPlug *outShaderPlug() const;
 
 		static const IECore::InternedString g_outputParameterContextName;
 
@@ -268,6 +268,12 @@ class LocalDispatcher( GafferDispatch.Dispatcher ) :
 			if self.__ignoreScriptLoadErrors :
 				args.append( "-ignoreScriptLoadErrors" )
 
+			# Have the subprocess record its success in the execution
+			# journal, exactly as a farm dispatcher would.
+			journalDirectory = batch.blindData().get( "dispatcher:journalDirectory" )
+			if journalDirectory is not None :
+				args.extend( [ "-journal", journalDirectory.value ] )
+
 			contextArgs = []
 			for entry in [ k for k in taskContext.keys() if k != "frame" and not k.startswith( "ui:" ) ] :
 				if entry not in self.__context.keys() or taskContext[entry] != self.__context[entry] :
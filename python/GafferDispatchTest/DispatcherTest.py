@@ -1722,5 +1722,204 @@ class DispatcherTest( GafferTest.TestCase ) :
 		with self.assertRaisesRegexp( RuntimeError, "TaskPlug \"ScriptNode.badNode.task\" has no TaskNode" ) :
 			dispatcher.dispatch( [ s["taskList"] ] )
 
+	def testJournal( self ) :
+
+		s = Gaffer.ScriptNode()
+
+		s["n"] = GafferDispatchTest.LoggingTaskNode()
+
+		s["w"] = GafferDispatchTest.TextWriter()
+		s["w"]["fileName"].setValue( self.temporaryDirectory() + "/out.txt" )
+		s["w"]["mode"].setValue( "a" )
+		s["w"]["text"].setValue( "x" )
+
+		def contents() :
+			with open( s["w"]["fileName"].getValue() ) as f :
+				return f.read()
+
+		dispatcher = GafferDispatch.Dispatcher.create( "testDispatcher" )
+		dispatcher["journal"].setValue( True )
+
+		dispatcher.dispatch( [ s["n"], s["w"] ] )
+		self.assertEqual( len( s["n"].log ), 1 )
+		self.assertEqual( contents(), "x" )
+		self.assertTrue( os.path.isdir( self.temporaryDirectory() + "/journal" ) )
+
+		# Nothing has changed, so nothing should be executed.
+
+		dispatcher.dispatch( [ s["n"], s["w"] ] )
+		self.assertEqual( len( s["n"].log ), 1 )
+		self.assertEqual( contents(), "x" )
+		self.assertEqual( os.path.basename( dispatcher.jobDirectory() ), "000001" )
+
+		# Changing the task hash causes reexecution.
+
+		s["w"]["text"].setValue( "y" )
+		dispatcher.dispatch( [ s["n"], s["w"] ] )
+		self.assertEqual( len( s["n"].log ), 1 )
+		self.assertEqual( contents(), "xy" )
+
+		# As does removing the output file.
+
+		os.remove( s["w"]["fileName"].getValue() )
+		dispatcher.dispatch( [ s["n"], s["w"] ] )
+		self.assertEqual( len( s["n"].log ), 1 )
+		self.assertEqual( contents(), "y" )
+
+		# Forcing execution runs everything.
+
+		dispatcher["forceExecution"].setValue( True )
+		dispatcher.dispatch( [ s["n"], s["w"] ] )
+		self.assertEqual( len( s["n"].log ), 2 )
+		self.assertEqual( contents(), "yy" )
+
+		# As does disabling the journal.
+
+		dispatcher["forceExecution"].setValue( False )
+		dispatcher["journal"].setValue( False )
+		dispatcher.dispatch( [ s["n"], s["w"] ] )
+		self.assertEqual( len( s["n"].log ), 3 )
+		self.assertEqual( contents(), "yyy" )
+
+	def testJournalWithoutOutputFile( self ) :
+
+		s = Gaffer.ScriptNode()
+		s["n"] = GafferDispatchTest.LoggingTaskNode()
+		s["n"]["value"] = Gaffer.IntPlug()
+
+		dispatcher = GafferDispatch.Dispatcher.create( "testDispatcher" )
+		dispatcher["journal"].setValue( True )
+
+		dispatcher.dispatch( [ s["n"] ] )
+		dispatcher.dispatch( [ s["n"] ] )
+		self.assertEqual( len( s["n"].log ), 1 )
+
+		# There is no output file to check, but a change
+		# to the task's inputs must still cause reexecution.
+
+		s["n"]["value"].setValue( 1 )
+		dispatcher.dispatch( [ s["n"] ] )
+		self.assertEqual( len( s["n"].log ), 2 )
+
+	def testJournalWithExecutingPreTask( self ) :
+
+		s = Gaffer.ScriptNode()
+
+		s["n"] = GafferDispatchTest.LoggingTaskNode()
+		s["n"]["value"] = Gaffer.IntPlug()
+
+		s["w"] = GafferDispatchTest.TextWriter()
+		s["w"]["preTasks"][0].setInput( s["n"]["task"] )
+		s["w"]["fileName"].setValue( self.temporaryDirectory() + "/out.txt" )
+		s["w"]["mode"].setValue( "a" )
+		s["w"]["text"].setValue( "x" )
+
+		def contents() :
+			with open( s["w"]["fileName"].getValue() ) as f :
+				return f.read()
+
+		dispatcher = GafferDispatch.Dispatcher.create( "testDispatcher" )
+		dispatcher["journal"].setValue( True )
+
+		dispatcher.dispatch( [ s["w"] ] )
+		self.assertEqual( len( s["n"].log ), 1 )
+		self.assertEqual( contents(), "x" )
+
+		dispatcher.dispatch( [ s["w"] ] )
+		self.assertEqual( len( s["n"].log ), 1 )
+		self.assertEqual( contents(), "x" )
+
+		# The writer's own hash is unchanged, but its preTask now needs
+		# executing, and may change its inputs. So it must be executed too.
+
+		s["n"]["value"].setValue( 1 )
+		dispatcher.dispatch( [ s["w"] ] )
+		self.assertEqual( len( s["n"].log ), 2 )
+		self.assertEqual( contents(), "xx" )
+
+		# The same applies when the preTask is reached via a no-op.
+
+		s["l"] = GafferDispatch.TaskList()
+		s["l"]["preTasks"][0].setInput( s["n"]["task"] )
+		s["w"]["preTasks"][0].setInput( s["l"]["task"] )
+
+		dispatcher.dispatch( [ s["w"] ] )
+		self.assertEqual( len( s["n"].log ), 2 )
+		self.assertEqual( contents(), "xx" )
+
+		s["n"]["value"].setValue( 2 )
+		dispatcher.dispatch( [ s["w"] ] )
+		self.assertEqual( len( s["n"].log ), 3 )
+		self.assertEqual( contents(), "xxx" )
+
+	def testRecordExecution( self ) :
+
+		# Dispatchers which execute tasks in another process
+		# record them in the journal via this static method.
+
+		s = Gaffer.ScriptNode()
+		s["n"] = GafferDispatchTest.LoggingTaskNode()
+
+		dispatcher = GafferDispatch.Dispatcher.create( "testDispatcher" )
+		dispatcher["journal"].setValue( True )
+
+		with s.context() :
+			GafferDispatch.Dispatcher.recordExecution( s["n"]["task"], [ 1 ], self.temporaryDirectory() + "/journal" )
+
+		dispatcher.dispatch( [ s["n"] ] )
+		self.assertEqual( len( s["n"].log ), 0 )
+
+	# This test builds the batch graph for a large Wedge-based
+	# dispatch. It uses a NullDispatcher so that nothing is
+	# actually executed.
+	def testLargeWedgeDispatchBatches( self ) :
+
+		s = Gaffer.ScriptNode()
+
+		for i in range( 0, 100 ) :
+			s["command%d" % i] = GafferDispatch.SystemCommand()
+			s["command%d" % i]["command"].setValue( "echo %d ${wedge:value} ${frame}" % i )
+			if i :
+				s["command%d" % i]["preTasks"][0].setInput( s["command%d" % ( i - 1 )]["task"] )
+
+		s["wedge"] = GafferDispatch.Wedge()
+		s["wedge"]["preTasks"][0].setInput( s["command99"]["task"] )
+		s["wedge"]["mode"].setValue( int( GafferDispatch.Wedge.Mode.IntRange ) )
+		s["wedge"]["intMin"].setValue( 1 )
+		s["wedge"]["intMax"].setValue( 10 )
+
+		dispatcher = self.NullDispatcher()
+		dispatcher["jobsDirectory"].setValue( self.temporaryDirectory() )
+		dispatcher["framesMode"].setValue( GafferDispatch.Dispatcher.FramesMode.CustomRange )
+		dispatcher["frameRange"].setValue( "1-100" )
+		dispatcher.dispatch( [ s["wedge"] ] )
+
+		wedgeBatches = dispatcher.lastDispatch.preTasks()
+		self.assertEqual( len( wedgeBatches ), 100 )
+
+		for wedgeBatch in wedgeBatches :
+
+			self.assertEqual( wedgeBatch.node(), s["wedge"] )
+
+			wedgeValues = set()
+			for batch in wedgeBatch.preTasks() :
+
+				wedgeValue = batch.context()["wedge:value"]
+				frames = batch.frames()
+				self.assertEqual( len( frames ), 1 )
+				wedgeValues.add( wedgeValue )
+
+				# Each wedge value and frame gets its own chain of
+				# batches, one per command.
+				for i in reversed( range( 0, 100 ) ) :
+					self.assertEqual( batch.node(), s["command%d" % i] )
+					self.assertEqual( batch.frames(), frames )
+					self.assertEqual( batch.context()["wedge:value"], wedgeValue )
+					preTasks = batch.preTasks()
+					self.assertEqual( len( preTasks ), 1 if i else 0 )
+					batch = preTasks[0] if i else None
+
+			self.assertEqual( wedgeValues, set( range( 1, 11 ) ) )
+
 if __name__ == "__main__":
 	unittest.main()
@@ -853,5 +853,28 @@ class LocalDispatcherTest( GafferTest.TestCase ) :
 			open( self.temporaryDirectory() + "/outer.txt" ).readlines(),
 		)
 
+	def testJournalInBackground( self ) :
+
+		s = Gaffer.ScriptNode()
+
+		s["w"] = GafferDispatchTest.TextWriter()
+		s["w"]["fileName"].setValue( self.temporaryDirectory() + "/out.txt" )
+		s["w"]["mode"].setValue( "a" )
+		s["w"]["text"].setValue( "x" )
+
+		dispatcher = self.__createLocalDispatcher()
+		dispatcher["executeInBackground"].setValue( True )
+		dispatcher["journal"].setValue( True )
+
+		# The execution is recorded by the `gaffer execute` subprocess,
+		# as it would be for a farm dispatcher, so the second dispatch
+		# has nothing to do.
+		for i in range( 0, 2 ) :
+			dispatcher.dispatch( [ s["w"] ] )
+			dispatcher.jobPool().waitForAll()
+
+		with open( s["w"]["fileName"].getValue() ) as f :
+			self.assertEqual( f.read(), "x" )
+
 if __name__ == "__main__":
 	unittest.main()
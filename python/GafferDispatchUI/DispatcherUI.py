@@ -55,6 +55,7 @@ Gaffer.Metadata.registerNode(
 	""",
 
 	"layout:activator:framesModeIsCustomRange", lambda node : node["framesMode"].getValue() == GafferDispatch.Dispatcher.FramesMode.CustomRange,
+	"layout:activator:journalEnabled", lambda node : node["journal"].getValue(),
 
 	plugs = {
 
@@ -118,6 +119,31 @@ Gaffer.Metadata.registerNode(
 
 		),
 
+		"journal" : (
+
+			"description",
+			"""
+			Records the tasks which have been executed successfully in
+			a journal stored alongside the job directories. Subsequent
+			dispatches skip tasks whose hash is recorded in the journal,
+			provided that the file specified by the task's `fileName`
+			plug (if any) has not changed since.
+			""",
+
+		),
+
+		"forceExecution" : (
+
+			"description",
+			"""
+			Executes all tasks, even those which the journal considers
+			to be up to date.
+			""",
+
+			"layout:activator", "journalEnabled",
+
+		),
+
 	}
 
 )
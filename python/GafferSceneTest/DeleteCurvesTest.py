@@ -34,6 +34,7 @@
 #
 ##########################################################################
 
+import random
 import imath
 
 import IECore
@@ -182,3 +183,69 @@ class DeleteCurvesTest( GafferSceneTest.SceneTestCase ) :
 		expectedBoundingBox = imath.Box3f( imath.V3f( 0, -1, 0 ), imath.V3f( 2, 1, 0 ) )
 
 		self.assertEqual( actualCurveDeletedBounds, expectedBoundingBox )
+
+	def testMatchesCortex( self ) :
+
+		random.seed( 0 )
+		verticesPerCurve = IECore.IntVectorData( [ random.randint( 4, 10 ) for i in range( 0, 1000 ) ] )
+
+		for basis, periodic in [
+			( IECore.CubicBasisf.linear(), False ),
+			( IECore.CubicBasisf.linear(), True ),
+			( IECore.CubicBasisf.bSpline(), False ),
+		] :
+
+			curves = IECoreScene.CurvesPrimitive( verticesPerCurve, basis, periodic )
+
+			def primitiveVariable( interpolation, values ) :
+				return IECoreScene.PrimitiveVariable(
+					interpolation,
+					values( curves.variableSize( interpolation ) )
+				)
+
+			curves["P"] = primitiveVariable(
+				IECoreScene.PrimitiveVariable.Interpolation.Vertex,
+				lambda n : IECore.V3fVectorData( [ imath.V3f( i ) for i in range( 0, n ) ], IECore.GeometricData.Interpretation.Point )
+			)
+			curves["deleteCurves"] = primitiveVariable(
+				IECoreScene.PrimitiveVariable.Interpolation.Uniform,
+				lambda n : IECore.IntVectorData( [ random.randint( 0, 1 ) for i in range( 0, n ) ] )
+			)
+			curves["varying"] = primitiveVariable(
+				IECoreScene.PrimitiveVariable.Interpolation.Varying,
+				lambda n : IECore.StringVectorData( [ str( i ) for i in range( 0, n ) ] )
+			)
+			curves["faceVarying"] = primitiveVariable(
+				IECoreScene.PrimitiveVariable.Interpolation.FaceVarying,
+				lambda n : IECore.FloatVectorData( range( 0, n ) )
+			)
+			curves["indexedUniform"] = IECoreScene.PrimitiveVariable(
+				IECoreScene.PrimitiveVariable.Interpolation.Uniform,
+				IECore.FloatVectorData( [ 1, 2 ] ),
+				IECore.IntVectorData( [ i % 2 for i in range( 0, curves.numCurves() ) ] )
+			)
+			curves["constant"] = IECoreScene.PrimitiveVariable(
+				IECoreScene.PrimitiveVariable.Interpolation.Constant,
+				IECore.StringData( "test" )
+			)
+			self.assertTrue( curves.arePrimitiveVariablesValid() )
+
+			objectToScene = GafferScene.ObjectToScene()
+			objectToScene["object"].setValue( curves )
+
+			pathFilter = GafferScene.PathFilter()
+			pathFilter["paths"].setValue( IECore.StringVectorData( [ "/object" ] ) )
+
+			deleteCurves = GafferScene.DeleteCurves()
+			deleteCurves["in"].setInput( objectToScene["out"] )
+			deleteCurves["filter"].setInput( pathFilter["out"] )
+
+			for parallel in ( True, False ) :
+				for invert in ( False, True ) :
+
+					deleteCurves["parallel"].setValue( parallel )
+					deleteCurves["invert"].setValue( invert )
+					self.assertEqual(
+						deleteCurves["out"].object( "/object" ),
+						IECoreScene.CurvesAlgo.deleteCurves( curves, curves["deleteCurves"], invert )
+					)
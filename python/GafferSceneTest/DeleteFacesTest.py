@@ -34,6 +34,7 @@
 #
 ##########################################################################
 
+import random
 import imath
 
 import IECore
@@ -124,3 +125,85 @@ class DeleteFacesTest( GafferSceneTest.SceneTestCase ) :
 		expectedBoundingBox = imath.Box3f( imath.V3f( 0, 0, 0 ), imath.V3f( 1, 1, 0 ) )
 
 		self.assertEqual( actualFaceDeletedBounds, expectedBoundingBox )
+
+	def makeLargeMesh( self, divisions ) :
+
+		mesh = IECoreScene.MeshPrimitive.createPlane( imath.Box2f( imath.V2f( -1 ), imath.V2f( 1 ) ), divisions )
+
+		random.seed( 0 )
+		mesh["deleteFaces"] = IECoreScene.PrimitiveVariable(
+			IECoreScene.PrimitiveVariable.Interpolation.Uniform,
+			IECore.IntVectorData( [ random.randint( 0, 1 ) for i in range( 0, mesh.numFaces() ) ] )
+		)
+
+		return mesh
+
+	def testMatchesCortex( self ) :
+
+		mesh = self.makeLargeMesh( imath.V2i( 100 ) )
+
+		numFaces = mesh.numFaces()
+		numVertices = mesh.variableSize( IECoreScene.PrimitiveVariable.Interpolation.Vertex )
+		numFaceVertices = mesh.variableSize( IECoreScene.PrimitiveVariable.Interpolation.FaceVarying )
+
+		mesh["uniform"] = IECoreScene.PrimitiveVariable(
+			IECoreScene.PrimitiveVariable.Interpolation.Uniform,
+			IECore.BoolVectorData( [ i % 3 == 0 for i in range( 0, numFaces ) ] )
+		)
+		mesh["vertex"] = IECoreScene.PrimitiveVariable(
+			IECoreScene.PrimitiveVariable.Interpolation.Vertex,
+			IECore.StringVectorData( [ str( i ) for i in range( 0, numVertices ) ] )
+		)
+		mesh["indexedVertex"] = IECoreScene.PrimitiveVariable(
+			IECoreScene.PrimitiveVariable.Interpolation.Vertex,
+			IECore.FloatVectorData( [ 1, 2 ] ),
+			IECore.IntVectorData( [ i % 2 for i in range( 0, numVertices ) ] )
+		)
+		mesh["faceVarying"] = IECoreScene.PrimitiveVariable(
+			IECoreScene.PrimitiveVariable.Interpolation.FaceVarying,
+			IECore.V3fVectorData( [ imath.V3f( i ) for i in range( 0, numFaceVertices ) ], IECore.GeometricData.Interpretation.Normal )
+		)
+		mesh["constant"] = IECoreScene.PrimitiveVariable(
+			IECoreScene.PrimitiveVariable.Interpolation.Constant,
+			IECore.StringData( "test" )
+		)
+		self.assertTrue( mesh.arePrimitiveVariablesValid() )
+
+		objectToScene = GafferScene.ObjectToScene()
+		objectToScene["object"].setValue( mesh )
+
+		pathFilter = GafferScene.PathFilter()
+		pathFilter["paths"].setValue( IECore.StringVectorData( [ "/object" ] ) )
+
+		deleteFaces = GafferScene.DeleteFaces()
+		deleteFaces["in"].setInput( objectToScene["out"] )
+		deleteFaces["filter"].setInput( pathFilter["out"] )
+
+		for parallel in ( True, False ) :
+			for invert in ( False, True ) :
+
+				deleteFaces["parallel"].setValue( parallel )
+				deleteFaces["invert"].setValue( invert )
+				self.assertEqual(
+					deleteFaces["out"].object( "/object" ),
+					IECoreScene.MeshAlgo.deleteFaces( mesh, mesh["deleteFaces"], invert )
+				)
+
+	def testLargeMesh( self ) :
+
+		mesh = self.makeLargeMesh( imath.V2i( 1000 ) )
+
+		objectToScene = GafferScene.ObjectToScene()
+		objectToScene["object"].setValue( mesh )
+
+		pathFilter = GafferScene.PathFilter()
+		pathFilter["paths"].setValue( IECore.StringVectorData( [ "/object" ] ) )
+
+		deleteFaces = GafferScene.DeleteFaces()
+		deleteFaces["in"].setInput( objectToScene["out"] )
+		deleteFaces["filter"].setInput( pathFilter["out"] )
+
+		result = deleteFaces["out"].object( "/object" )
+		self.assertEqual( result.numFaces(), list( mesh["deleteFaces"].data ).count( 0 ) )
+		self.assertTrue( result.arePrimitiveVariablesValid() )
+		self.assertEqual( result, IECoreScene.MeshAlgo.deleteFaces( mesh, mesh["deleteFaces"] ) )
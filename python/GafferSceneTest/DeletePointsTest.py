@@ -34,6 +34,7 @@
 #
 ##########################################################################
 
+import random
 import imath
 
 import IECore
@@ -149,3 +150,51 @@ class DeletePointsTest( GafferSceneTest.SceneTestCase ) :
 
 		self.assertEqual( actualPointsDeletedBounds, expectedBoundingBox )
 
+	def testMatchesCortex( self ) :
+
+		numPoints = 10000
+		random.seed( 0 )
+
+		points = IECoreScene.PointsPrimitive( IECore.V3fVectorData( [ imath.V3f( i ) for i in range( 0, numPoints ) ] ) )
+		points["deletePoints"] = IECoreScene.PrimitiveVariable(
+			IECoreScene.PrimitiveVariable.Interpolation.Vertex,
+			IECore.IntVectorData( [ random.randint( 0, 1 ) for i in range( 0, numPoints ) ] )
+		)
+		points["varying"] = IECoreScene.PrimitiveVariable(
+			IECoreScene.PrimitiveVariable.Interpolation.Varying,
+			IECore.StringVectorData( [ str( i ) for i in range( 0, numPoints ) ] )
+		)
+		points["indexedVertex"] = IECoreScene.PrimitiveVariable(
+			IECoreScene.PrimitiveVariable.Interpolation.Vertex,
+			IECore.FloatVectorData( [ 1, 2 ] ),
+			IECore.IntVectorData( [ i % 2 for i in range( 0, numPoints ) ] )
+		)
+		points["bool"] = IECoreScene.PrimitiveVariable(
+			IECoreScene.PrimitiveVariable.Interpolation.Vertex,
+			IECore.BoolVectorData( [ i % 3 == 0 for i in range( 0, numPoints ) ] )
+		)
+		points["constant"] = IECoreScene.PrimitiveVariable(
+			IECoreScene.PrimitiveVariable.Interpolation.Constant,
+			IECore.StringData( "test" )
+		)
+		self.assertTrue( points.arePrimitiveVariablesValid() )
+
+		objectToScene = GafferScene.ObjectToScene()
+		objectToScene["object"].setValue( points )
+
+		pathFilter = GafferScene.PathFilter()
+		pathFilter["paths"].setValue( IECore.StringVectorData( [ "/object" ] ) )
+
+		deletePoints = GafferScene.DeletePoints()
+		deletePoints["in"].setInput( objectToScene["out"] )
+		deletePoints["filter"].setInput( pathFilter["out"] )
+
+		for parallel in ( True, False ) :
+			for invert in ( False, True ) :
+
+				deletePoints["parallel"].setValue( parallel )
+				deletePoints["invert"].setValue( invert )
+				self.assertEqual(
+					deletePoints["out"].object( "/object" ),
+					IECoreScene.PointsAlgo.deletePoints( points, points["deletePoints"], invert )
+				)
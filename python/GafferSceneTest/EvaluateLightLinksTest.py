@@ -257,3 +257,58 @@ class EvaluateLightLinksTest( GafferSceneTest.SceneTestCase ) :
 
 		light1["defaultLight"].setValue( True )
 
+	def testSharedExpressions( self ) :
+
+		sphere = GafferScene.Sphere()
+
+		attributes = GafferScene.StandardAttributes()
+		attributes["in"].setInput( sphere["out"] )
+		attributes["attributes"]["linkedLights"]["enabled"].setValue( True )
+		attributes["attributes"]["linkedLights"]["value"].setValue( "lightSet" )
+
+		duplicate = GafferScene.Duplicate()
+		duplicate["in"].setInput( attributes["out"] )
+		duplicate["target"].setValue( "/sphere" )
+		duplicate["copies"].setValue( 100 )
+
+		light1 = GafferSceneTest.TestLight()
+		light2 = GafferSceneTest.TestLight()
+
+		group = GafferScene.Group()
+		group["in"].addChild( GafferScene.ScenePlug( "in1" ) )
+		group["in"].addChild( GafferScene.ScenePlug( "in2" ) )
+		group["in"].addChild( GafferScene.ScenePlug( "in3" ) )
+		group["in"]["in1"].setInput( duplicate["out"] )
+		group["in"]["in2"].setInput( light1["out"] )
+		group["in"]["in3"].setInput( light2["out"] )
+
+		lightSet = GafferScene.Set()
+		lightSet["in"].setInput( group["out"] )
+		lightSet["name"].setValue( "lightSet" )
+		lightSet["paths"].setValue( IECore.StringVectorData( [ "/group/light" ] ) )
+
+		evalNode = GafferScene.EvaluateLightLinks()
+		evalNode["in"].setInput( lightSet["out"] )
+
+		# All locations share the same expression, so they should
+		# all share the same result.
+
+		linkedLights = evalNode["out"].attributes( "/group/sphere", _copy = False )["linkedLights"]
+		self.assertEqual( linkedLights, IECore.StringVectorData( [ "/group/light" ] ) )
+
+		for name in evalNode["out"].childNames( "/group" ) :
+			if not name.value().startswith( "sphere" ) :
+				continue
+			self.assertTrue(
+				evalNode["out"].attributes( "/group/" + name.value(), _copy = False )["linkedLights"].isSame( linkedLights )
+			)
+
+		# But changes to the sets must still be reflected everywhere.
+
+		lightSet["paths"].setValue( IECore.StringVectorData( [ "/group/light1" ] ) )
+		for name in [ "sphere", "sphere1", "sphere100" ] :
+			self.assertEqual(
+				evalNode["out"].attributes( "/group/" + name )["linkedLights"],
+				IECore.StringVectorData( [ "/group/light1" ] )
+			)
+
@@ -36,12 +36,14 @@
 
 import os
 import unittest
+import threading
 import imath
 
 import IECore
 import IECoreScene
 import IECoreGL
 
+import Gaffer
 import GafferTest
 import GafferScene
 
@@ -226,5 +228,169 @@ class RendererTest( GafferTest.TestCase ) :
 
 		del o
 
+	def testStreamingOptions( self ) :
+
+		renderer = GafferScene.Private.IECoreScenePreview.Renderer.create(
+			"OpenGL",
+			GafferScene.Private.IECoreScenePreview.Renderer.RenderType.Interactive
+		)
+
+		with IECore.CapturingMessageHandler() as handler :
+			renderer.option( "gl:streaming:maxPendingEdits", IECore.IntData( 10 ) )
+			renderer.option( "gl:streaming:timeBudget", IECore.FloatData( 0.01 ) )
+			renderer.option( "gl:streaming:maxPendingEdits", None )
+			renderer.option( "gl:streaming:timeBudget", None )
+
+		self.assertEqual( len( handler.messages ), 0 )
+
+		# A capacity doesn't block synchronous edits, since
+		# they may be made from the render thread itself.
+
+		renderer.option( "gl:streaming:maxPendingEdits", IECore.IntData( 2 ) )
+		self.assertFalse( renderer.command( "gl:queryEditsPending", {} ).value )
+
+		attributes = renderer.attributes( IECore.CompoundObject() )
+		objects = []
+		for i in range( 0, 10 ) :
+			objects.append( renderer.object( "/sphere%d" % i, IECoreScene.SpherePrimitive(), attributes ) )
+
+		self.assertTrue( renderer.command( "gl:queryEditsPending", {} ).value )
+		self.assertEqual( renderer.command( "gl:processQueue", {} ).value, 11 )
+		self.assertFalse( renderer.command( "gl:queryEditsPending", {} ).value )
+
+		self.assertEqual(
+			renderer.command( "gl:queryBound", {} ),
+			IECoreScene.SpherePrimitive().bound()
+		)
+
+		del objects
+
+	def testStreamingBackPressure( self ) :
+
+		renderer = GafferScene.Private.IECoreScenePreview.Renderer.create(
+			"OpenGL",
+			GafferScene.Private.IECoreScenePreview.Renderer.RenderType.Interactive
+		)
+
+		renderer.option( "gl:streaming:maxPendingEdits", IECore.IntData( 2 ) )
+		attributes = renderer.attributes( IECore.CompoundObject() )
+		renderer.command( "gl:processQueue", {} )
+
+		def producer( objects, canceller ) :
+
+			with Gaffer.Context( Gaffer.Context(), canceller ) :
+				for i in range( 0, 10 ) :
+					objects.append( renderer.object( "/sphere%d" % i, IECoreScene.SpherePrimitive(), attributes ) )
+
+		# A background update should block once the queue is full,
+		# and only complete as the render thread processes edits.
+
+		objects = []
+		thread = threading.Thread( target = producer, args = ( objects, IECore.Canceller() ) )
+		thread.start()
+
+		thread.join( 0.5 )
+		self.assertTrue( thread.is_alive() )
+		self.assertLessEqual( len( objects ), 2 )
+
+		numEdits = 0
+		while thread.is_alive() :
+			numEdits += renderer.command( "gl:processQueue", {} ).value
+			thread.join( 0.01 )
+
+		numEdits += renderer.command( "gl:processQueue", {} ).value
+		self.assertEqual( len( objects ), 10 )
+		self.assertEqual( numEdits, 10 )
+
+		# Cancellation should release a blocked update, even if
+		# the render thread isn't processing edits.
+
+		del objects[:]
+		canceller = IECore.Canceller()
+		thread = threading.Thread( target = producer, args = ( objects, canceller ) )
+		thread.start()
+
+		thread.join( 0.5 )
+		self.assertTrue( thread.is_alive() )
+
+		canceller.cancel()
+		thread.join( 5 )
+		self.assertFalse( thread.is_alive() )
+
+		del objects
+
+	def testStreamingTimeBudget( self ) :
+
+		renderer = GafferScene.Private.IECoreScenePreview.Renderer.create(
+			"OpenGL",
+			GafferScene.Private.IECoreScenePreview.Renderer.RenderType.Interactive
+		)
+
+		attributes = renderer.attributes( IECore.CompoundObject() )
+		objects = [
+			renderer.object( "/sphere%d" % i, IECoreScene.SpherePrimitive(), attributes )
+			for i in range( 0, 1000 )
+		]
+		self.assertEqual( renderer.command( "gl:processQueue", {} ).value, 1001 )
+
+		for i, o in enumerate( objects ) :
+			o.transform( imath.M44f().translate( imath.V3f( i ) ) )
+
+		# With a tiny budget, only the edits processed before the
+		# first check of the time should be applied, and the rest
+		# should remain pending for subsequent renders.
+
+		numEdits = renderer.command( "gl:processQueue", { "timeBudget" : IECore.FloatData( 1e-9 ) } ).value
+		self.assertLess( numEdits, 1000 )
+		self.assertTrue( renderer.command( "gl:queryEditsPending", {} ).value )
+
+		while renderer.command( "gl:queryEditsPending", {} ).value :
+			numEdits += renderer.command( "gl:processQueue", { "timeBudget" : IECore.FloatData( 1e-9 ) } ).value
+
+		self.assertEqual( numEdits, 1000 )
+
+		del objects
+
+	def testLevelOfDetail( self ) :
+
+		renderer = GafferScene.Private.IECoreScenePreview.Renderer.create(
+			"OpenGL",
+			GafferScene.Private.IECoreScenePreview.Renderer.RenderType.Interactive
+		)
+
+		plane = IECoreScene.MeshPrimitive.createPlane(
+			imath.Box2f( imath.V2f( -1 ), imath.V2f( 1 ) ), imath.V2i( 100 )
+		)
+
+		attributes = renderer.attributes(
+			IECore.CompoundObject( {
+				"gl:lod:vertexThreshold" : IECore.IntData( 1000 ),
+				"gl:lod:proxyPoints" : IECore.IntData( 100 ),
+			} )
+		)
+
+		o = renderer.object( "/plane", plane, attributes )
+
+		# The proxy is only a subset of the mesh, but the bound
+		# must still be that of the full mesh.
+
+		self.assertEqual( renderer.command( "gl:queryBound", {} ), plane.bound() )
+
+		# Changing the level of detail requires the object
+		# to be recreated.
+
+		self.assertFalse(
+			o.attributes(
+				renderer.attributes(
+					IECore.CompoundObject( {
+						"gl:lod:vertexThreshold" : IECore.IntData( 0 ),
+					} )
+				)
+			)
+		)
+		self.assertTrue( o.attributes( attributes ) )
+
+		del o
+
 if __name__ == "__main__":
 	unittest.main()
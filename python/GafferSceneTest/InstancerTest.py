@@ -702,6 +702,29 @@ class InstancerTest( GafferSceneTest.SceneTestCase ) :
 			}
 		)
 
+	def testSetsDontComputeChildNames( self ) :
+
+		points = IECoreScene.PointsPrimitive( IECore.V3fVectorData( [ imath.V3f( x, 0, 0 ) for x in range( 0, 100 ) ] ) )
+
+		objectToScene = GafferScene.ObjectToScene()
+		objectToScene["object"].setValue( points )
+
+		sphere = GafferScene.Sphere()
+		sphere["sets"].setValue( "sphereSet" )
+
+		instancer = GafferScene.Instancer()
+		instancer["in"].setInput( objectToScene["out"] )
+		instancer["instances"].setInput( sphere["out"] )
+		instancer["parent"].setValue( "/object" )
+
+		with Gaffer.PerformanceMonitor() as m :
+			self.assertEqual(
+				set( instancer["out"].set( "sphereSet" ).value.paths() ),
+				{ "/object/instances/sphere/{}".format( i ) for i in range( 0, 100 ) }
+			)
+
+		self.assertEqual( m.plugStatistics( instancer["out"]["childNames"] ).computeCount, 0 )
+
 	def testIds( self ) :
 
 		points = IECoreScene.PointsPrimitive( IECore.V3fVectorData( [ imath.V3f( x, 0, 0 ) for x in range( 0, 4 ) ] ) )
@@ -828,6 +851,67 @@ class InstancerTest( GafferSceneTest.SceneTestCase ) :
 		self.assertEqual( instancer["out"].transform( "/object/instances/sphere/4" ), imath.M44f().translate( imath.V3f( 4, 0, 0 ) ) )
 
 
+	def testDenseAndSparseIds( self ) :
+
+		for ids in [
+			range( 2000, 1000, -1 ),
+			[ x * 1000 for x in range( 0, 1000 ) ],
+		] :
+
+			points = IECoreScene.PointsPrimitive( IECore.V3fVectorData( [ imath.V3f( x, 0, 0 ) for x in range( 0, len( ids ) ) ] ) )
+			points["id"] = IECoreScene.PrimitiveVariable(
+				IECoreScene.PrimitiveVariable.Interpolation.Vertex,
+				IECore.IntVectorData( ids ),
+			)
+			points["index"] = IECoreScene.PrimitiveVariable(
+				IECoreScene.PrimitiveVariable.Interpolation.Vertex,
+				IECore.IntVectorData( [ x % 2 for x in range( 0, len( ids ) ) ] ),
+			)
+
+			objectToScene = GafferScene.ObjectToScene()
+			objectToScene["object"].setValue( points )
+
+			sphere = GafferScene.Sphere()
+			sphere["sets"].setValue( "testSet" )
+			cube = GafferScene.Cube()
+			instances = GafferScene.Parent()
+			instances["in"].setInput( sphere["out"] )
+			instances["child"].setInput( cube["out"] )
+			instances["parent"].setValue( "/" )
+
+			instancer = GafferScene.Instancer()
+			instancer["in"].setInput( objectToScene["out"] )
+			instancer["instances"].setInput( instances["out"] )
+			instancer["parent"].setValue( "/object" )
+			instancer["index"].setValue( "index" )
+			instancer["id"].setValue( "id" )
+
+			sphereIds = sorted( ids[0::2] )
+			self.assertEqual(
+				instancer["out"].childNames( "/object/instances/sphere" ),
+				IECore.InternedStringVectorData( [ str( i ) for i in sphereIds ] )
+			)
+			self.assertEqual(
+				instancer["out"].childNames( "/object/instances/cube" ),
+				IECore.InternedStringVectorData( [ str( i ) for i in sorted( ids[1::2] ) ] )
+			)
+
+			for pointIndex, id in enumerate( ids ) :
+				self.assertEqual(
+					instancer["out"].transform( "/object/instances/{}/{}".format( "cube" if pointIndex % 2 else "sphere", id ) ),
+					imath.M44f().translate( imath.V3f( pointIndex, 0, 0 ) )
+				)
+
+			self.assertEqual(
+				instancer["out"].bound( "/object/instances/sphere" ),
+				imath.Box3f( imath.V3f( -1 ), imath.V3f( len( ids ) - 1, 1, 1 ) )
+			)
+
+			self.assertEqual(
+				set( instancer["out"].set( "testSet" ).value.paths() ),
+				{ "/object/instances/sphere/{}".format( i ) for i in sphereIds }
+			)
+
 	def testAttributes( self ) :
 
 		points = IECoreScene.PointsPrimitive( IECore.V3fVectorData( [ imath.V3f( x, 0, 0 ) for x in range( 0, 2 ) ] ) )
@@ -975,6 +1059,154 @@ class InstancerTest( GafferSceneTest.SceneTestCase ) :
 			} )
 		)
 
+	def testEncapsulateInstanceGroups( self ) :
+
+		points = IECoreScene.PointsPrimitive( IECore.V3fVectorData( [ imath.V3f( x, 0, 0 ) for x in range( 0, 10 ) ] ) )
+		objectToScene = GafferScene.ObjectToScene()
+		objectToScene["object"].setValue( points )
+
+		sphere = GafferScene.Sphere()
+		sphere["sets"].setValue( "A" )
+
+		instancer = GafferScene.Instancer()
+		instancer["in"].setInput( objectToScene["out"] )
+		instancer["instances"].setInput( sphere["out"] )
+		instancer["parent"].setValue( "/object" )
+
+		self.assertEqual( len( instancer["out"].childNames( "/object/instances/sphere" ) ), 10 )
+		self.assertEqual( len( instancer["out"].set( "A" ).value.paths() ), 10 )
+		bound = instancer["out"].bound( "/object/instances/sphere" )
+		objectHash = instancer["out"].objectHash( "/object/instances/sphere" )
+
+		instancer["encapsulateInstanceGroups"].setValue( True )
+
+		# The instances are replaced by a single capsule per prototype,
+		# but the bounds and everything above the prototype level are
+		# unaffected.
+
+		self.assertEqual( instancer["out"].childNames( "/object/instances" ), IECore.InternedStringVectorData( [ "sphere" ] ) )
+		self.assertEqual( instancer["out"].childNames( "/object/instances/sphere" ), IECore.InternedStringVectorData() )
+		self.assertEqual( instancer["out"].bound( "/object/instances/sphere" ), bound )
+		self.assertNotEqual( instancer["out"].objectHash( "/object/instances/sphere" ), objectHash )
+
+		capsule = instancer["out"].object( "/object/instances/sphere" )
+		self.assertIsInstance( capsule, GafferScene.Capsule )
+		self.assertEqual( capsule.scene(), instancer["out"] )
+		self.assertEqual( capsule.root(), "/object/instances/sphere" )
+		self.assertEqual( capsule.bound(), bound )
+
+		# The sets can't refer to locations inside the capsules.
+
+		self.assertEqual( instancer["out"].set( "A" ).value.paths(), [] )
+
+		# And the capsule should be updated when the points change.
+
+		capsuleHash = capsule.hash()
+		points = IECoreScene.PointsPrimitive( IECore.V3fVectorData( [ imath.V3f( x, 1, 0 ) for x in range( 0, 10 ) ] ) )
+		objectToScene["object"].setValue( points )
+		self.assertNotEqual( instancer["out"].object( "/object/instances/sphere" ).hash(), capsuleHash )
+
+	def testEncapsulatedRender( self ) :
+
+		points = IECoreScene.PointsPrimitive( IECore.V3fVectorData( [ imath.V3f( x, 0, 0 ) for x in range( 0, 4 ) ] ) )
+		points["instanceId"] = IECoreScene.PrimitiveVariable(
+			IECoreScene.PrimitiveVariable.Interpolation.Vertex,
+			IECore.IntVectorData( [ 10, 20, 30, 40 ] ),
+		)
+		points["testFloat"] = IECoreScene.PrimitiveVariable(
+			IECoreScene.PrimitiveVariable.Interpolation.Vertex,
+			IECore.FloatVectorData( [ 0, 1, 2, 3 ] ),
+		)
+
+		objectToScene = GafferScene.ObjectToScene()
+		objectToScene["object"].setValue( points )
+
+		# Prototype with an object at its root and a child location,
+		# each with their own attributes and sets.
+
+		sphere = GafferScene.Sphere()
+		sphere["sets"].setValue( "A" )
+		sphere["transform"]["translate"].setValue( imath.V3f( 0, 1, 0 ) )
+
+		cube = GafferScene.Cube()
+		cube["sets"].setValue( "B" )
+		cube["transform"]["rotate"].setValue( imath.V3f( 0, 45, 0 ) )
+
+		parent = GafferScene.Parent()
+		parent["in"].setInput( sphere["out"] )
+		parent["child"].setInput( cube["out"] )
+		parent["parent"].setValue( "/sphere" )
+
+		sphereFilter = GafferScene.PathFilter()
+		sphereFilter["paths"].setValue( IECore.StringVectorData( [ "/sphere" ] ) )
+
+		sphereAttributes = GafferScene.CustomAttributes()
+		sphereAttributes["in"].setInput( parent["out"] )
+		sphereAttributes["filter"].setInput( sphereFilter["out"] )
+		sphereAttributes["attributes"].addMember( "testFloat", IECore.FloatData( 10 ) )
+		sphereAttributes["attributes"].addMember( "testProto", IECore.IntData( 1 ) )
+
+		cubeFilter = GafferScene.PathFilter()
+		cubeFilter["paths"].setValue( IECore.StringVectorData( [ "/sphere/cube" ] ) )
+
+		cubeAttributes = GafferScene.CustomAttributes()
+		cubeAttributes["in"].setInput( sphereAttributes["out"] )
+		cubeAttributes["filter"].setInput( cubeFilter["out"] )
+		cubeAttributes["attributes"].addMember( "testCube", IECore.IntData( 2 ) )
+
+		instancer = GafferScene.Instancer()
+		instancer["in"].setInput( objectToScene["out"] )
+		instancer["instances"].setInput( cubeAttributes["out"] )
+		instancer["parent"].setValue( "/object" )
+		instancer["attributes"].setValue( "testFloat" )
+
+		# Record what the expanded hierarchy looks like relative to the
+		# location of the capsule.
+
+		prototypePath = "/object/instances/sphere"
+		prototypeTransform = instancer["out"].fullTransform( prototypePath )
+
+		expected = {}
+		for id in [ 10, 20, 30, 40 ] :
+			for childPath, setName in [ ( "", "A" ), ( "/cube", "B" ) ] :
+				path = "{}/{}{}".format( prototypePath, id, childPath )
+				expected["/{}{}".format( id, childPath )] = {
+					"object" : instancer["out"].object( path ),
+					"transform" : instancer["out"].fullTransform( path ) * prototypeTransform.inverse(),
+					"attributes" : instancer["out"].fullAttributes( path ),
+					"sets" : IECore.InternedStringVectorData( [ setName ] ),
+				}
+
+		# Per-instance attributes take precedence over attributes at
+		# the root of the prototype, and are inherited by its children.
+
+		self.assertEqual( expected["/20"]["attributes"]["testFloat"], IECore.FloatData( 1 ) )
+		self.assertEqual( expected["/20/cube"]["attributes"]["testFloat"], IECore.FloatData( 1 ) )
+
+		# Render the capsule, and check that it produces exactly the same
+		# objects as the expanded hierarchy would.
+
+		instancer["encapsulateInstanceGroups"].setValue( True )
+		capsule = instancer["out"].object( prototypePath )
+
+		renderer = GafferScene.Private.IECoreScenePreview.CapturingRenderer()
+		capsule.render( renderer )
+
+		self.assertEqual( sorted( renderer.capturedObjectNames() ), sorted( expected.keys() ) )
+
+		for name, e in expected.items() :
+
+			o = renderer.capturedObject( name )
+			self.assertEqual( o.capturedName(), name )
+			self.assertEqual( o.capturedSamples(), [ e["object"] ] )
+			self.assertEqual( len( o.capturedTransforms() ), 1 )
+			self.assertTrue( o.capturedTransforms()[0].equalWithAbsError( e["transform"], 0.00001 ) )
+
+			attributes = o.capturedAttributes().attributes()
+			self.assertEqual( attributes["sets"], e["sets"] )
+			del attributes["sets"]
+			self.assertEqual( attributes, e["attributes"] )
+
 	def testUnconnectedInstanceInput( self ) :
 
 		plane = GafferScene.Plane()
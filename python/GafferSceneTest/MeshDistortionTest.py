@@ -34,6 +34,7 @@
 #
 ##########################################################################
 
+import random
 import unittest
 import imath
 
@@ -100,5 +101,55 @@ class MeshDistortionTest( GafferSceneTest.SceneTestCase ) :
 		self.assertNotIn( "uvDistortion", mesh )
 		self.assertIn( "D", mesh )
 
+	def testMatchesCortex( self ) :
+
+		# Enough faces to be split into several chunks by the
+		# parallel implementation.
+
+		plane = IECoreScene.MeshPrimitive.createPlane(
+			imath.Box2f( imath.V2f( -1 ), imath.V2f( 1 ) ),
+			imath.V2i( 120 )
+		)
+
+		random.seed( 0 )
+		plane["Pref"] = plane["P"]
+		plane["P"] = IECoreScene.PrimitiveVariable(
+			IECoreScene.PrimitiveVariable.Interpolation.Vertex,
+			IECore.V3fVectorData( [ p * imath.V3f( random.uniform( 0.5, 2 ), random.uniform( 0.5, 2 ), 1 ) for p in plane["P"].data ] )
+		)
+
+		uv = plane["uv"]
+		self.assertIsNotNone( uv.indices )
+		plane["unindexedUV"] = IECoreScene.PrimitiveVariable( uv.interpolation, uv.expandedData() )
+
+		objectToScene = GafferScene.ObjectToScene()
+		objectToScene["object"].setValue( plane )
+
+		f = GafferScene.PathFilter()
+		f["paths"].setValue( IECore.StringVectorData( [ "/object" ] ) )
+
+		meshDistortion = GafferScene.MeshDistortion()
+		meshDistortion["in"].setInput( objectToScene["out"] )
+		meshDistortion["filter"].setInput( f["out"] )
+
+		for parallel in ( True, False ) :
+			for uvSet in ( "uv", "unindexedUV" ) :
+
+				meshDistortion["parallel"].setValue( parallel )
+				meshDistortion["uvSet"].setValue( uvSet )
+
+				distortion, uvDistortion = IECoreScene.MeshAlgo.calculateDistortion( plane, uvSet, "Pref", "P" )
+
+				mesh = meshDistortion["out"].object( "/object" )
+				self.assertEqual( mesh["distortion"], distortion )
+				self.assertEqual( mesh["uvDistortion"], uvDistortion )
+
+	def testAffects( self ) :
+
+		meshDistortion = GafferScene.MeshDistortion()
+
+		for name in ( "position", "referencePosition", "uvSet", "distortion", "uvDistortion", "parallel" ) :
+			self.assertIn( meshDistortion["out"]["object"], meshDistortion.affects( meshDistortion[name] ) )
+
 if __name__ == "__main__":
 	unittest.main()
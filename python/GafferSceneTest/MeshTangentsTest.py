@@ -35,6 +35,7 @@
 ##########################################################################
 
 import os
+import random
 import unittest
 import imath
 
@@ -190,3 +191,46 @@ class MeshTangentsTest( GafferSceneTest.SceneTestCase ) :
 
 		for v in vTangent.data :
 			self.failUnless( v.equalWithAbsError( imath.V3f( 1, 0, 0 ), 0.000001 ) )
+
+	def testMatchesCortex( self ) :
+
+		# Enough faces to be split into several chunks by the
+		# parallel implementation.
+
+		mesh = IECoreScene.MeshPrimitive.createPlane( imath.Box2f( imath.V2f( -1 ), imath.V2f( 1 ) ), imath.V2i( 120 ) )
+		mesh = IECoreScene.MeshAlgo.triangulate( mesh )
+
+		random.seed( 0 )
+		mesh["P"] = IECoreScene.PrimitiveVariable(
+			IECoreScene.PrimitiveVariable.Interpolation.Vertex,
+			IECore.V3fVectorData( [ p + imath.V3f( 0, 0, random.uniform( -0.1, 0.1 ) ) for p in mesh["P"].data ], IECore.GeometricData.Interpretation.Point )
+		)
+
+		uv = mesh["uv"]
+		self.assertIsNotNone( uv.indices )
+		mesh["unindexedUV"] = IECoreScene.PrimitiveVariable( uv.interpolation, uv.expandedData() )
+		self.assertTrue( mesh.arePrimitiveVariablesValid() )
+
+		objectToScene = GafferScene.ObjectToScene()
+		objectToScene["object"].setValue( mesh )
+
+		pathFilter = GafferScene.PathFilter()
+		pathFilter["paths"].setValue( IECore.StringVectorData( [ "/object" ] ) )
+
+		meshTangents = GafferScene.MeshTangents()
+		meshTangents["in"].setInput( objectToScene["out"] )
+		meshTangents["filter"].setInput( pathFilter["out"] )
+
+		for parallel in ( True, False ) :
+			for uvSet in ( "uv", "unindexedUV" ) :
+				for orthogonal in ( True, False ) :
+
+					meshTangents["parallel"].setValue( parallel )
+					meshTangents["uvSet"].setValue( uvSet )
+					meshTangents["orthogonal"].setValue( orthogonal )
+
+					uTangent, vTangent = IECoreScene.MeshAlgo.calculateTangents( mesh, uvSet, orthogonal, "P" )
+
+					result = meshTangents["out"].object( "/object" )
+					self.assertEqual( result["uTangent"], uTangent )
+					self.assertEqual( result["vTangent"], vTangent )
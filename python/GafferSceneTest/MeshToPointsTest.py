@@ -35,6 +35,7 @@
 ##########################################################################
 
 import unittest
+import imath
 
 import IECore
 import IECoreScene
@@ -70,6 +71,34 @@ class MeshToPointsTest( GafferSceneTest.SceneTestCase ) :
 
 		self.assertEqual( points["type"].data.value, "particle" )
 
+	def testIndexedPrimitiveVariables( self ) :
+
+		mesh = IECoreScene.MeshPrimitive.createPlane( imath.Box2f( imath.V2f( -1 ), imath.V2f( 1 ) ), imath.V2i( 10 ) )
+		numVertices = mesh.variableSize( IECoreScene.PrimitiveVariable.Interpolation.Vertex )
+		mesh["indexed"] = IECoreScene.PrimitiveVariable(
+			IECoreScene.PrimitiveVariable.Interpolation.Vertex,
+			IECore.FloatVectorData( [ 1, 2 ] ),
+			IECore.IntVectorData( [ i % 2 for i in range( 0, numVertices ) ] )
+		)
+
+		objectToScene = GafferScene.ObjectToScene()
+		objectToScene["object"].setValue( mesh )
+
+		filter = GafferScene.PathFilter()
+		filter["paths"].setValue( IECore.StringVectorData( [ "/object" ] ) )
+
+		meshToPoints = GafferScene.MeshToPoints()
+		meshToPoints["in"].setInput( objectToScene["out"] )
+		meshToPoints["filter"].setInput( filter["out"] )
+
+		mesh = objectToScene["out"].object( "/object", _copy = False )
+		points = meshToPoints["out"].object( "/object", _copy = False )
+
+		self.assertTrue( points.arePrimitiveVariablesValid() )
+		self.assertEqual( points["indexed"], mesh["indexed"] )
+		self.assertTrue( points["indexed"].data.isSame( mesh["indexed"].data ) )
+		self.assertTrue( points["indexed"].indices.isSame( mesh["indexed"].indices ) )
+
 	def testNonPrimitiveObject( self ) :
 
 		c = GafferScene.Camera()
@@ -72,5 +72,24 @@ class OpenGLAttributesTest( GafferSceneTest.SceneTestCase ) :
 		self.assertTrue( "attributes1" not in s2["a"] )
 		self.assertEqual( s2["a"]["attributes"]["primitiveSolid"]["value"].getValue(), False )
 
+	def testLevelOfDetail( self ) :
+
+		p = GafferScene.Plane()
+
+		a = GafferScene.OpenGLAttributes()
+		a["in"].setInput( p["out"] )
+
+		a["attributes"]["lodVertexThreshold"]["enabled"].setValue( True )
+		a["attributes"]["lodVertexThreshold"]["value"].setValue( 1000 )
+		a["attributes"]["lodProxyPoints"]["enabled"].setValue( True )
+
+		self.assertEqual(
+			a["out"].attributes( "/plane" ),
+			IECore.CompoundObject( {
+				"gl:lod:vertexThreshold" : IECore.IntData( 1000 ),
+				"gl:lod:proxyPoints" : IECore.IntData( 100000 ),
+			} )
+		)
+
 if __name__ == "__main__":
 	unittest.main()
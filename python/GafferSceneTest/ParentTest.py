@@ -38,6 +38,7 @@ import imath
 
 import IECore
 
+import Gaffer
 import GafferScene
 import GafferSceneTest
 
@@ -318,5 +319,47 @@ class ParentTest( GafferSceneTest.SceneTestCase ) :
 		self.assertNotEqual( p["out"].setHash( "test" ), h )
 		self.assertEqual( p["out"].set( "test" ).value, IECore.PathMatcher( [ "/cube" ] ) )
 
+	def testBoundWithManyChildren( self ) :
+
+		plane = GafferScene.Plane()
+		plane["divisions"].setValue( imath.V2i( 49 ) )
+
+		sphere = GafferScene.Sphere()
+
+		instancer = GafferScene.Instancer()
+		instancer["in"].setInput( plane["out"] )
+		instancer["instances"].setInput( sphere["out"] )
+		instancer["parent"].setValue( "/plane" )
+
+		cube = GafferScene.Cube()
+
+		parent = GafferScene.Parent()
+		parent["in"].setInput( instancer["out"] )
+		parent["parent"].setValue( "/plane/instances/sphere" )
+		parent["child"].setInput( cube["out"] )
+
+		self.assertEqual( len( parent["out"].childNames( "/plane/instances/sphere" ) ), 2501 )
+
+		def unionOfChildBounds( path ) :
+
+			result = imath.Box3f()
+			for name in parent["out"].childNames( path ) :
+				childPath = path + "/" + str( name )
+				result.extendBy( parent["out"].bound( childPath ) * parent["out"].transform( childPath ) )
+			return result
+
+		self.assertEqual( parent["out"].bound( "/plane/instances/sphere" ), unionOfChildBounds( "/plane/instances/sphere" ) )
+		self.assertSceneValid( parent["out"] )
+
+		# Changing a single child should only require
+		# the chunk containing it to be recomputed.
+
+		cube["transform"]["translate"]["x"].setValue( 100 )
+		with Gaffer.PerformanceMonitor() as m :
+			bound = parent["out"].bound( "/plane/instances/sphere" )
+
+		self.assertEqual( bound, unionOfChildBounds( "/plane/instances/sphere" ) )
+		self.assertEqual( m.plugStatistics( parent["__childBounds"] ).computeCount, 1 )
+
 if __name__ == "__main__":
 	unittest.main()
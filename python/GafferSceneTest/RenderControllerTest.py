@@ -35,6 +35,7 @@
 ##########################################################################
 
 import unittest
+import imath
 
 import IECore
 
@@ -203,5 +204,78 @@ class RenderControllerTest( GafferSceneTest.SceneTestCase ) :
 			lightSet["out"].bound( "/" )
 		)
 
+	def testProcessQueueCommand( self ) :
+
+		sphere = GafferScene.Sphere()
+		group = GafferScene.Group()
+		group["in"][0].setInput( sphere["out"] )
+
+		renderer = GafferScene.Private.IECoreScenePreview.Renderer.create(
+			"OpenGL",
+			GafferScene.Private.IECoreScenePreview.Renderer.RenderType.Interactive
+		)
+		controller = GafferScene.RenderController( group["out"], Gaffer.Context(), renderer )
+		controller.setMinimumExpansionDepth( 2 )
+		controller.update()
+
+		self.assertGreater( renderer.command( "gl:processQueue", {} ).value, 0 )
+		self.assertEqual( renderer.command( "gl:processQueue", {} ).value, 0 )
+		self.assertEqual( renderer.command( "gl:queryBound", {} ), group["out"].bound( "/" ) )
+
+		sphere["transform"]["translate"]["x"].setValue( 1 )
+		controller.update()
+
+		self.assertGreater( renderer.command( "gl:processQueue", {} ).value, 0 )
+		self.assertEqual( renderer.command( "gl:queryBound", {} ), group["out"].bound( "/" ) )
+
+	def __translate( self, scene ) :
+
+		renderer = GafferScene.Private.IECoreScenePreview.Renderer.create(
+			"OpenGL",
+			GafferScene.Private.IECoreScenePreview.Renderer.RenderType.Interactive
+		)
+		controller = GafferScene.RenderController( scene, Gaffer.Context(), renderer )
+		controller.setMinimumExpansionDepth( 100000 )
+		controller.update()
+
+		self.assertGreater( renderer.command( "gl:processQueue", {} ).value, 0 )
+		self.assertEqual( renderer.command( "gl:queryBound", {} ), scene.bound( "/" ) )
+
+	def testDeepHierarchyPerformance( self ) :
+
+		sphere = GafferScene.Sphere()
+
+		groups = []
+		for i in range( 0, 100 ) :
+			group = GafferScene.Group()
+			group["in"][0].setInput( groups[-1]["out"] if groups else sphere["out"] )
+			group["in"][1].setInput( sphere["out"] )
+			group["transform"]["translate"]["x"].setValue( 1 )
+			groups.append( group )
+
+		self.__translate( groups[-1]["out"] )
+
+	def testWideInstancerPerformance( self ) :
+
+		plane = GafferScene.Plane()
+		plane["divisions"].setValue( imath.V2i( 250 ) )
+
+		sphere = GafferScene.Sphere()
+		sphere["radius"].setValue( 0.001 )
+
+		instancer = GafferScene.Instancer()
+		instancer["in"].setInput( plane["out"] )
+		instancer["instances"].setInput( sphere["out"] )
+		instancer["parent"].setValue( "/plane" )
+
+		self.__translate( instancer["out"] )
+
+	def testLargeMeshPerformance( self ) :
+
+		plane = GafferScene.Plane()
+		plane["divisions"].setValue( imath.V2i( 1000 ) )
+
+		self.__translate( plane["out"] )
+
 if __name__ == "__main__":
 	unittest.main()
@@ -36,8 +36,11 @@
 
 import unittest
 
+import imath
+
 import IECore
 
+import Gaffer
 import GafferScene
 import GafferSceneTest
 
@@ -75,6 +78,67 @@ class RendererAlgoTest( GafferSceneTest.SceneTestCase ) :
 		self.assertScenesEqual( defaultAdaptors["out"], defaultAdaptors2["out"] )
 		self.assertSceneHashesEqual( defaultAdaptors["out"], defaultAdaptors2["out"] )
 
+	def testTransformSamples( self ) :
+
+		sphere = GafferScene.Sphere()
+		sphere["transform"]["translate"]["y"].setValue( 1 )
+
+		with Gaffer.Context() as c :
+
+			c["scene:path"] = IECore.InternedStringVectorData( [ "sphere" ] )
+
+			# Static transforms should only be computed once,
+			# no matter how many segments are requested.
+
+			with Gaffer.PerformanceMonitor() as m :
+				samples, times = GafferScene.transformSamples( sphere["out"], 4, imath.V2f( 0.75, 1.25 ) )
+
+			self.assertEqual( samples, [ sphere["out"].transform( "/sphere" ) ] )
+			self.assertEqual( times, [] )
+			self.assertEqual( m.plugStatistics( sphere["out"]["transform"] ).computeCount, 1 )
+
+			# Animated transforms should be computed once per sample.
+
+			expression = Gaffer.Expression()
+			sphere.addChild( expression )
+			expression.setExpression( 'parent["transform"]["translate"]["x"] = context.getFrame()' )
+
+			with Gaffer.PerformanceMonitor() as m :
+				samples, times = GafferScene.transformSamples( sphere["out"], 4, imath.V2f( 0.75, 1.25 ) )
+
+			self.assertEqual( times, [ 0.75, 0.875, 1.0, 1.125, 1.25 ] )
+			self.assertEqual(
+				samples,
+				[ imath.M44f().translate( imath.V3f( t, 1, 0 ) ) for t in times ]
+			)
+			self.assertEqual( m.plugStatistics( sphere["out"]["transform"] ).computeCount, 5 )
+
+	def testObjectSamples( self ) :
+
+		sphere = GafferScene.Sphere()
+
+		with Gaffer.Context() as c :
+
+			c["scene:path"] = IECore.InternedStringVectorData( [ "sphere" ] )
+
+			with Gaffer.PerformanceMonitor() as m :
+				samples, times = GafferScene.objectSamples( sphere["out"], 2, imath.V2f( 0.75, 1.25 ) )
+
+			self.assertEqual( samples, [ sphere["out"].object( "/sphere" ) ] )
+			self.assertEqual( times, [] )
+			self.assertEqual( m.plugStatistics( sphere["out"]["object"] ).computeCount, 1 )
+
+			expression = Gaffer.Expression()
+			sphere.addChild( expression )
+			expression.setExpression( 'parent["radius"] = context.getFrame()' )
+
+			with Gaffer.PerformanceMonitor() as m :
+				samples, times = GafferScene.objectSamples( sphere["out"], 2, imath.V2f( 0.75, 1.25 ) )
+
+			self.assertEqual( times, [ 0.75, 1.0, 1.25 ] )
+			self.assertEqual( [ s.radius() for s in samples ], times )
+			self.assertEqual( m.plugStatistics( sphere["out"]["object"] ).computeCount, 3 )
+
 	def tearDown( self ) :
 
 		GafferSceneTest.SceneTestCase.tearDown( self )
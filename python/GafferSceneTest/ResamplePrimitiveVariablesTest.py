@@ -34,6 +34,7 @@
 #
 ##########################################################################
 
+import random
 import imath
 
 import IECore
@@ -118,6 +119,59 @@ class ResamplePrimitiveVariablesTest( GafferSceneTest.SceneTestCase ) :
 		self.assertEqual( IECoreScene.PrimitiveVariable.Interpolation.Vertex, actualObject["c"].interpolation )
 		self.assertEqual( actualObject["c"].data, IECore.FloatVectorData( [42, 42, 42, 42] ) )
 
+	def testMatchesCortex( self ) :
+
+		# Enough faces to be split into several chunks by the
+		# parallel implementation.
+
+		mesh = IECoreScene.MeshPrimitive.createPlane( imath.Box2f( imath.V2f( -1 ), imath.V2f( 1 ) ), imath.V2i( 120 ) )
+
+		random.seed( 0 )
+		def primitiveVariable( interpolation ) :
+			n = mesh.variableSize( interpolation )
+			return IECoreScene.PrimitiveVariable(
+				interpolation,
+				IECore.V3fVectorData( [ imath.V3f( random.random(), random.random(), random.random() ) for i in range( 0, n ) ] )
+			)
+
+		mesh["uniform"] = primitiveVariable( IECoreScene.PrimitiveVariable.Interpolation.Uniform )
+		mesh["vertex"] = primitiveVariable( IECoreScene.PrimitiveVariable.Interpolation.Vertex )
+		mesh["varying"] = primitiveVariable( IECoreScene.PrimitiveVariable.Interpolation.Varying )
+		mesh["faceVarying"] = primitiveVariable( IECoreScene.PrimitiveVariable.Interpolation.FaceVarying )
+		mesh["constant"] = IECoreScene.PrimitiveVariable( IECoreScene.PrimitiveVariable.Interpolation.Constant, IECore.FloatData( 1 ) )
+		self.assertTrue( mesh.arePrimitiveVariablesValid() )
+
+		objectToScene = GafferScene.ObjectToScene()
+		objectToScene["object"].setValue( mesh )
+
+		pathFilter = GafferScene.PathFilter()
+		pathFilter["paths"].setValue( IECore.StringVectorData( [ "/object" ] ) )
+
+		names = [ "uniform", "vertex", "varying", "faceVarying", "constant", "uv" ]
+
+		resample = GafferScene.ResamplePrimitiveVariables()
+		resample["in"].setInput( objectToScene["out"] )
+		resample["filter"].setInput( pathFilter["out"] )
+		resample["names"].setValue( " ".join( names ) )
+
+		for parallel in ( True, False ) :
+			for interpolation in (
+				IECoreScene.PrimitiveVariable.Interpolation.Constant,
+				IECoreScene.PrimitiveVariable.Interpolation.Uniform,
+				IECoreScene.PrimitiveVariable.Interpolation.Vertex,
+				IECoreScene.PrimitiveVariable.Interpolation.Varying,
+				IECoreScene.PrimitiveVariable.Interpolation.FaceVarying,
+			) :
+
+				resample["parallel"].setValue( parallel )
+				resample["interpolation"].setValue( interpolation )
+				result = resample["out"].object( "/object" )
+
+				for name in names :
+					expected = mesh[name]
+					IECoreScene.MeshAlgo.resamplePrimitiveVariable( mesh, expected, interpolation )
+					self.assertEqual( result[name], expected )
+
 	def testInvalidPrimitiveThrowsException(self):
 
 		nurbsPrimitive = IECoreScene.NURBSPrimitive()
@@ -209,5 +209,32 @@ class ScenePathTest( GafferSceneTest.SceneTestCase ) :
 		path.setFilter( GafferScene.ScenePath.createStandardFilter( [ "__cameras" ] ) )
 		self.assertEqual( { str( c ) for c in path.children() }, { "/camera" } )
 
+	def testCancellationSubject( self ) :
+
+		plane = GafferScene.Plane()
+		path = GafferScene.ScenePath( plane["out"], Gaffer.Context(), "/" )
+		self.assertTrue( path.cancellationSubject().isSame( plane["out"] ) )
+
+		self.assertIsNone( Gaffer.DictPath( {}, "/" ).cancellationSubject() )
+
+	def testCopyForBackgroundUse( self ) :
+
+		plane = GafferScene.Plane()
+		context = Gaffer.Context()
+		context.setFrame( 10 )
+
+		path = GafferScene.ScenePath( plane["out"], context, "/" )
+		pathCopy = path.copyForBackgroundUse()
+		self.assertIsInstance( pathCopy, GafferScene.ScenePath )
+		self.assertEqual( pathCopy, path )
+		self.assertTrue( pathCopy.getScene().isSame( plane["out"] ) )
+		self.assertFalse( pathCopy.getContext().isSame( context ) )
+		self.assertEqual( pathCopy.getContext().getFrame(), 10 )
+
+		# The copy must be unaffected by edits to the original context.
+		context.setFrame( 20 )
+		self.assertEqual( pathCopy.getContext().getFrame(), 10 )
+		self.assertEqual( [ str( c ) for c in pathCopy.children() ], [ "/plane" ] )
+
 if __name__ == "__main__":
 	unittest.main()
@@ -237,5 +237,147 @@ class ScenePlugTest( GafferSceneTest.SceneTestCase ) :
 		self.assertEqual( p.globalsHash(), p["globals"].hash() )
 		self.assertEqual( p.setNamesHash(), p["setNames"].hash() )
 
+	def testFullTransformAndAttributes( self ) :
+
+		sphere = GafferScene.Sphere()
+
+		groups = []
+		for i in range( 0, 16 ) :
+			group = GafferScene.Group()
+			group["in"][0].setInput( groups[-1]["out"] if groups else sphere["out"] )
+			group["transform"]["translate"]["x"].setValue( i + 1 )
+			group["transform"]["rotate"]["y"].setValue( i * 10 )
+			groups.append( group )
+
+		filter1 = GafferScene.PathFilter()
+		filter1["paths"].setValue( IECore.StringVectorData( [ "/group" ] ) )
+
+		attributes1 = GafferScene.CustomAttributes()
+		attributes1["in"].setInput( groups[-1]["out"] )
+		attributes1["filter"].setInput( filter1["out"] )
+		attributes1["attributes"].addMember( "test:a", IECore.IntData( 1 ) )
+		attributes1["attributes"].addMember( "test:b", IECore.IntData( 1 ) )
+
+		filter2 = GafferScene.PathFilter()
+		filter2["paths"].setValue( IECore.StringVectorData( [ "/group/group/group" ] ) )
+
+		attributes2 = GafferScene.CustomAttributes()
+		attributes2["in"].setInput( attributes1["out"] )
+		attributes2["filter"].setInput( filter2["out"] )
+		attributes2["attributes"].addMember( "test:b", IECore.IntData( 2 ) )
+
+		# Constraints cache the full transforms and attributes of their
+		# input, whereas the output of the CustomAttributes node computes
+		# them by traversing to the root.
+		constraint = GafferScene.ParentConstraint()
+		constraint["in"].setInput( attributes2["out"] )
+		plug = constraint["in"]
+
+		path = "/group" * 16 + "/sphere"
+		self.assertEqual(
+			plug.fullTransform( path ),
+			attributes2["out"].fullTransform( path )
+		)
+
+		scenePath = GafferScene.ScenePlug.stringToPath( path )
+		expected = imath.M44f()
+		while scenePath :
+			expected = expected * attributes2["out"].transform( scenePath )
+			scenePath = scenePath[:-1]
+		self.assertEqual( plug.fullTransform( path ), expected )
+
+		for p in [ "/group", "/group/group", "/group/group/group", path ] :
+			attributes = plug.fullAttributes( p )
+			self.assertEqual( attributes, attributes2["out"].fullAttributes( p ) )
+			self.assertEqual( attributes["test:a"], IECore.IntData( 1 ) )
+			self.assertEqual( attributes["test:b"], IECore.IntData( 2 if p.count( "/" ) >= 3 else 1 ) )
+
+		# Changing an ancestor must change the hashes and values
+		# for all descendants.
+
+		transformHash = plug.fullTransformHash( path )
+		attributesHash = plug.fullAttributesHash( path )
+
+		groups[-1]["transform"]["translate"]["y"].setValue( 10 )
+		attributes1["attributes"][0]["value"].setValue( 3 )
+
+		self.assertNotEqual( plug.fullTransformHash( path ), transformHash )
+		self.assertNotEqual( plug.fullAttributesHash( path ), attributesHash )
+		self.assertEqual(
+			plug.fullTransform( path ),
+			attributes2["out"].fullTransform( path )
+		)
+		self.assertEqual( plug.fullAttributes( path )["test:a"], IECore.IntData( 3 ) )
+
+		# Nodes caching the same scene should share the hashes
+		# of the full transform and attributes.
+
+		constraint2 = GafferScene.AimConstraint()
+		constraint2["in"].setInput( attributes2["out"] )
+
+		self.assertEqual( constraint2["in"].fullTransformHash( path ), plug.fullTransformHash( path ) )
+		self.assertEqual( constraint2["in"].fullAttributesHash( path ), plug.fullAttributesHash( path ) )
+
+		# And nodes which don't opt in shouldn't pay for the
+		# internal plugs.
+
+		self.assertNotIn( "__fullTransform", attributes2 )
+		self.assertIn( "__fullTransform", constraint )
+
+	def testFullTransformAndAttributesIgnoreRoot( self ) :
+
+		# The root location doesn't contribute to the full transform
+		# and attributes, whether or not they are cached, even if the
+		# source specifies a transform and attributes for it.
+
+		rootTransform = imath.M44f().translate( imath.V3f( 1, 2, 3 ) )
+		childTransform = imath.M44f().translate( imath.V3f( 0, 10, 0 ) )
+
+		source = GafferSceneTest.CompoundObjectSource()
+		source["in"].setValue(
+			IECore.CompoundObject( {
+				"bound" : IECore.Box3fData( imath.Box3f( imath.V3f( -1 ), imath.V3f( 1 ) ) ),
+				"transform" : IECore.M44fData( rootTransform ),
+				"attributes" : IECore.CompoundObject( { "test:root" : IECore.IntData( 1 ) } ),
+				"children" : {
+					"child" : {
+						"bound" : IECore.Box3fData( imath.Box3f( imath.V3f( -1 ), imath.V3f( 1 ) ) ),
+						"transform" : IECore.M44fData( childTransform ),
+						"attributes" : IECore.CompoundObject( { "test:child" : IECore.IntData( 2 ) } ),
+					},
+				},
+			} )
+		)
+
+		constraint = GafferScene.ParentConstraint()
+		constraint["in"].setInput( source["out"] )
+
+		for plug in ( source["out"], constraint["in"] ) :
+
+			self.assertEqual( plug.fullTransform( "/" ), imath.M44f() )
+			self.assertEqual( plug.fullAttributes( "/" ), IECore.CompoundObject() )
+
+			self.assertEqual( plug.fullTransform( "/child" ), childTransform )
+			self.assertEqual(
+				plug.fullAttributes( "/child" ),
+				IECore.CompoundObject( { "test:child" : IECore.IntData( 2 ) } )
+			)
+
+		# Root hashes are constant, so are unaffected by edits.
+
+		transformHash = constraint["in"].fullTransformHash( "/" )
+		attributesHash = constraint["in"].fullAttributesHash( "/" )
+
+		source["in"].setValue(
+			IECore.CompoundObject( {
+				"bound" : IECore.Box3fData( imath.Box3f( imath.V3f( -1 ), imath.V3f( 1 ) ) ),
+				"transform" : IECore.M44fData( imath.M44f().translate( imath.V3f( 4, 5, 6 ) ) ),
+				"attributes" : IECore.CompoundObject( { "test:root" : IECore.IntData( 3 ) } ),
+			} )
+		)
+
+		self.assertEqual( constraint["in"].fullTransformHash( "/" ), transformHash )
+		self.assertEqual( constraint["in"].fullAttributesHash( "/" ), attributesHash )
+
 if __name__ == "__main__":
 	unittest.main()
@@ -533,5 +533,150 @@ class SceneReaderTest( GafferSceneTest.SceneTestCase ) :
 			sceneReader["refreshCount"].setValue( sceneReader["refreshCount"].getValue() + 1 )
 			GafferSceneTest.traverseScene( sceneReader["out"] )
 
+	def testSceneCache( self ) :
+
+		fileName = self.temporaryDirectory() + "/test.scc"
+
+		def writeHierarchy( offset ) :
+
+			def walk( scene, depth ) :
+
+				if depth == 0 :
+					return
+
+				for i in range( 0, 3 ) :
+					child = scene.createChild( "child%d" % i )
+					child.writeTransform( IECore.M44dData( imath.M44d().translate( imath.V3d( i + offset, depth, 0 ) ) ), 0 )
+					walk( child, depth - 1 )
+
+			root = IECoreScene.SceneCache( fileName, IECore.IndexedIO.OpenMode.Write )
+			walk( root, 4 )
+
+		writeHierarchy( 0 )
+
+		reader = GafferScene.SceneReader()
+		reader["fileName"].setValue( fileName )
+
+		lookups = GafferScene.SceneReader.sceneCacheLookups()
+		hits = GafferScene.SceneReader.sceneCacheHits()
+
+		self.assertSceneValid( reader["out"] )
+		self.assertEqual(
+			reader["out"].transform( "/child2/child1/child0/child2" ),
+			imath.M44f().translate( imath.V3f( 2, 1, 0 ) )
+		)
+
+		self.assertGreater( GafferScene.SceneReader.sceneCacheLookups(), lookups )
+		self.assertGreater( GafferScene.SceneReader.sceneCacheHits(), hits )
+
+		# Refreshing must discard cached entries for the old file.
+
+		writeHierarchy( 10 )
+		reader["refreshCount"].setValue( reader["refreshCount"].getValue() + 1 )
+
+		self.assertEqual(
+			reader["out"].transform( "/child2/child1/child0/child2" ),
+			imath.M44f().translate( imath.V3f( 12, 1, 0 ) )
+		)
+
+	def testSceneCacheEviction( self ) :
+
+		# Write more locations than are cached per file, so
+		# that some must be evicted and read again.
+
+		fileName = self.temporaryDirectory() + "/test.scc"
+		root = IECoreScene.SceneCache( fileName, IECore.IndexedIO.OpenMode.Write )
+		for i in range( 0, 120 ) :
+			child = root.createChild( "child%d" % i )
+			for j in range( 0, 100 ) :
+				grandChild = child.createChild( "grandChild%d" % j )
+				grandChild.writeTransform( IECore.M44dData( imath.M44d().translate( imath.V3d( i, j, 0 ) ) ), 0 )
+		del root, child, grandChild
+
+		reader = GafferScene.SceneReader()
+		reader["fileName"].setValue( fileName )
+
+		for i in range( 0, 2 ) :
+			reader["refreshCount"].setValue( i + 1 )
+			GafferSceneTest.traverseScene( reader["out"] )
+			for path, translate in [
+				( "/child0/grandChild0", imath.V3f( 0 ) ),
+				( "/child119/grandChild99", imath.V3f( 119, 99, 0 ) ),
+				( "/child60/grandChild1", imath.V3f( 60, 1, 0 ) ),
+			] :
+				self.assertEqual( reader["out"].transform( path ), imath.M44f().translate( translate ) )
+
+	def testPreload( self ) :
+
+		for fileName, animated in [ ( "animatedCube.abc", True ), ( "groupedPlane.abc", False ) ] :
+
+			reader = GafferScene.SceneReader()
+			reader["fileName"].setValue( os.path.dirname( __file__ ) + "/alembicFiles/" + fileName )
+			reader["transform"]["translate"].setValue( imath.V3f( 1, 2, 3 ) )
+
+			preloadingReader = GafferScene.SceneReader()
+			preloadingReader["fileName"].setInput( reader["fileName"] )
+			preloadingReader["transform"].setInput( reader["transform"] )
+			preloadingReader["preload"].setValue( True )
+
+			# Clear the caches, so we know exactly what must be loaded.
+			reader["refreshCount"].setValue( reader["refreshCount"].getValue() + 1 )
+
+			builds = GafferScene.SceneReader.preloadBuilds()
+			hits = GafferScene.SceneReader.preloadHits()
+
+			with Gaffer.Context() as c :
+				for frame in range( 0, 4 ) :
+					c.setFrame( frame )
+					self.assertScenesEqual( preloadingReader["out"], reader["out"] )
+					self.assertSceneHashesEqual( preloadingReader["out"], reader["out"] )
+
+			# The queries must have been answered from the preloaded
+			# file, and a file without animation should only be loaded
+			# once for all frames.
+			self.assertGreater( GafferScene.SceneReader.preloadHits(), hits )
+			self.assertEqual( GafferScene.SceneReader.preloadBuilds() - builds, 4 if animated else 1 )
+
+	def testConcurrentPreloads( self ) :
+
+		# Many files are preloaded concurrently, from threads which are
+		# also running the parallel loads of other files. There are more
+		# files than there are mutexes used to serialise the loading, so
+		# some files must share a mutex.
+
+		numFiles = 40
+		script = Gaffer.ScriptNode()
+		script["group"] = GafferScene.Group()
+		for i in range( 0, numFiles ) :
+
+			fileName = self.temporaryDirectory() + "/test%d.scc" % i
+			root = IECoreScene.SceneCache( fileName, IECore.IndexedIO.OpenMode.Write )
+			for j in range( 0, 20 ) :
+				child = root.createChild( "child%d" % j )
+				child.writeTransform( IECore.M44dData( imath.M44d().translate( imath.V3d( i, j, 0 ) ) ), 0 )
+				for k in range( 0, 20 ) :
+					child.createChild( "grandChild%d" % k )
+			del root, child
+
+			script["reader%d" % i] = GafferScene.SceneReader()
+			script["reader%d" % i]["fileName"].setValue( fileName )
+			script["reader%d" % i]["preload"].setValue( True )
+			script["group"]["in"][i].setInput( script["reader%d" % i]["out"] )
+
+		for i in range( 0, 5 ) :
+
+			# Clear the caches, so that every file must be loaded again.
+			for j in range( 0, numFiles ) :
+				script["reader%d" % j]["refreshCount"].setValue( i + 1 )
+
+			builds = GafferScene.SceneReader.preloadBuilds()
+			GafferSceneTest.traverseScene( script["group"]["out"] )
+			self.assertEqual( GafferScene.SceneReader.preloadBuilds() - builds, numFiles )
+
+		self.assertEqual(
+			script["group"]["out"].transform( "/group/child19" ),
+			imath.M44f().translate( imath.V3f( 0, 19, 0 ) )
+		)
+
 if __name__ == "__main__":
 	unittest.main()
@@ -37,11 +37,13 @@
 
 import unittest
 import threading
+import imath
 
 import IECore
 import IECoreScene
 
 import Gaffer
+import GafferImage
 import GafferScene
 import GafferSceneTest
 
@@ -224,5 +226,79 @@ class SeedsTest( GafferSceneTest.SceneTestCase ) :
 		primitiveVariables["primitiveVariables"].addMember( "d", IECore.FloatData( 0.5 ) )
 		self.assertLessEqual( seeds["out"].object( "/plane/seeds" ).numPoints, p.numPoints )
 
+	def testDensityImage( self ) :
+
+		plane = GafferScene.Plane()
+
+		seeds = GafferScene.Seeds()
+		seeds["in"].setInput( plane["out"] )
+		seeds["parent"].setValue( "/plane" )
+		seeds["density"].setValue( 100 )
+
+		points = seeds["out"].object( "/plane/seeds" )
+		self.assertGreater( points.numPoints, 0 )
+
+		image = GafferImage.Constant()
+		image["color"].setValue( imath.Color4f( 1, 0, 0, 1 ) )
+		seeds["densityImage"].setInput( image["out"] )
+
+		self.assertEqual( seeds["out"].object( "/plane/seeds" ), points )
+		self.assertNotIn( "__seedsDensityImage", seeds["out"].object( "/plane/seeds" ).keys() )
+
+		image["color"]["r"].setValue( 0 )
+		self.assertEqual( seeds["out"].object( "/plane/seeds" ).numPoints, 0 )
+
+		seeds["densityImageChannel"].setValue( "A" )
+		self.assertEqual( seeds["out"].object( "/plane/seeds" ), points )
+
+		seeds["densityImageChannel"].setValue( "Z" )
+		self.assertRaisesRegexp( RuntimeError, 'Density image has no channel named "Z"', seeds["out"].object, "/plane/seeds" )
+
+	def testAffectsDensityImage( self ) :
+
+		s = GafferScene.Seeds()
+		self.assertIn( s["out"]["object"], s.affects( s["densityImage"]["channelData"] ) )
+		self.assertIn( s["out"]["object"], s.affects( s["densityImageChannel"] ) )
+
+	def testChunkedDistribution( self ) :
+
+		# Enough faces to be divided into several chunks
+		# for parallel processing.
+		plane = GafferScene.Plane()
+		plane["divisions"].setValue( imath.V2i( 250 ) )
+
+		seeds = GafferScene.Seeds()
+		seeds["in"].setInput( plane["out"] )
+		seeds["parent"].setValue( "/plane" )
+		seeds["density"].setValue( 100000 )
+
+		points = seeds["out"].object( "/plane/seeds" )
+		self.assertTrue( points.arePrimitiveVariablesValid() )
+		self.assertAlmostEqual( points.numPoints, 100000, delta = 5000 )
+		for p in points["P"].data :
+			self.assertTrue( plane["out"].bound( "/plane" ).intersects( p ) )
+
+		# Results should be identical when recomputed, regardless of
+		# how the work was scheduled.
+
+		Gaffer.ValuePlug.clearCache()
+		self.assertEqual( seeds["out"].object( "/plane/seeds" ), points )
+
+	def testLargeMesh( self ) :
+
+		plane = GafferScene.Plane()
+		plane["divisions"].setValue( imath.V2i( 1000 ) )
+
+		seeds = GafferScene.Seeds()
+		seeds["in"].setInput( plane["out"] )
+		seeds["parent"].setValue( "/plane" )
+		seeds["density"].setValue( 1000000 )
+
+		# The plane has unit area, so we expect roughly one point per face.
+
+		points = seeds["out"].object( "/plane/seeds" )
+		self.assertAlmostEqual( points.numPoints, 1000000, delta = 50000 )
+		self.assertTrue( points.arePrimitiveVariablesValid() )
+
 if __name__ == "__main__":
 	unittest.main()
@@ -159,6 +159,53 @@ class SetAlgoTest( GafferSceneTest.SceneTestCase ) :
 		self.assertCorrectEvaluation( setA["out"], "MySets:setA.set", [ "/MyObject:sphere1.model" ] )
 		self.assertCorrectEvaluation( setA["out"], "/MyObject:sphere1.model", [ "/MyObject:sphere1.model" ] )
 
+	def testRepeatedSetNames( self ) :
+
+		sphere = GafferScene.Sphere()
+
+		setA = GafferScene.Set()
+		setA["in"].setInput( sphere["out"] )
+		setA["name"].setValue( "setA" )
+		setA["paths"].setValue( IECore.StringVectorData( [ "/sphere" ] ) )
+
+		setB = GafferScene.Set()
+		setB["in"].setInput( setA["out"] )
+		setB["name"].setValue( "setB" )
+		setB["paths"].setValue( IECore.StringVectorData( [ "/sphere", "/cube" ] ) )
+
+		self.assertCorrectEvaluation( setB["out"], "setA setA", [ "/sphere" ] )
+		self.assertCorrectEvaluation( setB["out"], "setA & setA", [ "/sphere" ] )
+		self.assertCorrectEvaluation( setB["out"], "setA - setA", [] )
+		self.assertCorrectEvaluation( setB["out"], "setB - setA", [ "/cube" ] )
+		self.assertCorrectEvaluation( setB["out"], "setB - ( setA & setB ) | setA", [ "/sphere", "/cube" ] )
+
+	def testCachedExpressions( self ) :
+
+		setA = GafferScene.Set()
+		setA["name"].setValue( "setA" )
+		setA["paths"].setValue( IECore.StringVectorData( [ "/sphere" ] ) )
+
+		# Evaluating the same expression repeatedly must reflect
+		# changes to the scene, even though the parsed expression
+		# is reused.
+
+		self.assertCorrectEvaluation( setA["out"], "setA", [ "/sphere" ] )
+		h = GafferScene.SetAlgo.setExpressionHash( "setA", setA["out"] )
+
+		setA["paths"].setValue( IECore.StringVectorData( [ "/cube" ] ) )
+		self.assertCorrectEvaluation( setA["out"], "setA", [ "/cube" ] )
+		self.assertNotEqual( GafferScene.SetAlgo.setExpressionHash( "setA", setA["out"] ), h )
+
+		# And syntax errors must be reported every time, not just the first.
+
+		for i in range( 0, 2 ) :
+
+			with self.assertRaisesRegexp( RuntimeError, "Syntax error" ) :
+				GafferScene.SetAlgo.evaluateSetExpression( "setA - (", setA["out"] )
+
+			with self.assertRaisesRegexp( RuntimeError, "Syntax error" ) :
+				GafferScene.SetAlgo.setExpressionHash( "setA - (", setA["out"] )
+
 	def assertCorrectEvaluation( self, scenePlug, expression, expectedContents ) :
 
 		result = set( GafferScene.SetAlgo.evaluateSetExpression( expression, scenePlug ).paths() )
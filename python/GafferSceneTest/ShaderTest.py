@@ -252,6 +252,56 @@ class ShaderTest( GafferSceneTest.SceneTestCase ) :
 					[ network.Connection( network.Parameter( "n{0}".format( effectiveIndex + 1 ), "", ), network.Parameter( "n3", "c" ) ) ]
 				)
 
+	def testUnchangedShadersAreNotRecomputed( self ) :
+
+		n1 = GafferSceneTest.TestShader( "n1" )
+		n2 = GafferSceneTest.TestShader( "n2" )
+		n2["type"].setValue( "test:shader" )
+		n3 = GafferSceneTest.TestShader( "n3" )
+		n3["type"].setValue( "test:surface" )
+
+		n2["parameters"]["c"].setInput( n1["out"] )
+		n3["parameters"]["c"].setInput( n2["out"] )
+
+		network = n3.attributes()["test:surface"]
+		self.assertEqual( len( network ), 3 )
+
+		# Editing the parameters of one shader should only require
+		# that shader to be recomputed. The others should be reused
+		# from the cache.
+
+		n3["parameters"]["i"].setValue( 10 )
+		with Gaffer.PerformanceMonitor() as m :
+			network = n3.attributes()["test:surface"]
+
+		self.assertEqual( network.getShader( "n3" ).parameters["i"].value, 10 )
+		self.assertEqual( m.plugStatistics( n3["__outShader"] ).computeCount, 1 )
+		self.assertEqual( m.plugStatistics( n2["__outShader"] ).computeCount, 0 )
+		self.assertEqual( m.plugStatistics( n1["__outShader"] ).computeCount, 0 )
+
+		n1["parameters"]["i"].setValue( 20 )
+		with Gaffer.PerformanceMonitor() as m :
+			network = n3.attributes()["test:surface"]
+
+		self.assertEqual( network.getShader( "n1" ).parameters["i"].value, 20 )
+		self.assertEqual( m.plugStatistics( n3["__outShader"] ).computeCount, 0 )
+		self.assertEqual( m.plugStatistics( n2["__outShader"] ).computeCount, 0 )
+		self.assertEqual( m.plugStatistics( n1["__outShader"] ).computeCount, 1 )
+
+		# And the network should still be complete, with the correct types,
+		# including a default type for the untyped shader.
+
+		self.assertEqual( network.getShader( "n3" ).type, "test:surface" )
+		self.assertEqual( network.getShader( "n2" ).type, "test:shader" )
+		self.assertEqual( network.getShader( "n1" ).type, "shader" )
+		self.assertEqual( network.inputConnections( "n3" ), [ ( ( "n2", "" ), ( "n3", "c" ) ) ] )
+		self.assertEqual( network.inputConnections( "n2" ), [ ( ( "n1", "" ), ( "n2", "c" ) ) ] )
+
+		# Connected parameters must not have values, even though the
+		# per-shader results are computed without the connections.
+
+		self.assertNotIn( "c", network.getShader( "n3" ).parameters )
+
 	def testComponentToComponentConnections( self ) :
 
 		n1 = GafferSceneTest.TestShader( "n1" )
@@ -141,5 +141,59 @@ class WireframeTest( GafferSceneTest.SceneTestCase ) :
 		with self.assertRaisesRegexp( RuntimeError, ".* \"constantV3f\" must have Vertex, Varying or FaceVarying interpolation" ) :
 			wireframe["out"].object( "/plane" )
 
+	def testMatchesSerialImplementation( self ) :
+
+		sphere = GafferScene.Sphere()
+		sphere["divisions"].setValue( imath.V2i( 50, 100 ) )
+
+		filter = GafferScene.PathFilter()
+		filter["paths"].setValue( IECore.StringVectorData( [ "/sphere" ] ) )
+
+		wireframe = GafferScene.Wireframe()
+		wireframe["in"].setInput( sphere["out"] )
+		wireframe["filter"].setInput( filter["out"] )
+
+		mesh = sphere["out"].object( "/sphere" )
+		p = mesh["P"].data
+		vertexIds = mesh.vertexIds
+
+		expectedP = IECore.V3fVectorData( [], IECore.GeometricData.Interpretation.Point )
+		visited = set()
+		offset = 0
+		for numVertices in mesh.verticesPerFace :
+			for i in range( 0, numVertices ) :
+				index0 = vertexIds[offset + i]
+				index1 = vertexIds[offset + ( i + 1 ) % numVertices]
+				edge = ( min( index0, index1 ), max( index0, index1 ) )
+				if edge not in visited :
+					visited.add( edge )
+					expectedP.append( p[index0] )
+					expectedP.append( p[index1] )
+			offset += numVertices
+
+		curves = wireframe["out"].object( "/sphere" )
+		self.assertEqual( len( curves.verticesPerCurve() ), len( visited ) )
+		self.assertEqual( curves["P"].data, expectedP )
+
+	def testLargeMesh( self ) :
+
+		plane = GafferScene.Plane()
+		plane["divisions"].setValue( imath.V2i( 1000 ) )
+
+		filter = GafferScene.PathFilter()
+		filter["paths"].setValue( IECore.StringVectorData( [ "/plane" ] ) )
+
+		wireframe = GafferScene.Wireframe()
+		wireframe["in"].setInput( plane["out"] )
+		wireframe["filter"].setInput( filter["out"] )
+
+		# Each edge is shared by up to two faces, but should only be
+		# output once.
+
+		curves = wireframe["out"].object( "/plane" )
+		self.assertEqual( curves.numCurves(), 2 * 1000 * 1001 )
+		self.assertEqual( curves.verticesPerCurve(), IECore.IntVectorData( [ 2 ] * curves.numCurves() ) )
+		self.assertEqual( len( curves["P"].data ), 2 * curves.numCurves() )
+
 if __name__ == "__main__":
 	unittest.main()
@@ -59,6 +59,15 @@ Gaffer.Metadata.registerNode(
 			"""
 			Invert the condition used to delete curves. If the primvar is zero then the curve will be deleted. 
 			"""
+		],
+
+		"parallel" : [
+			"description",
+			"""
+			Processes large curves primitives using multiple threads. The result is
+			identical either way, but turning this off may reduce overhead when
+			many small curves primitives are being processed at once.
+			"""
 		]
 
 	}
@@ -59,6 +59,14 @@ Gaffer.Metadata.registerNode(
 			"""
 			Invert the condition used to delete faces. If the primvar is zero then the face will be deleted. 
 			"""
+		],
+		"parallel" : [
+			"description",
+			"""
+			Processes large meshes using multiple threads. The result is
+			identical either way, but turning this off may reduce overhead when
+			many small meshes are being processed at once.
+			"""
 		]
 	}
 
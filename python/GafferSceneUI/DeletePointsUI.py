@@ -59,6 +59,14 @@ Gaffer.Metadata.registerNode(
 			"""
 			Invert the condition used to delete points. If the primvar is zero then the point will be deleted. 
 			"""
+		],
+		"parallel" : [
+			"description",
+			"""
+			Processes large points primitives using multiple threads. The result is
+			identical either way, but turning this off may reduce overhead when
+			many small points primitives are being processed at once.
+			"""
 		]
 	}
 
@@ -172,6 +172,22 @@ Gaffer.Metadata.registerNode(
 
 		],
 
+		"encapsulateInstanceGroups" : [
+
+			"description",
+			"""
+			Converts each group of instances into a capsule, which won't
+			be expanded until it is sent to the renderer. Each object in
+			a prototype is then sent to the renderer just once, along with
+			the transforms and attributes of all its instances, allowing
+			the renderer to instance it rather than copy it. This is much
+			more efficient for large numbers of instances, at the expense
+			of not being able to view or edit the individual instances in
+			Gaffer.
+			""",
+
+		],
+
 	}
 
 )
@@ -104,6 +104,17 @@ Gaffer.Metadata.registerNode(
 
 		],
 
+		"parallel" : [
+
+			"description",
+			"""
+			Calculates the distortion of large meshes using multiple threads.
+			The result is identical either way, but turning this off may reduce
+			overhead when many small meshes are being processed at once.
+			""",
+
+		],
+
 	}
 
 )
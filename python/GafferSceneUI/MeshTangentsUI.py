@@ -81,6 +81,14 @@ Gaffer.Metadata.registerNode(
 			"""
 			Name of the primitive variable which will contain the vTangent data. 
 			""",
+		],
+		"parallel" : [
+			"description",
+			"""
+			Calculates the tangents for large meshes using multiple threads. The
+			result is identical either way, but turning this off may reduce overhead
+			when many small meshes are being processed at once.
+			""",
 		]
 	}
 
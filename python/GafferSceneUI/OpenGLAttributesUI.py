@@ -90,6 +90,16 @@ def __curvesPrimitivesSummary( plug ) :
 
 	return ", ".join( info )
 
+def __levelOfDetailSummary( plug ) :
+
+	info = []
+	if plug["lodVertexThreshold"]["enabled"].getValue() :
+		info.append( "Threshold %d" % plug["lodVertexThreshold"]["value"].getValue() )
+	if plug["lodProxyPoints"]["enabled"].getValue() :
+		info.append( "Proxy Points %d" % plug["lodProxyPoints"]["value"].getValue() )
+
+	return ", ".join( info )
+
 Gaffer.Metadata.registerNode(
 
 	GafferScene.OpenGLAttributes,
@@ -109,6 +119,7 @@ Gaffer.Metadata.registerNode(
 			"layout:section:Drawing:summary", __drawingSummary,
 			"layout:section:Points Primitives:summary", __pointsPrimitivesSummary,
 			"layout:section:Curves Primitives:summary", __curvesPrimitivesSummary,
+			"layout:section:Level Of Detail:summary", __levelOfDetailSummary,
 
 		],
 
@@ -362,6 +373,36 @@ Gaffer.Metadata.registerNode(
 
 		],
 
+		# Level of detail plugs
+
+		"attributes.lodVertexThreshold" : [
+
+			"description",
+			"""
+			Meshes with more vertices than this are drawn in the
+			viewer using a lightweight point-sampled proxy, unless
+			they are selected. A value of 0 disables the use of
+			proxies.
+			""",
+
+			"layout:section", "Level Of Detail",
+			"label", "Vertex Threshold",
+
+		],
+
+		"attributes.lodProxyPoints" : [
+
+			"description",
+			"""
+			The approximate number of points used to draw the
+			proxy for a mesh that exceeds the vertex threshold.
+			""",
+
+			"layout:section", "Level Of Detail",
+			"label", "Proxy Points",
+
+		],
+
 	}
 
 )
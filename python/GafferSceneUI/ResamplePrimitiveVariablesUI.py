@@ -181,6 +181,15 @@ Gaffer.Metadata.registerNode(
 
 			"plugValueWidget:type", "GafferUI.PresetsPlugValueWidget",
 
+		],
+		"parallel" : [
+			"description",
+			"""
+			Resamples the primitive variables of large meshes using multiple
+			threads. The result is identical either way, but turning this off
+			may reduce overhead when many small meshes are being processed at
+			once. Curves and points are always resampled on a single thread.
+			""",
 		]
 	}
 
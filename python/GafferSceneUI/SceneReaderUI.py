@@ -114,6 +114,19 @@ Gaffer.Metadata.registerNode(
 
 		],
 
+		"preload" : [
+
+			"description",
+			"""
+			Reads the hierarchy, bounds and transforms for the whole
+			file in a single parallel pass when it is first accessed,
+			rather than one location at a time. This is typically faster
+			when the whole scene will be used, as in a batch render.
+			Objects and attributes are still loaded on demand.
+			""",
+
+		],
+
 	}
 
 )
@@ -113,7 +113,33 @@ Gaffer.Metadata.registerNode(
 
 			"plugValueWidget:type", "GafferUI.PresetsPlugValueWidget",
 
-		]
+		],
+
+		"densityImage" : [
+
+			"description",
+			"""
+			An optional image used to specify a varying point
+			density across the surface of the mesh. The image is
+			sampled using the mesh's "uv" primitive variable and
+			multiplied with the density setting above. When an
+			image is connected, it is used in place of the
+			densityPrimitiveVariable.
+			""",
+
+			"nodule:type", "GafferUI::StandardNodule",
+			"noduleLayout:section", "left",
+
+		],
+
+		"densityImageChannel" : [
+
+			"description",
+			"""
+			The channel of the densityImage to use as the density.
+			""",
+
+		],
 
 	}
 
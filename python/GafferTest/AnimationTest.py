@@ -583,5 +583,44 @@ class AnimationTest( GafferTest.TestCase ) :
 				Gaffer.Animation.Key( context.getTime(), context.getTime(), Gaffer.Animation.Type.Linear )
 			)
 
+	def testEvaluateTimes( self ) :
+
+		curve = Gaffer.Animation.CurvePlug()
+		self.assertEqual( curve.evaluate( IECore.FloatVectorData( [ 0, 1 ] ) ), IECore.FloatVectorData( [ 0, 0 ] ) )
+
+		curve.addKey( Gaffer.Animation.Key( 0, 0, Gaffer.Animation.Type.Linear ) )
+		curve.addKey( Gaffer.Animation.Key( 1, 2, Gaffer.Animation.Type.Linear ) )
+		curve.addKey( Gaffer.Animation.Key( 2, 4, Gaffer.Animation.Type.Step ) )
+		curve.addKey( Gaffer.Animation.Key( 10, 1, Gaffer.Animation.Type.Linear ) )
+
+		def assertMatchesSingleEvaluation( times ) :
+
+			values = curve.evaluate( IECore.FloatVectorData( times ) )
+			self.assertIsInstance( values, IECore.FloatVectorData )
+			self.assertEqual( list( values ), [ curve.evaluate( t ) for t in times ] )
+
+		# Ascending, densely sampled
+		assertMatchesSingleEvaluation( [ -1 + i * 0.125 for i in range( 0, 100 ) ] )
+		# Ascending, sparse
+		assertMatchesSingleEvaluation( [ -5, 0, 9.5, 10, 20 ] )
+		# Unordered, including repeats
+		assertMatchesSingleEvaluation( [ 9, 0.5, 0.5, 2, 1.5, -1, 11, 1 ] )
+
+		# Evaluation must reflect subsequent edits.
+
+		curve.addKey( Gaffer.Animation.Key( 5, 10, Gaffer.Animation.Type.Linear ) )
+		self.assertEqual( curve.evaluate( 5 ), 10 )
+		self.assertEqual( curve.evaluate( IECore.FloatVectorData( [ 5 ] ) ), IECore.FloatVectorData( [ 10 ] ) )
+
+		curve.getKey( 5 ).setValue( 20 )
+		self.assertEqual( curve.evaluate( IECore.FloatVectorData( [ 5 ] ) ), IECore.FloatVectorData( [ 20 ] ) )
+
+		curve.getKey( 5 ).setTime( 6 )
+		self.assertEqual( curve.evaluate( 6 ), 20 )
+
+		curve.removeKey( curve.getKey( 6 ) )
+		assertMatchesSingleEvaluation( [ 5, 6, 7 ] )
+		self.assertEqual( curve.evaluate( 2 ), 4 )
+
 if __name__ == "__main__":
 	unittest.main()
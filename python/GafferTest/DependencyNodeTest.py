@@ -675,5 +675,49 @@ class DependencyNodeTest( GafferTest.TestCase ) :
 		self.assertEqual( mh.messages[0].context, "BadAffects::affects()" )
 		self.assertEqual( mh.messages[0].message, "TypeError: No registered converter was able to extract a C++ reference to type Gaffer::Plug from this Python object of type NoneType\n" )
 
+	def testDirtyPropagationAfterTopologyChanges( self ) :
+
+		s = Gaffer.ScriptNode()
+		s["a"] = GafferTest.AddNode()
+		s["b"] = GafferTest.AddNode()
+		s["c"] = GafferTest.AddNode()
+
+		cs = GafferTest.CapturingSlot( s["c"].plugDirtiedSignal() )
+		def dirtied() :
+			result = { c[0].getName() for c in cs }
+			del cs[:]
+			return result
+
+		s["c"]["op1"].setInput( s["a"]["sum"] )
+		dirtied()
+
+		# Propagate twice, so that the second propagation
+		# can reuse anything cached by the first.
+		for i in range( 0, 2 ) :
+			s["a"]["op1"].setValue( i + 1 )
+			self.assertEqual( dirtied(), { "op1", "sum" } )
+			s["b"]["op1"].setValue( i + 1 )
+			self.assertEqual( dirtied(), set() )
+
+		# Changing an input must be reflected in
+		# subsequent propagation.
+
+		s["c"]["op1"].setInput( s["b"]["sum"] )
+		dirtied()
+
+		s["a"]["op1"].setValue( 10 )
+		self.assertEqual( dirtied(), set() )
+		s["b"]["op1"].setValue( 10 )
+		self.assertEqual( dirtied(), { "op1", "sum" } )
+
+		# As must adding a plug.
+
+		s["c"]["user"]["p"] = Gaffer.IntPlug( flags = Gaffer.Plug.Flags.Default | Gaffer.Plug.Flags.Dynamic )
+		s["c"]["user"]["p"].setInput( s["b"]["sum"] )
+		dirtied()
+
+		s["b"]["op1"].setValue( 20 )
+		self.assertEqual( dirtied(), { "op1", "sum", "user", "p" } )
+
 if __name__ == "__main__":
 	unittest.main()
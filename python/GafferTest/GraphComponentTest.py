@@ -636,6 +636,68 @@ class GraphComponentTest( GafferTest.TestCase ) :
 			else :
 				self.assertEqual( child.getName(), "GraphComponent%d" % index )
 
+	def testNameLookupWithManyChildren( self ) :
+
+		s = Gaffer.ScriptNode()
+		for i in range( 0, 100 ) :
+			s.addChild( Gaffer.Node( "n%d" % i ) )
+
+		for i in range( 0, 100 ) :
+			self.assertEqual( s["n%d" % i].getName(), "n%d" % i )
+		self.assertNotIn( "n100", s )
+
+		# Renaming
+
+		with Gaffer.UndoScope( s ) :
+			s["n10"].setName( "renamed" )
+
+		self.assertNotIn( "n10", s )
+		self.assertEqual( s["renamed"].getName(), "renamed" )
+
+		s.undo()
+		self.assertNotIn( "renamed", s )
+		self.assertEqual( s["n10"].getName(), "n10" )
+
+		# Unique name generation, including after removal of
+		# the child with the largest suffix.
+
+		n = Gaffer.Node( "n0" )
+		s.addChild( n )
+		self.assertEqual( n.getName(), "n100" )
+		self.assertTrue( s["n100"].isSame( n ) )
+
+		s.removeChild( n )
+		self.assertNotIn( "n100", s )
+		n = Gaffer.Node( "n0" )
+		s.addChild( n )
+		self.assertEqual( n.getName(), "n100" )
+
+		c = s["n50"]
+		c.setName( "n" )
+		self.assertTrue( s["n"].isSame( c ) )
+		c.setName( "n100" )
+		self.assertEqual( c.getName(), "n101" )
+		c.setName( "n99" )
+		self.assertEqual( c.getName(), "n101" )
+		self.assertTrue( s["n101"].isSame( c ) )
+
+		# Removal and undo
+
+		with Gaffer.UndoScope( s ) :
+			s.removeChild( s["n20"] )
+
+		self.assertNotIn( "n20", s )
+		s.undo()
+		self.assertEqual( s["n20"].getName(), "n20" )
+		self.assertTrue( s.descendant( "n20.user" ).isSame( s["n20"]["user"] ) )
+
+		# Reparenting
+
+		s2 = Gaffer.ScriptNode()
+		s2.addChild( s["n30"] )
+		self.assertNotIn( "n30", s )
+		self.assertEqual( s2["n30"].getName(), "n30" )
+
 	def testNamesWithStrangeSuffixes( self ) :
 
 		g = Gaffer.GraphComponent()
@@ -221,5 +221,94 @@ class LoopTest( GafferTest.TestCase ) :
 		self.assertIsInstance( s2["c"]["previous"], Gaffer.IntPlug )
 		self.assertIsInstance( s2["c"]["next"], Gaffer.IntPlug )
 
+	def testManyIterations( self ) :
+
+		s = Gaffer.ScriptNode()
+
+		s["n"] = self.intLoop()
+		s["a"] = GafferTest.AddNode()
+
+		s["n"]["in"].setValue( 0 )
+		s["n"]["next"].setInput( s["a"]["sum"] )
+		s["a"]["op1"].setInput( s["n"]["previous"] )
+		s["a"]["op2"].setValue( 1 )
+
+		# Enough iterations to exhaust the stack if they
+		# were evaluated by recursion alone.
+		s["n"]["iterations"].setValue( 10000 )
+		self.assertEqual( s["n"]["out"].getValue(), 10000 )
+
+		# Asking for the next iteration should only require
+		# one more computation.
+		s["n"]["iterations"].setValue( 10001 )
+		with Gaffer.PerformanceMonitor() as m :
+			self.assertEqual( s["n"]["out"].getValue(), 10001 )
+
+		self.assertEqual( m.plugStatistics( s["a"]["sum"] ).computeCount, 1 )
+
+	def testManyIterationsWithoutCaching( self ) :
+
+		s = Gaffer.ScriptNode()
+
+		s["n"] = self.intLoop()
+		s["a"] = GafferTest.AddNode()
+
+		s["n"]["in"].setValue( 0 )
+		s["n"]["next"].setInput( s["a"]["sum"] )
+		s["a"]["op1"].setInput( s["n"]["previous"] )
+		s["a"]["op2"].setValue( 1 )
+		s["n"]["iterations"].setValue( 10000 )
+
+		# Checkpoints are held by the Loop itself, so we shouldn't
+		# exhaust the stack even when nothing can be cached.
+
+		cacheMemoryLimit = Gaffer.ValuePlug.getCacheMemoryLimit()
+		hashCacheSizeLimit = Gaffer.ValuePlug.getHashCacheSizeLimit()
+		try :
+			Gaffer.ValuePlug.setCacheMemoryLimit( 0 )
+			Gaffer.ValuePlug.setHashCacheSizeLimit( 1 )
+			Gaffer.ValuePlug.clearCache()
+
+			self.assertEqual( s["n"]["out"].getValue(), 10000 )
+			with Gaffer.Context() as c :
+				c["loop:index"] = 10000
+				self.assertEqual( s["n"]["previous"].getValue(), 10000 )
+		finally :
+			Gaffer.ValuePlug.setCacheMemoryLimit( cacheMemoryLimit )
+			Gaffer.ValuePlug.setHashCacheSizeLimit( hashCacheSizeLimit )
+
+	def testCheckpointInterval( self ) :
+
+		s = Gaffer.ScriptNode()
+
+		s["n"] = self.intLoop()
+		s["a"] = GafferTest.AddNode()
+
+		s["n"]["in"].setValue( 0 )
+		s["n"]["next"].setInput( s["a"]["sum"] )
+		s["a"]["op1"].setInput( s["n"]["previous"] )
+		s["a"]["op2"].setValue( 1 )
+		s["n"]["iterations"].setValue( 100 )
+
+		self.assertEqual( s["n"]["checkpointInterval"].getValue(), 50 )
+		h = s["n"]["out"].hash()
+
+		# The interval affects only how iterations are
+		# evaluated, and not the result.
+
+		cs = GafferTest.CapturingSlot( s["n"].plugDirtiedSignal() )
+		for interval in ( 0, 1, 7, 100, 1000 ) :
+			s["n"]["checkpointInterval"].setValue( interval )
+			Gaffer.ValuePlug.clearCache()
+			self.assertEqual( s["n"]["out"].hash(), h )
+			self.assertEqual( s["n"]["out"].getValue(), 100 )
+
+		self.assertEqual( { x[0] for x in cs }, { s["n"]["checkpointInterval"] } )
+
+		s2 = Gaffer.ScriptNode()
+		s2.execute( s.serialise() )
+		self.assertEqual( s2["n"]["checkpointInterval"].getValue(), 1000 )
+		self.assertEqual( s2["n"]["out"].getValue(), 100 )
+
 if __name__ == "__main__":
 	unittest.main()
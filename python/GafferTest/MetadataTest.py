@@ -1155,5 +1155,40 @@ class MetadataTest( GafferTest.TestCase ) :
 		with self.assertRaisesRegexp( Exception, "did not match C\+\+ signature" ) :
 			Gaffer.Metadata.value( None, "test" )
 
+	def testWildcardRegistrationAfterQuery( self ) :
+
+		class MetadataTestNodeF( Gaffer.Node ) :
+
+			def __init__( self, name = "MetadataTestNodeF" ) :
+
+				Gaffer.Node.__init__( self, name )
+
+				self["p"] = Gaffer.Plug()
+				self["p"]["a"] = Gaffer.IntPlug()
+
+		IECore.registerRunTimeTyped( MetadataTestNodeF )
+
+		n = MetadataTestNodeF()
+		Gaffer.Metadata.registerValue( MetadataTestNodeF, "p.*", "test", 1 )
+		self.assertEqual( Gaffer.Metadata.value( n["p"]["a"], "test" ), 1 )
+		self.assertEqual( Gaffer.Metadata.value( n["p"]["a"], "test2" ), None )
+
+		# New registrations must be visible to plugs
+		# which have already been queried.
+
+		Gaffer.Metadata.registerValue( MetadataTestNodeF, "p.a", "test", 2 )
+		Gaffer.Metadata.registerValue( MetadataTestNodeF, "...a", "test2", 3 )
+		self.assertEqual( Gaffer.Metadata.value( n["p"]["a"], "test" ), 2 )
+		self.assertEqual( Gaffer.Metadata.value( n["p"]["a"], "test2" ), 3 )
+		self.assertIn( "test2", Gaffer.Metadata.registeredValues( n["p"]["a"] ) )
+
+		# As must deregistrations.
+
+		Gaffer.Metadata.deregisterValue( MetadataTestNodeF, "p.a", "test" )
+		Gaffer.Metadata.deregisterValue( MetadataTestNodeF, "...a", "test2" )
+		self.assertEqual( Gaffer.Metadata.value( n["p"]["a"], "test" ), 1 )
+		self.assertEqual( Gaffer.Metadata.value( n["p"]["a"], "test2" ), None )
+		self.assertNotIn( "test2", Gaffer.Metadata.registeredValues( n["p"]["a"] ) )
+
 if __name__ == "__main__":
 	unittest.main()
@@ -571,6 +571,51 @@ class ReferenceTest( GafferTest.TestCase ) :
 
 		self.assertTrue( s["c"]["op1"].getInput().isSame( s["a"]["sum"] ) )
 
+	def testReferenceFileEditedInPlace( self ) :
+
+		# Loading the same file repeatedly reuses its compiled
+		# contents, but edits must still be picked up, even if they
+		# leave the file the same size and happen within the same
+		# second.
+
+		s = Gaffer.ScriptNode()
+		s["b"] = Gaffer.Box()
+		s["b"]["n"] = GafferTest.AddNode()
+		s["b"]["n"]["op2"].setValue( 1 )
+		Gaffer.PlugAlgo.promote( s["b"]["n"]["op1"] )
+		s["b"].exportForReference( self.temporaryDirectory() + "/test.grf" )
+
+		for i in range( 0, 10 ) :
+			s["r%d" % i] = Gaffer.Reference()
+			s["r%d" % i].load( self.temporaryDirectory() + "/test.grf" )
+			self.assertEqual( s["r%d" % i]["n"]["op2"].getValue(), 1 )
+
+		s["b"]["n"]["op2"].setValue( 2 )
+		s["b"].exportForReference( self.temporaryDirectory() + "/test.grf" )
+
+		s["r0"].load( self.temporaryDirectory() + "/test.grf" )
+		self.assertEqual( s["r0"]["n"]["op2"].getValue(), 2 )
+		self.assertEqual( s["r1"]["n"]["op2"].getValue(), 1 )
+
+	def testReferenceFileRemoved( self ) :
+
+		# Cached file contents must not hide the fact that
+		# the file has since been removed.
+
+		s = Gaffer.ScriptNode()
+		s["b"] = Gaffer.Box()
+		s["b"]["n"] = GafferTest.AddNode()
+		s["b"].exportForReference( self.temporaryDirectory() + "/test.grf" )
+
+		s["r1"] = Gaffer.Reference()
+		s["r1"].load( self.temporaryDirectory() + "/test.grf" )
+		self.assertIn( "n", s["r1"] )
+
+		os.remove( self.temporaryDirectory() + "/test.grf" )
+
+		s["r2"] = Gaffer.Reference()
+		self.assertRaises( Exception, s["r2"].load, self.temporaryDirectory() + "/test.grf" )
+
 	def testPlugFlagsOnReload( self ):
 
 		s = Gaffer.ScriptNode()
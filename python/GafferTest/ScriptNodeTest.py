@@ -44,6 +44,7 @@ import shutil
 import stat
 import inspect
 import functools
+import subprocess32 as subprocess
 
 import IECore
 
@@ -1409,6 +1410,93 @@ class ScriptNodeTest( GafferTest.TestCase ) :
 		self.assertEqual( len( mh.messages ), 1 )
 		self.assertIn( "SyntaxError: invalid syntax", mh.messages[0].message )
 
+	def testErrorTolerantExecutionResumesAfterError( self ) :
+
+		script = Gaffer.ScriptNode()
+
+		serialisation = "\n".join( [
+			"parent.addChild( Gaffer.Node( 'a' ) )",
+			"iDontExist",
+			"parent.addChild(",
+			"	Gaffer.Node( 'b' )",
+			")",
+			"parent.addChild( Gaffer.Node( 'c' ) ) ; iDontExistEither",
+			"parent.addChild( Gaffer.Node( 'd' ) )",
+			"iDontExistAtAll ; parent.addChild( Gaffer.Node( 'e' ) )",
+		] )
+
+		# Execute twice, so that we test the reuse
+		# of the compiled serialisation too.
+		for i in range( 0, 2 ) :
+
+			for node in script.children( Gaffer.Node ) :
+				script.removeChild( node )
+
+			with IECore.CapturingMessageHandler() as mh :
+				self.assertTrue( script.execute( serialisation, continueOnError = True ) )
+
+			self.assertEqual( len( mh.messages ), 3 )
+			self.assertEqual( mh.messages[0].context, "Line 2" )
+			self.assertIn( "iDontExist", mh.messages[0].message )
+			self.assertEqual( mh.messages[1].context, "Line 6" )
+			self.assertIn( "iDontExistEither", mh.messages[1].message )
+			self.assertEqual( mh.messages[2].context, "Line 8" )
+			self.assertIn( "iDontExistAtAll", mh.messages[2].message )
+
+			# Each statement should have been executed exactly once,
+			# including those following an error on the same line.
+			self.assertEqual(
+				[ n.getName() for n in script.children( Gaffer.Node ) ],
+				[ "a", "b", "c", "d", "e" ]
+			)
+
+	def testPersistentCompiledSerialisationCache( self ) :
+
+		script = Gaffer.ScriptNode()
+		script["node"] = GafferTest.AddNode()
+		script["fileName"].setValue( os.path.join( self.temporaryDirectory(), "test.gfr" ) )
+		script.save()
+
+		cachePath = os.path.join( self.temporaryDirectory(), "cache" )
+		env = os.environ.copy()
+		env["GAFFER_SCRIPT_CACHE_PATH"] = cachePath
+
+		def load() :
+			subprocess.check_output( [ "gaffer", "stats", script["fileName"].getValue() ], env = env, stderr = subprocess.STDOUT )
+
+		def cacheFiles() :
+			return sorted( os.path.join( cachePath, f ) for f in os.listdir( cachePath ) )
+
+		# The first load should populate the cache.
+
+		load()
+		files = cacheFiles()
+		self.assertGreater( len( files ), 0 )
+		self.assertFalse( any( f.endswith( ".tmp" ) for f in files ) )
+
+		# Subsequent loads in a new process should use
+		# the cache rather than writing it again.
+
+		for f in files :
+			os.utime( f, ( 0, 0 ) )
+
+		load()
+		self.assertEqual( cacheFiles(), files )
+		for f in files :
+			self.assertEqual( os.stat( f ).st_mtime, 0 )
+
+		# Invalid cache files should be ignored and replaced.
+
+		for f in files :
+			with open( f, "w" ) as fileHandle :
+				fileHandle.write( "garbage" )
+
+		load()
+		self.assertEqual( cacheFiles(), files )
+		for f in files :
+			with open( f ) as fileHandle :
+				self.assertNotEqual( fileHandle.read(), "garbage" )
+
 	def testImport( self ) :
 
 		s1 = Gaffer.ScriptNode()
@@ -83,12 +83,9 @@ class SpeedTest( GafferTest.TestCase ) :
 
 	#
 	# this test checks it doesn't take a ludicrous amount of time
-	# to retrieve children from their parents by name. even though
-	# we're currently doing a linear search to achieve this it doesn't
-	# seem to be a particularly pressing issue, perhaps because comparison
-	# against many InternedStrings is much cheaper than comparison
-	# against many std::strings. if necessary we can improve things by
-	# storing a map from name to children in GraphComponent.
+	# to retrieve children from their parents by name. components with
+	# many children now maintain a map from name to child, so lookups
+	# are constant time.
 	#
 	# r338 (linear search with string comparisons)
 	#
@@ -117,5 +114,73 @@ class SpeedTest( GafferTest.TestCase ) :
 			c = s[n]
 			self.assertEqual( c.getName(), n )
 
+	# This test checks that querying plug metadata is fast for nodes
+	# with many plugs and many wildcard registrations, as is the case
+	# for the nodes representing large shaders.
+	def testPlugMetadataLookup( self ) :
+
+		class SpeedTestNode( Gaffer.Node ) :
+
+			def __init__( self, name = "SpeedTestNode" ) :
+
+				Gaffer.Node.__init__( self, name )
+
+				self["parameters"] = Gaffer.Plug()
+				for i in range( 0, 300 ) :
+					self["parameters"]["p%d" % i] = Gaffer.IntPlug()
+
+		IECore.registerRunTimeTyped( SpeedTestNode )
+
+		for i in range( 0, 100 ) :
+			Gaffer.Metadata.registerValue( SpeedTestNode, "parameters.p%d*" % i, "key%d" % i, i )
+
+		n = SpeedTestNode()
+		for i in range( 0, 10 ) :
+			for plug in n["parameters"].children() :
+				for key in ( "label", "layout:section", "nodule:type", "plugValueWidget:type", "key1" ) :
+					Gaffer.Metadata.value( plug, key )
+
+	# This test measures the time taken to propagate dirtiness
+	# for a single `setValue()` call in a large graph.
+	def testSetValueInLargeGraph( self ) :
+
+		s = Gaffer.ScriptNode()
+
+		# A long chain, with a fan out from each node.
+		s["n0"] = GafferTest.AddNode()
+		for i in range( 1, 5000 ) :
+			n = GafferTest.AddNode( "n%d" % i )
+			n["op1"].setInput( s["n%d" % ( i - 1 )]["sum"] )
+			s.addChild( n )
+			f = GafferTest.AddNode( "f%d" % i )
+			f["op1"].setInput( n["sum"] )
+			s.addChild( f )
+
+		cs = GafferTest.CapturingSlot( s["n4999"].plugDirtiedSignal() )
+		for i in range( 0, 10 ) :
+			s["n0"]["op1"].setValue( i )
+
+		self.assertEqual( len( [ c for c in cs if c[0].isSame( s["n4999"]["sum"] ) ] ), 10 )
+
+	# This test measures the time taken to load a Box containing
+	# many children, where every line of the serialisation must
+	# look up its parent by name.
+	def testLoadBoxWithManyChildren( self ) :
+
+		s = Gaffer.ScriptNode()
+		s["b"] = Gaffer.Box()
+		for i in range( 0, 20000 ) :
+			s["b"].addChild( GafferTest.AddNode() )
+
+		self.assertEqual( len( s["b"].children( Gaffer.Node ) ), 20000 )
+		self.assertIn( "AddNode19999", s["b"] )
+
+		serialisation = s.serialise()
+
+		s2 = Gaffer.ScriptNode()
+		s2.execute( serialisation )
+
+		self.assertEqual( s2["b"].keys(), s["b"].keys() )
+
 if __name__ == "__main__":
 	unittest.main()
@@ -122,6 +122,21 @@ Gaffer.Metadata.registerNode(
 
 		],
 
+		"checkpointInterval" : [
+
+			"description",
+			"""
+			Iterations are evaluated in steps of this size, holding
+			on to the result of each step. This bounds the amount of
+			recursion needed to evaluate large numbers of iterations.
+			It has no effect on the result of the loop. A value of
+			0 disables checkpointing.
+			""",
+
+			"nodule:type", "",
+
+		],
+
 	}
 
 )
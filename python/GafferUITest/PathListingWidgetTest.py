@@ -36,6 +36,7 @@
 ##########################################################################
 
 import unittest
+import time
 
 import IECore
 
@@ -45,6 +46,8 @@ import GafferTest
 import GafferUI
 import GafferUITest
 
+from Qt import QtCore
+
 class PathListingWidgetTest( GafferUITest.TestCase ) :
 
 	def testExpandedPaths( self ) :
@@ -317,5 +320,85 @@ class PathListingWidgetTest( GafferUITest.TestCase ) :
 		self.assertEqual( len( s ), 1 )
 		self.assertEqual( str( s[0] ), "/a" )
 
+	def testRowsAreFetchedInPages( self ) :
+
+		d = { "item%d" % i : i for i in range( 0, 2500 ) }
+		p = Gaffer.DictPath( d, "/" )
+
+		w = GafferUI.PathListingWidget( p, allowMultipleSelection = True )
+
+		model = w._qtWidget().model()
+		self.__waitForChildren( model )
+
+		# Only the first page is available to the view.
+		self.assertEqual( model.rowCount(), 1000 )
+		self.assertTrue( model.index( 999, 0 ).isValid() )
+		self.assertFalse( model.index( 1000, 0 ).isValid() )
+		self.assertTrue( model.canFetchMore( QtCore.QModelIndex() ) )
+
+		# Selecting a path must fetch the rows needed to show it,
+		# but no more.
+		s = IECore.PathMatcher( [ "/item2499" ] )
+		w.setSelection( s )
+		self.assertEqual( w.getSelection(), s )
+		selectedRow = w._qtWidget().selectionModel().selectedIndexes()[0].row()
+		self.assertEqual( model.rowCount(), max( 1000, selectedRow + 1 ) )
+
+		model.fetchMore( QtCore.QModelIndex() )
+		self.assertEqual( model.rowCount(), 2500 )
+		self.assertFalse( model.canFetchMore( QtCore.QModelIndex() ) )
+
+	def testChildrenAreListedInBackground( self ) :
+
+		d = { "item%d" % i : { "child" : i } for i in range( 0, 10 ) }
+		p = Gaffer.DictPath( d, "/" )
+
+		w = GafferUI.PathListingWidget( p, displayMode = GafferUI.PathListingWidget.DisplayMode.Tree )
+		model = w._qtWidget().model()
+
+		# Nothing is listed on the UI thread. The children are
+		# inserted once the event loop delivers them.
+		self.assertEqual( model.rowCount(), 0 )
+		self.__waitForChildren( model )
+		self.assertEqual( model.rowCount(), 10 )
+
+		# Mapping paths to indices can't wait, so lists
+		# children immediately.
+		firstIndex = model.index( 0, 0 )
+		self.assertEqual( model.rowCount( firstIndex ), 0 )
+		w.setSelection( IECore.PathMatcher( [ "/item0/child" ] ) )
+		self.assertEqual( model.rowCount( firstIndex ), 1 )
+		self.assertEqual( w.getSelection(), IECore.PathMatcher( [ "/item0/child" ] ) )
+
+	def testHasChildrenDoesntListChildren( self ) :
+
+		d = { "item%d" % i : { "child" : i } for i in range( 0, 10 ) }
+		d["leaf"] = 10
+		p = Gaffer.DictPath( d, "/" )
+
+		w = GafferUI.PathListingWidget( p, displayMode = GafferUI.PathListingWidget.DisplayMode.Tree )
+		model = w._qtWidget().model()
+		self.__waitForChildren( model )
+
+		branchIndex = None
+		for row in range( 0, model.rowCount() ) :
+			index = model.index( row, 0 )
+			isLeaf = model.data( index ) == "leaf"
+			self.assertEqual( model.hasChildren( index ), not isLeaf )
+			if not isLeaf :
+				branchIndex = index
+
+		# Having children is determined without waiting for them
+		# to be listed, after which it reflects the listing.
+		self.assertEqual( model.rowCount( branchIndex ), 0 )
+		self.__waitForChildren( model, branchIndex )
+		self.assertEqual( model.rowCount( branchIndex ), 1 )
+		self.assertTrue( model.hasChildren( branchIndex ) )
+
+
+		timeout = time.time() + 10
+		while not model.rowCount( parent ) and time.time() < timeout :
+			self.waitForIdle()
+
 if __name__ == "__main__":
 	unittest.main()
@@ -43,6 +43,8 @@
 
 #include "boost/bind.hpp"
 
+#include <limits>
+
 using namespace std;
 using namespace Imath;
 using namespace IECore;
@@ -83,7 +85,7 @@ void Animation::Key::setTime( float time )
 						key->m_time = time;
 					}
 				);
-				curve->propagateDirtiness( curve->outPlug() );
+				curve->keysChanged();
 			},
 			// Undo
 			[ curve, previousTime, time ] {
@@ -93,7 +95,7 @@ void Animation::Key::setTime( float time )
 						key->m_time = previousTime;
 					}
 				);
-				curve->propagateDirtiness( curve->outPlug() );
+				curve->keysChanged();
 			}
 		);
 	}
@@ -119,12 +121,12 @@ void Animation::Key::setValue( float value )
 			// Do
 			[ k, value ] {
 				k->m_value = value;
-				k->m_parent->propagateDirtiness( k->m_parent->outPlug() );
+				k->m_parent->keysChanged();
 			},
 			// Undo
 			[ k, previousValue ] {
 				k->m_value = previousValue;
-				k->m_parent->propagateDirtiness( k->m_parent->outPlug() );
+				k->m_parent->keysChanged();
 			}
 		);
 	}
@@ -150,12 +152,12 @@ void Animation::Key::setType( Type type )
 			// Do
 			[ k, type ] {
 				k->m_value = type;
-				k->m_parent->propagateDirtiness( k->m_parent->outPlug() );
+				k->m_parent->keysChanged();
 			},
 			// Undo
 			[ k, previousType ] {
 				k->m_type = previousType;
-				k->m_parent->propagateDirtiness( k->m_parent->outPlug() );
+				k->m_parent->keysChanged();
 			}
 		);
 	}
@@ -192,10 +194,60 @@ const Animation::CurvePlug *Animation::Key::parent() const
 // CurvePlug implementation
 //////////////////////////////////////////////////////////////////////////
 
+namespace
+{
+
+struct CompareKeyTime
+{
+	template<typename CompactKey>
+	bool operator()( const CompactKey &key, float time ) const
+	{
+		return key.time < time;
+	}
+};
+
+// Evaluates the curve given the first key whose time is
+// not less than `time`.
+template<typename CompactKeys>
+float evaluateCompactKeys( const CompactKeys &keys, typename CompactKeys::const_iterator rightIt, float time )
+{
+	if( keys.empty() )
+	{
+		return 0;
+	}
+
+	if( rightIt == keys.end() )
+	{
+		return keys.back().value;
+	}
+
+	const auto &right = *rightIt;
+	if( right.time == time || rightIt == keys.begin() )
+	{
+		return right.value;
+	}
+
+	const auto &left = *std::prev( rightIt );
+	if( right.type == Animation::Linear )
+	{
+		const float t = ( time - left.time ) / ( right.time - left.time );
+		return Imath::lerp( left.value, right.value, t );
+	}
+	else
+	{
+		// Step. We already dealt with the case where we're
+		// exactly at the time of the right keyframe, so we
+		// just return the value of the left keyframe.
+		return left.value;
+	}
+}
+
+} // namespace
+
 IE_CORE_DEFINERUNTIMETYPED( Animation::CurvePlug );
 
 Animation::CurvePlug::CurvePlug( const std::string &name, Direction direction, unsigned flags )
-	:	ValuePlug( name, direction, flags & ~Plug::AcceptsInputs )
+	:	ValuePlug( name, direction, flags & ~Plug::AcceptsInputs ), m_compactKeysValid( false )
 {
 	addChild( new FloatPlug( "out", Plug::Out ) );
 	outPlug()->setFlags( Plug::Cacheable, false );
@@ -223,13 +275,13 @@ void Animation::CurvePlug::addKey( const KeyPtr &key )
 		[this, key] {
 			m_keys.insert( key );
 			key->m_parent = this;
-			propagateDirtiness( outPlug() );
+			keysChanged();
 		},
 		// Undo
 		[this, key] {
 			m_keys.erase( key->getTime() );
 			key->m_parent = nullptr;
-			propagateDirtiness( outPlug() );
+			keysChanged();
 		}
 	);
 }
@@ -272,13 +324,13 @@ void Animation::CurvePlug::removeKey( const KeyPtr &key )
 		[ this, key ] {
 			m_keys.erase( key->getTime() );
 			key->m_parent = nullptr;
-			propagateDirtiness( outPlug() );
+			keysChanged();
 		},
 		// Undo
 		[ this, key ] {
 			m_keys.insert( key );
 			key->m_parent = this;
-			propagateDirtiness( outPlug() );
+			keysChanged();
 		}
 	);
 }
@@ -380,38 +432,69 @@ Animation::ConstKeyIterator Animation::CurvePlug::end() const
 
 float Animation::CurvePlug::evaluate( float time ) const
 {
-	if( m_keys.empty() )
-	{
-		return 0;
-	}
+	const CompactKeys &keys = compactKeys();
+	return evaluateCompactKeys(
+		keys, std::lower_bound( keys.begin(), keys.end(), time, CompareKeyTime() ), time
+	);
+}
 
-	Keys::const_iterator rightIt = m_keys.lower_bound( time );
-	if( rightIt == m_keys.end() )
-	{
-		return (*m_keys.rbegin())->getValue();
-	}
+std::vector<float> Animation::CurvePlug::evaluate( const std::vector<float> &times ) const
+{
+	const CompactKeys &keys = compactKeys();
 
-	const Key &right = **rightIt;
-	if( right.getTime() == time || rightIt == m_keys.begin() )
-	{
-		return right.getValue();
-	}
+	std::vector<float> result;
+	result.reserve( times.size() );
 
-	const Key &left = **std::prev( rightIt );
-	if( right.getType() == Linear )
+	// Walk forward through the keys while the times are ascending.
+	// Densely sampled times typically advance by at most one key,
+	// so we check for that before resorting to a binary search
+	// of the remaining keys.
+	CompactKeys::const_iterator rightIt = keys.begin();
+	float previousTime = std::numeric_limits<float>::lowest();
+	for( float time : times )
 	{
-		const float t = ( time - left.getTime() ) / ( right.getTime() - left.getTime() );
-		return Imath::lerp( left.getValue(), right.getValue(), t );
+		if( time < previousTime )
+		{
+			rightIt = std::lower_bound( keys.begin(), rightIt, time, CompareKeyTime() );
+		}
+		else if( rightIt != keys.end() && rightIt->time < time )
+		{
+			++rightIt;
+			if( rightIt != keys.end() && rightIt->time < time )
+			{
+				rightIt = std::lower_bound( rightIt, keys.end(), time, CompareKeyTime() );
+			}
+		}
+		result.push_back( evaluateCompactKeys( keys, rightIt, time ) );
+		previousTime = time;
 	}
-	else
+
+	return result;
+}
+
+void Animation::CurvePlug::keysChanged()
+{
+	m_compactKeysValid = false;
+	propagateDirtiness( outPlug() );
+}
+
+const Animation::CurvePlug::CompactKeys &Animation::CurvePlug::compactKeys() const
+{
+	if( !m_compactKeysValid )
 	{
-		// Step. We already dealt with the case where we're
-		// exactly at the time of the right keyframe, so we
-		// just return the value of the left keyframe.
-		return left.getValue();
+		tbb::spin_mutex::scoped_lock lock( m_compactKeysMutex );
+		if( !m_compactKeysValid )
+		{
+			m_compactKeys.clear();
+			m_compactKeys.reserve( m_keys.size() );
+			for( const auto &key : m_keys )
+			{
+				m_compactKeys.push_back( { key->getTime(), key->getValue(), key->getType() } );
+			}
+			m_compactKeysValid = true;
+		}
 	}
-
-	return 0;
+	return m_compactKeys;
 }
 
 FloatPlug *Animation::CurvePlug::outPlug()
@@ -49,6 +49,7 @@
 #include "boost/regex.hpp"
 
 #include <set>
+#include <unordered_map>
 
 using namespace Gaffer;
 using namespace IECore;
@@ -85,6 +86,122 @@ struct GraphComponent::Signals : boost::noncopyable
 
 };
 
+//////////////////////////////////////////////////////////////////////////
+// GraphComponent::ChildNameIndex
+//
+// Provides constant-time lookup of children by name, and tracks the
+// numeric suffixes in use for each name prefix so that unique names can
+// be generated without visiting every sibling. This allows components with
+// thousands of children to be built and queried without quadratic cost.
+//////////////////////////////////////////////////////////////////////////
+
+namespace
+{
+
+// Indices are only created once the number of children reaches this
+// threshold. Below it, a linear search is cheaper than maintaining
+// the index.
+const size_t g_childNameIndexThreshold = 32;
+
+struct InternedStringHash
+{
+	size_t operator()( const InternedString &s ) const
+	{
+		// InternedStrings with equal values share storage, so
+		// the address is sufficient for a hash.
+		return std::hash<const char *>()( s.c_str() );
+	}
+};
+
+// Splits a name in the same way as the sibling search in `setName()`,
+// returning the prefix and treating an empty suffix as 0.
+int splitName( const std::string &name, std::string &prefix )
+{
+	const size_t prefixSize = name.find_last_not_of( "0123456789" ) + 1;
+	prefix = name.substr( 0, prefixSize );
+	return (int)strtol( name.c_str() + prefixSize, nullptr, 10 );
+}
+
+} // namespace
+
+struct GraphComponent::ChildNameIndex : boost::noncopyable
+{
+
+	GraphComponent *find( const InternedString &name ) const
+	{
+		auto it = m_children.find( name );
+		return it != m_children.end() ? it->second : nullptr;
+	}
+
+	void insert( GraphComponent *child )
+	{
+		GraphComponent *&entry = m_children[child->m_name];
+		if( entry )
+		{
+			// Already indexed, or a sibling is transiently using the
+			// same name. In the latter case, the sibling wins, matching
+			// the ordering of the linear search.
+			return;
+		}
+		entry = child;
+		std::string prefix;
+		const int suffix = splitName( child->m_name.string(), prefix );
+		m_suffixes[prefix].insert( suffix );
+	}
+
+	// Returns false if the child was not indexed.
+	bool erase( const GraphComponent *child )
+	{
+		auto it = m_children.find( child->m_name );
+		if( it == m_children.end() || it->second != child )
+		{
+			return false;
+		}
+		m_children.erase( it );
+
+		std::string prefix;
+		const int suffix = splitName( child->m_name.string(), prefix );
+		auto sIt = m_suffixes.find( prefix );
+		sIt->second.erase( sIt->second.find( suffix ) );
+		if( sIt->second.empty() )
+		{
+			m_suffixes.erase( sIt );
+		}
+		return true;
+	}
+
+	// Returns one more than the largest suffix used with `prefix`,
+	// ignoring `exclude`. Returns 0 if the prefix is not in use.
+	int nextSuffix( const std::string &prefix, const GraphComponent *exclude ) const
+	{
+		auto sIt = m_suffixes.find( prefix );
+		if( sIt == m_suffixes.end() )
+		{
+			return 0;
+		}
+
+		const std::multiset<int> &suffixes = sIt->second;
+		auto it = suffixes.rbegin();
+		if( find( exclude->m_name ) == exclude )
+		{
+			std::string excludePrefix;
+			const int excludeSuffix = splitName( exclude->m_name.string(), excludePrefix );
+			if( excludePrefix == prefix && excludeSuffix == *it )
+			{
+				++it;
+			}
+		}
+
+		return it != suffixes.rend() ? *it + 1 : 0;
+	}
+
+	private :
+
+		std::unordered_map<InternedString, GraphComponent *, InternedStringHash> m_children;
+		std::unordered_map<std::string, std::multiset<int>> m_suffixes;
+
+};
+
 //////////////////////////////////////////////////////////////////////////
 // GraphComponent
 //////////////////////////////////////////////////////////////////////////
@@ -126,13 +243,23 @@ const IECore::InternedString &GraphComponent::setName( const IECore::InternedStr
 	IECore::InternedString newName = name;
 	if( m_parent )
 	{
+		const ChildNameIndex *childNameIndex = m_parent->m_childNameIndex.get();
+
 		bool uniqueAlready = true;
-		for( ChildContainer::const_iterator it=m_parent->m_children.begin(), eIt=m_parent->m_children.end(); it != eIt; it++ )
+		if( childNameIndex )
 		{
-			if( *it != this && (*it)->m_name == newName )
+			const GraphComponent *existing = childNameIndex->find( newName );
+			uniqueAlready = !existing || existing == this;
+		}
+		else
+		{
+			for( ChildContainer::const_iterator it=m_parent->m_children.begin(), eIt=m_parent->m_children.end(); it != eIt; it++ )
 			{
-				uniqueAlready = false;
-				break;
+				if( *it != this && (*it)->m_name == newName )
+				{
+					uniqueAlready = false;
+					break;
+				}
 			}
 		}
 
@@ -143,21 +270,28 @@ const IECore::InternedString &GraphComponent::setName( const IECore::InternedStr
 			std::string prefix;
 			int suffix = StringAlgo::numericSuffix( newName.value(), 1, &prefix );
 
-			// iterate over all the siblings to find the minimum value for the suffix which
-			// will be greater than any existing suffix.
-			for( ChildContainer::const_iterator it=m_parent->m_children.begin(), eIt=m_parent->m_children.end(); it != eIt; it++ )
+			// find the minimum value for the suffix which will be greater
+			// than any existing suffix.
+			if( childNameIndex )
 			{
-				if( *it == this )
-				{
-					continue;
-				}
-				if( (*it)->m_name.value().compare( 0, prefix.size(), prefix ) == 0 )
+				suffix = max( suffix, childNameIndex->nextSuffix( prefix, this ) );
+			}
+			else
+			{
+				for( ChildContainer::const_iterator it=m_parent->m_children.begin(), eIt=m_parent->m_children.end(); it != eIt; it++ )
 				{
-					char *endPtr = nullptr;
-					long siblingSuffix = strtol( (*it)->m_name.value().c_str() + prefix.size(), &endPtr, 10 );
-					if( *endPtr == '\0' )
+					if( *it == this )
+					{
+						continue;
+					}
+					if( (*it)->m_name.value().compare( 0, prefix.size(), prefix ) == 0 )
 					{
-						suffix = max( suffix, (int)siblingSuffix + 1 );
+						char *endPtr = nullptr;
+						long siblingSuffix = strtol( (*it)->m_name.value().c_str() + prefix.size(), &endPtr, 10 );
+						if( *endPtr == '\0' )
+						{
+							suffix = max( suffix, (int)siblingSuffix + 1 );
+						}
 					}
 				}
 			}
@@ -184,7 +318,16 @@ const IECore::InternedString &GraphComponent::setName( const IECore::InternedStr
 
 void GraphComponent::setNameInternal( const IECore::InternedString &name )
 {
-	m_name = name;
+	ChildNameIndex *childNameIndex = m_parent ? m_parent->m_childNameIndex.get() : nullptr;
+	if( childNameIndex && childNameIndex->erase( this ) )
+	{
+		m_name = name;
+		childNameIndex->insert( this );
+	}
+	else
+	{
+		m_name = name;
+	}
 	Signals::emitLazily( m_signals.get(), &Signals::nameChangedSignal, this );
 }
 
@@ -342,6 +485,18 @@ void GraphComponent::addChildInternal( GraphComponentPtr child, size_t index )
 	m_children.insert( m_children.begin() + min( index, m_children.size() ), child );
 	child->m_parent = this;
 	child->setName( child->m_name.value() ); // to force uniqueness
+	if( m_childNameIndex )
+	{
+		m_childNameIndex->insert( child.get() );
+	}
+	else if( m_children.size() >= g_childNameIndexThreshold )
+	{
+		m_childNameIndex.reset( new ChildNameIndex );
+		for( const auto &c : m_children )
+		{
+			m_childNameIndex->insert( c.get() );
+		}
+	}
 	Signals::emitLazily( m_signals.get(), &Signals::childAddedSignal, this, child.get() );
 	child->parentChanged( previousParent );
 	Signals::emitLazily( child->m_signals.get(), &Signals::parentChangedSignal, child.get(), previousParent );
@@ -404,6 +559,10 @@ void GraphComponent::removeChildInternal( GraphComponentPtr child, bool emitPare
 		throw Exception( boost::str( boost::format( "GraphComponent::removeChildInternal : \"%s\" is not a child of \"%s\"." ) % child->fullName() % fullName() ) );
 	}
 	m_children.erase( it );
+	if( m_childNameIndex )
+	{
+		m_childNameIndex->erase( child.get() );
+	}
 	child->m_parent = nullptr;
 	Signals::emitLazily( m_signals.get(), &Signals::childRemovedSignal, this, child.get() );
 	if( emitParentChanged )
@@ -420,6 +579,23 @@ size_t GraphComponent::index() const
 	return std::find( c.begin(), c.end(), this ) - c.begin();
 }
 
+const GraphComponent *GraphComponent::getChildInternal( const IECore::InternedString &name ) const
+{
+	if( m_childNameIndex )
+	{
+		return m_childNameIndex->find( name );
+	}
+
+	for( ChildContainer::const_iterator it=m_children.begin(), eIt=m_children.end(); it!=eIt; it++ )
+	{
+		if( (*it)->m_name==name )
+		{
+			return it->get();
+		}
+	}
+	return nullptr;
+}
+
 const GraphComponent::ChildContainer &GraphComponent::children() const
 {
 	return m_children;
@@ -40,6 +40,174 @@
 #include "Gaffer/MetadataAlgo.h"
 
 #include "boost/bind.hpp"
+#include "boost/functional/hash.hpp"
+#include "boost/noncopyable.hpp"
+
+#include "tbb/concurrent_hash_map.h"
+
+using namespace IECore;
+
+//////////////////////////////////////////////////////////////////////////
+// Checkpoints
+//////////////////////////////////////////////////////////////////////////
+
+// Evaluating an iteration of a loop recurses through all the preceding
+// iterations, so for large numbers of iterations we risk exhausting the
+// stack. We avoid this by walking forwards through every `checkpointInterval`th
+// iteration, evaluating each in turn and holding on to the result explicitly
+// for as long as it is needed. Requests for a checkpoint iteration are then
+// answered directly from the held results, so the depth of recursion is
+// bounded by the interval, regardless of what the hash and compute caches
+// choose to keep. The walk starts from the highest checkpoint that is
+// already available, so asking for iteration N after N-1 costs only one
+// more step.
+
+namespace Gaffer
+{
+
+class Loop::Checkpoints
+{
+
+	public :
+
+		// Checkpoints are identified by the plug being evaluated and
+		// the hash of the context it is evaluated in.
+		typedef std::pair<const ValuePlug *, MurmurHash> Key;
+
+		template<typename T>
+		class Map
+		{
+
+			public :
+
+				bool find( const Key &key, T &value ) const
+				{
+					typename Entries::const_accessor a;
+					if( !m_entries.find( a, key ) )
+					{
+						return false;
+					}
+					value = a->second.value;
+					return true;
+				}
+
+				void acquire( const Key &key, const T &value )
+				{
+					typename Entries::accessor a;
+					if( m_entries.insert( a, key ) )
+					{
+						a->second.value = value;
+						a->second.references = 1;
+					}
+					else
+					{
+						a->second.references++;
+					}
+				}
+
+				void release( const Key &key )
+				{
+					typename Entries::accessor a;
+					if( m_entries.find( a, key ) && --a->second.references == 0 )
+					{
+						m_entries.erase( a );
+					}
+				}
+
+			private :
+
+				struct Entry
+				{
+					T value;
+					size_t references;
+				};
+
+				struct KeyHashCompare
+				{
+					static size_t hash( const Key &key )
+					{
+						size_t result = 0;
+						boost::hash_combine( result, key.first );
+						boost::hash_combine( result, key.second );
+						return result;
+					}
+
+					static bool equal( const Key &a, const Key &b )
+					{
+						return a == b;
+					}
+				};
+
+				typedef tbb::concurrent_hash_map<Key, Entry, KeyHashCompare> Entries;
+				Entries m_entries;
+
+		};
+
+		Map<MurmurHash> hashes;
+		Map<ConstObjectPtr> values;
+
+		template<typename T>
+		Map<T> &map();
+
+		static Key key( const ValuePlug *plug )
+		{
+			return Key( plug, Context::current()->hash() );
+		}
+
+};
+
+template<>
+Loop::Checkpoints::Map<MurmurHash> &Loop::Checkpoints::map<MurmurHash>()
+{
+	return hashes;
+}
+
+template<>
+Loop::Checkpoints::Map<ConstObjectPtr> &Loop::Checkpoints::map<ConstObjectPtr>()
+{
+	return values;
+}
+
+// Releases the checkpoints it has acquired when it is destroyed.
+template<typename T>
+class Loop::CheckpointScope : boost::noncopyable
+{
+
+	public :
+
+		CheckpointScope( Checkpoints &checkpoints )
+			:	m_map( checkpoints.map<T>() )
+		{
+		}
+
+		~CheckpointScope()
+		{
+			releaseAll();
+		}
+
+		void acquire( const Checkpoints::Key &key, const T &value )
+		{
+			m_map.acquire( key, value );
+			m_keys.push_back( key );
+		}
+
+		void releaseAll()
+		{
+			for( const auto &key : m_keys )
+			{
+				m_map.release( key );
+			}
+			m_keys.clear();
+		}
+
+	private :
+
+		Checkpoints::Map<T> &m_map;
+		std::vector<Checkpoints::Key> m_keys;
+
+};
+
+} // namespace Gaffer
 
 namespace Gaffer
 {
@@ -47,7 +215,7 @@ namespace Gaffer
 IE_CORE_DEFINERUNTIMETYPED( Loop );
 
 Loop::Loop( const std::string &name )
-	:	ComputeNode( name ), m_inPlugIndex( 0 ), m_outPlugIndex( 0 ), m_firstPlugIndex( 0 )
+	:	ComputeNode( name ), m_inPlugIndex( 0 ), m_outPlugIndex( 0 ), m_firstPlugIndex( 0 ), m_checkpoints( new Checkpoints )
 {
 	// Connect to `childAddedSignal()` so we can set ourselves up later when the
 	// appropriate plugs are added manually.
@@ -140,6 +308,16 @@ const StringPlug *Loop::indexVariablePlug() const
 	return m_firstPlugIndex ? getChild<StringPlug>( m_firstPlugIndex + 3 ) : nullptr;
 }
 
+IntPlug *Loop::checkpointIntervalPlug()
+{
+	return m_firstPlugIndex ? getChild<IntPlug>( m_firstPlugIndex + 5 ) : nullptr;
+}
+
+const IntPlug *Loop::checkpointIntervalPlug() const
+{
+	return m_firstPlugIndex ? getChild<IntPlug>( m_firstPlugIndex + 5 ) : nullptr;
+}
+
 Gaffer::BoolPlug *Loop::enabledPlug()
 {
 	return m_firstPlugIndex ? getChild<BoolPlug>( m_firstPlugIndex + 4 ) : nullptr;
@@ -195,9 +373,19 @@ void Loop::hash( const ValuePlug *output, const Context *context, IECore::Murmur
 	if( const ValuePlug *plug = sourcePlug( output, context, index, indexVariable ) )
 	{
 		Context::EditableScope tmpContext( context );
+		HashCheckpointScope checkpointScope( *m_checkpoints );
 		if( index >= 0 )
 		{
+			const int interval = checkpointInterval( context );
 			tmpContext.set<int>( indexVariable, index );
+			if( interval > 0 && index > 0 && index % interval == 0 )
+			{
+				if( m_checkpoints->hashes.find( Checkpoints::key( plug ), h ) )
+				{
+					return;
+				}
+			}
+			acquireHashCheckpoints( plug, indexVariable, index, interval, checkpointScope );
 		}
 		else
 		{
@@ -217,9 +405,22 @@ void Loop::compute( ValuePlug *output, const Context *context ) const
 	if( const ValuePlug *plug = sourcePlug( output, context, index, indexVariable ) )
 	{
 		Context::EditableScope tmpContext( context );
+		HashCheckpointScope hashCheckpointScope( *m_checkpoints );
+		ValueCheckpointScope valueCheckpointScope( *m_checkpoints );
 		if( index >= 0 )
 		{
+			const int interval = checkpointInterval( context );
 			tmpContext.set<int>( indexVariable, index );
+			if( interval > 0 && index > 0 && index % interval == 0 )
+			{
+				ConstObjectPtr value;
+				if( m_checkpoints->values.find( Checkpoints::key( plug ), value ) )
+				{
+					output->setObjectValue( value );
+					return;
+				}
+			}
+			acquireValueCheckpoints( plug, indexVariable, index, interval, hashCheckpointScope, valueCheckpointScope );
 		}
 		else
 		{
@@ -232,6 +433,111 @@ void Loop::compute( ValuePlug *output, const Context *context ) const
 	ComputeNode::compute( output, context );
 }
 
+void Loop::acquireHashCheckpoints( const ValuePlug *plug, const IECore::InternedString &indexVariable, int index, int interval, HashCheckpointScope &scope ) const
+{
+	if( interval <= 0 || index <= interval )
+	{
+		// Recursion is already bounded by the interval.
+		return;
+	}
+
+	// The last checkpoint before `index`. Once this is held,
+	// evaluating `index` recurses at most `interval` times.
+	const int last = ( ( index - 1 ) / interval ) * interval;
+
+	Context::EditableScope tmpContext( Context::current() );
+
+	// Find the highest checkpoint that is already held,
+	// and hold it ourselves while we need it.
+	int first = interval;
+	for( int i = last; i >= interval; i -= interval )
+	{
+		tmpContext.set<int>( indexVariable, i );
+		const Checkpoints::Key key = Checkpoints::key( plug );
+		MurmurHash h;
+		if( m_checkpoints->hashes.find( key, h ) )
+		{
+			scope.acquire( key, h );
+			first = i + interval;
+			break;
+		}
+	}
+
+	// Walk forwards from there. Each evaluation finds
+	// the previous checkpoint held.
+	for( int i = first; i <= last; i += interval )
+	{
+		tmpContext.set<int>( indexVariable, i );
+		const Checkpoints::Key key = Checkpoints::key( plug );
+		scope.acquire( key, plug->hash() );
+	}
+}
+
+void Loop::acquireValueCheckpoints( const ValuePlug *plug, const IECore::InternedString &indexVariable, int index, int interval, HashCheckpointScope &hashScope, ValueCheckpointScope &valueScope ) const
+{
+	if( interval <= 0 || index <= interval )
+	{
+		return;
+	}
+
+	// Computes require hashes, so make sure they are
+	// bounded too.
+	acquireHashCheckpoints( plug, indexVariable, index, interval, hashScope );
+
+	const int last = ( ( index - 1 ) / interval ) * interval;
+
+	Context::EditableScope tmpContext( Context::current() );
+
+	// Find the highest checkpoint whose value is already
+	// available, either because it is held, or because it
+	// is in the cache.
+	int first = interval;
+	for( int i = last; i >= interval; i -= interval )
+	{
+		tmpContext.set<int>( indexVariable, i );
+		const Checkpoints::Key key = Checkpoints::key( plug );
+		ConstObjectPtr value;
+		if( !m_checkpoints->values.find( key, value ) )
+		{
+			MurmurHash h;
+			if( !m_checkpoints->hashes.find( key, h ) )
+			{
+				h = plug->hash();
+			}
+			value = plug->getObjectValueIfCached( &h );
+		}
+
+		if( value )
+		{
+			valueScope.acquire( key, value );
+			first = i + interval;
+			break;
+		}
+	}
+
+	// Walk forwards from there, holding on to
+	// only the latest value.
+	for( int i = first; i <= last; i += interval )
+	{
+		tmpContext.set<int>( indexVariable, i );
+		const Checkpoints::Key key = Checkpoints::key( plug );
+		MurmurHash h;
+		if( !m_checkpoints->hashes.find( key, h ) )
+		{
+			h = plug->hash();
+		}
+		ConstObjectPtr value = plug->getObjectValue( &h );
+		valueScope.releaseAll();
+		valueScope.acquire( key, value );
+	}
+}
+
+int Loop::checkpointInterval( const Context *context ) const
+{
+	ContextAlgo::GlobalScope globalScope( context, inPlug() );
+	return checkpointIntervalPlug()->getValue();
+}
+
 void Loop::childAdded()
 {
 	setupPlugs();
@@ -257,6 +563,7 @@ bool Loop::setupPlugs()
 	addChild( new IntPlug( "iterations", Gaffer::Plug::In, 10, 0 ) );
 	addChild( new StringPlug( "indexVariable", Gaffer::Plug::In, "loop:index" ) );
 	addChild( new BoolPlug( "enabled", Gaffer::Plug::In, true ) );
+	addChild( new IntPlug( "checkpointInterval", Gaffer::Plug::In, 50, 0 ) );
 
 	// Only assign after adding all plugs, because our plug accessors
 	// use a non-zero value to indicate that all plugs are now available.
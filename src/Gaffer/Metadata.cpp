@@ -45,6 +45,7 @@
 #include "IECore/StringAlgo.h"
 
 #include "boost/bind.hpp"
+#include "boost/functional/hash.hpp"
 #include "boost/multi_index/member.hpp"
 #include "boost/multi_index/ordered_index.hpp"
 #include "boost/multi_index/sequenced_index.hpp"
@@ -110,9 +111,73 @@ struct GraphComponentMetadata
 
 	typedef map<StringAlgo::MatchPatternPath, PlugValues> PlugPathsToValues;
 
+	// The entries from `plugPathsToValues` which match a particular
+	// plug path, in the order they appear in `plugPathsToValues`.
+	struct PlugPathMatches
+	{
+		const PlugValues *exactMatch = nullptr;
+		vector<const PlugValues *> matches;
+	};
+
+	struct PlugPathHashCompare
+	{
+		static size_t hash( const vector<InternedString> &plugPath )
+		{
+			size_t result = 0;
+			for( const auto &name : plugPath )
+			{
+				// InternedStrings are unique, so we can
+				// just hash the address.
+				boost::hash_combine( result, name.c_str() );
+			}
+			return result;
+		}
+
+		static bool equal( const vector<InternedString> &a, const vector<InternedString> &b )
+		{
+			return a == b;
+		}
+	};
+
+	typedef concurrent_hash_map<vector<InternedString>, PlugPathMatches, PlugPathHashCompare> PlugPathMatchesCache;
+
 	Values values;
 	PlugPathsToValues plugPathsToValues;
 
+	// Matching a plug path against every pattern is expensive, and
+	// the UI queries many keys for each plug, so we cache the matches
+	// for each plug path. Must be cleared whenever `plugPathsToValues`
+	// is modified.
+	mutable PlugPathMatchesCache plugPathMatchesCache;
+
+	void plugPathMatches( const vector<InternedString> &plugPath, PlugPathMatchesCache::const_accessor &accessor ) const
+	{
+		if( plugPathMatchesCache.find( accessor, plugPath ) )
+		{
+			return;
+		}
+
+		PlugPathMatches matches;
+		if( !plugPathsToValues.empty() )
+		{
+			auto it = plugPathsToValues.find( plugPath );
+			if( it != plugPathsToValues.end() )
+			{
+				matches.exactMatch = &it->second;
+			}
+
+			for( const auto &p : plugPathsToValues )
+			{
+				if( StringAlgo::match( plugPath, p.first ) )
+				{
+					matches.matches.push_back( &p.second );
+				}
+			}
+		}
+
+		plugPathMatchesCache.insert( accessor, PlugPathMatchesCache::value_type( plugPath, matches ) );
+	}
+
 };
 
 typedef std::map<IECore::TypeId, GraphComponentMetadata> GraphComponentMetadataMap;
@@ -421,6 +486,7 @@ void Metadata::deregisterValue( IECore::TypeId ancestorTypeId, const StringAlgo:
 {
 	auto &m = graphComponentMetadataMap()[ancestorTypeId];
 	auto &plugValues = m.plugPathsToValues[StringAlgo::matchPatternPath( plugPath, '.' )];
+	m.plugPathMatchesCache.clear();
 
 	auto it = plugValues.find( key );
 	if( it == plugValues.end() )
@@ -482,6 +548,7 @@ void Metadata::registerValue( IECore::TypeId ancestorTypeId, const StringAlgo::M
 {
 	auto &graphComponentMetadata = graphComponentMetadataMap()[ancestorTypeId];
 	auto &plugValues = graphComponentMetadata.plugPathsToValues[StringAlgo::matchPatternPath( plugPath, '.' )];
+	graphComponentMetadata.plugPathMatchesCache.clear();
 
 	GraphComponentMetadata::NamedPlugValue namedValue( key, value );
 
@@ -574,17 +641,16 @@ void Metadata::registeredValues( const GraphComponent *target, std::vector<IECor
 				while( typeId != InvalidTypeId )
 				{
 					auto nIt = graphComponentMetadataMap().find( typeId );
-					if( nIt != graphComponentMetadataMap().end() )
+					if( nIt != graphComponentMetadataMap().end() && !nIt->second.plugPathsToValues.empty() )
 					{
-						for( auto it = nIt->second.plugPathsToValues.begin(), eIt = nIt->second.plugPathsToValues.end(); it != eIt; ++it )
+						GraphComponentMetadata::PlugPathMatchesCache::const_accessor accessor;
+						nIt->second.plugPathMatches( plugPath, accessor );
+						for( const auto &plugValues : accessor->second.matches )
 						{
-							if( StringAlgo::match( plugPath, it->first ) )
+							const auto &index = plugValues->get<1>();
+							for( auto vIt = index.rbegin(), veIt = index.rend(); vIt != veIt; ++vIt )
 							{
-								const auto &index = it->second.get<1>();
-								for( auto vIt = index.rbegin(), veIt = index.rend(); vIt != veIt; ++vIt )
-								{
-									plugPathKeys.push_back( vIt->first );
-								}
+								plugPathKeys.push_back( vIt->first );
 							}
 						}
 					}
@@ -628,32 +694,38 @@ IECore::ConstDataPtr Metadata::valueInternal( const GraphComponent *target, IECo
 			while( typeId != InvalidTypeId )
 			{
 				auto nIt = graphComponentMetadataMap().find( typeId );
-				if( nIt != graphComponentMetadataMap().end() )
+				if( nIt != graphComponentMetadataMap().end() && !nIt->second.plugPathsToValues.empty() )
 				{
-					// First do a direct lookup using the plug path.
-					auto it = nIt->second.plugPathsToValues.find( plugPath );
-					const auto eIt = nIt->second.plugPathsToValues.end();
-					if( it != eIt )
+					// Copy the value function, so that we're not holding
+					// the cache lock while calling it.
+					Metadata::PlugValueFunction valueFunction;
 					{
-						auto vIt = it->second.find( key );
-						if( vIt != it->second.end() )
+						GraphComponentMetadata::PlugPathMatchesCache::const_accessor accessor;
+						nIt->second.plugPathMatches( plugPath, accessor );
+						// Exact matches take precedence.
+						if( const auto *plugValues = accessor->second.exactMatch )
 						{
-							return vIt->second( plug );
+							auto vIt = plugValues->find( key );
+							if( vIt != plugValues->end() )
+							{
+								valueFunction = vIt->second;
+							}
 						}
-					}
-					// And only if the direct lookup fails, do a full search using
-					// wildcard matches.
-					for( it = nIt->second.plugPathsToValues.begin(); it != eIt; ++it )
-					{
-						if( StringAlgo::match( plugPath, it->first ) )
+						// And only if there is no exact match, use
+						// the first wildcard match.
+						for( auto it = accessor->second.matches.begin(); !valueFunction && it != accessor->second.matches.end(); ++it )
 						{
-							auto vIt = it->second.find( key );
-							if( vIt != it->second.end() )
+							auto vIt = (*it)->find( key );
+							if( vIt != (*it)->end() )
 							{
-								return vIt->second( plug );
+								valueFunction = vIt->second;
 							}
 						}
 					}
+					if( valueFunction )
+					{
+						return valueFunction( plug );
+					}
 				}
 				typeId = RunTimeTyped::baseTypeId( typeId );
 			}
@@ -136,6 +136,16 @@ IECore::ConstRunTimeTypedPtr Path::property( const IECore::InternedString &name
 	return nullptr;
 }
 
+PathPtr Path::copyForBackgroundUse() const
+{
+	return copy();
+}
+
+const Plug *Path::cancellationSubject() const
+{
+	return nullptr;
+}
+
 PathPtr Path::parent() const
 {
 	if( m_names.empty() )
@@ -53,6 +53,9 @@
 
 #include "tbb/enumerable_thread_specific.h"
 
+#include <atomic>
+#include <unordered_map>
+
 using namespace boost;
 using namespace Gaffer;
 
@@ -63,6 +66,16 @@ using namespace Gaffer;
 namespace
 {
 
+// Incremented whenever the topology of any graph changes, to
+// invalidate the caches of downstream plugs used in dirty
+// propagation. See `DirtyPlugs::downstreamPlugs()`.
+std::atomic<size_t> g_topologyGeneration( 0 );
+
+void topologyChanged()
+{
+	g_topologyGeneration++;
+}
+
 /// Assigns a value to something, reassigning the original
 /// value when it goes out of scope.
 template<typename T>
@@ -116,6 +129,7 @@ Plug::Plug( const std::string &name, Direction direction, unsigned flags )
 
 Plug::~Plug()
 {
+	topologyChanged();
 	setInputInternal( nullptr, false );
 	for( OutputContainer::iterator it=m_outputs.begin(); it!=m_outputs.end(); )
 	{
@@ -471,6 +485,7 @@ void Plug::setInput( PlugPtr input, bool setChildInputs, bool updateParentInput
 
 void Plug::setInputInternal( PlugPtr input, bool emit )
 {
+	topologyChanged();
 	if( m_input )
 	{
 		m_input->m_outputs.remove( this );
@@ -592,6 +607,7 @@ PlugPtr Plug::createCounterpart( const std::string &name, Direction direction )
 
 void Plug::parentChanging( Gaffer::GraphComponent *newParent )
 {
+	topologyChanged();
 	if( getFlags( Dynamic ) )
 	{
 		// When a dynamic plug is removed from a node, we
@@ -689,6 +705,7 @@ void Plug::parentChanging( Gaffer::GraphComponent *newParent )
 
 void Plug::parentChanged( Gaffer::GraphComponent *oldParent )
 {
+	topologyChanged();
 	GraphComponent::parentChanged( oldParent );
 
 	if( getFlags( Dynamic ) )
@@ -745,7 +762,7 @@ class Plug::DirtyPlugs
 	public :
 
 		DirtyPlugs()
-			:	m_scopeCount( 0 ), m_emitting( false )
+			:	m_scopeCount( 0 ), m_emitting( false ), m_traversing( false ), m_downstreamCacheGeneration( g_topologyGeneration )
 		{
 		}
 
@@ -763,23 +780,54 @@ class Plug::DirtyPlugs
 				return;
 			}
 
-			for( DownstreamIterator it( plugToDirty ); !it.done(); ++it )
+			// We can't clear the cache if we've been reentered from
+			// `affects()` during another traversal, because that
+			// traversal holds references into it.
+			if( !m_traversing && m_downstreamCacheGeneration != g_topologyGeneration )
+			{
+				m_downstreamCache.clear();
+				m_downstreamCacheGeneration = g_topologyGeneration;
+			}
+			ScopedAssignment<bool> scopedAssignment( m_traversing, true );
+
+			// Depth-first traversal, visiting plugs in the same order
+			// as DownstreamIterator would.
+			struct Frame
+			{
+				const Plug *plug;
+				const DependencyNode::AffectedPlugsContainer *downstream;
+				size_t index;
+			};
+
+			std::vector<Frame> stack;
+			stack.push_back( { plugToDirty, &downstreamPlugs( plugToDirty ), 0 } );
+			while( !stack.empty() )
 			{
-				InsertedVertex v = insertVertex( &*it );
-				if( !it->getFlags( Plug::AcceptsDependencyCycles ) )
+				Frame &frame = stack.back();
+				if( frame.index == frame.downstream->size() )
+				{
+					stack.pop_back();
+					continue;
+				}
+
+				const Plug *upstream = frame.plug;
+				const Plug *plug = (*frame.downstream)[frame.index++];
+
+				InsertedVertex v = insertVertex( plug );
+				if( !plug->getFlags( Plug::AcceptsDependencyCycles ) )
 				{
 					add_edge(
 						v.first,
-						insertVertex( it.upstream() ).first,
+						insertVertex( upstream ).first,
 						m_graph
 					);
 				}
 
-				if( !v.second )
+				// Only visit the dependents if we haven't already
+				// visited this plug by another path.
+				if( v.second )
 				{
-					// Already visited this plug by another path,
-					// so we can prune the iteration.
-					it.prune();
+					stack.push_back( { plug, &downstreamPlugs( plug ), 0 } );
 				}
 			}
 		}
@@ -820,7 +868,7 @@ class Plug::DirtyPlugs
 		typedef Graph::vertex_descriptor VertexDescriptor;
 		typedef Graph::edge_descriptor EdgeDescriptor;
 
-		typedef std::map<const Plug *, VertexDescriptor> PlugMap;
+		typedef std::unordered_map<const Plug *, VertexDescriptor> PlugMap;
 
 		// Equivalent to the return type for map::insert - the first
 		// field is the vertex descriptor, and the second field is
@@ -932,10 +980,33 @@ class Plug::DirtyPlugs
 			m_plugs.clear();
 		}
 
+		// Returns the plugs immediately downstream of `plug`, as visited
+		// by DownstreamIterator before recursing. Finding these involves
+		// calls to `DependencyNode::affects()`, which add up for large
+		// graphs, so we cache them until the topology next changes.
+		const DependencyNode::AffectedPlugsContainer &downstreamPlugs( const Plug *plug )
+		{
+			auto inserted = m_downstreamCache.insert( DownstreamCache::value_type( plug, DependencyNode::AffectedPlugsContainer() ) );
+			if( inserted.second )
+			{
+				for( DownstreamIterator it( plug ); !it.done(); ++it )
+				{
+					inserted.first->second.push_back( &*it );
+					it.prune();
+				}
+			}
+			return inserted.first->second;
+		}
+
 		Graph m_graph;
 		PlugMap m_plugs;
 		size_t m_scopeCount;
 		bool m_emitting;
+		bool m_traversing;
+
+		typedef std::unordered_map<const Plug *, DependencyNode::AffectedPlugsContainer> DownstreamCache;
+		DownstreamCache m_downstreamCache;
+		size_t m_downstreamCacheGeneration;
 
 };
 
@@ -58,7 +58,12 @@
 #include "boost/filesystem/path.hpp"
 
 #include <fstream>
+#include <list>
+#include <mutex>
+#include <sstream>
+#include <unordered_map>
 
+#include <sys/stat.h>
 #include <unistd.h>
 
 using namespace Gaffer;
@@ -204,7 +209,7 @@ IE_CORE_DEFINERUNTIMETYPED( ScriptNode::CompoundAction );
 namespace
 {
 
-std::string readFile( const std::string &fileName )
+std::string readFileInternal( const std::string &fileName )
 {
 	std::ifstream f( fileName.c_str() );
 	if( !f.good() )
@@ -212,20 +217,174 @@ std::string readFile( const std::string &fileName )
 		throw IECore::IOException( "Unable to open file \"" + fileName + "\"" );
 	}
 
-	std::string s;
-	while( !f.eof() )
+	std::ostringstream s;
+	if( f.peek() != std::ifstream::traits_type::eof() )
+	{
+		s << f.rdbuf();
+	}
+
+	if( f.bad() || !s.good() )
+	{
+		throw IECore::IOException( "Failed to read from \"" + fileName + "\"" );
+	}
+
+	// Maintain the trailing newline added by previous
+	// line-by-line implementations.
+	s << "\n";
+	return s.str();
+}
+
+// Identifies a particular version of a file on disk. We use
+// the full resolution modification time so that edits made
+// in quick succession are still detected.
+struct FileStamp
+{
+
+	FileStamp()
+		:	device( 0 ), inode( 0 ), size( 0 ), modificationSeconds( 0 ), modificationNanoseconds( 0 )
+	{
+	}
+
+	bool operator == ( const FileStamp &rhs ) const
+	{
+		return
+			device == rhs.device &&
+			inode == rhs.inode &&
+			size == rhs.size &&
+			modificationSeconds == rhs.modificationSeconds &&
+			modificationNanoseconds == rhs.modificationNanoseconds
+		;
+	}
+
+	dev_t device;
+	ino_t inode;
+	off_t size;
+	time_t modificationSeconds;
+	long modificationNanoseconds;
+
+};
+
+bool fileStamp( const std::string &fileName, FileStamp &stamp )
+{
+	struct stat s;
+	if( stat( fileName.c_str(), &s ) != 0 )
 	{
-		if( !f.good() )
+		return false;
+	}
+
+	stamp.device = s.st_dev;
+	stamp.inode = s.st_ino;
+	stamp.size = s.st_size;
+#ifdef __APPLE__
+	stamp.modificationSeconds = s.st_mtimespec.tv_sec;
+	stamp.modificationNanoseconds = s.st_mtimespec.tv_nsec;
+#else
+	stamp.modificationSeconds = s.st_mtim.tv_sec;
+	stamp.modificationNanoseconds = s.st_mtim.tv_nsec;
+#endif
+	return true;
+}
+
+// Caches file contents keyed by path and FileStamp, so that
+// loading many References to the same file only reads it from
+// disk once. Combined with the compiled serialisation cache in
+// the Python bindings, this also means each distinct file is
+// only compiled once.
+class FileCache
+{
+
+	public :
+
+		FileCache( size_t maxCost )
+			:	m_maxCost( maxCost ), m_cost( 0 )
 		{
-			throw IECore::IOException( "Failed to read from \"" + fileName + "\"" );
 		}
 
-		std::string line;
-		std::getline( f, line );
-		s += line + "\n";
-	}
+		std::string get( const std::string &fileName )
+		{
+			FileStamp stamp;
+			if( !fileStamp( fileName, stamp ) )
+			{
+				// Let `readFileInternal()` report the problem.
+				return readFileInternal( fileName );
+			}
 
-	return s;
+			{
+				std::lock_guard<std::mutex> lock( m_mutex );
+				Map::iterator it = m_map.find( fileName );
+				if( it != m_map.end() )
+				{
+					if( it->second->stamp == stamp )
+					{
+						m_list.splice( m_list.begin(), m_list, it->second );
+						return it->second->contents;
+					}
+					erase( it );
+				}
+			}
+
+			const std::string contents = readFileInternal( fileName );
+
+			// Only cache the contents if the file wasn't modified
+			// while we were reading it.
+			FileStamp postReadStamp;
+			if( !fileStamp( fileName, postReadStamp ) || !( postReadStamp == stamp ) )
+			{
+				return contents;
+			}
+
+			std::lock_guard<std::mutex> lock( m_mutex );
+			Map::iterator it = m_map.find( fileName );
+			if( it != m_map.end() )
+			{
+				erase( it );
+			}
+
+			m_list.push_front( Entry{ fileName, stamp, contents } );
+			m_map[fileName] = m_list.begin();
+			m_cost += contents.size();
+
+			// Evict least recently used entries, but always keep the
+			// one we just added.
+			while( m_cost > m_maxCost && m_list.size() > 1 )
+			{
+				erase( m_map.find( m_list.back().fileName ) );
+			}
+
+			return contents;
+		}
+
+	private :
+
+		struct Entry
+		{
+			std::string fileName;
+			FileStamp stamp;
+			std::string contents;
+		};
+
+		typedef std::list<Entry> List;
+		typedef std::unordered_map<std::string, List::iterator> Map;
+
+		void erase( Map::iterator it )
+		{
+			m_cost -= it->second->contents.size();
+			m_list.erase( it->second );
+			m_map.erase( it );
+		}
+
+		const size_t m_maxCost;
+		size_t m_cost;
+		std::mutex m_mutex;
+		List m_list;
+		Map m_map;
+
+};
+
+std::string readFile( const std::string &fileName )
+{
+	static FileCache g_cache( 100 * 1024 * 1024 );
+	return g_cache.get( fileName );
 }
 
 const IECore::InternedString g_scriptName( "script:name" );
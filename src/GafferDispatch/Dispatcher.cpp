@@ -46,9 +46,16 @@
 
 #include "IECore/FrameRange.h"
 #include "IECore/MessageHandler.h"
+#include "IECore/VectorTypedData.h"
 
 #include "boost/algorithm/string/predicate.hpp"
 #include "boost/filesystem.hpp"
+#include "boost/filesystem/fstream.hpp"
+#include "boost/unordered_map.hpp"
+#include "boost/unordered_set.hpp"
+
+#include "tbb/concurrent_unordered_map.h"
+#include "tbb/parallel_for.h"
 
 using namespace std;
 using namespace IECore;
@@ -63,6 +70,8 @@ static InternedString g_immediateBlindDataName( "dispatcher:immediate" );
 static InternedString g_sizeBlindDataName( "dispatcher:size" );
 static InternedString g_executedBlindDataName( "dispatcher:executed" );
 static InternedString g_visitedBlindDataName( "dispatcher:visited" );
+static InternedString g_journalDirectoryBlindDataName( "dispatcher:journalDirectory" );
+static InternedString g_fileName( "fileName" );
 static InternedString g_jobDirectoryContextEntry( "dispatcher:jobDirectory" );
 static InternedString g_scriptFileNameContextEntry( "dispatcher:scriptFileName" );
 static IECore::BoolDataPtr g_trueBoolData = new BoolData( true );
@@ -84,6 +93,8 @@ Dispatcher::Dispatcher( const std::string &name )
 	addChild( new StringPlug( "frameRange", Plug::In, "1-100x10" ) );
 	addChild( new StringPlug( "jobName", Plug::In, "" ) );
 	addChild( new StringPlug( "jobsDirectory", Plug::In, "" ) );
+	addChild( new BoolPlug( "journal", Plug::In, false ) );
+	addChild( new BoolPlug( "forceExecution", Plug::In, false ) );
 }
 
 Dispatcher::~Dispatcher()
@@ -130,6 +141,26 @@ const StringPlug *Dispatcher::jobsDirectoryPlug() const
 	return getChild<StringPlug>( g_firstPlugIndex + 3 );
 }
 
+BoolPlug *Dispatcher::journalPlug()
+{
+	return getChild<BoolPlug>( g_firstPlugIndex + 4 );
+}
+
+const BoolPlug *Dispatcher::journalPlug() const
+{
+	return getChild<BoolPlug>( g_firstPlugIndex + 4 );
+}
+
+BoolPlug *Dispatcher::forceExecutionPlug()
+{
+	return getChild<BoolPlug>( g_firstPlugIndex + 5 );
+}
+
+const BoolPlug *Dispatcher::forceExecutionPlug() const
+{
+	return getChild<BoolPlug>( g_firstPlugIndex + 5 );
+}
+
 const std::string Dispatcher::jobDirectory() const
 {
 	return m_jobDirectory;
@@ -179,7 +210,14 @@ void Dispatcher::createJobDirectory( const Gaffer::ScriptNode *script, Gaffer::C
 	long i = -1;
 	for( const auto &d : boost::filesystem::directory_iterator( jobDirectory ) )
 	{
-		i = std::max( i, strtol( d.path().filename().c_str(), nullptr, 10 ) );
+		// Ignore non-numeric entries such as the journal.
+		const std::string name = d.path().filename().string();
+		char *end = nullptr;
+		const long n = strtol( name.c_str(), &end, 10 );
+		if( end != name.c_str() && *end == '\0' )
+		{
+			i = std::max( i, n );
+		}
 	}
 
 	// Now create the next directory. We do this in a loop until we
@@ -287,6 +325,125 @@ FrameListPtr Dispatcher::frameRange( const ScriptNode *script, const Context *co
 	}
 }
 
+//////////////////////////////////////////////////////////////////////////
+// Journal utilities
+//////////////////////////////////////////////////////////////////////////
+
+namespace
+{
+
+// Returns the name of the journal entry for a task. We include the
+// name of the plug because the hash alone doesn't identify the node.
+std::string journalEntry( const TaskNode::TaskPlug *plug, const IECore::MurmurHash &taskHash )
+{
+	IECore::MurmurHash h = taskHash;
+	h.append( plug->relativeName( plug->ancestor<ScriptNode>() ) );
+	return h.toString();
+}
+
+// Fills `fingerprint` with a description of a task and its output file,
+// evaluated in the current context. The task hash is always included, so
+// that tasks without an output file are still invalidated by changes to
+// their inputs. Returns false if the task has an output file and it
+// doesn't exist.
+bool outputFingerprint( const TaskNode::TaskPlug *plug, const IECore::MurmurHash &taskHash, std::string &fingerprint )
+{
+	fingerprint = taskHash.toString();
+	const Node *node = plug->node();
+	const StringPlug *fileNamePlug = node ? node->getChild<StringPlug>( g_fileName ) : nullptr;
+	if( !fileNamePlug )
+	{
+		return true;
+	}
+
+	const std::string fileName = fileNamePlug->getValue();
+	if( fileName.empty() )
+	{
+		return true;
+	}
+
+	boost::system::error_code ec;
+	const uintmax_t size = boost::filesystem::file_size( fileName, ec );
+	if( ec )
+	{
+		return false;
+	}
+	const std::time_t time = boost::filesystem::last_write_time( fileName, ec );
+	if( ec )
+	{
+		return false;
+	}
+
+	fingerprint += boost::str( boost::format( " %s %d %d" ) % fileName % size % time );
+	return true;
+}
+
+// Returns true if the journal records a successful execution
+// of the task in the current context, and its output file is
+// unchanged since.
+bool upToDate( const std::string &journalDirectory, const TaskNode::TaskPlug *plug, const IECore::MurmurHash &taskHash )
+{
+	boost::filesystem::ifstream file( boost::filesystem::path( journalDirectory ) / journalEntry( plug, taskHash ) );
+	if( !file )
+	{
+		return false;
+	}
+
+	std::string recordedFingerprint;
+	std::getline( file, recordedFingerprint );
+
+	std::string fingerprint;
+	if( !outputFingerprint( plug, taskHash, fingerprint ) )
+	{
+		return false;
+	}
+
+	return fingerprint == recordedFingerprint;
+}
+
+} // namespace
+
+void Dispatcher::recordExecution( const TaskNode::TaskPlug *plug, const std::vector<float> &frames, const std::string &journalDirectory )
+{
+	// The tasks have been executed successfully, so a failure to
+	// update the journal is not fatal. The worst outcome is that the
+	// tasks will be executed again by the next dispatch.
+	try
+	{
+		boost::filesystem::create_directories( journalDirectory );
+
+		Context::EditableScope scopedContext( Context::current() );
+		for( auto frame : frames )
+		{
+			scopedContext.setFrame( frame );
+			const IECore::MurmurHash taskHash = plug->hash();
+			if( taskHash == IECore::MurmurHash() )
+			{
+				// No-ops are never journaled.
+				continue;
+			}
+
+			std::string fingerprint;
+			outputFingerprint( plug, taskHash, fingerprint );
+
+			// Write to a temporary file and rename, so that concurrent
+			// readers never see a partial entry.
+			const boost::filesystem::path entry = boost::filesystem::path( journalDirectory ) / journalEntry( plug, taskHash );
+			boost::filesystem::path tmpEntry = entry;
+			tmpEntry += boost::filesystem::unique_path( ".%%%%-%%%%-%%%%" );
+			{
+				boost::filesystem::ofstream file( tmpEntry );
+				file << fingerprint << "\n";
+			}
+			boost::filesystem::rename( tmpEntry, entry );
+		}
+	}
+	catch( const std::exception &e )
+	{
+		IECore::msg( IECore::Msg::Warning, "Dispatcher::recordExecution", e.what() );
+	}
+}
+
 //////////////////////////////////////////////////////////////////////////
 // TaskBatch implementation
 //////////////////////////////////////////////////////////////////////////
@@ -317,8 +474,24 @@ void Dispatcher::TaskBatch::execute() const
 		return;
 	}
 
+	{
+		Context::Scope scopedContext( m_context.get() );
+		m_plug->executeSequence( m_frames );
+	}
+
+	recordExecution();
+}
+
+void Dispatcher::TaskBatch::recordExecution() const
+{
+	const StringData *journalDirectoryData = m_blindData->member<StringData>( g_journalDirectoryBlindDataName );
+	if( !journalDirectoryData || m_frames.empty() )
+	{
+		return;
+	}
+
 	Context::Scope scopedContext( m_context.get() );
-	m_plug->executeSequence( m_frames );
+	Dispatcher::recordExecution( m_plug.get(), m_frames, journalDirectoryData->readable() );
 }
 
 const TaskNode::TaskPlug *Dispatcher::TaskBatch::plug() const
@@ -377,11 +550,22 @@ class Dispatcher::Batcher
 
 	public :
 
-		Batcher()
-			:	m_rootBatch( new TaskBatch() )
+		Batcher( const std::string &journalDirectory = "", bool forceExecution = false )
+			:	m_rootBatch( new TaskBatch() ), m_journalDirectory( journalDirectory ), m_forceExecution( forceExecution )
 		{
 		}
 
+		void addTasks( const TaskNode::Tasks &tasks )
+		{
+			// Query the tasks in parallel first, so that the
+			// serial walk below need not compute anything.
+			prepareTasks( tasks );
+			for( const auto &task : tasks )
+			{
+				addTask( task );
+			}
+		}
+
 		void addTask( const TaskNode::Task &task )
 		{
 			if( auto batch = batchTasksWalk( task ) )
@@ -397,7 +581,130 @@ class Dispatcher::Batcher
 
 	private :
 
-		TaskBatchPtr batchTasksWalk( TaskNode::Task task, const std::set<const TaskBatch *> &ancestors = std::set<const TaskBatch *>() )
+		// The results of querying a task. Computing these is the
+		// expensive part of building the batch graph, because it
+		// requires hashing the task and evaluating `preTasks()` and
+		// `postTasks()`, all of which may trigger arbitrary
+		// computation upstream.
+		struct TaskInfo
+		{
+
+			TaskInfo( const TaskNode::Task &task )
+				:	task( task )
+			{
+			}
+
+			// The task with Switches and ContextProcessors resolved.
+			TaskNode::Task task;
+			// The remaining members are only filled if `task` is
+			// an output.
+			IECore::MurmurHash hash;
+			TaskNode::Tasks preTasks;
+			TaskNode::Tasks postTasks;
+
+		};
+
+		typedef std::shared_ptr<const TaskInfo> ConstTaskInfoPtr;
+
+		// Walks the graph of tasks reachable from each of `tasks` in
+		// parallel, storing a TaskInfo for each in `m_taskInfos`. Because
+		// the order in which tasks are visited is non-deterministic, we don't
+		// construct any batches here, leaving that to the serial walk in
+		// `batchTasksWalk()`. This guarantees that the batches are identical
+		// to those that would be made by a purely serial dispatch.
+		void prepareTasks( const TaskNode::Tasks &tasks )
+		{
+			tbb::task_group_context taskGroupContext( tbb::task_group_context::isolated );
+			tbb::parallel_for(
+				tbb::blocked_range<size_t>( 0, tasks.size() ),
+				[&]( const tbb::blocked_range<size_t> &r ) {
+					for( size_t i = r.begin(); i != r.end(); ++i )
+					{
+						prepareTasksWalk( tasks[i] );
+					}
+				},
+				taskGroupContext
+			);
+		}
+
+		void prepareTasksWalk( const TaskNode::Task &task )
+		{
+			auto inserted = m_taskInfos.insert( TaskInfoMap::value_type( taskKey( task ), nullptr ) );
+			if( !inserted.second )
+			{
+				// Already visited by this or another thread.
+				return;
+			}
+
+			std::shared_ptr<TaskInfo> info;
+			try
+			{
+				info = computeTaskInfo( task );
+			}
+			catch( ... )
+			{
+				// Leave the error to be rethrown by the serial
+				// walk, so that it is reported exactly as it would
+				// be without the parallel pass.
+				return;
+			}
+
+			// No other thread will access this entry until the
+			// parallel walk is complete, so we can assign it
+			// without locking.
+			inserted.first->second = info;
+
+			for( const auto &t : info->postTasks )
+			{
+				prepareTasksWalk( t );
+			}
+			for( const auto &t : info->preTasks )
+			{
+				prepareTasksWalk( t );
+			}
+		}
+
+		// Returns the TaskInfo stored by `prepareTasks()`, or null
+		// if it is not available.
+		ConstTaskInfoPtr taskInfo( const TaskNode::Task &task ) const
+		{
+			auto it = m_taskInfos.find( taskKey( task ) );
+			return it != m_taskInfos.end() ? it->second : nullptr;
+		}
+
+		std::shared_ptr<TaskInfo> computeTaskInfo( const TaskNode::Task &task ) const
+		{
+			std::shared_ptr<TaskInfo> result = std::make_shared<TaskInfo>( resolveTask( task ) );
+			if( result->task.plug()->direction() != Plug::Out )
+			{
+				return result;
+			}
+
+			Context::Scope scopedTaskContext( result->task.context() );
+			result->hash = result->task.plug()->hash();
+			result->task.plug()->preTasks( result->preTasks );
+			result->task.plug()->postTasks( result->postTasks );
+			return result;
+		}
+
+		// Identifies a task uniquely, taking into account the entire
+		// context. Unlike `Context::hash()`, we include "ui:" variables,
+		// because they will be visible in the TaskBatch contexts.
+		static IECore::MurmurHash taskKey( const TaskNode::Task &task )
+		{
+			IECore::MurmurHash result;
+			result.append( (uint64_t)task.plug() );
+			std::vector<IECore::InternedString> names;
+			task.context()->names( names );
+			for( const auto &name : names )
+			{
+				result.append( name );
+				task.context()->get<const IECore::Data>( name )->hash( result );
+			}
+			return result;
+		}
+
+		static TaskNode::Task resolveTask( TaskNode::Task task )
 		{
 			task = TaskNode::Task( task.plug()->source<TaskNode::TaskPlug>(), task.context() );
 			// Deal with Switch and ContextProcessor nodes. We need to do this manually
@@ -418,6 +725,15 @@ class Dispatcher::Batcher
 					task = TaskNode::Task( contextProcessor->inPlug()->source<TaskNode::TaskPlug>(), contextProcessor->inPlugContext().get() );
 				}
 			}
+			return task;
+		}
+
+		// If `executes` is passed, it is set to true if the task or any of its
+		// preTasks (transitively) will be executed by the dispatch.
+		TaskBatchPtr batchTasksWalk( TaskNode::Task task, const std::set<const TaskBatch *> &ancestors = std::set<const TaskBatch *>(), bool *executes = nullptr )
+		{
+			ConstTaskInfoPtr info = taskInfo( task );
+			task = info ? info->task : resolveTask( task );
 
 			if( task.plug()->direction() != Plug::Out )
 			{
@@ -427,20 +743,36 @@ class Dispatcher::Batcher
 			// Acquire a batch with this task placed in it,
 			// and check that we haven't discovered a cyclic
 			// dependency.
-			TaskBatchPtr batch = acquireBatch( task );
+			MurmurHash taskHash;
+			if( info )
+			{
+				taskHash = info->hash;
+			}
+			else
+			{
+				Context::Scope scopedTaskContext( task.context() );
+				taskHash = task.plug()->hash();
+			}
+
+			MurmurHash batchedTaskHash;
+			bool journalCheckPending = false;
+			TaskBatchPtr batch = acquireBatch( task, taskHash, batchedTaskHash, journalCheckPending );
 			if( ancestors.find( batch.get() ) != ancestors.end() )
 			{
 				throw IECore::Exception( ( boost::format( "Dispatched tasks cannot have cyclic dependencies but %s is involved in a cycle." ) % batch->plug()->relativeName( batch->plug()->ancestor<ScriptNode>() ) ).str() );
 			}
 
 			// Ask the task what preTasks and postTasks it would like.
-			TaskNode::Tasks preTasks;
-			TaskNode::Tasks postTasks;
+			TaskNode::Tasks computedPreTasks;
+			TaskNode::Tasks computedPostTasks;
+			if( !info )
 			{
 				Context::Scope scopedTaskContext( task.context() );
-				task.plug()->preTasks( preTasks );
-				task.plug()->postTasks( postTasks );
+				task.plug()->preTasks( computedPreTasks );
+				task.plug()->postTasks( computedPostTasks );
 			}
+			const TaskNode::Tasks &preTasks = info ? info->preTasks : computedPreTasks;
+			const TaskNode::Tasks &postTasks = info ? info->postTasks : computedPostTasks;
 
 			// Collect all the batches the postTasks belong in.
 			// We grab these first because they need to be included
@@ -465,12 +797,40 @@ class Dispatcher::Batcher
 				preTaskAncestors.insert( it->get() );
 			}
 
+			bool preTasksExecute = false;
 			for( TaskNode::Tasks::const_iterator it = preTasks.begin(); it != preTasks.end(); ++it )
 			{
-				if( auto preBatch = batchTasksWalk( *it, preTaskAncestors ) )
+				bool preTaskExecutes = false;
+				if( auto preBatch = batchTasksWalk( *it, preTaskAncestors, &preTaskExecutes ) )
 				{
 					addPreTask( batch.get(), preBatch );
 				}
+				preTasksExecute = preTasksExecute || preTaskExecutes;
+			}
+
+			// If the journal says the task has been executed already, we treat
+			// it as a no-op, so that it remains in the graph to connect its
+			// preTasks and postTasks, but isn't executed. We can only do that
+			// once we know that none of its preTasks will be executed, because
+			// they may change the task's inputs.
+			if( journalCheckPending )
+			{
+				bool taskIsUpToDate = false;
+				if( !preTasksExecute )
+				{
+					Context::Scope scopedTaskContext( task.context() );
+					taskIsUpToDate = upToDate( m_journalDirectory, task.plug(), taskHash );
+				}
+				if( !taskIsUpToDate )
+				{
+					addTaskFrame( task, batch.get(), batchedTaskHash );
+					batch->blindData()->writable()[g_journalDirectoryBlindDataName] = new StringData( m_journalDirectory );
+				}
+			}
+
+			if( executes )
+			{
+				*executes = preTasksExecute || m_executingTasks.find( batchedTaskHash ) != m_executingTasks.end();
 			}
 
 			// As far as TaskBatch and doDispatch() are concerned, there
@@ -487,18 +847,19 @@ class Dispatcher::Batcher
 			return batch;
 		}
 
-		TaskBatchPtr acquireBatch( const TaskNode::Task &task )
+		// Returns the batch for the task, placing the task in a batch if it hasn't
+		// been visited before. The unique identity of the task within the dispatch
+		// is returned in `batchedTaskHash`. If the task must be checked against
+		// the journal before its frame is added to the batch, `journalCheckPending`
+		// is set to true and the check is left to the caller.
+		TaskBatchPtr acquireBatch( const TaskNode::Task &task, MurmurHash taskHash, MurmurHash &batchedTaskHash, bool &journalCheckPending )
 		{
 			// See if we've previously visited this task, and therefore
 			// have placed it in a batch already, which we can return
 			// unchanged. The `taskHash` is used as the unique identity of
 			// the task.
-			MurmurHash taskHash;
-			{
-				Context::Scope scopedTaskContext( task.context() );
-				taskHash = task.plug()->hash();
-			}
 			const bool taskIsNoOp = taskHash == IECore::MurmurHash();
+			const bool journalTask = !taskIsNoOp && !m_journalDirectory.empty();
 			if( taskIsNoOp )
 			{
 				// Prevent no-ops from coalescing into a single batch, as this
@@ -509,6 +870,7 @@ class Dispatcher::Batcher
 			// coalesced.
 			taskHash.append( (uint64_t)task.plug() );
 
+			batchedTaskHash = taskHash;
 			const TaskToBatchMap::const_iterator it = m_tasksToBatches.find( taskHash );
 			if( it != m_tasksToBatches.end() )
 			{
@@ -549,18 +911,20 @@ class Dispatcher::Batcher
 
 			// Now we have an appropriate batch, update it to include
 			// the frame for our task, and any other relevant information.
+			// Tasks that may be up to date according to the journal are
+			// left for the caller to check once their preTasks have been
+			// visited.
 
-			if( !taskIsNoOp )
+			if( journalTask && !m_forceExecution )
 			{
-				float frame = task.context()->getFrame();
-				std::vector<float> &frames = batch->frames();
-				if( requiresSequenceExecution )
-				{
-					frames.insert( std::lower_bound( frames.begin(), frames.end(), frame ), frame );
-				}
-				else
+				journalCheckPending = true;
+			}
+			else if( !taskIsNoOp )
+			{
+				addTaskFrame( task, batch.get(), taskHash );
+				if( journalTask )
 				{
-					frames.push_back( frame );
+					batch->blindData()->writable()[g_journalDirectoryBlindDataName] = new StringData( m_journalDirectory );
 				}
 			}
 
@@ -581,6 +945,23 @@ class Dispatcher::Batcher
 			return batch;
 		}
 
+		// Adds the frame for `task` to `batch`, and records that the task
+		// will be executed.
+		void addTaskFrame( const TaskNode::Task &task, TaskBatch *batch, const MurmurHash &batchedTaskHash )
+		{
+			const float frame = task.context()->getFrame();
+			std::vector<float> &frames = batch->frames();
+			if( task.plug()->requiresSequenceExecution() )
+			{
+				frames.insert( std::lower_bound( frames.begin(), frames.end(), frame ), frame );
+			}
+			else
+			{
+				frames.push_back( frame );
+			}
+			m_executingTasks.insert( batchedTaskHash );
+		}
+
 		// Hash used to determine how to coalesce tasks into batches.
 		// If `batchHash( task1 ) == batchHash( task2 )` then the two
 		// tasks can be placed in the same batch.
@@ -654,12 +1035,17 @@ class Dispatcher::Batcher
 			return static_cast<const TaskNode *>( task.plug()->node() )->dispatcherPlug();
 		}
 
-		typedef std::map<IECore::MurmurHash, TaskBatchPtr> BatchMap;
-		typedef std::map<IECore::MurmurHash, TaskBatchPtr> TaskToBatchMap;
+		typedef boost::unordered_map<IECore::MurmurHash, TaskBatchPtr> BatchMap;
+		typedef boost::unordered_map<IECore::MurmurHash, TaskBatchPtr> TaskToBatchMap;
+		typedef tbb::concurrent_unordered_map<IECore::MurmurHash, ConstTaskInfoPtr, boost::hash<IECore::MurmurHash>> TaskInfoMap;
 
 		TaskBatchPtr m_rootBatch;
 		BatchMap m_currentBatches;
 		TaskToBatchMap m_tasksToBatches;
+		boost::unordered_set<IECore::MurmurHash> m_executingTasks;
+		TaskInfoMap m_taskInfos;
+		const std::string m_journalDirectory;
+		const bool m_forceExecution;
 
 };
 
@@ -775,16 +1161,25 @@ void Dispatcher::dispatch( const std::vector<NodePtr> &nodes ) const
 	FrameListPtr frameList = frameRange( script, Context::current() );
 	frameList->asList( frames );
 
-	Batcher batcher;
+	TaskNode::Tasks tasks;
 	for( std::vector<FrameList::Frame>::const_iterator fIt = frames.begin(); fIt != frames.end(); ++fIt )
 	{
 		for( std::vector<TaskNodePtr>::const_iterator nIt = taskNodes.begin(); nIt != taskNodes.end(); ++nIt )
 		{
 			jobContext->setFrame( *fIt );
-			batcher.addTask( TaskNode::Task( *nIt, Context::current() ) );
+			tasks.push_back( TaskNode::Task( *nIt, Context::current() ) );
 		}
 	}
 
+	std::string journalDirectory;
+	if( journalPlug()->getValue() )
+	{
+		journalDirectory = ( boost::filesystem::path( m_jobDirectory ).parent_path() / "journal" ).string();
+	}
+
+	Batcher batcher( journalDirectory, forceExecutionPlug()->getValue() );
+	batcher.addTasks( tasks );
+
 	executeAndPruneImmediateBatches( batcher.rootBatch() );
 
 	// Save the script. If we're in a nested dispatch, this may have been done already by
@@ -134,6 +134,12 @@ class DispatcherWrapper : public NodeWrapper<Dispatcher>
 			batch.execute();
 		}
 
+		static void taskBatchRecordExecution( const Dispatcher::TaskBatch &batch )
+		{
+			ScopedGILRelease gilRelease;
+			batch.recordExecution();
+		}
+
 		static TaskNodePtr taskBatchGetNode( const Dispatcher::TaskBatchPtr &batch )
 		{
 			if ( ConstTaskNodePtr node = batch->node() )
@@ -254,6 +260,14 @@ IECore::FrameListPtr frameRange( Dispatcher &n, const ScriptNode &script, const
 	return n.Dispatcher::frameRange( &script, &context );
 }
 
+void recordExecution( const TaskNode::TaskPlug &plug, object pythonFrames, const std::string &journalDirectory )
+{
+	std::vector<float> frames;
+	boost::python::container_utils::extend_container( frames, pythonFrames );
+	ScopedGILRelease gilRelease;
+	Dispatcher::recordExecution( &plug, frames, journalDirectory );
+}
+
 static void registerDispatcher( std::string type, object creator, object setupPlugsFn )
 {
 	DispatcherHelper helper( creator, setupPlugsFn );
@@ -367,6 +381,7 @@ void GafferDispatchModule::bindDispatcher()
 		.def( "preDispatchSignal", &Dispatcher::preDispatchSignal, return_value_policy<reference_existing_object>() ).staticmethod( "preDispatchSignal" )
 		.def( "dispatchSignal", &Dispatcher::dispatchSignal, return_value_policy<reference_existing_object>() ).staticmethod( "dispatchSignal" )
 		.def( "postDispatchSignal", &Dispatcher::postDispatchSignal, return_value_policy<reference_existing_object>() ).staticmethod( "postDispatchSignal" )
+		.def( "recordExecution", &recordExecution, ( arg( "plug" ), arg( "frames" ), arg( "journalDirectory" ) ) ).staticmethod( "recordExecution" )
 	;
 
 	enum_<Dispatcher::FramesMode>( "FramesMode" )
@@ -377,6 +392,7 @@ void GafferDispatchModule::bindDispatcher()
 
 	RefCountedClass<DispatcherWrapper::TaskBatch, RefCounted>( "_TaskBatch" )
 		.def( "execute", &DispatcherWrapper::taskBatchExecute )
+		.def( "recordExecution", &DispatcherWrapper::taskBatchRecordExecution )
 		.def( "node", &DispatcherWrapper::taskBatchGetNode )
 		.def( "plug", &DispatcherWrapper::taskBatchPlug )
 		.def( "context", &DispatcherWrapper::taskBatchGetContext, ( boost::python::arg_( "_copy" ) = true ) )
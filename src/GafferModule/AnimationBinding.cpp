@@ -43,6 +43,8 @@
 
 #include "Gaffer/Animation.h"
 
+#include "IECore/VectorTypedData.h"
+
 #include "boost/lexical_cast.hpp"
 
 using namespace boost::python;
@@ -109,6 +111,14 @@ void removeKey( Animation::CurvePlug &p, const Animation::KeyPtr &k )
 	p.removeKey( k );
 }
 
+IECore::FloatVectorDataPtr evaluateTimes( const Animation::CurvePlug &p, const IECore::FloatVectorData *times )
+{
+	IECore::FloatVectorDataPtr result = new IECore::FloatVectorData;
+	ScopedGILRelease gilRelease;
+	result->writable() = p.evaluate( times->readable() );
+	return result;
+}
+
 class CurvePlugSerialiser : public ValuePlugSerialiser
 {
 
@@ -208,7 +218,8 @@ void GafferModule::bindAnimation()
 			(Animation::Key *(Animation::CurvePlug::*)( float ))&Animation::CurvePlug::nextKey,
 			return_value_policy<IECorePython::CastToIntrusivePtr>()
 		)
-		.def( "evaluate", &Animation::CurvePlug::evaluate )
+		.def( "evaluate", (float (Animation::CurvePlug::*)( float ) const)&Animation::CurvePlug::evaluate )
+		.def( "evaluate", &evaluateTimes )
 		.attr( "__qualname__" ) = "Animation.CurvePlug"
 	;
 
@@ -46,6 +46,7 @@
 #include "Gaffer/Path.h"
 #include "Gaffer/PathFilter.h"
 #include "Gaffer/FileSystemPath.h"
+#include "Gaffer/Plug.h"
 
 #include "IECorePython/RunTimeTypedBinding.h"
 #include "IECorePython/ExceptionAlgo.h"
@@ -397,6 +398,11 @@ void delSlice( Path &p, boost::python::slice s )
 	p.remove( start, stop );
 }
 
+PlugPtr cancellationSubject( const Path &p )
+{
+	return const_cast<Plug *>( p.cancellationSubject() );
+}
+
 struct PathChangedSlotCaller
 {
 	boost::signals::detail::unusable operator()( boost::python::object slot, PathPtr p )
@@ -446,6 +452,8 @@ void GafferModule::bindPath()
 			.def( "isEmpty", &Path::isEmpty )
 			.def( "parent", &Path::parent )
 			.def( "children", &childrenWrapper )
+			.def( "copyForBackgroundUse", &Path::copyForBackgroundUse )
+			.def( "cancellationSubject", &cancellationSubject )
 			.def( "setFilter", &Path::setFilter )
 			.def( "getFilter", (PathFilter *(Path::*)())&Path::getFilter, return_value_policy<CastToIntrusivePtr>() )
 			.def( "pathChangedSignal", &Path::pathChangedSignal, return_internal_reference<1>() )
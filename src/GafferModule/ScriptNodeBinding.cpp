@@ -48,18 +48,28 @@
 #include "Gaffer/ScriptNode.h"
 #include "Gaffer/StandardSet.h"
 #include "Gaffer/StringPlug.h"
+#include "Gaffer/Version.h"
 
 #include "IECorePython/ExceptionAlgo.h"
 #include "IECorePython/ScopedGILLock.h"
 #include "IECorePython/ScopedGILRelease.h"
 
 #include "IECore/MessageHandler.h"
+#include "IECore/MurmurHash.h"
 
 #include "boost/algorithm/string/replace.hpp"
+#include "boost/filesystem.hpp"
+#include "boost/format.hpp"
+#include "boost/functional/hash.hpp"
 #include "boost/lexical_cast.hpp"
 #include "boost/regex.hpp"
 
+#include <cstdlib>
+#include <fstream>
+#include <iterator>
+#include <list>
 #include <memory>
+#include <unordered_map>
 
 using namespace Gaffer;
 using namespace GafferBindings;
@@ -70,6 +80,7 @@ using namespace GafferBindings;
 
 extern "C"
 {
+#include "marshal.h"
 // essential to include this last, since it defines macros which
 // clash with other headers.
 #include "Python-ast.h"
@@ -105,74 +116,6 @@ const std::string formattedErrorContext( int lineNumber, const std::string &cont
 	);
 }
 
-// Execute the script one top level statement at a time,
-// reporting errors that occur, but otherwise continuing
-// with execution.
-bool tolerantExec( const char *pythonScript, boost::python::object globals, boost::python::object locals, const std::string &context )
-{
-	// The python parsing framework uses an arena to simplify memory allocation,
-	// which is handy for us, since we're going to manipulate the AST a little.
-	std::unique_ptr<PyArena, decltype( &PyArena_Free )> arena( PyArena_New(), PyArena_Free );
-
-	// Parse the whole script, getting an abstract syntax tree for a
-	// module which would execute everything.
-	mod_ty mod = PyParser_ASTFromString(
-		pythonScript,
-		"<string>",
-		Py_file_input,
-		nullptr,
-		arena.get()
-	);
-
-	if( !mod )
-	{
-		int lineNumber = 0;
-		std::string message = IECorePython::ExceptionAlgo::formatPythonException( /* withTraceback = */ false, &lineNumber );
-		IECore::msg( IECore::Msg::Error, formattedErrorContext( lineNumber, context ), message );
-		return false;
-	}
-
-	assert( mod->kind == Module_kind );
-
-	// Loop over the top-level statements in the module body,
-	// executing one at a time.
-	bool result = false;
-	int numStatements = asdl_seq_LEN( mod->v.Module.body );
-	for( int i=0; i<numStatements; ++i )
-	{
-		// Make a new module containing just this one statement.
-		asdl_seq *newBody = asdl_seq_new( 1, arena.get() );
-		asdl_seq_SET( newBody, 0, asdl_seq_GET( mod->v.Module.body, i ) );
-		mod_ty newModule = Module(
-			newBody,
-			arena.get()
-		);
-
-		// Compile it.
-		boost::python::handle<PyCodeObject> code( PyAST_Compile( newModule, "<string>", nullptr, arena.get() ) );
-
-		// And execute it.
-		boost::python::handle<> v( boost::python::allow_null(
-			PyEval_EvalCode(
-				code.get(),
-				globals.ptr(),
-				locals.ptr()
-			)
-		) );
-
-		// Report any errors.
-		if( v == nullptr)
-		{
-			int lineNumber = 0;
-			std::string message = IECorePython::ExceptionAlgo::formatPythonException( /* withTraceback = */ false, &lineNumber );
-			IECore::msg( IECore::Msg::Error, formattedErrorContext( lineNumber, context ), message );
-			result = true;
-		}
-	}
-
-	return result;
-}
-
 // The dict returned will form both the locals and the globals for
 // the execute() methods. It's not possible to have a separate locals
 // and globals dictionary and have things work as intended. See
@@ -270,6 +213,479 @@ std::string replaceImath( const std::string &serialisation )
 	return result;
 }
 
+// Compiled serialisations
+// =======================
+//
+// Compiling large serialisations is expensive, so we cache the compiled
+// code, keyed by the hash of the serialisation. Top level statements are
+// compiled together in batches so that they can be executed in one go.
+// A new batch is started whenever a statement shares a line with the
+// previous one (which can only happen when they are separated by `;`), so
+// that within a batch, the line number of an error identifies the statement
+// that raised it. This allows `tolerantExec()` to resume execution from
+// the very next statement.
+
+typedef boost::python::handle<PyCodeObject> CodePtr;
+
+struct CompiledSerialisation
+{
+
+	struct Batch
+	{
+		CodePtr code;
+		// Index of the first statement in the batch.
+		size_t firstStatement;
+		// The line number on which each statement in the batch starts.
+		std::vector<int> lineNumbers;
+	};
+
+	std::vector<Batch> batches;
+
+};
+
+typedef std::shared_ptr<const CompiledSerialisation> ConstCompiledSerialisationPtr;
+
+// Returns null, leaving the Python error set, if compilation fails.
+ConstCompiledSerialisationPtr compileSerialisation( const std::string &serialisation )
+{
+	const std::string toExecute = replaceImath( serialisation );
+
+	// The python parsing framework uses an arena to simplify memory allocation,
+	// which is handy for us, since we're going to manipulate the AST a little.
+	std::unique_ptr<PyArena, decltype( &PyArena_Free )> arena( PyArena_New(), PyArena_Free );
+
+	// Parse the whole script, getting an abstract syntax tree for a
+	// module which would execute everything.
+	mod_ty mod = PyParser_ASTFromString(
+		toExecute.c_str(),
+		"<string>",
+		Py_file_input,
+		nullptr,
+		arena.get()
+	);
+
+	if( !mod )
+	{
+		return nullptr;
+	}
+
+	assert( mod->kind == Module_kind );
+
+	std::shared_ptr<CompiledSerialisation> result( new CompiledSerialisation );
+
+	const int numStatements = asdl_seq_LEN( mod->v.Module.body );
+	int batchBegin = 0;
+	while( batchBegin < numStatements )
+	{
+		// Top level statements start in the first column unless
+		// they follow another statement on the same line.
+		int batchEnd = batchBegin + 1;
+		while(
+			batchEnd < numStatements &&
+			((stmt_ty)asdl_seq_GET( mod->v.Module.body, batchEnd ))->col_offset == 0
+		)
+		{
+			batchEnd++;
+		}
+
+		// Make a new module containing just the statements in the batch.
+		CompiledSerialisation::Batch batch;
+		batch.firstStatement = batchBegin;
+		asdl_seq *batchBody = asdl_seq_new( batchEnd - batchBegin, arena.get() );
+		for( int i = batchBegin; i < batchEnd; ++i )
+		{
+			stmt_ty statement = (stmt_ty)asdl_seq_GET( mod->v.Module.body, i );
+			asdl_seq_SET( batchBody, i - batchBegin, statement );
+			batch.lineNumbers.push_back( statement->lineno );
+		}
+
+		mod_ty batchModule = Module(
+			batchBody,
+			arena.get()
+		);
+
+		// Compile it.
+		batch.code = CodePtr( boost::python::allow_null(
+			PyAST_Compile( batchModule, "<string>", nullptr, arena.get() )
+		) );
+		if( !batch.code )
+		{
+			return nullptr;
+		}
+
+		result->batches.push_back( batch );
+		batchBegin = batchEnd;
+	}
+
+	return result;
+}
+
+// Persistent cache
+// ================
+//
+// Processes which only load a script once, such as those on a render farm,
+// get no benefit from an in-process cache. So if the `GAFFER_SCRIPT_CACHE_PATH`
+// environment variable is set, compiled serialisations are also stored in
+// that directory, in Python's `marshal` format, and reused by subsequent
+// processes. Marshalled code is only valid for the version of Python that
+// wrote it, and `replaceImath()` depends on the version of Gaffer, so both
+// versions are included in the key.
+
+IECore::MurmurHash serialisationHash( const std::string &serialisation )
+{
+	IECore::MurmurHash result;
+	result.append( serialisation );
+	result.append( PY_VERSION );
+	result.append( Py_MARSHAL_VERSION );
+	result.append( GAFFER_MILESTONE_VERSION );
+	result.append( GAFFER_MAJOR_VERSION );
+	result.append( GAFFER_MINOR_VERSION );
+	result.append( GAFFER_PATCH_VERSION );
+	return result;
+}
+
+boost::filesystem::path persistentCacheFile( const IECore::MurmurHash &hash )
+{
+	const char *cachePath = getenv( "GAFFER_SCRIPT_CACHE_PATH" );
+	if( !cachePath || !*cachePath )
+	{
+		return boost::filesystem::path();
+	}
+
+	return boost::filesystem::path( cachePath ) / ( hash.toString() + ".gfrc" );
+}
+
+// Returns null if the file doesn't exist or isn't valid.
+ConstCompiledSerialisationPtr readCompiledSerialisation( const boost::filesystem::path &file )
+{
+	std::ifstream stream( file.string(), std::ios::binary );
+	if( !stream )
+	{
+		return nullptr;
+	}
+
+	std::string data( ( std::istreambuf_iterator<char>( stream ) ), std::istreambuf_iterator<char>() );
+
+	boost::python::handle<> marshalled( boost::python::allow_null(
+		PyMarshal_ReadObjectFromString( &data[0], data.size() )
+	) );
+	if( !marshalled )
+	{
+		PyErr_Clear();
+		return nullptr;
+	}
+
+	// The file contains a list with a `( firstStatement, lineNumbers, code )`
+	// tuple for each batch. Since it could have been modified by anyone, we
+	// validate it fully before using it.
+
+	std::shared_ptr<CompiledSerialisation> result( new CompiledSerialisation );
+	try
+	{
+		boost::python::extract<boost::python::list> batches( boost::python::object( marshalled ) );
+		if( !batches.check() )
+		{
+			return nullptr;
+		}
+
+		for( boost::python::ssize_t i = 0, e = boost::python::len( batches() ); i < e; ++i )
+		{
+			boost::python::extract<boost::python::tuple> t( batches()[i] );
+			if( !t.check() || boost::python::len( t() ) != 3 )
+			{
+				return nullptr;
+			}
+
+			CompiledSerialisation::Batch batch;
+			batch.firstStatement = boost::python::extract<size_t>( t()[0] );
+
+			boost::python::list lineNumbers = boost::python::extract<boost::python::list>( t()[1] );
+			for( boost::python::ssize_t j = 0, je = boost::python::len( lineNumbers ); j < je; ++j )
+			{
+				batch.lineNumbers.push_back( boost::python::extract<int>( lineNumbers[j] ) );
+			}
+
+			boost::python::object code = t()[2];
+			if( !PyCode_Check( code.ptr() ) || batch.lineNumbers.empty() )
+			{
+				return nullptr;
+			}
+			batch.code = CodePtr( boost::python::borrowed( (PyCodeObject *)code.ptr() ) );
+
+			result->batches.push_back( batch );
+		}
+	}
+	catch( boost::python::error_already_set &e )
+	{
+		PyErr_Clear();
+		return nullptr;
+	}
+
+	return result;
+}
+
+void writeCompiledSerialisation( const CompiledSerialisation &compiled, const boost::filesystem::path &file )
+{
+	boost::python::list batches;
+	for( const auto &batch : compiled.batches )
+	{
+		boost::python::list lineNumbers;
+		for( int lineNumber : batch.lineNumbers )
+		{
+			lineNumbers.append( lineNumber );
+		}
+		boost::python::object code( boost::python::handle<>( boost::python::borrowed( (PyObject *)batch.code.get() ) ) );
+		batches.append( boost::python::make_tuple( batch.firstStatement, lineNumbers, code ) );
+	}
+
+	boost::python::handle<> data( boost::python::allow_null(
+		PyMarshal_WriteObjectToString( batches.ptr(), Py_MARSHAL_VERSION )
+	) );
+	if( !data )
+	{
+		PyErr_Clear();
+		return;
+	}
+
+	// Write to a temporary file and then rename it into place, so that
+	// other processes never see a partially written file.
+
+	boost::system::error_code ec;
+	boost::filesystem::create_directories( file.parent_path(), ec );
+	const boost::filesystem::path tempFile = file.parent_path() / boost::filesystem::unique_path( "%%%%-%%%%-%%%%-%%%%.tmp" );
+	{
+		std::ofstream stream( tempFile.string(), std::ios::binary );
+		stream.write( PyString_AsString( data.get() ), PyString_Size( data.get() ) );
+		if( !stream )
+		{
+			stream.close();
+			boost::filesystem::remove( tempFile, ec );
+			IECore::msg( IECore::Msg::Warning, "ScriptNode", boost::format( "Unable to write compiled script cache file \"%s\"" ) % tempFile.string() );
+			return;
+		}
+	}
+
+	boost::filesystem::rename( tempFile, file, ec );
+	if( ec )
+	{
+		boost::filesystem::remove( tempFile, ec );
+	}
+}
+
+// Returns null, leaving the Python error set, if compilation fails.
+ConstCompiledSerialisationPtr loadOrCompileSerialisation( const std::string &serialisation, const IECore::MurmurHash &hash )
+{
+	const boost::filesystem::path cacheFile = persistentCacheFile( hash );
+	if( !cacheFile.empty() )
+	{
+		if( ConstCompiledSerialisationPtr result = readCompiledSerialisation( cacheFile ) )
+		{
+			return result;
+		}
+	}
+
+	ConstCompiledSerialisationPtr result = compileSerialisation( serialisation );
+	if( result && !cacheFile.empty() )
+	{
+		writeCompiledSerialisation( *result, cacheFile );
+	}
+
+	return result;
+}
+
+// In-process cache
+// ================
+//
+// LRU cache of compiled serialisations, so that repeated loads of the same
+// content within a single process don't even need to visit the persistent
+// cache. Bounded by the total size of the serialisations, which is a
+// reasonable proxy for the size of the compiled code. Must only be accessed
+// with the GIL held.
+class CompiledSerialisationCache
+{
+
+	public :
+
+		CompiledSerialisationCache( size_t maxCost )
+			:	m_maxCost( maxCost ), m_cost( 0 )
+		{
+		}
+
+		// Returns null, leaving the Python error set, if compilation fails.
+		ConstCompiledSerialisationPtr get( const std::string &serialisation )
+		{
+			const IECore::MurmurHash hash = serialisationHash( serialisation );
+
+			Map::iterator it = m_map.find( hash );
+			if( it != m_map.end() )
+			{
+				m_list.splice( m_list.begin(), m_list, it->second );
+				return it->second->value;
+			}
+
+			ConstCompiledSerialisationPtr result = loadOrCompileSerialisation( serialisation, hash );
+			if( !result )
+			{
+				return result;
+			}
+
+			m_list.push_front( Entry{ hash, result, serialisation.size() } );
+			m_map[hash] = m_list.begin();
+			m_cost += serialisation.size();
+
+			// Evict least recently used entries, but always keep the
+			// one we just added.
+			while( m_cost > m_maxCost && m_list.size() > 1 )
+			{
+				m_cost -= m_list.back().cost;
+				m_map.erase( m_list.back().hash );
+				m_list.pop_back();
+			}
+
+			return result;
+		}
+
+	private :
+
+		struct Entry
+		{
+			IECore::MurmurHash hash;
+			ConstCompiledSerialisationPtr value;
+			size_t cost;
+		};
+
+		typedef std::list<Entry> List;
+		typedef std::unordered_map<IECore::MurmurHash, List::iterator, boost::hash<IECore::MurmurHash>> Map;
+
+		const size_t m_maxCost;
+		size_t m_cost;
+		List m_list;
+		Map m_map;
+
+};
+
+ConstCompiledSerialisationPtr compiledSerialisation( const std::string &serialisation )
+{
+	// Deliberately leaked, so that the Python objects it holds are
+	// never destroyed after `Py_Finalize()` has been called.
+	static CompiledSerialisationCache *g_cache = new CompiledSerialisationCache( 500 * 1024 * 1024 );
+	return g_cache->get( serialisation );
+}
+
+void reportError( const std::string &context )
+{
+	int lineNumber = 0;
+	std::string message = IECorePython::ExceptionAlgo::formatPythonException( /* withTraceback = */ false, &lineNumber );
+	IECore::msg( IECore::Msg::Error, formattedErrorContext( lineNumber, context ), message );
+}
+
+// Executes the top level statements from `firstStatement` onwards one
+// at a time, reporting errors that occur, but otherwise continuing with
+// execution.
+void executeStatements( const std::string &serialisation, size_t firstStatement, boost::python::object globals, boost::python::object locals, const std::string &context )
+{
+	std::unique_ptr<PyArena, decltype( &PyArena_Free )> arena( PyArena_New(), PyArena_Free );
+
+	// Parse the whole script. This can't fail, because
+	// we've already compiled the script successfully.
+	const std::string toExecute = replaceImath( serialisation );
+	mod_ty mod = PyParser_ASTFromString(
+		toExecute.c_str(),
+		"<string>",
+		Py_file_input,
+		nullptr,
+		arena.get()
+	);
+
+	assert( mod->kind == Module_kind );
+
+	const size_t numStatements = asdl_seq_LEN( mod->v.Module.body );
+	for( size_t i = firstStatement; i < numStatements; ++i )
+	{
+		// Make a new module containing just this one statement.
+		asdl_seq *newBody = asdl_seq_new( 1, arena.get() );
+		asdl_seq_SET( newBody, 0, asdl_seq_GET( mod->v.Module.body, i ) );
+		mod_ty newModule = Module(
+			newBody,
+			arena.get()
+		);
+
+		// Compile it.
+		CodePtr statementCode( PyAST_Compile( newModule, "<string>", nullptr, arena.get() ) );
+
+		// And execute it.
+		boost::python::handle<> v( boost::python::allow_null(
+			PyEval_EvalCode(
+				statementCode.get(),
+				globals.ptr(),
+				locals.ptr()
+			)
+		) );
+
+		// Report any errors.
+		if( v == nullptr)
+		{
+			reportError( context );
+		}
+	}
+}
+
+// Executes the script, reporting errors that occur, but otherwise
+// continuing with execution. We execute the compiled batches of
+// statements in one go where possible, since it is much quicker than
+// executing each statement individually. If an error occurs, we fall
+// back to executing the remaining statements one at a time.
+bool tolerantExec( const std::string &serialisation, boost::python::object globals, boost::python::object locals, const std::string &context )
+{
+	ConstCompiledSerialisationPtr compiled = compiledSerialisation( serialisation );
+	if( !compiled )
+	{
+		reportError( context );
+		return false;
+	}
+
+	for( const auto &batch : compiled->batches )
+	{
+		boost::python::handle<> v( boost::python::allow_null(
+			PyEval_EvalCode( batch.code.get(), globals.ptr(), locals.ptr() )
+		) );
+
+		if( v != nullptr )
+		{
+			continue;
+		}
+
+		// Find the line number of the statement which failed. This
+		// is in the outermost frame of the traceback, which belongs
+		// to the batch itself.
+
+		PyObject *type, *value, *traceback;
+		PyErr_Fetch( &type, &value, &traceback );
+		const int failedLineNumber = traceback ? ((PyTracebackObject *)traceback)->tb_lineno : -1;
+		PyErr_Restore( type, value, traceback );
+
+		reportError( context );
+		if( failedLineNumber < 0 )
+		{
+			// Can't tell where to resume from.
+			return true;
+		}
+
+		// The failed statement is the last one starting at or
+		// before the failed line. Continue from the one after it.
+		size_t failedStatement = batch.firstStatement;
+		for( size_t i = 1; i < batch.lineNumbers.size() && batch.lineNumbers[i] <= failedLineNumber; ++i )
+		{
+			failedStatement = batch.firstStatement + i;
+		}
+
+		executeStatements( serialisation, failedStatement + 1, globals, locals, context );
+		return true;
+	}
+
+	return false;
+}
+
 bool execute( ScriptNode *script, const std::string &serialisation, Node *parent, bool continueOnError, const std::string &context = "" )
 {
 	if( !Py_IsInitialized() )
@@ -277,8 +693,6 @@ bool execute( ScriptNode *script, const std::string &serialisation, Node *parent
 		Py_Initialize();
 	}
 
-	const std::string toExecute = replaceImath( serialisation );
-
 	IECorePython::ScopedGILLock gilLock;
 	bool result = false;
 	try
@@ -289,7 +703,15 @@ bool execute( ScriptNode *script, const std::string &serialisation, Node *parent
 		{
 			try
 			{
-				exec( toExecute.c_str(), e, e );
+				ConstCompiledSerialisationPtr compiled = compiledSerialisation( serialisation );
+				if( !compiled )
+				{
+					boost::python::throw_error_already_set();
+				}
+				for( const auto &batch : compiled->batches )
+				{
+					boost::python::handle<> v( PyEval_EvalCode( batch.code.get(), e.ptr(), e.ptr() ) );
+				}
 			}
 			catch( boost::python::error_already_set &e )
 			{
@@ -300,7 +722,7 @@ bool execute( ScriptNode *script, const std::string &serialisation, Node *parent
 		}
 		else
 		{
-			result = tolerantExec( toExecute.c_str(), e, e, context );
+			result = tolerantExec( serialisation, e, e, context );
 		}
 	}
 	catch( boost::python::error_already_set &e )
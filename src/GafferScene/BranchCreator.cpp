@@ -42,8 +42,12 @@
 
 #include "IECore/StringAlgo.h"
 
+#include "OpenEXR/ImathBoxAlgo.h"
+
 #include "boost/algorithm/string/predicate.hpp"
 
+#include "tbb/parallel_reduce.h"
+
 using namespace std;
 using namespace Imath;
 using namespace IECore;
@@ -57,6 +61,21 @@ size_t BranchCreator::g_firstPlugIndex = 0;
 static InternedString g_childNamesKey( "__BranchCreatorChildNames" );
 static InternedString g_parentKey( "__BranchCreatorParent" );
 static InternedString g_forwardMappingKey( "__BranchCreatorForwardMappings" );
+static InternedString g_childBoundsChunkContextName( "__branchCreatorChildBoundsChunk" );
+
+namespace
+{
+
+// Number of children in each chunk processed by `childBoundsPlug()`.
+// Locations with fewer children than this are processed directly.
+const size_t g_childBoundsChunkSize = 1000;
+
+size_t numChildBoundsChunks( size_t numChildren )
+{
+	return ( numChildren + g_childBoundsChunkSize - 1 ) / g_childBoundsChunkSize;
+}
+
+} // namespace
 
 BranchCreator::BranchCreator( const std::string &name )
 	:	SceneProcessor( name )
@@ -64,6 +83,7 @@ BranchCreator::BranchCreator( const std::string &name )
 	storeIndexOfNextChild( g_firstPlugIndex );
 	addChild( new StringPlug( "parent" ) );
 	addChild( new Gaffer::ObjectPlug( "__mapping", Gaffer::Plug::Out, new CompoundData() ) );
+	addChild( new AtomicBox3fPlug( "__childBounds", Gaffer::Plug::Out ) );
 
 	outPlug()->globalsPlug()->setInput( inPlug()->globalsPlug() );
 }
@@ -92,6 +112,16 @@ const Gaffer::ObjectPlug *BranchCreator::mappingPlug() const
 	return getChild<ObjectPlug>( g_firstPlugIndex + 1 );
 }
 
+Gaffer::AtomicBox3fPlug *BranchCreator::childBoundsPlug()
+{
+	return getChild<AtomicBox3fPlug>( g_firstPlugIndex + 2 );
+}
+
+const Gaffer::AtomicBox3fPlug *BranchCreator::childBoundsPlug() const
+{
+	return getChild<AtomicBox3fPlug>( g_firstPlugIndex + 2 );
+}
+
 void BranchCreator::affects( const Plug *input, AffectedPlugsContainer &outputs ) const
 {
 	SceneProcessor::affects( input, outputs );
@@ -116,6 +146,14 @@ void BranchCreator::affects( const Plug *input, AffectedPlugsContainer &outputs
 		// it's just a pass-through connection.
 		outputs.push_back( outPlug()->setPlug() );
 	}
+	else if(
+		input == outPlug()->boundPlug() ||
+		input == outPlug()->transformPlug() ||
+		input == outPlug()->childNamesPlug()
+	)
+	{
+		outputs.push_back( childBoundsPlug() );
+	}
 }
 
 void BranchCreator::hash( const Gaffer::ValuePlug *output, const Gaffer::Context *context, IECore::MurmurHash &h ) const
@@ -126,6 +164,30 @@ void BranchCreator::hash( const Gaffer::ValuePlug *output, const Gaffer::Context
 	{
 		hashMapping( context, h );
 	}
+	else if( output == childBoundsPlug() )
+	{
+		const size_t chunk = context->get<int>( g_childBoundsChunkContextName );
+
+		// Remove the chunk variable so it doesn't leak
+		// into the evaluation of the children.
+		ScenePlug::PathScope scope( context );
+		scope.remove( g_childBoundsChunkContextName );
+
+		ScenePath childPath = context->get<ScenePath>( ScenePlug::scenePathContextName );
+		ConstInternedStringVectorDataPtr childNamesData = outPlug()->childNamesPlug()->getValue();
+		const vector<InternedString> &childNames = childNamesData->readable();
+
+		const size_t begin = chunk * g_childBoundsChunkSize;
+		const size_t end = std::min( begin + g_childBoundsChunkSize, childNames.size() );
+		childPath.push_back( InternedString() ); // room for the child name
+		for( size_t i = begin; i < end; ++i )
+		{
+			childPath.back() = childNames[i];
+			scope.setPath( childPath );
+			outPlug()->boundPlug()->hash( h );
+			outPlug()->transformPlug()->hash( h );
+		}
+	}
 }
 
 void BranchCreator::compute( Gaffer::ValuePlug *output, const Gaffer::Context *context ) const
@@ -135,6 +197,32 @@ void BranchCreator::compute( Gaffer::ValuePlug *output, const Gaffer::Context *c
 		static_cast<Gaffer::ObjectPlug *>( output )->setValue( computeMapping( context ) );
 		return;
 	}
+	else if( output == childBoundsPlug() )
+	{
+		const size_t chunk = context->get<int>( g_childBoundsChunkContextName );
+
+		ScenePlug::PathScope scope( context );
+		scope.remove( g_childBoundsChunkContextName );
+
+		ScenePath childPath = context->get<ScenePath>( ScenePlug::scenePathContextName );
+		ConstInternedStringVectorDataPtr childNamesData = outPlug()->childNamesPlug()->getValue();
+		const vector<InternedString> &childNames = childNamesData->readable();
+
+		Box3f result;
+		const size_t begin = chunk * g_childBoundsChunkSize;
+		const size_t end = std::min( begin + g_childBoundsChunkSize, childNames.size() );
+		childPath.push_back( InternedString() ); // room for the child name
+		for( size_t i = begin; i < end; ++i )
+		{
+			childPath.back() = childNames[i];
+			scope.setPath( childPath );
+			const Box3f childBound = outPlug()->boundPlug()->getValue();
+			result.extendBy( transform( childBound, outPlug()->transformPlug()->getValue() ) );
+		}
+
+		static_cast<AtomicBox3fPlug *>( output )->setValue( result );
+		return;
+	}
 
 	SceneProcessor::compute( output, context );
 }
@@ -153,7 +241,7 @@ void BranchCreator::hashBound( const ScenePath &path, const Gaffer::Context *con
 	{
 		SceneProcessor::hashBound( path, context, parent, h );
 		inPlug()->boundPlug()->hash( h );
-		h.append( hashOfTransformedChildBounds( path, outPlug() ) );
+		hashChildBounds( path, context, h );
 	}
 	else
 	{
@@ -174,7 +262,7 @@ Imath::Box3f BranchCreator::computeBound( const ScenePath &path, const Gaffer::C
 	else if( parentMatch == IECore::PathMatcher::ExactMatch || parentMatch == IECore::PathMatcher::DescendantMatch )
 	{
 		Box3f result = inPlug()->boundPlug()->getValue();
-		result.extendBy( unionOfTransformedChildBounds( path, outPlug() ) );
+		result.extendBy( computeChildBounds( path, context ) );
 		return result;
 	}
 	else
@@ -632,6 +720,60 @@ IECore::ConstCompoundDataPtr BranchCreator::computeMapping( const Gaffer::Contex
 	return result;
 }
 
+void BranchCreator::hashChildBounds( const ScenePath &path, const Gaffer::Context *context, IECore::MurmurHash &h ) const
+{
+	ConstInternedStringVectorDataPtr childNames = outPlug()->childNamesPlug()->getValue();
+	const size_t numChildren = childNames->readable().size();
+	if( numChildren <= g_childBoundsChunkSize )
+	{
+		h.append( hashOfTransformedChildBounds( path, outPlug(), childNames.get() ) );
+		return;
+	}
+
+	Context::EditableScope chunkScope( context );
+	for( size_t i = 0, e = numChildBoundsChunks( numChildren ); i < e; ++i )
+	{
+		chunkScope.set( g_childBoundsChunkContextName, (int)i );
+		childBoundsPlug()->hash( h );
+	}
+}
+
+Imath::Box3f BranchCreator::computeChildBounds( const ScenePath &path, const Gaffer::Context *context ) const
+{
+	ConstInternedStringVectorDataPtr childNames = outPlug()->childNamesPlug()->getValue();
+	const size_t numChildren = childNames->readable().size();
+	if( numChildren <= g_childBoundsChunkSize )
+	{
+		return unionOfTransformedChildBounds( path, outPlug(), childNames.get() );
+	}
+
+	typedef tbb::blocked_range<size_t> Range;
+
+	tbb::task_group_context taskGroupContext( tbb::task_group_context::isolated );
+	return tbb::parallel_reduce(
+		Range( 0, numChildBoundsChunks( numChildren ) ),
+		Box3f(),
+		[ this, context ] ( const Range &r, Box3f u ) {
+			Context::EditableScope chunkScope( context );
+			for( size_t i = r.begin(); i != r.end(); ++i )
+			{
+				chunkScope.set( g_childBoundsChunkContextName, (int)i );
+				u.extendBy( childBoundsPlug()->getValue() );
+			}
+			return u;
+		},
+		// Union
+		[] ( const Box3f &b0, const Box3f &b1 ) {
+			Box3f u( b0 );
+			u.extendBy( b1 );
+			return u;
+		},
+		tbb::auto_partitioner(),
+		// Prevents outer tasks silently cancelling our tasks
+		taskGroupContext
+	);
+}
+
 IECore::PathMatcher::Result BranchCreator::parentAndBranchPaths( const IECore::CompoundData *mapping, const ScenePath &path, ScenePath &parentPath, ScenePath &branchPath ) const
 {
 	if( !mapping->readable().size() )
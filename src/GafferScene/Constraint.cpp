@@ -58,6 +58,10 @@ Constraint::Constraint( const std::string &name )
 	// Pass through things we don't want to modify
 	outPlug()->attributesPlug()->setInput( inPlug()->attributesPlug() );
 	outPlug()->objectPlug()->setInput( inPlug()->objectPlug() );
+
+	// We query the full transforms of many locations with common
+	// ancestors, so benefit from having them cached.
+	cacheFullTransformAndAttributes( inPlug() );
 }
 
 Constraint::~Constraint()
@@ -36,6 +36,8 @@
 
 #include "GafferScene/DeleteCurves.h"
 
+#include "GafferScene/Private/IECoreScenePreview/CurvesAlgo.h"
+
 #include "Gaffer/StringPlug.h"
 
 #include "IECoreScene/CurvesAlgo.h"
@@ -59,6 +61,7 @@ DeleteCurves::DeleteCurves( const std::string &name ) : SceneElementProcessor( n
 
 	addChild( new StringPlug( "curves", Plug::In, "deleteCurves" ) );
 	addChild( new BoolPlug( "invert", Plug::In, false ) );
+	addChild( new BoolPlug( "parallel", Plug::In, true ) );
 
 	// Fast pass-through for things we don't modify
 	outPlug()->attributesPlug()->setInput( inPlug()->attributesPlug() );
@@ -90,12 +93,22 @@ const Gaffer::BoolPlug *DeleteCurves::invertPlug() const
 	return getChild<BoolPlug>( g_firstPlugIndex + 1);
 }
 
+Gaffer::BoolPlug *DeleteCurves::parallelPlug()
+{
+	return getChild<BoolPlug>( g_firstPlugIndex + 2 );
+}
+
+const Gaffer::BoolPlug *DeleteCurves::parallelPlug() const
+{
+	return getChild<BoolPlug>( g_firstPlugIndex + 2 );
+}
+
 
 void DeleteCurves::affects( const Gaffer::Plug *input, AffectedPlugsContainer &outputs ) const
 {
 	SceneElementProcessor::affects( input, outputs );
 
-	if( input == curvesPlug() || input == invertPlug() )
+	if( input == curvesPlug() || input == invertPlug() || input == parallelPlug() )
 	{
 		outputs.push_back( outPlug()->objectPlug() );
 	}
@@ -134,6 +147,7 @@ void DeleteCurves::hashProcessedObject( const ScenePath &path, const Gaffer::Con
 {
 	curvesPlug()->hash( h );
 	invertPlug()->hash( h );
+	parallelPlug()->hash( h );
 }
 
 IECore::ConstObjectPtr DeleteCurves::computeProcessedObject( const ScenePath &path, const Gaffer::Context *context, IECore::ConstObjectPtr inputObject ) const
@@ -157,5 +171,11 @@ IECore::ConstObjectPtr DeleteCurves::computeProcessedObject( const ScenePath &pa
 		throw InvalidArgumentException( boost::str( boost::format( "DeleteCurves : No primitive variable \"%s\" found" ) % deletePrimVarName ) );
 	}
 
-	return CurvesAlgo::deleteCurves(curves, it->second, invertPlug()->getValue());
+	const bool invert = invertPlug()->getValue();
+	if( parallelPlug()->getValue() )
+	{
+		return IECoreScenePreview::CurvesAlgo::deleteCurves( curves, it->second, invert );
+	}
+
+	return CurvesAlgo::deleteCurves( curves, it->second, invert );
 }
@@ -36,6 +36,8 @@
 
 #include "GafferScene/DeleteFaces.h"
 
+#include "GafferScene/Private/IECoreScenePreview/MeshAlgo.h"
+
 #include "Gaffer/StringPlug.h"
 
 #include "IECoreScene/MeshAlgo.h"
@@ -59,6 +61,7 @@ DeleteFaces::DeleteFaces( const std::string &name ) : SceneElementProcessor( nam
 
 	addChild( new StringPlug( "faces", Plug::In, "deleteFaces" ) );
 	addChild( new BoolPlug( "invert", Plug::In, false ) );
+	addChild( new BoolPlug( "parallel", Plug::In, true ) );
 
 	// Fast pass-through for things we don't modify
 	outPlug()->attributesPlug()->setInput( inPlug()->attributesPlug() );
@@ -89,11 +92,21 @@ const Gaffer::BoolPlug *DeleteFaces::invertPlug() const
 	return getChild<BoolPlug>( g_firstPlugIndex + 1);
 }
 
+Gaffer::BoolPlug *DeleteFaces::parallelPlug()
+{
+	return getChild<BoolPlug>( g_firstPlugIndex + 2 );
+}
+
+const Gaffer::BoolPlug *DeleteFaces::parallelPlug() const
+{
+	return getChild<BoolPlug>( g_firstPlugIndex + 2 );
+}
+
 void DeleteFaces::affects( const Gaffer::Plug *input, AffectedPlugsContainer &outputs ) const
 {
 	SceneElementProcessor::affects( input, outputs );
 
-	if( input == facesPlug() || input == invertPlug() )
+	if( input == facesPlug() || input == invertPlug() || input == parallelPlug() )
 	{
 		outputs.push_back( outPlug()->objectPlug() );
 	}
@@ -133,6 +146,7 @@ void DeleteFaces::hashProcessedObject( const ScenePath &path, const Gaffer::Cont
 {
 	facesPlug()->hash( h );
 	invertPlug()->hash( h );
+	parallelPlug()->hash( h );
 }
 
 IECore::ConstObjectPtr DeleteFaces::computeProcessedObject( const ScenePath &path, const Gaffer::Context *context, IECore::ConstObjectPtr inputObject ) const
@@ -157,5 +171,11 @@ IECore::ConstObjectPtr DeleteFaces::computeProcessedObject( const ScenePath &pat
 		throw InvalidArgumentException( boost::str( boost::format( "DeleteFaces : No primitive variable \"%s\" found" ) % deletePrimVarName ) );
 	}
 
-	return MeshAlgo::deleteFaces( mesh, it->second, invertPlug()->getValue() );
+	const bool invert = invertPlug()->getValue();
+	if( parallelPlug()->getValue() )
+	{
+		return IECoreScenePreview::MeshAlgo::deleteFaces( mesh, it->second, invert );
+	}
+
+	return MeshAlgo::deleteFaces( mesh, it->second, invert );
 }
@@ -37,6 +37,8 @@
 
 #include "GafferScene/DeletePoints.h"
 
+#include "GafferScene/Private/IECoreScenePreview/PointsAlgo.h"
+
 #include "Gaffer/StringPlug.h"
 
 #include "IECoreScene/PointsAlgo.h"
@@ -60,6 +62,7 @@ DeletePoints::DeletePoints( const std::string &name ) : SceneElementProcessor( n
 
 	addChild( new StringPlug( "points", Plug::In, "deletePoints" ) );
 	addChild( new BoolPlug( "invert", Plug::In, false ) );
+	addChild( new BoolPlug( "parallel", Plug::In, true ) );
 
 	// Fast pass-through for things we don't modify
 	outPlug()->attributesPlug()->setInput( inPlug()->attributesPlug() );
@@ -91,11 +94,21 @@ const Gaffer::BoolPlug *DeletePoints::invertPlug() const
 	return getChild<BoolPlug>( g_firstPlugIndex + 1);
 }
 
+Gaffer::BoolPlug *DeletePoints::parallelPlug()
+{
+	return getChild<BoolPlug>( g_firstPlugIndex + 2 );
+}
+
+const Gaffer::BoolPlug *DeletePoints::parallelPlug() const
+{
+	return getChild<BoolPlug>( g_firstPlugIndex + 2 );
+}
+
 void DeletePoints::affects( const Gaffer::Plug *input, AffectedPlugsContainer &outputs ) const
 {
 	SceneElementProcessor::affects( input, outputs );
 
-	if( input == pointsPlug() || input == invertPlug() )
+	if( input == pointsPlug() || input == invertPlug() || input == parallelPlug() )
 	{
 		outputs.push_back( outPlug()->objectPlug() );
 	}
@@ -135,6 +148,7 @@ void DeletePoints::hashProcessedObject( const ScenePath &path, const Gaffer::Con
 {
 	pointsPlug()->hash( h );
 	invertPlug()->hash( h );
+	parallelPlug()->hash( h );
 }
 
 IECore::ConstObjectPtr DeletePoints::computeProcessedObject( const ScenePath &path, const Gaffer::Context *context, IECore::ConstObjectPtr inputObject ) const
@@ -158,5 +172,11 @@ IECore::ConstObjectPtr DeletePoints::computeProcessedObject( const ScenePath &pa
 		throw InvalidArgumentException( boost::str( boost::format( "DeletePoints : No primitive variable \"%s\" found" ) % deletePrimVarName ) );
 	}
 
-	return PointsAlgo::deletePoints( points, it->second, invertPlug()->getValue() );
+	const bool invert = invertPlug()->getValue();
+	if( parallelPlug()->getValue() )
+	{
+		return IECoreScenePreview::PointsAlgo::deletePoints( points, it->second, invert );
+	}
+
+	return PointsAlgo::deletePoints( points, it->second, invert );
 }
@@ -199,7 +199,12 @@ void EvaluateLightLinks::hashAttributes( const ScenePath &path, const Gaffer::Co
 	SceneProcessor::hashAttributes( path, context, parent, h );
 	h.append( inputHash );
 
+	// The light names depend only on the expression and the sets, so we
+	// remove the location from the context. This means that each expression
+	// is hashed and evaluated only once for the whole scene, rather than
+	// once per location that references it.
 	Context::EditableScope scope( context );
+	scope.remove( ScenePlug::scenePathContextName );
 
 	if( illuminationExpressionData || path.size() == 1 )
 	{
@@ -251,6 +256,7 @@ IECore::ConstCompoundObjectPtr EvaluateLightLinks::computeAttributes( const Scen
 	result->members() = inputAttributes->members();
 
 	Context::EditableScope scope( context );
+	scope.remove( ScenePlug::scenePathContextName );
 
 	if( illuminationExpressionData || path.size() == 1 )
 	{
@@ -39,6 +39,8 @@
 #include "GafferScene/Private/IECoreGLPreview/ObjectVisualiser.h"
 #include "GafferScene/Private/IECoreGLPreview/AttributeVisualiser.h"
 
+#include "Gaffer/Context.h"
+
 #include "IECoreGL/CachedConverter.h"
 #include "IECoreGL/Camera.h"
 #include "IECoreGL/ColorTexture.h"
@@ -56,11 +58,16 @@
 #include "IECoreGL/ToGLCameraConverter.h"
 #include "IECoreGL/IECoreGL.h"
 
+#include "IECoreScene/MeshPrimitive.h"
+#include "IECoreScene/PointsPrimitive.h"
+
 #include "IECore/CompoundParameter.h"
+#include "IECore/LRUCache.h"
 #include "IECore/MessageHandler.h"
 #include "IECore/PathMatcherData.h"
 #include "IECore/SimpleTypedData.h"
 #include "IECore/StringAlgo.h"
+#include "IECore/VectorTypedData.h"
 #include "IECore/Writer.h"
 
 #include "OpenEXR/ImathBoxAlgo.h"
@@ -70,7 +77,10 @@
 
 #include "tbb/concurrent_queue.h"
 
+#include <atomic>
+#include <chrono>
 #include <functional>
+#include <thread>
 #include <unordered_map>
 #include <vector>
 
@@ -121,6 +131,17 @@ T parameter( const IECore::CompoundDataMap &parameters, const IECore::InternedSt
 	}
 }
 
+template<typename T>
+T attribute( const IECore::CompoundObject *attributes, const IECore::InternedString &name, const T &defaultValue )
+{
+	typedef IECore::TypedData<T> DataType;
+	if( const DataType *d = attributes->member<const DataType>( name ) )
+	{
+		return d->readable();
+	}
+	return defaultValue;
+}
+
 const IECoreGL::State &selectionState()
 {
 	static IECoreGL::StatePtr s;
@@ -148,6 +169,8 @@ class OpenGLAttributes : public IECoreScenePreview::Renderer::AttributesInterfac
 	public :
 
 		OpenGLAttributes( const IECore::CompoundObject *attributes )
+			:	m_lodVertexThreshold( std::max( attribute<int>( attributes, g_lodVertexThresholdAttributeName, 0 ), 0 ) ),
+				m_lodProxyPoints( std::max( attribute<int>( attributes, g_lodProxyPointsAttributeName, 100000 ), 1 ) )
 		{
 			m_state = static_pointer_cast<const State>(
 				CachedConverter::defaultCachedConverter()->convert( attributes )
@@ -173,17 +196,111 @@ class OpenGLAttributes : public IECoreScenePreview::Renderer::AttributesInterfac
 			return m_visualisation.get();
 		}
 
+		// Meshes with more vertices than this are drawn using
+		// a point-sampled proxy, unless they are selected. Zero
+		// means that proxies are never used.
+		size_t lodVertexThreshold() const
+		{
+			return m_lodVertexThreshold;
+		}
+
+		// The number of points used in proxies.
+		size_t lodProxyPoints() const
+		{
+			return m_lodProxyPoints;
+		}
+
 	private :
 
+		static IECore::InternedString g_lodVertexThresholdAttributeName;
+		static IECore::InternedString g_lodProxyPointsAttributeName;
+
 		ConstStatePtr m_state;
 		IECoreGL::ConstRenderablePtr m_visualisation;
+		size_t m_lodVertexThreshold;
+		size_t m_lodProxyPoints;
 
 };
 
+IECore::InternedString OpenGLAttributes::g_lodVertexThresholdAttributeName( "gl:lod:vertexThreshold" );
+IECore::InternedString OpenGLAttributes::g_lodProxyPointsAttributeName( "gl:lod:proxyPoints" );
+
 IE_CORE_DECLAREPTR( OpenGLAttributes )
 
 } // namespace
 
+//////////////////////////////////////////////////////////////////////////
+// Level of detail proxies
+//////////////////////////////////////////////////////////////////////////
+
+namespace
+{
+
+struct ProxyCacheGetterKey
+{
+
+	ProxyCacheGetterKey()
+		:	mesh( nullptr ), numPoints( 0 )
+	{
+	}
+
+	ProxyCacheGetterKey( const IECoreScene::MeshPrimitive *mesh, size_t numPoints )
+		:	mesh( mesh ), numPoints( numPoints )
+	{
+		mesh->hash( hash );
+		hash.append( (uint64_t)numPoints );
+	}
+
+	operator const IECore::MurmurHash & () const
+	{
+		return hash;
+	}
+
+	const IECoreScene::MeshPrimitive *mesh;
+	size_t numPoints;
+	MurmurHash hash;
+
+};
+
+IECoreGL::ConstRenderablePtr proxyGetter( const ProxyCacheGetterKey &key, size_t &cost )
+{
+	// We build a point-sampled proxy by taking every Nth vertex. This is
+	// deterministic, so proxies don't flicker when they are rebuilt, and
+	// unlike decimation it is cheap enough to do for every large mesh.
+
+	const V3fVectorData *p = key.mesh->variableData<V3fVectorData>( "P", PrimitiveVariable::Vertex );
+	if( !p )
+	{
+		cost = 0;
+		return nullptr;
+	}
+
+	const vector<V3f> &pReadable = p->readable();
+	const size_t stride = std::max<size_t>( pReadable.size() / key.numPoints, 1 );
+
+	V3fVectorDataPtr proxyPData = new V3fVectorData;
+	vector<V3f> &proxyP = proxyPData->writable();
+	proxyP.reserve( pReadable.size() / stride + 1 );
+	for( size_t i = 0; i < pReadable.size(); i += stride )
+	{
+		proxyP.push_back( pReadable[i] );
+	}
+
+	IECoreScene::PointsPrimitivePtr proxy = new IECoreScene::PointsPrimitive( proxyPData );
+	IECore::ConstRunTimeTypedPtr glProxy = IECoreGL::CachedConverter::defaultCachedConverter()->convert( proxy.get() );
+
+	cost = proxyP.size();
+	return IECore::runTimeCast<const IECoreGL::Renderable>( glProxy.get() );
+}
+
+typedef LRUCache<IECore::MurmurHash, IECoreGL::ConstRenderablePtr, LRUCachePolicy::Parallel, ProxyCacheGetterKey> ProxyCache;
+// Proxies are keyed by the hash of the source mesh, so they are shared
+// between locations and reused for as long as the mesh is unchanged.
+// Cost is measured in points.
+ProxyCache g_proxyCache( proxyGetter, 50000000 );
+
+} // namespace
+
 //////////////////////////////////////////////////////////////////////////
 // OpenGLObject
 //////////////////////////////////////////////////////////////////////////
@@ -192,7 +309,74 @@ namespace
 {
 
 typedef std::function<void ()> Edit;
-typedef tbb::concurrent_queue<Edit> EditQueue;
+
+// Queue used to pass edits from background threads to the render thread.
+// An optional capacity may be specified, in which case background updates
+// are made to wait while the render thread catches up. This bounds the memory
+// used by pending edits, and allows the render thread to display partial
+// results progressively.
+class EditQueue
+{
+
+	public :
+
+		EditQueue()
+			:	m_capacity( 0 )
+		{
+		}
+
+		void setCapacity( size_t capacity )
+		{
+			m_capacity = capacity;
+		}
+
+		void push( const Edit &edit )
+		{
+			waitForCapacity();
+			m_queue.push( edit );
+		}
+
+		bool tryPop( Edit &edit )
+		{
+			return m_queue.try_pop( edit );
+		}
+
+		bool empty() const
+		{
+			return m_queue.empty();
+		}
+
+	private :
+
+		void waitForCapacity()
+		{
+			const size_t capacity = m_capacity;
+			if( !capacity )
+			{
+				return;
+			}
+
+			// We only apply back-pressure to cancellable background updates.
+			// Synchronous updates may be made from the render thread itself,
+			// in which case waiting would deadlock. And when a background update
+			// is cancelled, we stop waiting immediately so that the cancellation
+			// isn't held up by a render thread which is no longer drawing.
+			const IECore::Canceller *canceller = Gaffer::Context::current()->canceller();
+			if( !canceller )
+			{
+				return;
+			}
+
+			while( m_queue.unsafe_size() >= capacity && !canceller->cancelled() )
+			{
+				std::this_thread::sleep_for( std::chrono::milliseconds( 1 ) );
+			}
+		}
+
+		tbb::concurrent_queue<Edit> m_queue;
+		std::atomic<size_t> m_capacity;
+
+};
 
 class OpenGLObject : public IECoreScenePreview::Renderer::ObjectInterface
 {
@@ -202,13 +386,27 @@ class OpenGLObject : public IECoreScenePreview::Renderer::ObjectInterface
 		OpenGLObject( const std::string &name, const IECore::Object *object, const ConstOpenGLAttributesPtr &attributes, EditQueue &editQueue )
 			:	m_objectType( object ? object->typeId() : IECore::NullObjectTypeId ),
 				m_attributes( attributes ),
+				m_lodVertexThreshold( attributes ? attributes->lodVertexThreshold() : 0 ),
+				m_lodProxyPoints( attributes ? attributes->lodProxyPoints() : 0 ),
 				m_editQueue( editQueue )
 		{
 			IECore::StringAlgo::tokenize( name, '/', m_name );
 
 			if( object )
 			{
-				if( const ObjectVisualiser *visualiser = IECoreGLPreview::ObjectVisualiser::acquire( object->typeId() ) )
+				const IECoreScene::MeshPrimitive *mesh = runTimeCast<const IECoreScene::MeshPrimitive>( object );
+				if( mesh && m_lodVertexThreshold && mesh->variableSize( PrimitiveVariable::Vertex ) > m_lodVertexThreshold )
+				{
+					// Draw a proxy, deferring conversion of the full mesh until
+					// it is selected.
+					m_renderable = g_proxyCache.get( ProxyCacheGetterKey( mesh, m_lodProxyPoints ) );
+					m_fullResolutionObject = mesh;
+					// The proxy is a subset of the mesh's points, so its bound
+					// may be smaller than the mesh's. Use the real bound so that
+					// bound queries and framing aren't affected by the proxy.
+					m_bound = mesh->bound();
+				}
+				else if( const ObjectVisualiser *visualiser = IECoreGLPreview::ObjectVisualiser::acquire( object->typeId() ) )
 				{
 					m_renderable = visualiser->visualise( object );
 				}
@@ -224,6 +422,11 @@ class OpenGLObject : public IECoreScenePreview::Renderer::ObjectInterface
 						// Leave m_renderable as null
 					}
 				}
+
+				if( m_renderable && !m_fullResolutionObject )
+				{
+					m_bound = m_renderable->bound();
+				}
 			}
 		}
 
@@ -242,6 +445,15 @@ class OpenGLObject : public IECoreScenePreview::Renderer::ObjectInterface
 		bool attributes( const IECoreScenePreview::Renderer::AttributesInterface *attributes ) override
 		{
 			ConstOpenGLAttributesPtr openGLAttributes = static_cast<const OpenGLAttributes *>( attributes );
+			if(
+				openGLAttributes->lodVertexThreshold() != m_lodVertexThreshold ||
+				openGLAttributes->lodProxyPoints() != m_lodProxyPoints
+			)
+			{
+				// Level of detail is decided at construction, so
+				// we need to be recreated.
+				return false;
+			}
 			m_editQueue.push( [this, openGLAttributes]() {
 				m_attributes = openGLAttributes;
 			} );
@@ -250,11 +462,7 @@ class OpenGLObject : public IECoreScenePreview::Renderer::ObjectInterface
 
 		Box3f transformedBound() const
 		{
-			Box3f b;
-			if( m_renderable )
-			{
-				b.extendBy( m_renderable->bound() );
-			}
+			Box3f b = m_bound;
 			if( m_attributes->visualisation() )
 			{
 				b.extendBy( m_attributes->visualisation()->bound() );
@@ -290,9 +498,9 @@ class OpenGLObject : public IECoreScenePreview::Renderer::ObjectInterface
 			IECoreGL::State::ScopedBinding scope( *m_attributes->state(), *currentState );
 			IECoreGL::State::ScopedBinding selectionScope( selectionState(), *currentState, selected( selection ) );
 
-			if( m_renderable )
+			if( const IECoreGL::Renderable *renderable = this->renderable( selection ) )
 			{
-				m_renderable->render( currentState );
+				renderable->render( currentState );
 			}
 
 			if( m_attributes->visualisation() )
@@ -320,10 +528,52 @@ class OpenGLObject : public IECoreScenePreview::Renderer::ObjectInterface
 
 	private :
 
+		const IECoreGL::Renderable *renderable( const IECore::PathMatcher &selection ) const
+		{
+			if( !m_fullResolutionObject )
+			{
+				return m_renderable.get();
+			}
+
+			if( !selected( selection ) )
+			{
+				// Release the full resolution renderable so that we only pay
+				// for it while it is needed. Reselection is cheap so long as
+				// it remains in the CachedConverter's cache.
+				m_fullResolutionRenderable = nullptr;
+				return m_renderable.get();
+			}
+
+			if( !m_fullResolutionRenderable )
+			{
+				try
+				{
+					IECore::ConstRunTimeTypedPtr glObject = IECoreGL::CachedConverter::defaultCachedConverter()->convert( m_fullResolutionObject.get() );
+					m_fullResolutionRenderable = IECore::runTimeCast<const IECoreGL::Renderable>( glObject.get() );
+				}
+				catch( ... )
+				{
+					return m_renderable.get();
+				}
+			}
+
+			return m_fullResolutionRenderable.get();
+		}
+
 		IECore::TypeId m_objectType;
 		M44f m_transform;
 		ConstOpenGLAttributesPtr m_attributes;
 		IECoreGL::ConstRenderablePtr m_renderable;
+		// Bound of the object being rendered, which is not
+		// necessarily the bound of `m_renderable`.
+		Box3f m_bound;
+		// Level of detail. When `m_fullResolutionObject` is set,
+		// `m_renderable` is a proxy for it, and the full resolution
+		// renderable is converted on demand.
+		size_t m_lodVertexThreshold;
+		size_t m_lodProxyPoints;
+		IECore::ConstObjectPtr m_fullResolutionObject;
+		mutable IECoreGL::ConstRenderablePtr m_fullResolutionRenderable;
 		vector<InternedString> m_name;
 		EditQueue &m_editQueue;
 
@@ -404,7 +654,7 @@ class OpenGLRenderer final : public IECoreScenePreview::Renderer
 	public :
 
 		OpenGLRenderer( RenderType renderType, const std::string &fileName )
-			:	m_renderType( renderType ), m_baseStateOptions( new CompoundObject )
+			:	m_renderType( renderType ), m_baseStateOptions( new CompoundObject ), m_timeBudget( 0.0f )
 		{
 			if( renderType == SceneDescription )
 			{
@@ -436,6 +686,30 @@ class OpenGLRenderer final : public IECoreScenePreview::Renderer
 				}
 				return;
 			}
+			else if( name == "gl:streaming:maxPendingEdits" )
+			{
+				if( value == nullptr )
+				{
+					m_editQueue.setCapacity( 0 );
+				}
+				else if( auto d = reportedCast<const IECore::IntData>( value, "option", name ) )
+				{
+					m_editQueue.setCapacity( std::max( d->readable(), 0 ) );
+				}
+				return;
+			}
+			else if( name == "gl:streaming:timeBudget" )
+			{
+				if( value == nullptr )
+				{
+					m_timeBudget = 0.0f;
+				}
+				else if( auto d = reportedCast<const IECore::FloatData>( value, "option", name ) )
+				{
+					m_timeBudget = std::max( d->readable(), 0.0f );
+				}
+				return;
+			}
 			else if( name == "frame" || name == "sampleMotion" )
 			{
 				// We know what these mean, we just have no use for them.
@@ -556,6 +830,21 @@ class OpenGLRenderer final : public IECoreScenePreview::Renderer
 			{
 				return querySelectedObjects( parameters );
 			}
+			else if( name == "gl:queryEditsPending" )
+			{
+				return new BoolData( !m_editQueue.empty() );
+			}
+			else if( name == "gl:processQueue" )
+			{
+				// Applies pending edits without drawing anything, so that
+				// the cost of scene translation can be measured without a
+				// GL context. An optional "timeBudget" parameter limits
+				// processing in the same way as for interactive renders.
+				// Returns the number of edits processed.
+				const size_t numEdits = processQueue( parameter<float>( parameters, "timeBudget", 0.0f ) );
+				removeDeletedObjects();
+				return new UInt64Data( numEdits );
+			}
 
 			throw IECore::Exception( "Unknown command" );
 		}
@@ -564,7 +853,13 @@ class OpenGLRenderer final : public IECoreScenePreview::Renderer
 
 		void renderInteractive()
 		{
-			processQueue();
+			// Only process as many edits as we can within our time budget,
+			// so that large updates are displayed progressively rather than
+			// blocking the UI until they are complete. Remaining edits are
+			// processed on subsequent renders - clients can use the
+			// "gl:queryEditsPending" command to find out if another render
+			// is needed.
+			processQueue( m_timeBudget );
 			removeDeletedObjects();
 			CachedConverter::defaultCachedConverter()->clearUnused();
 
@@ -667,13 +962,31 @@ class OpenGLRenderer final : public IECoreScenePreview::Renderer
 			glUseProgram( prevProgram );
 		}
 
-		void processQueue()
+		// Processes pending edits, returning the number processed. If
+		// `timeBudget` is non-zero, processing stops once that many
+		// seconds have elapsed.
+		size_t processQueue( float timeBudget = 0.0f )
 		{
+			using namespace std::chrono;
+			const steady_clock::time_point startTime = steady_clock::now();
+
+			size_t numEdits = 0;
 			Edit edit;
-			while( m_editQueue.try_pop( edit ) )
+			while( m_editQueue.tryPop( edit ) )
 			{
 				edit();
+				numEdits++;
+				// Checking the time is relatively expensive compared to
+				// many edits, so we only do it periodically.
+				if( timeBudget > 0.0f && ( numEdits % 100 ) == 0 )
+				{
+					if( duration<float>( steady_clock::now() - startTime ).count() > timeBudget )
+					{
+						break;
+					}
+				}
 			}
+			return numEdits;
 		}
 
 		// During interactive renders, the client code controls the lifetime
@@ -862,6 +1175,8 @@ class OpenGLRenderer final : public IECoreScenePreview::Renderer
 
 		// Queue used to pass edits from background threads to the render thread.
 		EditQueue m_editQueue;
+		// Maximum time spent processing edits per interactive render.
+		float m_timeBudget;
 
 		// Render state. Updated on the render thread by processing Edits
 		// from m_editQueue.
@@ -0,0 +1,212 @@
+//////////////////////////////////////////////////////////////////////////
+//
+//  Copyright (c) 2019, Image Engine Design Inc. All rights reserved.
+//
+//  Redistribution and use in source and binary forms, with or without
+//  modification, are permitted provided that the following conditions are
+//  met:
+//
+//      * Redistributions of source code must retain the above
+//        copyright notice, this list of conditions and the following
+//        disclaimer.
+//
+//      * Redistributions in binary form must reproduce the above
+//        copyright notice, this list of conditions and the following
+//        disclaimer in the documentation and/or other materials provided with
+//        the distribution.
+//
+//      * Neither the name of John Haddon nor the names of
+//        any other contributors to this software may be used to endorse or
+//        promote products derived from this software without specific prior
+//        written permission.
+//
+//  THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS
+//  IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+//  THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+//  PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+//  CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+//  EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+//  PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+//  PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+//  LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+//  NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+//  SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+//
+//////////////////////////////////////////////////////////////////////////
+
+#include "GafferScene/Private/IECoreScenePreview/CapturingRenderer.h"
+
+#include "IECore/Exception.h"
+
+using namespace std;
+using namespace Imath;
+using namespace IECore;
+using namespace IECoreScenePreview;
+
+//////////////////////////////////////////////////////////////////////////
+// CapturingRenderer
+//////////////////////////////////////////////////////////////////////////
+
+CapturingRenderer::CapturingRenderer( RenderType renderType, const std::string &fileName )
+{
+}
+
+CapturingRenderer::~CapturingRenderer()
+{
+}
+
+const CapturingRenderer::CapturedObject *CapturingRenderer::capturedObject( const std::string &name ) const
+{
+	ObjectMap::const_accessor a;
+	if( m_capturedObjects.find( a, name ) )
+	{
+		return a->second.get();
+	}
+	return nullptr;
+}
+
+std::vector<std::string> CapturingRenderer::capturedObjectNames() const
+{
+	std::vector<std::string> result;
+	for( const auto &o : m_capturedObjects )
+	{
+		result.push_back( o.first );
+	}
+	return result;
+}
+
+IECore::InternedString CapturingRenderer::name() const
+{
+	return "Capturing";
+}
+
+void CapturingRenderer::option( const IECore::InternedString &name, const IECore::Object *value )
+{
+}
+
+void CapturingRenderer::output( const IECore::InternedString &name, const IECoreScene::Output *output )
+{
+}
+
+Renderer::AttributesInterfacePtr CapturingRenderer::attributes( const IECore::CompoundObject *attributes )
+{
+	return new CapturedAttributes( attributes );
+}
+
+Renderer::ObjectInterfacePtr CapturingRenderer::camera( const std::string &name, const IECoreScene::Camera *camera, const AttributesInterface *attributes )
+{
+	return capture( name, { camera }, {}, attributes );
+}
+
+Renderer::ObjectInterfacePtr CapturingRenderer::light( const std::string &name, const IECore::Object *object, const AttributesInterface *attributes )
+{
+	return capture( name, { object }, {}, attributes );
+}
+
+Renderer::ObjectInterfacePtr CapturingRenderer::object( const std::string &name, const IECore::Object *object, const AttributesInterface *attributes )
+{
+	return capture( name, { object }, {}, attributes );
+}
+
+Renderer::ObjectInterfacePtr CapturingRenderer::object( const std::string &name, const std::vector<const IECore::Object *> &samples, const std::vector<float> &times, const AttributesInterface *attributes )
+{
+	return capture( name, samples, times, attributes );
+}
+
+void CapturingRenderer::render()
+{
+}
+
+void CapturingRenderer::pause()
+{
+}
+
+Renderer::ObjectInterfacePtr CapturingRenderer::capture( const std::string &name, const std::vector<const IECore::Object *> &samples, const std::vector<float> &times, const AttributesInterface *attributes )
+{
+	CapturedObjectPtr result = new CapturedObject( name, samples, times, attributes );
+
+	ObjectMap::accessor a;
+	if( !m_capturedObjects.insert( a, name ) )
+	{
+		throw IECore::Exception( "Object named \"" + name + "\" already exists" );
+	}
+	a->second = result;
+
+	return result;
+}
+
+//////////////////////////////////////////////////////////////////////////
+// CapturedAttributes
+//////////////////////////////////////////////////////////////////////////
+
+CapturingRenderer::CapturedAttributes::CapturedAttributes( const IECore::ConstCompoundObjectPtr &attributes )
+	:	m_attributes( attributes )
+{
+}
+
+const IECore::CompoundObject *CapturingRenderer::CapturedAttributes::attributes() const
+{
+	return m_attributes.get();
+}
+
+//////////////////////////////////////////////////////////////////////////
+// CapturedObject
+//////////////////////////////////////////////////////////////////////////
+
+CapturingRenderer::CapturedObject::CapturedObject( const std::string &name, const std::vector<const IECore::Object *> &samples, const std::vector<float> &times, const AttributesInterface *attributes )
+	:	m_name( name ), m_capturedSampleTimes( times ), m_capturedTransforms( { M44f() } )
+{
+	for( auto s : samples )
+	{
+		m_capturedSamples.push_back( s );
+	}
+	this->attributes( attributes );
+}
+
+const std::string &CapturingRenderer::CapturedObject::capturedName() const
+{
+	return m_name;
+}
+
+const std::vector<IECore::ConstObjectPtr> &CapturingRenderer::CapturedObject::capturedSamples() const
+{
+	return m_capturedSamples;
+}
+
+const std::vector<float> &CapturingRenderer::CapturedObject::capturedSampleTimes() const
+{
+	return m_capturedSampleTimes;
+}
+
+const std::vector<Imath::M44f> &CapturingRenderer::CapturedObject::capturedTransforms() const
+{
+	return m_capturedTransforms;
+}
+
+const std::vector<float> &CapturingRenderer::CapturedObject::capturedTransformTimes() const
+{
+	return m_capturedTransformTimes;
+}
+
+const CapturingRenderer::CapturedAttributes *CapturingRenderer::CapturedObject::capturedAttributes() const
+{
+	return m_capturedAttributes.get();
+}
+
+void CapturingRenderer::CapturedObject::transform( const Imath::M44f &transform )
+{
+	m_capturedTransforms = { transform };
+	m_capturedTransformTimes.clear();
+}
+
+void CapturingRenderer::CapturedObject::transform( const std::vector<Imath::M44f> &samples, const std::vector<float> &times )
+{
+	m_capturedTransforms = samples;
+	m_capturedTransformTimes = times;
+}
+
+bool CapturingRenderer::CapturedObject::attributes( const AttributesInterface *attributes )
+{
+	m_capturedAttributes = static_cast<const CapturedAttributes *>( attributes );
+	return true;
+}
@@ -0,0 +1,99 @@
+//////////////////////////////////////////////////////////////////////////
+//
+//  Copyright (c) 2019, Image Engine Design Inc. All rights reserved.
+//
+//  Redistribution and use in source and binary forms, with or without
+//  modification, are permitted provided that the following conditions are
+//  met:
+//
+//      * Redistributions of source code must retain the above
+//        copyright notice, this list of conditions and the following
+//        disclaimer.
+//
+//      * Redistributions in binary form must reproduce the above
+//        copyright notice, this list of conditions and the following
+//        disclaimer in the documentation and/or other materials provided with
+//        the distribution.
+//
+//      * Neither the name of John Haddon nor the names of
+//        any other contributors to this software may be used to endorse or
+//        promote products derived from this software without specific prior
+//        written permission.
+//
+//  THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS
+//  IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+//  THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+//  PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+//  CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+//  EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+//  PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+//  PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+//  LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+//  NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+//  SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+//
+//////////////////////////////////////////////////////////////////////////
+
+#include "GafferScene/Private/IECoreScenePreview/CurvesAlgo.h"
+
+#include "PrimitiveAlgoUtils.h"
+
+using namespace std;
+using namespace IECore;
+using namespace IECoreScene;
+using namespace IECoreScenePreview::Detail;
+
+CurvesPrimitivePtr IECoreScenePreview::CurvesAlgo::deleteCurves( const CurvesPrimitive *curvesPrimitive, const PrimitiveVariable &curvesToDelete, bool invert )
+{
+	if( curvesToDelete.interpolation != PrimitiveVariable::Uniform )
+	{
+		throw InvalidArgumentException( "CurvesAlgo::deleteCurves requires a Uniform [Int|Bool|Float]VectorData primitiveVariable" );
+	}
+
+	const vector<int> &verticesPerCurve = curvesPrimitive->verticesPerCurve()->readable();
+
+	vector<char> keepCurves( verticesPerCurve.size() );
+	if( !keepFlags( curvesToDelete, invert, keepCurves, "CurvesAlgo::deleteCurves" ) )
+	{
+		throw InvalidArgumentException( "CurvesAlgo::deleteCurves requires a Uniform [Int|Bool|Float]VectorData primitiveVariable" );
+	}
+
+	// Each curve owns a contiguous run of elements for each
+	// interpolation, so we can compute the remappings for all
+	// of them from the same flags.
+
+	const bool periodic = curvesPrimitive->periodic();
+	const RunRemapping uniformRemapping( keepCurves, []( size_t ) { return 1; } );
+	const RunRemapping vertexRemapping( keepCurves, [&]( size_t i ) { return verticesPerCurve[i]; } );
+	const RunRemapping varyingRemapping(
+		keepCurves, [&]( size_t i ) { return (int)curvesPrimitive->numSegments( i ) + ( periodic ? 0 : 1 ); }
+	);
+
+	const std::string verticesPerCurveName( "verticesPerCurve" );
+	IntVectorDataPtr outputVerticesPerCurve = runTimeCast<IntVectorData>(
+		FilterRuns( uniformRemapping, verticesPerCurveName )( curvesPrimitive->verticesPerCurve() )
+	);
+
+	CurvesPrimitivePtr result = new CurvesPrimitive( outputVerticesPerCurve, curvesPrimitive->basis(), periodic );
+	for( const auto &p : curvesPrimitive->variables )
+	{
+		switch( p.second.interpolation )
+		{
+			case PrimitiveVariable::Uniform :
+				result->variables[p.first] = filterRuns( p.second, uniformRemapping, p.first );
+				break;
+			case PrimitiveVariable::Vertex :
+				result->variables[p.first] = filterRuns( p.second, vertexRemapping, p.first );
+				break;
+			case PrimitiveVariable::Varying :
+			case PrimitiveVariable::FaceVarying :
+				result->variables[p.first] = filterRuns( p.second, varyingRemapping, p.first );
+				break;
+			default :
+				result->variables[p.first] = p.second;
+				break;
+		}
+	}
+
+	return result;
+}
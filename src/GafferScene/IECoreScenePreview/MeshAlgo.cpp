@@ -0,0 +1,1527 @@
+//////////////////////////////////////////////////////////////////////////
+//
+//  Copyright (c) 2019, Image Engine Design Inc. All rights reserved.
+//
+//  Redistribution and use in source and binary forms, with or without
+//  modification, are permitted provided that the following conditions are
+//  met:
+//
+//      * Redistributions of source code must retain the above
+//        copyright notice, this list of conditions and the following
+//        disclaimer.
+//
+//      * Redistributions in binary form must reproduce the above
+//        copyright notice, this list of conditions and the following
+//        disclaimer in the documentation and/or other materials provided with
+//        the distribution.
+//
+//      * Neither the name of John Haddon nor the names of
+//        any other contributors to this software may be used to endorse or
+//        promote products derived from this software without specific prior
+//        written permission.
+//
+//  THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS
+//  IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+//  THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+//  PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+//  CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+//  EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+//  PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+//  PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+//  LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+//  NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+//  SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+//
+//////////////////////////////////////////////////////////////////////////
+
+#include "GafferScene/Private/IECoreScenePreview/MeshAlgo.h"
+
+#include "PrimitiveAlgoUtils.h"
+
+#include "IECoreScene/MeshAlgo.h"
+
+#include "IECore/DataAlgo.h"
+
+#include "boost/format.hpp"
+
+#include "tbb/blocked_range.h"
+#include "tbb/parallel_for.h"
+#include "tbb/parallel_sort.h"
+
+#include <algorithm>
+#include <atomic>
+#include <memory>
+
+using namespace std;
+using namespace tbb;
+using namespace Imath;
+using namespace IECore;
+using namespace IECoreScene;
+using namespace IECoreScenePreview::Detail;
+
+//////////////////////////////////////////////////////////////////////////
+// Internal utilities
+//////////////////////////////////////////////////////////////////////////
+
+namespace
+{
+
+// Describes the correspondence between the elements of the input
+// mesh and the elements of the output mesh.
+struct Remapping
+{
+
+	Remapping( const vector<int> &verticesPerFace, size_t numVertices )
+		:	verticesPerFace( verticesPerFace ), keepFaces( verticesPerFace.size() ), keepVertices( numVertices )
+	{
+	}
+
+	const vector<int> &verticesPerFace;
+
+	// Indexed by input face.
+	vector<char> keepFaces;
+	vector<int> outputFaceIndices;
+	vector<int> inputFaceVaryingOffsets;
+	vector<int> outputFaceVaryingOffsets;
+	int numOutputFaces;
+	int numOutputFaceVertices;
+
+	// Indexed by input vertex.
+	std::vector<std::atomic<char>> keepVertices;
+	vector<int> outputVertexIndices;
+	int numOutputVertices;
+
+};
+
+// Filters the elements of primitive variables according to a Remapping.
+struct FilterPrimitiveVariable : public VectorDataFunctor<FilterPrimitiveVariable>
+{
+
+	FilterPrimitiveVariable( const Remapping &remapping, PrimitiveVariable::Interpolation interpolation, const std::string &name )
+		:	VectorDataFunctor<FilterPrimitiveVariable>( name ), m_remapping( remapping ), m_interpolation( interpolation )
+	{
+	}
+
+	template<typename T>
+	void fill( const vector<T> &input, vector<T> &output ) const
+	{
+		const Remapping &r = m_remapping;
+		switch( m_interpolation )
+		{
+			case PrimitiveVariable::Uniform :
+				checkSize( input, r.keepFaces.size(), m_name );
+				output.resize( r.numOutputFaces );
+				forEachRange<T>(
+					input.size(),
+					[&]( const blocked_range<size_t> &range ) {
+						for( size_t i = range.begin(); i < range.end(); ++i )
+						{
+							if( r.keepFaces[i] )
+							{
+								output[r.outputFaceIndices[i]] = input[i];
+							}
+						}
+					}
+				);
+				break;
+			case PrimitiveVariable::Vertex :
+			case PrimitiveVariable::Varying :
+				checkSize( input, r.keepVertices.size(), m_name );
+				output.resize( r.numOutputVertices );
+				forEachRange<T>(
+					input.size(),
+					[&]( const blocked_range<size_t> &range ) {
+						for( size_t i = range.begin(); i < range.end(); ++i )
+						{
+							if( r.keepVertices[i].load( std::memory_order_relaxed ) )
+							{
+								output[r.outputVertexIndices[i]] = input[i];
+							}
+						}
+					}
+				);
+				break;
+			case PrimitiveVariable::FaceVarying :
+				checkSize( input, r.keepFaces.empty() ? 0 : r.inputFaceVaryingOffsets.back() + r.verticesPerFace.back(), m_name );
+				output.resize( r.numOutputFaceVertices );
+				forEachRange<T>(
+					r.keepFaces.size(),
+					[&]( const blocked_range<size_t> &range ) {
+						for( size_t i = range.begin(); i < range.end(); ++i )
+						{
+							if( r.keepFaces[i] )
+							{
+								const auto begin = input.begin() + r.inputFaceVaryingOffsets[i];
+								std::copy( begin, begin + r.verticesPerFace[i], output.begin() + r.outputFaceVaryingOffsets[i] );
+							}
+						}
+					}
+				);
+				break;
+			default :
+				// Constant and Invalid variables are handled by the caller.
+				break;
+		}
+	}
+
+	private :
+
+		const Remapping &m_remapping;
+		const PrimitiveVariable::Interpolation m_interpolation;
+
+};
+
+// Extracts the elements of a primitive variable that belong
+// to a contiguous range of faces.
+struct FaceRangePrimitiveVariable : public VectorDataFunctor<FaceRangePrimitiveVariable>
+{
+
+	FaceRangePrimitiveVariable(
+		size_t beginFace, size_t endFace, size_t beginFaceVertex, size_t endFaceVertex,
+		const vector<int> &vertices, const MeshPrimitive *mesh,
+		PrimitiveVariable::Interpolation interpolation, const std::string &name
+	)
+		:	VectorDataFunctor<FaceRangePrimitiveVariable>( name ),
+			m_beginFace( beginFace ), m_endFace( endFace ),
+			m_beginFaceVertex( beginFaceVertex ), m_endFaceVertex( endFaceVertex ),
+			m_vertices( vertices ), m_mesh( mesh ), m_interpolation( interpolation )
+	{
+	}
+
+	template<typename T>
+	void fill( const vector<T> &input, vector<T> &output ) const
+	{
+		checkSize( input, m_mesh->variableSize( m_interpolation ), m_name );
+		switch( m_interpolation )
+		{
+			case PrimitiveVariable::Uniform :
+				output.assign( input.begin() + m_beginFace, input.begin() + m_endFace );
+				break;
+			case PrimitiveVariable::FaceVarying :
+				output.assign( input.begin() + m_beginFaceVertex, input.begin() + m_endFaceVertex );
+				break;
+			case PrimitiveVariable::Vertex :
+			case PrimitiveVariable::Varying :
+				output.reserve( m_vertices.size() );
+				for( int v : m_vertices )
+				{
+					output.push_back( input[v] );
+				}
+				break;
+			default :
+				// Constant and Invalid variables are handled by the caller.
+				break;
+		}
+	}
+
+	private :
+
+		const size_t m_beginFace;
+		const size_t m_endFace;
+		const size_t m_beginFaceVertex;
+		const size_t m_endFaceVertex;
+		const vector<int> &m_vertices;
+		const MeshPrimitive *m_mesh;
+		const PrimitiveVariable::Interpolation m_interpolation;
+
+};
+
+// Returns a mesh containing only the faces in the range `[beginFace, endFace)`,
+// given the offset of each face into the face-varying data.
+MeshPrimitivePtr faceRange( const MeshPrimitive *mesh, size_t beginFace, size_t endFace, const vector<int> &faceVaryingOffsets )
+{
+	const vector<int> &verticesPerFace = mesh->verticesPerFace()->readable();
+	const vector<int> &vertexIds = mesh->vertexIds()->readable();
+
+	const size_t beginFaceVertex = faceVaryingOffsets[beginFace];
+	const size_t endFaceVertex = endFace < faceVaryingOffsets.size() ? faceVaryingOffsets[endFace] : vertexIds.size();
+
+	// Find the vertices used by the range, and renumber them
+	// so they are contiguous.
+
+	vector<int> vertices( vertexIds.begin() + beginFaceVertex, vertexIds.begin() + endFaceVertex );
+	std::sort( vertices.begin(), vertices.end() );
+	vertices.erase( std::unique( vertices.begin(), vertices.end() ), vertices.end() );
+
+	IntVectorDataPtr rangeVerticesPerFaceData = new IntVectorData( vector<int>( verticesPerFace.begin() + beginFace, verticesPerFace.begin() + endFace ) );
+	IntVectorDataPtr rangeVertexIdsData = new IntVectorData;
+	vector<int> &rangeVertexIds = rangeVertexIdsData->writable();
+	rangeVertexIds.reserve( endFaceVertex - beginFaceVertex );
+	for( size_t i = beginFaceVertex; i < endFaceVertex; ++i )
+	{
+		rangeVertexIds.push_back( std::lower_bound( vertices.begin(), vertices.end(), vertexIds[i] ) - vertices.begin() );
+	}
+
+	MeshPrimitivePtr result = new MeshPrimitive( rangeVerticesPerFaceData, rangeVertexIdsData, mesh->interpolation() );
+
+	for( const auto &p : mesh->variables )
+	{
+		if( p.second.interpolation == PrimitiveVariable::Constant )
+		{
+			result->variables[p.first] = p.second;
+			continue;
+		}
+
+		FaceRangePrimitiveVariable extract( beginFace, endFace, beginFaceVertex, endFaceVertex, vertices, mesh, p.second.interpolation, p.first );
+		if( p.second.indices )
+		{
+			IntVectorDataPtr indices = runTimeCast<IntVectorData>( extract( p.second.indices.get() ) );
+			result->variables[p.first] = PrimitiveVariable( p.second.interpolation, p.second.data, indices );
+		}
+		else
+		{
+			result->variables[p.first] = PrimitiveVariable( p.second.interpolation, dispatch( p.second.data.get(), extract ) );
+		}
+	}
+
+	return result;
+}
+
+// Concatenates a primitive variable from several PointsPrimitives
+// into a single array, copying each part directly into place.
+struct ConcatenatePrimitiveVariable : public VectorDataFunctor<ConcatenatePrimitiveVariable>
+{
+
+	ConcatenatePrimitiveVariable( const vector<PointsPrimitivePtr> &points, const vector<size_t> &offsets, const std::string &name )
+		:	VectorDataFunctor<ConcatenatePrimitiveVariable>( name ), m_points( points ), m_offsets( offsets )
+	{
+	}
+
+	// `input` is the data from the first PointsPrimitive - we
+	// retrieve the data from all of them ourselves.
+	template<typename T>
+	void fill( const vector<T> &input, vector<T> &output ) const
+	{
+		output.resize( m_offsets.back() );
+		forEachRange<T>(
+			m_points.size(),
+			[&]( const blocked_range<size_t> &range ) {
+				for( size_t i = range.begin(); i < range.end(); ++i )
+				{
+					const vector<T> &part = data<T>( m_points[i].get() );
+					checkSize( part, m_offsets[i+1] - m_offsets[i], m_name );
+					std::copy( part.begin(), part.end(), output.begin() + m_offsets[i] );
+				}
+			}
+		);
+	}
+
+	private :
+
+		template<typename T>
+		const vector<T> &data( const PointsPrimitive *points ) const
+		{
+			auto it = points->variables.find( m_name );
+			const TypedData<vector<T>> *d = it != points->variables.end() && !it->second.indices ? runTimeCast<const TypedData<vector<T>>>( it->second.data.get() ) : nullptr;
+			if( !d )
+			{
+				throw IECore::Exception( boost::str(
+					boost::format( "Primitive variable \"%1%\" has inconsistent type" ) % m_name
+				) );
+			}
+			return d->readable();
+		}
+
+		const vector<PointsPrimitivePtr> &m_points;
+		const vector<size_t> &m_offsets;
+
+};
+
+// The number of faces in each chunk distributed over by `distributePoints()`.
+// This is fixed so that the result doesn't depend on the number of threads.
+const size_t g_distributePointsFacesPerChunk = 10000;
+
+V3f v3f( const V3f &v )
+{
+	return v;
+}
+
+V3f v3f( const V2f &v )
+{
+	return V3f( v.x, v.y, 0.0f );
+}
+
+struct MakeWireframe
+{
+
+	CurvesPrimitivePtr operator() ( const V2fVectorData *data, const MeshPrimitive *mesh, const string &name, const PrimitiveVariable &primitiveVariable )
+	{
+		return makeWireframe<V2fVectorData>( data, mesh, name, primitiveVariable );
+	}
+
+	CurvesPrimitivePtr operator() ( const V3fVectorData *data, const MeshPrimitive *mesh, const string &name, const PrimitiveVariable &primitiveVariable )
+	{
+		return makeWireframe<V3fVectorData>( data, mesh, name, primitiveVariable );
+	}
+
+	CurvesPrimitivePtr operator() ( const Data *data, const MeshPrimitive *mesh, const string &name, const PrimitiveVariable &primitiveVariable )
+	{
+		throw IECore::Exception( boost::str(
+			boost::format( "PrimitiveVariable \"%1%\" has unsupported type \"%2%\"" ) % name % data->typeName()
+		) );
+	}
+
+	private :
+
+		template<typename T>
+		CurvesPrimitivePtr makeWireframe( const T *data, const MeshPrimitive *mesh, const string &name, const PrimitiveVariable &primitiveVariable )
+		{
+			using Vec = typename T::ValueType::value_type;
+			using DataView = PrimitiveVariable::IndexedView<Vec>;
+
+			DataView dataView;
+			const vector<int> *vertexIds = nullptr;
+			switch( primitiveVariable.interpolation )
+			{
+				case PrimitiveVariable::Vertex :
+				case PrimitiveVariable::Varying :
+					vertexIds = &mesh->vertexIds()->readable();
+					dataView = DataView( primitiveVariable );
+					break;
+				case PrimitiveVariable::FaceVarying :
+					vertexIds = primitiveVariable.indices ? &primitiveVariable.indices->readable() : nullptr;
+					dataView = DataView( data->readable(), nullptr );
+					break;
+				default :
+					throw IECore::Exception( boost::str(
+						boost::format( "Primitive variable \"%1%\" must have Vertex, Varying or FaceVarying interpolation" ) % name
+					) );
+			}
+
+			const vector<int> &verticesPerFace = mesh->verticesPerFace()->readable();
+			vector<int> faceVaryingOffsets;
+			const size_t numFaceVertices = prefixSum(
+				verticesPerFace.size(), [&]( size_t i ) { return verticesPerFace[i]; },
+				faceVaryingOffsets
+			);
+
+			// Edges can be shared by several faces, but we only want to
+			// output each one once. Rather than inserting edges into a set
+			// one at a time, we generate a key for every edge in parallel, and
+			// sort them so that duplicates are adjacent. Sorting on the
+			// face-vertex index as well means that the first of each run of
+			// duplicates is the first visit to the edge, so we output edges
+			// in the same order as a serial traversal would.
+
+			using Edge = std::pair<uint64_t, int>;
+			vector<Edge> edges( numFaceVertices );
+			forEachEdge(
+				verticesPerFace, faceVaryingOffsets, vertexIds,
+				[&]( size_t faceVertex, int index0, int index1 ) {
+					const uint64_t key = ( (uint64_t)min( index0, index1 ) << 32 ) | (uint32_t)max( index0, index1 );
+					edges[faceVertex] = Edge( key, faceVertex );
+				}
+			);
+
+			tbb::parallel_sort( edges.begin(), edges.end() );
+
+			vector<char> firstVisits( numFaceVertices, 0 );
+			parallel_for(
+				blocked_range<size_t>( 0, numFaceVertices ),
+				[&]( const blocked_range<size_t> &range ) {
+					for( size_t i = range.begin(); i < range.end(); ++i )
+					{
+						if( i == 0 || edges[i].first != edges[i-1].first )
+						{
+							firstVisits[edges[i].second] = 1;
+						}
+					}
+				}
+			);
+
+			vector<Edge>().swap( edges );
+
+			vector<int> outputEdgeIndices;
+			const int numEdges = prefixSum(
+				numFaceVertices, [&]( size_t i ) { return firstVisits[i]; },
+				outputEdgeIndices
+			);
+
+			IECore::V3fVectorDataPtr pData = new V3fVectorData;
+			pData->setInterpretation( GeometricData::Point );
+			vector<V3f> &p = pData->writable();
+			p.resize( numEdges * 2 );
+
+			forEachEdge(
+				verticesPerFace, faceVaryingOffsets, vertexIds,
+				[&]( size_t faceVertex, int index0, int index1 ) {
+					if( firstVisits[faceVertex] )
+					{
+						const size_t outputIndex = outputEdgeIndices[faceVertex] * 2;
+						p[outputIndex] = v3f( dataView[index0] );
+						p[outputIndex+1] = v3f( dataView[index1] );
+					}
+				}
+			);
+
+			IECore::IntVectorDataPtr vertsPerCurveData = new IntVectorData;
+			vertsPerCurveData->writable().resize( numEdges, 2 );
+
+			CurvesPrimitivePtr result = new CurvesPrimitive( vertsPerCurveData );
+			result->variables["P"] = PrimitiveVariable( PrimitiveVariable::Vertex, pData );
+			return result;
+		}
+
+		// Calls `f( faceVertex, index0, index1 )` in parallel for the edge
+		// starting at each face-vertex.
+		template<typename F>
+		static void forEachEdge( const vector<int> &verticesPerFace, const vector<int> &faceVaryingOffsets, const vector<int> *vertexIds, const F &f )
+		{
+			parallel_for(
+				blocked_range<size_t>( 0, verticesPerFace.size() ),
+				[&]( const blocked_range<size_t> &range ) {
+					for( size_t face = range.begin(); face < range.end(); ++face )
+					{
+						const int offset = faceVaryingOffsets[face];
+						const int numVertices = verticesPerFace[face];
+						for( int i = 0; i < numVertices; ++i )
+						{
+							int index0 = offset + i;
+							int index1 = offset + (i + 1) % numVertices;
+							if( vertexIds )
+							{
+								index0 = (*vertexIds)[index0];
+								index1 = (*vertexIds)[index1];
+							}
+							f( offset + i, index0, index1 );
+						}
+					}
+				}
+			);
+		}
+
+};
+
+// The number of faces in the core of each chunk processed by
+// ChunkedAlgorithm. Unlike `g_distributePointsFacesPerChunk`, this
+// doesn't affect the results, only the balance between parallelism
+// and the cost of extracting each chunk.
+const size_t g_facesPerChunk = 10000;
+
+// Lists the faces which use each element of an array, given the
+// element used by each face-vertex. The array may be the vertices of
+// the mesh, or the data of an indexed primitive variable. The faces
+// for each element are listed in ascending order.
+struct FaceIncidence
+{
+
+	FaceIncidence( const vector<int> &indices, size_t numElements, const vector<int> &faceVaryingOffsets )
+		:	indices( indices ), numElements( numElements )
+	{
+		vector<int> faceVertices( indices.size() );
+		parallel_for(
+			blocked_range<size_t>( 0, faceVertices.size() ),
+			[&]( const blocked_range<size_t> &range ) {
+				for( size_t i = range.begin(); i < range.end(); ++i )
+				{
+					faceVertices[i] = i;
+				}
+			}
+		);
+
+		// Sorting on the face-vertex as well as the element keeps
+		// the faces for each element in ascending order.
+		tbb::parallel_sort(
+			faceVertices.begin(), faceVertices.end(),
+			[&]( int a, int b ) {
+				return indices[a] < indices[b] || ( indices[a] == indices[b] && a < b );
+			}
+		);
+
+		if( faceVertices.size() && ( indices[faceVertices.front()] < 0 || indices[faceVertices.back()] >= (int)numElements ) )
+		{
+			throw IECore::InvalidArgumentException( "Index out of range" );
+		}
+
+		faces.resize( faceVertices.size() );
+		parallel_for(
+			blocked_range<size_t>( 0, faces.size() ),
+			[&]( const blocked_range<size_t> &range ) {
+				for( size_t i = range.begin(); i < range.end(); ++i )
+				{
+					faces[i] = std::upper_bound( faceVaryingOffsets.begin(), faceVaryingOffsets.end(), faceVertices[i] ) - faceVaryingOffsets.begin() - 1;
+				}
+			}
+		);
+
+		offsets.resize( numElements + 1 );
+		parallel_for(
+			blocked_range<size_t>( 0, offsets.size() ),
+			[&]( const blocked_range<size_t> &range ) {
+				for( size_t e = range.begin(); e < range.end(); ++e )
+				{
+					offsets[e] = std::lower_bound(
+						faceVertices.begin(), faceVertices.end(), (int)e,
+						[&]( int faceVertex, int element ) { return indices[faceVertex] < element; }
+					) - faceVertices.begin();
+				}
+			}
+		);
+	}
+
+	// Returns true if every element is used by at least one face.
+	bool allUsed() const
+	{
+		std::atomic_bool result( true );
+		parallel_for(
+			blocked_range<size_t>( 0, numElements ),
+			[&]( const blocked_range<size_t> &range ) {
+				for( size_t e = range.begin(); e < range.end(); ++e )
+				{
+					if( offsets[e] == offsets[e+1] )
+					{
+						result = false;
+						return;
+					}
+				}
+			}
+		);
+		return result;
+	}
+
+	int firstFace( size_t element ) const
+	{
+		return faces[offsets[element]];
+	}
+
+	const vector<int> &indices;
+	const size_t numElements;
+
+	// Indexed by element, with an additional entry for the end.
+	vector<int> offsets;
+	vector<int> faces;
+
+};
+
+// Gathers the elements listed in `elements` into a new array. The
+// elements must be in ascending order.
+struct GatherElements : public VectorDataFunctor<GatherElements>
+{
+
+	// If `expectedSize` is nonzero, the input must have exactly that size.
+	GatherElements( const vector<int> &elements, size_t expectedSize, const std::string &name )
+		:	VectorDataFunctor<GatherElements>( name ), m_elements( elements ), m_expectedSize( expectedSize )
+	{
+	}
+
+	template<typename T>
+	void fill( const vector<T> &input, vector<T> &output ) const
+	{
+		if( m_expectedSize )
+		{
+			checkSize( input, m_expectedSize, m_name );
+		}
+
+		if( m_elements.size() && ( m_elements.front() < 0 || m_elements.back() >= (int)input.size() ) )
+		{
+			throw IECore::InvalidArgumentException( boost::str(
+				boost::format( "Primitive variable \"%1%\" has index out of range" ) % m_name
+			) );
+		}
+
+		output.reserve( m_elements.size() );
+		for( int e : m_elements )
+		{
+			output.push_back( input[e] );
+		}
+	}
+
+	private :
+
+		const vector<int> &m_elements;
+		const size_t m_expectedSize;
+
+};
+
+// A subset of the faces of a mesh, extracted as a mesh of its own.
+// Faces, vertices and the data of indexed primitive variables all keep
+// their original relative order, so a serial algorithm run on the chunk
+// visits them in the same order as it would on the whole mesh.
+class MeshChunk
+{
+
+	public :
+
+		// `faces` must be in ascending order, with no duplicates.
+		MeshChunk( const MeshPrimitive *mesh, const vector<int> &faceVaryingOffsets, vector<int> &faces )
+			:	m_wholeMesh( mesh )
+		{
+			m_faces.swap( faces );
+
+			const vector<int> &verticesPerFace = mesh->verticesPerFace()->readable();
+			const vector<int> &vertexIds = mesh->vertexIds()->readable();
+
+			IntVectorDataPtr chunkVerticesPerFaceData = new IntVectorData;
+			vector<int> &chunkVerticesPerFace = chunkVerticesPerFaceData->writable();
+			chunkVerticesPerFace.reserve( m_faces.size() );
+			for( int face : m_faces )
+			{
+				chunkVerticesPerFace.push_back( verticesPerFace[face] );
+				for( int i = 0; i < verticesPerFace[face]; ++i )
+				{
+					m_faceVertices.push_back( faceVaryingOffsets[face] + i );
+				}
+			}
+
+			// Renumber the vertices so they are contiguous.
+
+			m_vertices.reserve( m_faceVertices.size() );
+			for( int faceVertex : m_faceVertices )
+			{
+				m_vertices.push_back( vertexIds[faceVertex] );
+			}
+			std::sort( m_vertices.begin(), m_vertices.end() );
+			m_vertices.erase( std::unique( m_vertices.begin(), m_vertices.end() ), m_vertices.end() );
+
+			IntVectorDataPtr chunkVertexIdsData = new IntVectorData;
+			vector<int> &chunkVertexIds = chunkVertexIdsData->writable();
+			chunkVertexIds.reserve( m_faceVertices.size() );
+			for( int faceVertex : m_faceVertices )
+			{
+				chunkVertexIds.push_back( std::lower_bound( m_vertices.begin(), m_vertices.end(), vertexIds[faceVertex] ) - m_vertices.begin() );
+			}
+
+			m_mesh = new MeshPrimitive( chunkVerticesPerFaceData, chunkVertexIdsData, mesh->interpolation() );
+		}
+
+		MeshPrimitive *mesh() const
+		{
+			return m_mesh.get();
+		}
+
+		// The faces, face-vertices and vertices of the whole mesh
+		// which are included in the chunk.
+		const vector<int> &faces() const
+		{
+			return m_faces;
+		}
+
+		const vector<int> &faceVertices() const
+		{
+			return m_faceVertices;
+		}
+
+		const vector<int> &vertices() const
+		{
+			return m_vertices;
+		}
+
+		// Returns the part of `primitiveVariable` used by the chunk. For
+		// indexed variables, only the data used by the chunk is included,
+		// and `dataElements` is filled with the original index of each
+		// data element.
+		PrimitiveVariable primitiveVariable( const PrimitiveVariable &primitiveVariable, const std::string &name, vector<int> *dataElements = nullptr ) const
+		{
+			const vector<int> *elements = nullptr;
+			switch( primitiveVariable.interpolation )
+			{
+				case PrimitiveVariable::Uniform :
+					elements = &m_faces;
+					break;
+				case PrimitiveVariable::Vertex :
+				case PrimitiveVariable::Varying :
+					elements = &m_vertices;
+					break;
+				case PrimitiveVariable::FaceVarying :
+					elements = &m_faceVertices;
+					break;
+				default :
+					return primitiveVariable;
+			}
+
+			GatherElements gather( *elements, m_wholeMesh->variableSize( primitiveVariable.interpolation ), name );
+			if( !primitiveVariable.indices )
+			{
+				return PrimitiveVariable( primitiveVariable.interpolation, dispatch( primitiveVariable.data.get(), gather ) );
+			}
+
+			IntVectorDataPtr indicesData = runTimeCast<IntVectorData>( gather( primitiveVariable.indices.get() ) );
+			vector<int> &indices = indicesData->writable();
+
+			vector<int> usedElements( indices );
+			std::sort( usedElements.begin(), usedElements.end() );
+			usedElements.erase( std::unique( usedElements.begin(), usedElements.end() ), usedElements.end() );
+			for( int &i : indices )
+			{
+				i = std::lower_bound( usedElements.begin(), usedElements.end(), i ) - usedElements.begin();
+			}
+
+			GatherElements gatherData( usedElements, 0, name );
+			DataPtr data = dispatch( primitiveVariable.data.get(), gatherData );
+			if( dataElements )
+			{
+				dataElements->swap( usedElements );
+			}
+
+			return PrimitiveVariable( primitiveVariable.interpolation, data, indicesData );
+		}
+
+		// Adds the part of `primitiveVariable` used by the chunk to
+		// `mesh()`, with the same name.
+		void addPrimitiveVariable( const std::string &name, const PrimitiveVariable &primitiveVariable )
+		{
+			vector<int> dataElements;
+			m_mesh->variables[name] = this->primitiveVariable( primitiveVariable, name, &dataElements );
+			if( primitiveVariable.indices )
+			{
+				m_indexedVariables.push_back( { name, primitiveVariable.indices.get(), std::move( dataElements ) } );
+			}
+		}
+
+		// An indexed variable added by `addPrimitiveVariable()`.
+		struct IndexedVariable
+		{
+			std::string name;
+			const IntVectorData *wholeIndices;
+			vector<int> dataElements;
+		};
+
+		// Returns the indexed variable with indices equal to `indices`,
+		// or null if there isn't one.
+		const IndexedVariable *indexedVariable( const IntVectorData *indices ) const
+		{
+			for( const auto &v : m_indexedVariables )
+			{
+				const PrimitiveVariable &p = m_mesh->variables.find( v.name )->second;
+				if( p.indices->readable() == indices->readable() )
+				{
+					return &v;
+				}
+			}
+			return nullptr;
+		}
+
+	private :
+
+		const MeshPrimitive *m_wholeMesh;
+		MeshPrimitivePtr m_mesh;
+		vector<int> m_faces;
+		vector<int> m_faceVertices;
+		vector<int> m_vertices;
+		vector<IndexedVariable> m_indexedVariables;
+
+};
+
+// Creates an array of the same type as the input, with `size` elements.
+struct AllocateVectorData : public VectorDataFunctor<AllocateVectorData>
+{
+
+	AllocateVectorData( size_t size, const std::string &name )
+		:	VectorDataFunctor<AllocateVectorData>( name ), m_size( size )
+	{
+	}
+
+	template<typename T>
+	void fill( const vector<T> &input, vector<T> &output ) const
+	{
+		output.resize( m_size );
+	}
+
+	private :
+
+		const size_t m_size;
+
+};
+
+// Runs a serial algorithm on chunks of a mesh in parallel, and assembles
+// the results into primitive variables for the whole mesh. Each chunk
+// consists of a contiguous range of "core" faces, extended with every
+// other face which uses the same elements as the core, as specified by
+// `extend()`. Because the chunk keeps the faces in their original order,
+// any per-element accumulation performed by the algorithm sees the same
+// contributions in the same order as it would for the whole mesh, so the
+// results for the core are identical. The results for each vertex or data
+// element are taken from the chunk whose core contains the first face
+// using it.
+class ChunkedAlgorithm
+{
+
+	public :
+
+		ChunkedAlgorithm( const MeshPrimitive *mesh )
+			:	m_mesh( mesh )
+		{
+			const vector<int> &verticesPerFace = mesh->verticesPerFace()->readable();
+			m_numFaceVertices = prefixSum(
+				verticesPerFace.size(), [&]( size_t i ) { return verticesPerFace[i]; },
+				m_faceVaryingOffsets
+			);
+		}
+
+		size_t numChunks() const
+		{
+			return ( m_mesh->numFaces() + g_facesPerChunk - 1 ) / g_facesPerChunk;
+		}
+
+		// Extends each chunk to include every face using the same elements
+		// as its core, where `indices` gives the element used by each
+		// face-vertex.
+		void extend( const vector<int> &indices, size_t numElements )
+		{
+			m_incidences.push_back( std::unique_ptr<FaceIncidence>( new FaceIncidence( indices, numElements, m_faceVaryingOffsets ) ) );
+		}
+
+		// Calls `f( chunk )` for each chunk, where `f` adds the primitive
+		// variables it needs to the chunk and returns the results of the
+		// serial algorithm. Returns false if the results can't be assembled,
+		// in which case the caller should run the algorithm on the whole
+		// mesh instead.
+		template<typename F>
+		bool run( const F &f, vector<PrimitiveVariable> &results ) const
+		{
+			// Run the first chunk on its own, so that we know the form
+			// of the results before dealing with the others.
+
+			std::unique_ptr<MeshChunk> firstChunk = chunk( 0 );
+			const vector<PrimitiveVariable> firstResults = f( *firstChunk );
+
+			bool parallel = true;
+			vector<Layout> layouts;
+			results.clear();
+			for( const auto &r : firstResults )
+			{
+				Layout layout;
+				if( !this->layout( *firstChunk, r, layout ) )
+				{
+					return false;
+				}
+				layouts.push_back( layout );
+				results.push_back(
+					PrimitiveVariable(
+						r.interpolation,
+						dispatch( r.data.get(), AllocateVectorData( layout.size, "" ) ),
+						layout.wholeIndices ? layout.wholeIndices->copy() : IntVectorDataPtr()
+					)
+				);
+				// Neighbouring elements of a `vector<bool>` share storage,
+				// so chunks can't write to one concurrently.
+				parallel = parallel && r.data->typeId() != BoolVectorDataTypeId;
+			}
+
+			assemble( 0, *firstChunk, firstResults, layouts, results );
+			firstChunk.reset();
+
+			// Then the rest.
+
+			auto processChunk = [&]( size_t i ) {
+				std::unique_ptr<MeshChunk> c = chunk( i );
+				assemble( i, *c, f( *c ), layouts, results );
+			};
+
+			if( parallel )
+			{
+				tbb::task_group_context taskGroupContext( tbb::task_group_context::isolated );
+				parallel_for(
+					blocked_range<size_t>( 1, numChunks() ),
+					[&]( const blocked_range<size_t> &range ) {
+						for( size_t i = range.begin(); i < range.end(); ++i )
+						{
+							processChunk( i );
+						}
+					},
+					taskGroupContext // Prevents outer tasks silently cancelling our tasks
+				);
+			}
+			else
+			{
+				for( size_t i = 1, e = numChunks(); i < e; ++i )
+				{
+					processChunk( i );
+				}
+			}
+
+			return true;
+		}
+
+	private :
+
+		size_t beginFace( size_t chunk ) const
+		{
+			return chunk * g_facesPerChunk;
+		}
+
+		size_t endFace( size_t chunk ) const
+		{
+			return std::min( ( chunk + 1 ) * g_facesPerChunk, m_faceVaryingOffsets.size() );
+		}
+
+		size_t faceVaryingOffset( size_t face ) const
+		{
+			return face < m_faceVaryingOffsets.size() ? m_faceVaryingOffsets[face] : m_numFaceVertices;
+		}
+
+		std::unique_ptr<MeshChunk> chunk( size_t i ) const
+		{
+			const size_t begin = beginFace( i );
+			const size_t end = endFace( i );
+
+			vector<int> faces;
+			for( size_t face = begin; face < end; ++face )
+			{
+				faces.push_back( face );
+			}
+
+			for( const auto &incidence : m_incidences )
+			{
+				for( size_t faceVertex = faceVaryingOffset( begin ), e = faceVaryingOffset( end ); faceVertex < e; ++faceVertex )
+				{
+					const int element = incidence->indices[faceVertex];
+					faces.insert(
+						faces.end(),
+						incidence->faces.begin() + incidence->offsets[element],
+						incidence->faces.begin() + incidence->offsets[element+1]
+					);
+				}
+			}
+
+			std::sort( faces.begin(), faces.end() );
+			faces.erase( std::unique( faces.begin(), faces.end() ), faces.end() );
+
+			return std::unique_ptr<MeshChunk>( new MeshChunk( m_mesh, m_faceVaryingOffsets, faces ) );
+		}
+
+		const FaceIncidence *incidence( const vector<int> &indices ) const
+		{
+			for( const auto &i : m_incidences )
+			{
+				if( &i->indices == &indices )
+				{
+					return i.get();
+				}
+			}
+			return nullptr;
+		}
+
+		// Describes how the result of a chunk is assembled into the
+		// result for the whole mesh.
+		struct Layout
+		{
+			size_t size;
+			// The incidence used to find the chunk responsible for each
+			// vertex or data element. Null for per-face and per-face-vertex
+			// results, which are taken from the core faces of each chunk.
+			const FaceIncidence *incidence = nullptr;
+			// For indexed results, the indices of the input variable
+			// they share their indices with.
+			const IntVectorData *wholeIndices = nullptr;
+		};
+
+		bool layout( const MeshChunk &chunk, const PrimitiveVariable &result, Layout &layout ) const
+		{
+			if( !result.data )
+			{
+				return false;
+			}
+
+			if( result.indices )
+			{
+				// We can only assemble indexed results if they share
+				// their indices with one of the inputs, and we know the
+				// chunk responsible for every data element.
+				if( result.interpolation != PrimitiveVariable::FaceVarying )
+				{
+					return false;
+				}
+				const MeshChunk::IndexedVariable *indexedVariable = chunk.indexedVariable( result.indices.get() );
+				if( !indexedVariable )
+				{
+					return false;
+				}
+				layout.wholeIndices = indexedVariable->wholeIndices;
+				layout.incidence = incidence( layout.wholeIndices->readable() );
+				if( !layout.incidence || !layout.incidence->allUsed() )
+				{
+					return false;
+				}
+				layout.size = layout.incidence->numElements;
+				return true;
+			}
+
+			switch( result.interpolation )
+			{
+				case PrimitiveVariable::Uniform :
+					layout.size = m_mesh->numFaces();
+					return true;
+				case PrimitiveVariable::FaceVarying :
+					layout.size = m_numFaceVertices;
+					return true;
+				case PrimitiveVariable::Vertex :
+				case PrimitiveVariable::Varying :
+					layout.incidence = incidence( m_mesh->vertexIds()->readable() );
+					if( !layout.incidence || !layout.incidence->allUsed() )
+					{
+						return false;
+					}
+					layout.size = layout.incidence->numElements;
+					return true;
+				default :
+					return false;
+			}
+		}
+
+		// Copies the elements that chunk `i` is responsible for into `results`.
+		void assemble( size_t i, const MeshChunk &chunk, const vector<PrimitiveVariable> &chunkResults, const vector<Layout> &layouts, vector<PrimitiveVariable> &results ) const
+		{
+			if( chunkResults.size() != results.size() )
+			{
+				throw IECore::Exception( "Inconsistent results from mesh chunks" );
+			}
+
+			const int begin = beginFace( i );
+			const int end = endFace( i );
+
+			for( size_t r = 0; r < results.size(); ++r )
+			{
+				const PrimitiveVariable &chunkResult = chunkResults[r];
+				const Layout &layout = layouts[r];
+				if(
+					chunkResult.interpolation != results[r].interpolation ||
+					!chunkResult.data || chunkResult.data->typeId() != results[r].data->typeId() ||
+					( layout.wholeIndices != nullptr ) != ( chunkResult.indices != nullptr )
+				)
+				{
+					throw IECore::Exception( "Inconsistent results from mesh chunks" );
+				}
+
+				// Build a list of ( chunk element, whole mesh element ) pairs
+				// for the elements we are responsible for.
+
+				vector<std::pair<int, int>> elements;
+				if( layout.wholeIndices )
+				{
+					const MeshChunk::IndexedVariable *indexedVariable = chunk.indexedVariable( chunkResult.indices.get() );
+					if( !indexedVariable || indexedVariable->wholeIndices != layout.wholeIndices )
+					{
+						throw IECore::Exception( "Inconsistent results from mesh chunks" );
+					}
+					const vector<int> &dataElements = indexedVariable->dataElements;
+					for( size_t j = 0; j < dataElements.size(); ++j )
+					{
+						const int face = layout.incidence->firstFace( dataElements[j] );
+						if( face >= begin && face < end )
+						{
+							elements.emplace_back( j, dataElements[j] );
+						}
+					}
+				}
+				else if( layout.incidence )
+				{
+					const vector<int> &vertices = chunk.vertices();
+					for( size_t j = 0; j < vertices.size(); ++j )
+					{
+						const int face = layout.incidence->firstFace( vertices[j] );
+						if( face >= begin && face < end )
+						{
+							elements.emplace_back( j, vertices[j] );
+						}
+					}
+				}
+				else if( chunkResult.interpolation == PrimitiveVariable::Uniform )
+				{
+					const int chunkBegin = std::lower_bound( chunk.faces().begin(), chunk.faces().end(), begin ) - chunk.faces().begin();
+					for( int face = begin; face < end; ++face )
+					{
+						elements.emplace_back( chunkBegin + face - begin, face );
+					}
+				}
+				else
+				{
+					const int wholeBegin = faceVaryingOffset( begin );
+					const int wholeEnd = faceVaryingOffset( end );
+					const int chunkBegin = std::lower_bound( chunk.faceVertices().begin(), chunk.faceVertices().end(), wholeBegin ) - chunk.faceVertices().begin();
+					for( int faceVertex = wholeBegin; faceVertex < wholeEnd; ++faceVertex )
+					{
+						elements.emplace_back( chunkBegin + faceVertex - wholeBegin, faceVertex );
+					}
+				}
+
+				dispatch( chunkResult.data.get(), AssembleElements(), elements, results[r].data.get() );
+			}
+		}
+
+		// Copies elements from a chunk result into the whole result.
+		struct AssembleElements
+		{
+
+			template<typename T>
+			void operator()( const TypedData<vector<T>> *chunkData, const vector<std::pair<int, int>> &elements, Data *result ) const
+			{
+				const vector<T> &input = chunkData->readable();
+				// The type has already been checked by the caller.
+				vector<T> &output = static_cast<TypedData<vector<T>> *>( result )->writable();
+				for( const auto &e : elements )
+				{
+					output[e.second] = input[e.first];
+				}
+			}
+
+			void operator()( const Data *chunkData, const vector<std::pair<int, int>> &elements, Data *result ) const
+			{
+				throw IECore::Exception( boost::str(
+					boost::format( "Unsupported result type \"%1%\"" ) % chunkData->typeName()
+				) );
+			}
+
+		};
+
+		const MeshPrimitive *m_mesh;
+		vector<int> m_faceVaryingOffsets;
+		size_t m_numFaceVertices;
+		vector<std::unique_ptr<FaceIncidence>> m_incidences;
+
+};
+
+} // namespace
+
+//////////////////////////////////////////////////////////////////////////
+// Public API
+//////////////////////////////////////////////////////////////////////////
+
+MeshPrimitivePtr IECoreScenePreview::MeshAlgo::deleteFaces( const MeshPrimitive *meshPrimitive, const PrimitiveVariable &facesToDelete, bool invert )
+{
+	const vector<int> &verticesPerFace = meshPrimitive->verticesPerFace()->readable();
+	const vector<int> &vertexIds = meshPrimitive->vertexIds()->readable();
+	const size_t numFaces = verticesPerFace.size();
+
+	Remapping remapping( verticesPerFace, meshPrimitive->variableSize( PrimitiveVariable::Vertex ) );
+
+	// Decide which faces to keep.
+
+	if( facesToDelete.interpolation != PrimitiveVariable::Uniform )
+	{
+		throw InvalidArgumentException( "MeshAlgo::deleteFaces requires a Uniform [Int|Bool|Float]VectorData primitiveVariable" );
+	}
+
+	if( !keepFlags( facesToDelete, invert, remapping.keepFaces, "MeshAlgo::deleteFaces" ) )
+	{
+		throw InvalidArgumentException( "MeshAlgo::deleteFaces requires a Uniform [Int|Bool|Float]VectorData primitiveVariable" );
+	}
+
+	// Compute the remapping for faces and face-vertices, using
+	// prefix sums so that each output element knows where it
+	// belongs without reference to any other.
+
+	const vector<char> &keepFaces = remapping.keepFaces;
+
+	prefixSum(
+		numFaces, [&]( size_t i ) { return verticesPerFace[i]; },
+		remapping.inputFaceVaryingOffsets
+	);
+
+	remapping.numOutputFaces = prefixSum(
+		numFaces, [&]( size_t i ) { return keepFaces[i] ? 1 : 0; },
+		remapping.outputFaceIndices
+	);
+
+	remapping.numOutputFaceVertices = prefixSum(
+		numFaces, [&]( size_t i ) { return keepFaces[i] ? verticesPerFace[i] : 0; },
+		remapping.outputFaceVaryingOffsets
+	);
+
+	// Compute the remapping for vertices, keeping only those
+	// used by the remaining faces.
+
+	parallel_for(
+		blocked_range<size_t>( 0, numFaces ),
+		[&]( const blocked_range<size_t> &range ) {
+			for( size_t i = range.begin(); i < range.end(); ++i )
+			{
+				if( !keepFaces[i] )
+				{
+					continue;
+				}
+				const int offset = remapping.inputFaceVaryingOffsets[i];
+				for( int j = 0; j < verticesPerFace[i]; ++j )
+				{
+					remapping.keepVertices[vertexIds[offset + j]].store( 1, std::memory_order_relaxed );
+				}
+			}
+		}
+	);
+
+	remapping.numOutputVertices = prefixSum(
+		remapping.keepVertices.size(), [&]( size_t i ) { return remapping.keepVertices[i].load( std::memory_order_relaxed ) ? 1 : 0; },
+		remapping.outputVertexIndices
+	);
+
+	// Build the output topology.
+
+	IntVectorDataPtr outputVerticesPerFaceData = new IntVectorData;
+	vector<int> &outputVerticesPerFace = outputVerticesPerFaceData->writable();
+	outputVerticesPerFace.resize( remapping.numOutputFaces );
+
+	IntVectorDataPtr outputVertexIdsData = new IntVectorData;
+	vector<int> &outputVertexIds = outputVertexIdsData->writable();
+	outputVertexIds.resize( remapping.numOutputFaceVertices );
+
+	parallel_for(
+		blocked_range<size_t>( 0, numFaces ),
+		[&]( const blocked_range<size_t> &range ) {
+			for( size_t i = range.begin(); i < range.end(); ++i )
+			{
+				if( !keepFaces[i] )
+				{
+					continue;
+				}
+				outputVerticesPerFace[remapping.outputFaceIndices[i]] = verticesPerFace[i];
+				const int inputOffset = remapping.inputFaceVaryingOffsets[i];
+				const int outputOffset = remapping.outputFaceVaryingOffsets[i];
+				for( int j = 0; j < verticesPerFace[i]; ++j )
+				{
+					outputVertexIds[outputOffset + j] = remapping.outputVertexIndices[vertexIds[inputOffset + j]];
+				}
+			}
+		}
+	);
+
+	MeshPrimitivePtr result = new MeshPrimitive( outputVerticesPerFaceData, outputVertexIdsData, meshPrimitive->interpolation() );
+
+	// Filter the primitive variables. Indexed variables
+	// are filtered by their indices, and share their data
+	// with the input.
+
+	for( const auto &p : meshPrimitive->variables )
+	{
+		if( p.second.interpolation == PrimitiveVariable::Constant )
+		{
+			result->variables[p.first] = p.second;
+			continue;
+		}
+
+		FilterPrimitiveVariable filter( remapping, p.second.interpolation, p.first );
+		if( p.second.indices )
+		{
+			IntVectorDataPtr indices = runTimeCast<IntVectorData>( filter( p.second.indices.get() ) );
+			result->variables[p.first] = PrimitiveVariable( p.second.interpolation, p.second.data, indices );
+		}
+		else
+		{
+			result->variables[p.first] = PrimitiveVariable( p.second.interpolation, dispatch( p.second.data.get(), filter ) );
+		}
+	}
+
+	return result;
+}
+
+PointsPrimitivePtr IECoreScenePreview::MeshAlgo::distributePoints( const MeshPrimitive *mesh, float density, const Imath::V2f &offset, const std::string &densityMask )
+{
+	const vector<int> &verticesPerFace = mesh->verticesPerFace()->readable();
+	const size_t numFaces = verticesPerFace.size();
+	const size_t numChunks = ( numFaces + g_distributePointsFacesPerChunk - 1 ) / g_distributePointsFacesPerChunk;
+	if( numChunks <= 1 )
+	{
+		return IECoreScene::MeshAlgo::distributePoints( mesh, density, offset, densityMask );
+	}
+
+	// Distribute points over each chunk of faces in parallel.
+
+	vector<int> faceVaryingOffsets;
+	prefixSum(
+		numFaces, [&]( size_t i ) { return verticesPerFace[i]; },
+		faceVaryingOffsets
+	);
+
+	vector<PointsPrimitivePtr> chunkPoints( numChunks );
+	tbb::task_group_context taskGroupContext( tbb::task_group_context::isolated );
+	parallel_for(
+		blocked_range<size_t>( 0, numChunks ),
+		[&]( const blocked_range<size_t> &range ) {
+			for( size_t i = range.begin(); i < range.end(); ++i )
+			{
+				const size_t beginFace = i * g_distributePointsFacesPerChunk;
+				const size_t endFace = std::min( beginFace + g_distributePointsFacesPerChunk, numFaces );
+				MeshPrimitivePtr chunk = faceRange( mesh, beginFace, endFace, faceVaryingOffsets );
+				chunkPoints[i] = IECoreScene::MeshAlgo::distributePoints( chunk.get(), density, offset, densityMask );
+			}
+		},
+		taskGroupContext // Prevents outer tasks silently cancelling our tasks
+	);
+
+	// Concatenate the results, in chunk order.
+
+	vector<size_t> pointOffsets( 1, 0 );
+	pointOffsets.reserve( numChunks + 1 );
+	for( const auto &points : chunkPoints )
+	{
+		pointOffsets.push_back( pointOffsets.back() + points->getNumPoints() );
+	}
+
+	PointsPrimitivePtr result = new PointsPrimitive( pointOffsets.back() );
+	for( const auto &p : chunkPoints.front()->variables )
+	{
+		if( p.second.interpolation == PrimitiveVariable::Constant )
+		{
+			result->variables[p.first] = p.second;
+			continue;
+		}
+
+		ConcatenatePrimitiveVariable concatenate( chunkPoints, pointOffsets, p.first );
+		result->variables[p.first] = PrimitiveVariable( p.second.interpolation, dispatch( p.second.data.get(), concatenate ) );
+	}
+
+	return result;
+}
+
+void IECoreScenePreview::MeshAlgo::resamplePrimitiveVariable( const MeshPrimitive *mesh, PrimitiveVariable &primitiveVariable, PrimitiveVariable::Interpolation interpolation )
+{
+	auto isVertex = []( PrimitiveVariable::Interpolation i ) {
+		return i == PrimitiveVariable::Vertex || i == PrimitiveVariable::Varying;
+	};
+
+	auto isChunkable = [&isVertex]( PrimitiveVariable::Interpolation i ) {
+		return isVertex( i ) || i == PrimitiveVariable::Uniform || i == PrimitiveVariable::FaceVarying;
+	};
+
+	const PrimitiveVariable::Interpolation source = primitiveVariable.interpolation;
+	ChunkedAlgorithm chunked( mesh );
+	if(
+		chunked.numChunks() <= 1 || source == interpolation ||
+		!isChunkable( source ) || !isChunkable( interpolation ) ||
+		( isVertex( source ) && isVertex( interpolation ) ) ||
+		primitiveVariable.indices || !mesh->isPrimitiveVariableValid( primitiveVariable )
+	)
+	{
+		IECoreScene::MeshAlgo::resamplePrimitiveVariable( mesh, primitiveVariable, interpolation );
+		return;
+	}
+
+	if( isVertex( interpolation ) )
+	{
+		// Each vertex needs every face that uses it.
+		chunked.extend( mesh->vertexIds()->readable(), mesh->variableSize( PrimitiveVariable::Vertex ) );
+	}
+
+	vector<PrimitiveVariable> results;
+	const bool assembled = chunked.run(
+		[&]( MeshChunk &chunk ) {
+			PrimitiveVariable chunkVariable = chunk.primitiveVariable( primitiveVariable, "" );
+			IECoreScene::MeshAlgo::resamplePrimitiveVariable( chunk.mesh(), chunkVariable, interpolation );
+			return vector<PrimitiveVariable>( { chunkVariable } );
+		},
+		results
+	);
+
+	if( assembled )
+	{
+		primitiveVariable = results[0];
+	}
+	else
+	{
+		IECoreScene::MeshAlgo::resamplePrimitiveVariable( mesh, primitiveVariable, interpolation );
+	}
+}
+
+std::pair<PrimitiveVariable, PrimitiveVariable> IECoreScenePreview::MeshAlgo::calculateTangents( const MeshPrimitive *mesh, const std::string &uvSet, bool orthoTangents, const std::string &position )
+{
+	ChunkedAlgorithm chunked( mesh );
+
+	const auto uvIt = mesh->variables.find( uvSet );
+	const auto positionIt = mesh->variables.find( position );
+	const V2fVectorData *uvData = uvIt != mesh->variables.end() ? runTimeCast<const V2fVectorData>( uvIt->second.data.get() ) : nullptr;
+	if(
+		chunked.numChunks() <= 1 || mesh->minVerticesPerFace() != 3 || mesh->maxVerticesPerFace() != 3 ||
+		!uvData || uvIt->second.interpolation != PrimitiveVariable::FaceVarying || !mesh->isPrimitiveVariableValid( uvIt->second ) ||
+		positionIt == mesh->variables.end() || positionIt->second.interpolation != PrimitiveVariable::Vertex ||
+		positionIt->second.indices || !mesh->isPrimitiveVariableValid( positionIt->second )
+	)
+	{
+		// Small meshes, and invalid ones, are left to the serial
+		// implementation, which also provides the error messages.
+		return IECoreScene::MeshAlgo::calculateTangents( mesh, uvSet, orthoTangents, position );
+	}
+
+	// Tangents are accumulated for each UV from all the faces which use
+	// it. Without indices, no UVs are shared, but we conservatively
+	// include every face sharing a vertex instead.
+	if( uvIt->second.indices )
+	{
+		chunked.extend( uvIt->second.indices->readable(), uvData->readable().size() );
+	}
+	else
+	{
+		chunked.extend( mesh->vertexIds()->readable(), mesh->variableSize( PrimitiveVariable::Vertex ) );
+	}
+
+	vector<PrimitiveVariable> results;
+	const bool assembled = chunked.run(
+		[&]( MeshChunk &chunk ) {
+			chunk.addPrimitiveVariable( uvSet, uvIt->second );
+			chunk.addPrimitiveVariable( position, positionIt->second );
+			auto tangents = IECoreScene::MeshAlgo::calculateTangents( chunk.mesh(), uvSet, orthoTangents, position );
+			return vector<PrimitiveVariable>( { tangents.first, tangents.second } );
+		},
+		results
+	);
+
+	if( !assembled )
+	{
+		return IECoreScene::MeshAlgo::calculateTangents( mesh, uvSet, orthoTangents, position );
+	}
+
+	return std::make_pair( results[0], results[1] );
+}
+
+std::pair<PrimitiveVariable, PrimitiveVariable> IECoreScenePreview::MeshAlgo::calculateDistortion( const MeshPrimitive *mesh, const std::string &uvSet, const std::string &referencePosition, const std::string &position )
+{
+	ChunkedAlgorithm chunked( mesh );
+
+	auto isValidPosition = [mesh]( PrimitiveVariableMap::const_iterator it ) {
+		return
+			it != mesh->variables.end() && it->second.interpolation == PrimitiveVariable::Vertex &&
+			!it->second.indices && mesh->isPrimitiveVariableValid( it->second )
+		;
+	};
+
+	const auto uvIt = mesh->variables.find( uvSet );
+	const auto positionIt = mesh->variables.find( position );
+	const auto referencePositionIt = mesh->variables.find( referencePosition );
+	const V2fVectorData *uvData = uvIt != mesh->variables.end() ? runTimeCast<const V2fVectorData>( uvIt->second.data.get() ) : nullptr;
+	if(
+		chunked.numChunks() <= 1 ||
+		!uvData || uvIt->second.interpolation != PrimitiveVariable::FaceVarying || !mesh->isPrimitiveVariableValid( uvIt->second ) ||
+		!isValidPosition( positionIt ) || !isValidPosition( referencePositionIt )
+	)
+	{
+		return IECoreScene::MeshAlgo::calculateDistortion( mesh, uvSet, referencePosition, position );
+	}
+
+	// Distortion is accumulated for each vertex and each UV from the
+	// edges of all the faces which use it.
+	chunked.extend( mesh->vertexIds()->readable(), mesh->variableSize( PrimitiveVariable::Vertex ) );
+	if( uvIt->second.indices )
+	{
+		chunked.extend( uvIt->second.indices->readable(), uvData->readable().size() );
+	}
+
+	vector<PrimitiveVariable> results;
+	const bool assembled = chunked.run(
+		[&]( MeshChunk &chunk ) {
+			chunk.addPrimitiveVariable( uvSet, uvIt->second );
+			chunk.addPrimitiveVariable( position, positionIt->second );
+			chunk.addPrimitiveVariable( referencePosition, referencePositionIt->second );
+			auto distortions = IECoreScene::MeshAlgo::calculateDistortion( chunk.mesh(), uvSet, referencePosition, position );
+			return vector<PrimitiveVariable>( { distortions.first, distortions.second } );
+		},
+		results
+	);
+
+	if( !assembled )
+	{
+		return IECoreScene::MeshAlgo::calculateDistortion( mesh, uvSet, referencePosition, position );
+	}
+
+	return std::make_pair( results[0], results[1] );
+}
+
+CurvesPrimitivePtr IECoreScenePreview::MeshAlgo::wireframe( const MeshPrimitive *mesh, const std::string &position )
+{
+	auto it = mesh->variables.find( position );
+	if( it == mesh->variables.end() )
+	{
+		throw IECore::Exception( boost::str(
+			boost::format( "MeshPrimitive has no primitive variable named \"%1%\"" ) % position
+		) );
+	}
+
+	return dispatch( it->second.data.get(), MakeWireframe(), mesh, it->first, it->second );
+}
@@ -0,0 +1,78 @@
+//////////////////////////////////////////////////////////////////////////
+//
+//  Copyright (c) 2019, Image Engine Design Inc. All rights reserved.
+//
+//  Redistribution and use in source and binary forms, with or without
+//  modification, are permitted provided that the following conditions are
+//  met:
+//
+//      * Redistributions of source code must retain the above
+//        copyright notice, this list of conditions and the following
+//        disclaimer.
+//
+//      * Redistributions in binary form must reproduce the above
+//        copyright notice, this list of conditions and the following
+//        disclaimer in the documentation and/or other materials provided with
+//        the distribution.
+//
+//      * Neither the name of John Haddon nor the names of
+//        any other contributors to this software may be used to endorse or
+//        promote products derived from this software without specific prior
+//        written permission.
+//
+//  THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS
+//  IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+//  THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+//  PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+//  CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+//  EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+//  PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+//  PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+//  LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+//  NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+//  SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+//
+//////////////////////////////////////////////////////////////////////////
+
+#include "GafferScene/Private/IECoreScenePreview/PointsAlgo.h"
+
+#include "PrimitiveAlgoUtils.h"
+
+using namespace std;
+using namespace IECore;
+using namespace IECoreScene;
+using namespace IECoreScenePreview::Detail;
+
+PointsPrimitivePtr IECoreScenePreview::PointsAlgo::deletePoints( const PointsPrimitive *pointsPrimitive, const PrimitiveVariable &pointsToDelete, bool invert )
+{
+	if( pointsToDelete.interpolation != PrimitiveVariable::Vertex )
+	{
+		throw InvalidArgumentException( "PointsAlgo::deletePoints requires a Vertex [Int|Bool|Float]VectorData primitiveVariable" );
+	}
+
+	vector<char> keepPoints( pointsPrimitive->getNumPoints() );
+	if( !keepFlags( pointsToDelete, invert, keepPoints, "PointsAlgo::deletePoints" ) )
+	{
+		throw InvalidArgumentException( "PointsAlgo::deletePoints requires a Vertex [Int|Bool|Float]VectorData primitiveVariable" );
+	}
+
+	const RunRemapping remapping( keepPoints, []( size_t ) { return 1; } );
+
+	PointsPrimitivePtr result = new PointsPrimitive( remapping.numOutputElements );
+	for( const auto &p : pointsPrimitive->variables )
+	{
+		switch( p.second.interpolation )
+		{
+			case PrimitiveVariable::Vertex :
+			case PrimitiveVariable::Varying :
+			case PrimitiveVariable::FaceVarying :
+				result->variables[p.first] = filterRuns( p.second, remapping, p.first );
+				break;
+			default :
+				result->variables[p.first] = p.second;
+				break;
+		}
+	}
+
+	return result;
+}
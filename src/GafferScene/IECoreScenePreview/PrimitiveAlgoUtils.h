@@ -0,0 +1,344 @@
+//////////////////////////////////////////////////////////////////////////
+//
+//  Copyright (c) 2019, Image Engine Design Inc. All rights reserved.
+//
+//  Redistribution and use in source and binary forms, with or without
+//  modification, are permitted provided that the following conditions are
+//  met:
+//
+//      * Redistributions of source code must retain the above
+//        copyright notice, this list of conditions and the following
+//        disclaimer.
+//
+//      * Redistributions in binary form must reproduce the above
+//        copyright notice, this list of conditions and the following
+//        disclaimer in the documentation and/or other materials provided with
+//        the distribution.
+//
+//      * Neither the name of John Haddon nor the names of
+//        any other contributors to this software may be used to endorse or
+//        promote products derived from this software without specific prior
+//        written permission.
+//
+//  THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS
+//  IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+//  THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+//  PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+//  CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+//  EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+//  PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+//  PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+//  LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+//  NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+//  SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+//
+//////////////////////////////////////////////////////////////////////////
+
+#ifndef IECORESCENEPREVIEW_PRIMITIVEALGOUTILS_H
+#define IECORESCENEPREVIEW_PRIMITIVEALGOUTILS_H
+
+#include "IECoreScene/PrimitiveVariable.h"
+
+#include "IECore/DataAlgo.h"
+#include "IECore/Exception.h"
+#include "IECore/GeometricTypedData.h"
+#include "IECore/VectorTypedData.h"
+
+#include "boost/format.hpp"
+
+#include "tbb/blocked_range.h"
+#include "tbb/parallel_for.h"
+#include "tbb/parallel_scan.h"
+
+#include <algorithm>
+#include <type_traits>
+#include <vector>
+
+// Utilities shared by the parallel implementations of the
+// MeshAlgo, PointsAlgo and CurvesAlgo functions.
+
+namespace IECoreScenePreview
+{
+
+namespace Detail
+{
+
+// Body for `tbb::parallel_scan()`, computing the exclusive prefix
+// sum of `f( i )` into `sums[i]`.
+template<typename F>
+class PrefixSum
+{
+
+	public :
+
+		PrefixSum( const F &f, std::vector<int> &sums )
+			:	m_f( f ), m_sums( sums ), m_sum( 0 )
+		{
+		}
+
+		PrefixSum( PrefixSum &other, tbb::split )
+			:	m_f( other.m_f ), m_sums( other.m_sums ), m_sum( 0 )
+		{
+		}
+
+		template<typename Tag>
+		void operator()( const tbb::blocked_range<size_t> &range, Tag )
+		{
+			int sum = m_sum;
+			for( size_t i = range.begin(); i < range.end(); ++i )
+			{
+				if( Tag::is_final_scan() )
+				{
+					m_sums[i] = sum;
+				}
+				sum += m_f( i );
+			}
+			m_sum = sum;
+		}
+
+		void reverse_join( PrefixSum &left )
+		{
+			m_sum += left.m_sum;
+		}
+
+		void assign( PrefixSum &other )
+		{
+			m_sum = other.m_sum;
+		}
+
+		int sum() const
+		{
+			return m_sum;
+		}
+
+	private :
+
+		const F &m_f;
+		std::vector<int> &m_sums;
+		int m_sum;
+
+};
+
+// Fills `sums` with the exclusive prefix sum of `f( i )` for
+// `i` in the range `[0, size)`, returning the total.
+template<typename F>
+int prefixSum( size_t size, const F &f, std::vector<int> &sums )
+{
+	sums.resize( size );
+	PrefixSum<F> body( f, sums );
+	tbb::parallel_scan( tbb::blocked_range<size_t>( 0, size ), body );
+	return body.sum();
+}
+
+// Calls `f( range )` for subranges of `[0, size)`. This is done in
+// parallel except when writing to a `vector<bool>`, where neighbouring
+// elements share storage and can't be written concurrently.
+template<typename T, typename F>
+void forEachRange( size_t size, const F &f )
+{
+	const tbb::blocked_range<size_t> range( 0, size );
+	if( std::is_same<T, bool>::value )
+	{
+		f( range );
+	}
+	else
+	{
+		tbb::parallel_for( range, f );
+	}
+}
+
+template<typename T>
+void keepFlags( const std::vector<T> &deleteFlags, const std::vector<int> *indices, bool invert, std::vector<char> &keep, const std::string &context )
+{
+	if( ( indices ? indices->size() : deleteFlags.size() ) != keep.size() )
+	{
+		throw IECore::InvalidArgumentException( context + " : Primitive variable has wrong size" );
+	}
+
+	tbb::parallel_for(
+		tbb::blocked_range<size_t>( 0, keep.size() ),
+		[&]( const tbb::blocked_range<size_t> &range ) {
+			for( size_t i = range.begin(); i < range.end(); ++i )
+			{
+				const bool deleteFlag = static_cast<bool>( deleteFlags[indices ? (*indices)[i] : i] );
+				keep[i] = deleteFlag == invert;
+			}
+		}
+	);
+}
+
+// Fills `keep` with a flag for each element, taking the delete flags
+// from an [Int|Bool|Float]VectorData primitive variable. Returns false
+// if the primitive variable has any other type.
+inline bool keepFlags( const IECoreScene::PrimitiveVariable &deleteFlags, bool invert, std::vector<char> &keep, const std::string &context )
+{
+	const std::vector<int> *indices = deleteFlags.indices ? &deleteFlags.indices->readable() : nullptr;
+	if( auto intData = IECore::runTimeCast<const IECore::IntVectorData>( deleteFlags.data.get() ) )
+	{
+		keepFlags( intData->readable(), indices, invert, keep, context );
+	}
+	else if( auto boolData = IECore::runTimeCast<const IECore::BoolVectorData>( deleteFlags.data.get() ) )
+	{
+		keepFlags( boolData->readable(), indices, invert, keep, context );
+	}
+	else if( auto floatData = IECore::runTimeCast<const IECore::FloatVectorData>( deleteFlags.data.get() ) )
+	{
+		keepFlags( floatData->readable(), indices, invert, keep, context );
+	}
+	else
+	{
+		return false;
+	}
+	return true;
+}
+
+// Throws if a primitive variable doesn't have the expected size. We
+// check this up front so that invalid primitive variables can't
+// cause us to read out of bounds.
+template<typename T>
+void checkSize( const std::vector<T> &input, size_t expectedSize, const std::string &name )
+{
+	if( input.size() != expectedSize )
+	{
+		throw IECore::InvalidArgumentException( boost::str(
+			boost::format( "Primitive variable \"%1%\" has wrong size (%2%, but should be %3%)" ) % name % input.size() % expectedSize
+		) );
+	}
+}
+
+// Base class for functors passed to `dispatch()`. Creates new vector
+// data of the same type and interpretation as the input, and calls
+// `Derived::fill( input, output )` to fill it.
+template<typename Derived>
+struct VectorDataFunctor
+{
+
+	VectorDataFunctor( const std::string &name )
+		:	m_name( name )
+	{
+	}
+
+	template<typename T>
+	IECore::DataPtr operator()( const IECore::TypedData<std::vector<T>> *data ) const
+	{
+		typename IECore::TypedData<std::vector<T>>::Ptr result = new IECore::TypedData<std::vector<T>>;
+		static_cast<const Derived *>( this )->fill( data->readable(), result->writable() );
+		return result;
+	}
+
+	template<typename T>
+	IECore::DataPtr operator()( const IECore::GeometricTypedData<std::vector<T>> *data ) const
+	{
+		typename IECore::GeometricTypedData<std::vector<T>>::Ptr result = new IECore::GeometricTypedData<std::vector<T>>;
+		result->setInterpretation( data->getInterpretation() );
+		static_cast<const Derived *>( this )->fill( data->readable(), result->writable() );
+		return result;
+	}
+
+	IECore::DataPtr operator()( const IECore::Data *data ) const
+	{
+		throw IECore::InvalidArgumentException( boost::str(
+			boost::format( "Primitive variable \"%1%\" has unsupported type \"%2%\"" ) % m_name % data->typeName()
+		) );
+	}
+
+	protected :
+
+		const std::string &m_name;
+
+};
+
+// Describes the correspondence between the elements of an input
+// primitive variable and the elements of an output primitive variable,
+// where the elements are grouped into consecutive runs which are either
+// kept or deleted as a whole. For instance, the vertices of each curve
+// in a CurvesPrimitive.
+struct RunRemapping
+{
+
+	// Computes the remapping from a flag per run, calling `size( i )`
+	// to find the number of elements in run `i`.
+	template<typename F>
+	RunRemapping( const std::vector<char> &keep, const F &size )
+		:	keep( keep )
+	{
+		numInputElements = prefixSum( keep.size(), size, inputOffsets );
+		numOutputElements = prefixSum(
+			keep.size(), [&]( size_t i ) { return keep[i] ? size( i ) : 0; },
+			outputOffsets
+		);
+	}
+
+	// Indexed by run.
+	const std::vector<char> &keep;
+	std::vector<int> inputOffsets;
+	std::vector<int> outputOffsets;
+
+	int numInputElements;
+	int numOutputElements;
+
+	int runSize( size_t i ) const
+	{
+		return ( i + 1 < inputOffsets.size() ? inputOffsets[i+1] : numInputElements ) - inputOffsets[i];
+	}
+
+};
+
+// Filters the elements of primitive variables according to a RunRemapping.
+struct FilterRuns : public VectorDataFunctor<FilterRuns>
+{
+
+	FilterRuns( const RunRemapping &remapping, const std::string &name )
+		:	VectorDataFunctor<FilterRuns>( name ), m_remapping( remapping )
+	{
+	}
+
+	template<typename T>
+	void fill( const std::vector<T> &input, std::vector<T> &output ) const
+	{
+		const RunRemapping &r = m_remapping;
+		checkSize( input, r.numInputElements, m_name );
+		output.resize( r.numOutputElements );
+		forEachRange<T>(
+			r.keep.size(),
+			[&]( const tbb::blocked_range<size_t> &range ) {
+				for( size_t i = range.begin(); i < range.end(); ++i )
+				{
+					if( r.keep[i] )
+					{
+						const auto begin = input.begin() + r.inputOffsets[i];
+						std::copy( begin, begin + r.runSize( i ), output.begin() + r.outputOffsets[i] );
+					}
+				}
+			}
+		);
+	}
+
+	private :
+
+		const RunRemapping &m_remapping;
+
+};
+
+// Filters a primitive variable according to a RunRemapping. Indexed
+// variables are filtered by their indices, and share their data with
+// the input.
+inline IECoreScene::PrimitiveVariable filterRuns( const IECoreScene::PrimitiveVariable &primitiveVariable, const RunRemapping &remapping, const std::string &name )
+{
+	FilterRuns filter( remapping, name );
+	if( primitiveVariable.indices )
+	{
+		IECore::IntVectorDataPtr indices = IECore::runTimeCast<IECore::IntVectorData>( filter( primitiveVariable.indices.get() ) );
+		return IECoreScene::PrimitiveVariable( primitiveVariable.interpolation, primitiveVariable.data, indices );
+	}
+	else
+	{
+		return IECoreScene::PrimitiveVariable( primitiveVariable.interpolation, IECore::dispatch( primitiveVariable.data.get(), filter ) );
+	}
+}
+
+} // namespace Detail
+
+} // namespace IECoreScenePreview
+
+#endif // IECORESCENEPREVIEW_PRIMITIVEALGOUTILS_H
@@ -38,7 +38,13 @@
 
 #include "IECore/Exception.h"
 
+#include "tbb/blocked_range.h"
+#include "tbb/parallel_for.h"
+
+#include <atomic>
+
 using namespace std;
+using namespace Imath;
 using namespace IECoreScenePreview;
 
 //////////////////////////////////////////////////////////////////////////
@@ -65,6 +71,103 @@ CreatorMap &creators()
 
 } // namespace
 
+//////////////////////////////////////////////////////////////////////////
+// Instances
+//////////////////////////////////////////////////////////////////////////
+
+namespace
+{
+
+template<typename F>
+void parallelForEachInstance( size_t numInstances, F &&f )
+{
+	tbb::task_group_context taskGroupContext( tbb::task_group_context::isolated );
+	tbb::parallel_for(
+		tbb::blocked_range<size_t>( 0, numInstances ),
+		[&f] ( const tbb::blocked_range<size_t> &r ) {
+			for( size_t i = r.begin(); i != r.end(); ++i )
+			{
+				f( i );
+			}
+		},
+		taskGroupContext
+	);
+}
+
+const Renderer::AttributesInterface *instanceAttributes( const std::vector<const Renderer::AttributesInterface *> &attributes, size_t i )
+{
+	return attributes.size() == 1 ? attributes[0] : attributes[i];
+}
+
+// Handle returned by the default implementation of `Renderer::instances()`,
+// forwarding to a separate ObjectInterface per instance.
+class Instances : public Renderer::ObjectInterface
+{
+
+	public :
+
+		Instances( std::vector<Renderer::ObjectInterfacePtr> &objects, const std::vector<M44f> &instanceTransforms )
+			:	m_instanceTransforms( instanceTransforms )
+		{
+			m_objects.swap( objects );
+		}
+
+		void transform( const M44f &transform ) override
+		{
+			parallelForEachInstance(
+				m_objects.size(),
+				[this, &transform] ( size_t i ) {
+					if( m_objects[i] )
+					{
+						m_objects[i]->transform( transform * m_instanceTransforms[i] );
+					}
+				}
+			);
+		}
+
+		void transform( const std::vector<M44f> &samples, const std::vector<float> &times ) override
+		{
+			parallelForEachInstance(
+				m_objects.size(),
+				[this, &samples, &times] ( size_t i ) {
+					if( !m_objects[i] )
+					{
+						return;
+					}
+					std::vector<M44f> instanceSamples; instanceSamples.reserve( samples.size() );
+					for( const auto &s : samples )
+					{
+						instanceSamples.push_back( s * m_instanceTransforms[i] );
+					}
+					m_objects[i]->transform( instanceSamples, times );
+				}
+			);
+		}
+
+		bool attributes( const Renderer::AttributesInterface *attributes ) override
+		{
+			std::atomic_bool result( true );
+			parallelForEachInstance(
+				m_objects.size(),
+				[this, attributes, &result] ( size_t i ) {
+					if( m_objects[i] && !m_objects[i]->attributes( attributes ) )
+					{
+						result = false;
+					}
+				}
+			);
+			return result;
+		}
+
+	private :
+
+		std::vector<Renderer::ObjectInterfacePtr> m_objects;
+		const std::vector<M44f> m_instanceTransforms;
+
+};
+
+} // namespace
+
 //////////////////////////////////////////////////////////////////////////
 // Renderer
 //////////////////////////////////////////////////////////////////////////
@@ -79,6 +182,38 @@ Renderer::~Renderer()
 
 }
 
+Renderer::ObjectInterfacePtr Renderer::instances( const IECore::Object *object, const std::vector<std::string> &instanceNames, const std::vector<Imath::M44f> &instanceTransforms, const std::vector<const AttributesInterface *> &instanceAttributes )
+{
+	std::vector<ObjectInterfacePtr> objects( instanceNames.size() );
+	parallelForEachInstance(
+		instanceNames.size(),
+		[this, &objects, object, &instanceNames, &instanceTransforms, &instanceAttributes] ( size_t i ) {
+			objects[i] = this->object( instanceNames[i], object, ::instanceAttributes( instanceAttributes, i ) );
+			if( objects[i] )
+			{
+				objects[i]->transform( instanceTransforms[i] );
+			}
+		}
+	);
+	return new Instances( objects, instanceTransforms );
+}
+
+Renderer::ObjectInterfacePtr Renderer::instances( const std::vector<const IECore::Object *> &samples, const std::vector<float> &times, const std::vector<std::string> &instanceNames, const std::vector<Imath::M44f> &instanceTransforms, const std::vector<const AttributesInterface *> &instanceAttributes )
+{
+	std::vector<ObjectInterfacePtr> objects( instanceNames.size() );
+	parallelForEachInstance(
+		instanceNames.size(),
+		[this, &objects, &samples, &times, &instanceNames, &instanceTransforms, &instanceAttributes] ( size_t i ) {
+			objects[i] = this->object( instanceNames[i], samples, times, ::instanceAttributes( instanceAttributes, i ) );
+			if( objects[i] )
+			{
+				objects[i]->transform( instanceTransforms[i] );
+			}
+		}
+	);
+	return new Instances( objects, instanceTransforms );
+}
+
 IECore::DataPtr Renderer::command( const IECore::InternedString name, const IECore::CompoundDataMap &parameters )
 {
 	throw IECore::NotImplementedException( "Renderer::command" );
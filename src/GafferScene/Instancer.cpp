@@ -37,6 +37,11 @@
 
 #include "GafferScene/Instancer.h"
 
+#include "GafferScene/Capsule.h"
+#include "GafferScene/Private/IECoreScenePreview/Renderer.h"
+#include "GafferScene/RendererAlgo.h"
+#include "GafferScene/SceneAlgo.h"
+
 #include "Gaffer/Context.h"
 #include "Gaffer/StringPlug.h"
 
@@ -47,12 +52,16 @@
 #include "IECore/NullObject.h"
 #include "IECore/VectorTypedData.h"
 
+#include "boost/bind.hpp"
 #include "boost/lexical_cast.hpp"
 
 #include "tbb/blocked_range.h"
+#include "tbb/parallel_for.h"
 #include "tbb/parallel_reduce.h"
 
+#include <algorithm>
 #include <functional>
+#include <limits>
 #include <unordered_map>
 
 using namespace std;
@@ -68,6 +77,8 @@ using namespace GafferScene;
 // EngineData
 //////////////////////////////////////////////////////////////////////////
 
+static const size_t g_invalidPointIndex = std::numeric_limits<size_t>::max();
+
 // Custom Data derived class used to encapsulate the data and
 // logic needed to generate instances. We are deliberately omitting
 // a custom TypeId etc because this is just a private class.
@@ -90,7 +101,8 @@ class Instancer::EngineData : public Data
 				m_positions( nullptr ),
 				m_orientations( nullptr ),
 				m_scales( nullptr ),
-				m_uniformScales( nullptr )
+				m_uniformScales( nullptr ),
+				m_minId( 0 )
 		{
 			m_primitive = runTimeCast<const Primitive>( object );
 			if( !m_primitive )
@@ -151,13 +163,32 @@ class Instancer::EngineData : public Data
 				}
 			}
 
-			if( m_ids )
+			if( m_ids && numPoints() )
 			{
+				// If the ids are reasonably dense, we can map them to point indices
+				// using a vector indexed by id, which is much faster and smaller
+				// than a hash map.
+				const auto minMax = std::minmax_element( m_ids->begin(), m_ids->end() );
+				m_minId = *minMax.first;
+				const int64_t idRange = (int64_t)*minMax.second - (int64_t)m_minId + 1;
+				if( idRange <= (int64_t)numPoints() * 4 )
+				{
+					m_denseIdsToPointIndices.resize( idRange, g_invalidPointIndex );
+				}
+
 				for( size_t i = 0; i<numPoints(); ++i )
 				{
 					// Iterate in reverse order so that in case of duplicates, the first one will override
 					size_t reverseI = numPoints() - 1 - i;
-					m_idsToPointIndices[(*m_ids)[reverseI]] = reverseI;
+					const int id = (*m_ids)[reverseI];
+					if( m_denseIdsToPointIndices.size() )
+					{
+						m_denseIdsToPointIndices[(int64_t)id - m_minId] = reverseI;
+					}
+					else
+					{
+						m_idsToPointIndices[id] = reverseI;
+					}
 				}
 			}
 
@@ -176,13 +207,27 @@ class Instancer::EngineData : public Data
 
 		size_t pointIndex( const InternedString &name ) const
 		{
-			const size_t i = boost::lexical_cast<size_t>( name );
+			return pointIndexForId( boost::lexical_cast<size_t>( name ) );
+		}
+
+		size_t pointIndexForId( size_t id ) const
+		{
 			if( !m_ids )
 			{
-				return i;
+				return id;
 			}
 
-			IdsToPointIndices::const_iterator it = m_idsToPointIndices.find( i );
+			if( m_denseIdsToPointIndices.size() )
+			{
+				const int64_t i = (int64_t)(int)id - m_minId;
+				if( i < 0 || i >= (int64_t)m_denseIdsToPointIndices.size() || m_denseIdsToPointIndices[i] == g_invalidPointIndex )
+				{
+					throw IECore::Exception( "Invalid id" );
+				}
+				return m_denseIdsToPointIndices[i];
+			}
+
+			IdsToPointIndices::const_iterator it = m_idsToPointIndices.find( id );
 			if( it == m_idsToPointIndices.end() )
 			{
 				throw IECore::Exception( "Invalid id" );
@@ -328,6 +373,10 @@ class Instancer::EngineData : public Data
 		const std::vector<Imath::V3f> *m_scales;
 		const std::vector<float> *m_uniformScales;
 
+		// Used to map from id to point index when the ids are dense.
+		int m_minId;
+		std::vector<size_t> m_denseIdsToPointIndices;
+		// Used when the ids are sparse.
 		typedef std::unordered_map <int, size_t> IdsToPointIndices;
 		IdsToPointIndices m_idsToPointIndices;
 
@@ -336,6 +385,354 @@ class Instancer::EngineData : public Data
 
 };
 
+//////////////////////////////////////////////////////////////////////////
+// InstancerCapsule
+//////////////////////////////////////////////////////////////////////////
+
+// Capsule used to represent all the instances of a single prototype when
+// `encapsulateInstanceGroups` is on. Rather than generating a location per
+// instance, we traverse the prototype hierarchy once, and pass each object
+// to the renderer once per instance, varying only the transform and
+// attributes. Since the renderer receives the same object repeatedly, it is
+// free to instance it rather than make a copy.
+class Instancer::InstancerCapsule : public Capsule
+{
+
+	public :
+
+		InstancerCapsule()
+		{
+		}
+
+		InstancerCapsule(
+			const ScenePlug *scene,
+			const ScenePlug::ScenePath &root,
+			const Gaffer::Context &context,
+			const IECore::MurmurHash &hash,
+			const Imath::Box3f &bound
+		)
+			:	Capsule( scene, root, context, hash, bound )
+		{
+		}
+
+		IE_CORE_DECLAREEXTENSIONOBJECT( GafferScene::Instancer::InstancerCapsule, GafferScene::InstancerCapsuleTypeId, GafferScene::Capsule );
+
+		void render( IECoreScenePreview::Renderer *renderer ) const override;
+
+	private :
+
+		class InstancingRenderer;
+
+};
+
+// Renderer which forwards everything it receives to another renderer,
+// outputting each object once per instance via `Renderer::instances()`.
+class Instancer::InstancerCapsule::InstancingRenderer : public IECoreScenePreview::Renderer
+{
+
+	public :
+
+		InstancingRenderer(
+			IECoreScenePreview::Renderer *renderer,
+			ConstEngineDataPtr engine,
+			const vector<int> &ids,
+			const M44f &prototypeTransform,
+			ConstCompoundObjectPtr baseAttributes
+		)
+			:	m_renderer( renderer ),
+				m_engine( engine ),
+				m_baseAttributes( baseAttributes )
+		{
+			// The transforms and name prefixes are the same for
+			// every object, so we compute them just once.
+			m_pointIndices.reserve( ids.size() );
+			m_instanceTransforms.reserve( ids.size() );
+			m_namePrefixes.reserve( ids.size() );
+			for( int id : ids )
+			{
+				const size_t pointIndex = m_engine->pointIndexForId( id );
+				m_pointIndices.push_back( pointIndex );
+				m_instanceTransforms.push_back( prototypeTransform * m_engine->instanceTransform( pointIndex ) );
+				// Matches the names generated by `computeBranchChildNames()`,
+				// without the overhead of interning them.
+				m_namePrefixes.push_back( "/" + std::to_string( id ) );
+			}
+		}
+
+		IECore::InternedString name() const override
+		{
+			return m_renderer->name();
+		}
+
+		void option( const IECore::InternedString &name, const IECore::Object *value ) override
+		{
+			m_renderer->option( name, value );
+		}
+
+		void output( const IECore::InternedString &name, const IECoreScene::Output *output ) override
+		{
+			m_renderer->output( name, output );
+		}
+
+		AttributesInterfacePtr attributes( const IECore::CompoundObject *attributes ) override
+		{
+			AttributesInterfacePtr sharedAttributes;
+			if( !m_engine->numInstanceAttributes() )
+			{
+				// All instances get the same attributes, so there
+				// is no need to make them per-instance.
+				sharedAttributes = m_renderer->attributes( attributes );
+			}
+			return new InstanceAttributes( attributes, sharedAttributes );
+		}
+
+		ObjectInterfacePtr camera( const std::string &name, const IECoreScene::Camera *camera, const AttributesInterface *attributes ) override
+		{
+			// Not used by `RendererAlgo::outputObjects()`.
+			return nullptr;
+		}
+
+		ObjectInterfacePtr light( const std::string &name, const IECore::Object *object, const AttributesInterface *attributes ) override
+		{
+			// Not used by `RendererAlgo::outputObjects()`.
+			return nullptr;
+		}
+
+		ObjectInterfacePtr object( const std::string &name, const IECore::Object *object, const AttributesInterface *attributes ) override
+		{
+			const InstanceAttributes *instanceAttributes = static_cast<const InstanceAttributes *>( attributes );
+			vector<AttributesInterfacePtr> attributesStorage;
+			ObjectInterfacePtr instances = m_renderer->instances( object, instanceNames( name ), m_instanceTransforms, this->attributes( instanceAttributes, attributesStorage ) );
+			return instances ? new Instances( instances ) : nullptr;
+		}
+
+		ObjectInterfacePtr object( const std::string &name, const std::vector<const IECore::Object *> &samples, const std::vector<float> &times, const AttributesInterface *attributes ) override
+		{
+			const InstanceAttributes *instanceAttributes = static_cast<const InstanceAttributes *>( attributes );
+			vector<AttributesInterfacePtr> attributesStorage;
+			ObjectInterfacePtr instances = m_renderer->instances( samples, times, instanceNames( name ), m_instanceTransforms, this->attributes( instanceAttributes, attributesStorage ) );
+			return instances ? new Instances( instances ) : nullptr;
+		}
+
+		void render() override
+		{
+		}
+
+		void pause() override
+		{
+		}
+
+	private :
+
+		class InstanceAttributes : public AttributesInterface
+		{
+
+			public :
+
+				InstanceAttributes( ConstCompoundObjectPtr attributes, AttributesInterfacePtr sharedAttributes )
+					:	m_attributes( attributes ), m_sharedAttributes( sharedAttributes )
+				{
+				}
+
+				ConstCompoundObjectPtr m_attributes;
+				// Only set when there are no per-instance attributes.
+				AttributesInterfacePtr m_sharedAttributes;
+
+		};
+
+		class Instances : public ObjectInterface
+		{
+
+			public :
+
+				Instances( ObjectInterfacePtr instances )
+					:	m_instances( instances )
+				{
+				}
+
+				void transform( const Imath::M44f &transform ) override
+				{
+					m_instances->transform( transform );
+				}
+
+				void transform( const std::vector<Imath::M44f> &samples, const std::vector<float> &times ) override
+				{
+					m_instances->transform( samples, times );
+				}
+
+				bool attributes( const AttributesInterface *attributes ) override
+				{
+					const InstanceAttributes *instanceAttributes = static_cast<const InstanceAttributes *>( attributes );
+					if( !instanceAttributes->m_sharedAttributes )
+					{
+						// Per-instance attributes can't be assigned via a
+						// single handle, so the object must be replaced.
+						return false;
+					}
+					return m_instances->attributes( instanceAttributes->m_sharedAttributes.get() );
+				}
+
+			private :
+
+				ObjectInterfacePtr m_instances;
+
+		};
+
+		vector<std::string> instanceNames( const std::string &name ) const
+		{
+			vector<std::string> result;
+			result.reserve( m_namePrefixes.size() );
+			for( const auto &prefix : m_namePrefixes )
+			{
+				result.push_back( name != "/" ? prefix + name : prefix );
+			}
+			return result;
+		}
+
+		// Returns the attributes for each instance, using `storage`
+		// to keep them alive for as long as they are needed.
+		vector<const AttributesInterface *> attributes( const InstanceAttributes *attributes, vector<AttributesInterfacePtr> &storage ) const
+		{
+			if( attributes->m_sharedAttributes )
+			{
+				return { attributes->m_sharedAttributes.get() };
+			}
+
+			storage.resize( m_pointIndices.size() );
+			task_group_context taskGroupContext( task_group_context::isolated );
+			parallel_for(
+				blocked_range<size_t>( 0, m_pointIndices.size() ),
+				[this, attributes, &storage] ( const blocked_range<size_t> &r ) {
+					for( size_t i = r.begin(); i != r.end(); ++i )
+					{
+						storage[i] = this->attributes( attributes, i );
+					}
+				},
+				taskGroupContext
+			);
+
+			vector<const AttributesInterface *> result;
+			result.reserve( storage.size() );
+			for( const auto &a : storage )
+			{
+				result.push_back( a.get() );
+			}
+			return result;
+		}
+
+		AttributesInterfacePtr attributes( const InstanceAttributes *attributes, size_t i ) const
+		{
+			CompoundObjectPtr result = m_engine->instanceAttributes( m_pointIndices[i] );
+			CompoundObject::ObjectMap &writableResult = result->members();
+			for( const auto &attribute : attributes->m_attributes->members() )
+			{
+				// Per-instance attributes take precedence over the attributes
+				// inherited from above the instance, but not over attributes
+				// specified within the prototype hierarchy. We distinguish the
+				// two by checking if the attribute is the one we started with.
+				auto it = writableResult.find( attribute.first );
+				if( it == writableResult.end() )
+				{
+					writableResult.insert( attribute );
+				}
+				else if( attribute.second.get() != m_baseAttributes->member<Object>( attribute.first ) )
+				{
+					it->second = attribute.second;
+				}
+			}
+
+			return m_renderer->attributes( result.get() );
+		}
+
+		IECoreScenePreview::Renderer *m_renderer;
+		ConstEngineDataPtr m_engine;
+		ConstCompoundObjectPtr m_baseAttributes;
+		vector<size_t> m_pointIndices;
+		vector<M44f> m_instanceTransforms;
+		vector<std::string> m_namePrefixes;
+
+};
+
+IE_CORE_DEFINEOBJECTTYPEDESCRIPTION( Instancer::InstancerCapsule );
+
+bool Instancer::InstancerCapsule::isEqualTo( const IECore::Object *other ) const
+{
+	return Capsule::isEqualTo( other );
+}
+
+void Instancer::InstancerCapsule::hash( IECore::MurmurHash &h ) const
+{
+	Capsule::hash( h );
+}
+
+void Instancer::InstancerCapsule::copyFrom( const IECore::Object *other, IECore::Object::CopyContext *context )
+{
+	Capsule::copyFrom( other, context );
+}
+
+void Instancer::InstancerCapsule::save( IECore::Object::SaveContext *context ) const
+{
+	Capsule::save( context );
+}
+
+void Instancer::InstancerCapsule::load( IECore::Object::LoadContextPtr context )
+{
+	Capsule::load( context );
+}
+
+void Instancer::InstancerCapsule::memoryUsage( IECore::Object::MemoryAccumulator &accumulator ) const
+{
+	Capsule::memoryUsage( accumulator );
+}
+
+void Instancer::InstancerCapsule::render( IECoreScenePreview::Renderer *renderer ) const
+{
+	const ScenePlug *scene = this->scene(); // Throws if we have expired
+	const Instancer *instancer = static_cast<const Instancer *>( scene->node() );
+
+	const ScenePath &root = this->root();
+	const ScenePath parentPath( root.begin(), root.end() - 2 );
+	const ScenePath branchPath( root.end() - 2, root.end() );
+
+	Context::Scope scope( context() );
+
+	ConstEngineDataPtr engine = instancer->engine( parentPath, context() );
+	ConstCompoundDataPtr instanceChildNames = instancer->instanceChildNames( parentPath, context() );
+	ConstIntVectorDataPtr ids = instanceChildNames->member<IntVectorData>( branchPath.back() );
+
+	M44f prototypeTransform;
+	ConstCompoundObjectPtr prototypeAttributes;
+	{
+		InstanceScope instanceScope( context(), branchPath );
+		prototypeTransform = instancer->instancesPlug()->transformPlug()->getValue();
+		prototypeAttributes = instancer->instancesPlug()->attributesPlug()->getValue();
+	}
+
+	const ScenePath prototypeRoot( 1, branchPath.back() );
+	RendererAlgo::RenderSets renderSets( instancer->instancesPlug() );
+
+	// `outputObjects()` doesn't output the attributes or set memberships
+	// for the root of the prototype, so we pass them in via the globals
+	// instead.
+	ConstCompoundObjectPtr inputGlobals = scene->globalsPlug()->getValue();
+	CompoundObjectPtr globals = new CompoundObject;
+	globals->members() = inputGlobals->members();
+	for( const auto &attribute : prototypeAttributes->members() )
+	{
+		globals->members()["attribute:" + attribute.first.string()] = attribute.second;
+	}
+	if( ConstInternedStringVectorDataPtr sets = renderSets.setsAttribute( prototypeRoot ) )
+	{
+		globals->members()["attribute:sets"] = boost::const_pointer_cast<InternedStringVectorData>( sets );
+	}
+
+	IECoreScenePreview::RendererPtr instancingRenderer = new InstancingRenderer(
+		renderer, engine, ids->readable(), prototypeTransform, SceneAlgo::globalAttributes( globals.get() )
+	);
+
+	RendererAlgo::outputObjects( instancer->instancesPlug(), globals.get(), renderSets, instancingRenderer.get(), prototypeRoot );
+}
+
 //////////////////////////////////////////////////////////////////////////
 // Instancer
 //////////////////////////////////////////////////////////////////////////
@@ -347,7 +744,7 @@ size_t Instancer::g_firstPlugIndex = 0;
 static const IECore::InternedString idContextName( "instancer:id" );
 
 Instancer::Instancer( const std::string &name )
-	:	BranchCreator( name )
+	:	BranchCreator( name ), m_dirtyCount( 0 )
 {
 	storeIndexOfNextChild( g_firstPlugIndex );
 	addChild( new StringPlug( "name", Plug::In, "instances" ) );
@@ -358,8 +755,11 @@ Instancer::Instancer( const std::string &name )
 	addChild( new StringPlug( "orientation", Plug::In ) );
 	addChild( new StringPlug( "scale", Plug::In ) );
 	addChild( new StringPlug( "attributes", Plug::In ) );
+	addChild( new BoolPlug( "encapsulateInstanceGroups", Plug::In, false ) );
 	addChild( new ObjectPlug( "__engine", Plug::Out, NullObject::defaultNullObject() ) );
 	addChild( new AtomicCompoundDataPlug( "__instanceChildNames", Plug::Out, new CompoundData ) );
+
+	plugDirtiedSignal().connect( 0, boost::bind( &Instancer::plugDirtied, this, ::_1 ) );
 }
 
 Instancer::~Instancer()
@@ -446,24 +846,34 @@ const Gaffer::StringPlug *Instancer::attributesPlug() const
 	return getChild<StringPlug>( g_firstPlugIndex + 7 );
 }
 
+Gaffer::BoolPlug *Instancer::encapsulateInstanceGroupsPlug()
+{
+	return getChild<BoolPlug>( g_firstPlugIndex + 8 );
+}
+
+const Gaffer::BoolPlug *Instancer::encapsulateInstanceGroupsPlug() const
+{
+	return getChild<BoolPlug>( g_firstPlugIndex + 8 );
+}
+
 Gaffer::ObjectPlug *Instancer::enginePlug()
 {
-	return getChild<ObjectPlug>( g_firstPlugIndex + 8 );
+	return getChild<ObjectPlug>( g_firstPlugIndex + 9 );
 }
 
 const Gaffer::ObjectPlug *Instancer::enginePlug() const
 {
-	return getChild<ObjectPlug>( g_firstPlugIndex + 8 );
+	return getChild<ObjectPlug>( g_firstPlugIndex + 9 );
 }
 
 Gaffer::AtomicCompoundDataPlug *Instancer::instanceChildNamesPlug()
 {
-	return getChild<AtomicCompoundDataPlug>( g_firstPlugIndex + 9 );
+	return getChild<AtomicCompoundDataPlug>( g_firstPlugIndex + 10 );
 }
 
 const Gaffer::AtomicCompoundDataPlug *Instancer::instanceChildNamesPlug() const
 {
-	return getChild<AtomicCompoundDataPlug>( g_firstPlugIndex + 9 );
+	return getChild<AtomicCompoundDataPlug>( g_firstPlugIndex + 10 );
 }
 
 void Instancer::affects( const Plug *input, AffectedPlugsContainer &outputs ) const
@@ -494,7 +904,8 @@ void Instancer::affects( const Plug *input, AffectedPlugsContainer &outputs ) co
 	if(
 		input == namePlug() ||
 		input == instanceChildNamesPlug() ||
-		input == instancesPlug()->childNamesPlug()
+		input == instancesPlug()->childNamesPlug() ||
+		input == encapsulateInstanceGroupsPlug()
 	)
 	{
 		outputs.push_back( outPlug()->childNamesPlug() );
@@ -519,11 +930,24 @@ void Instancer::affects( const Plug *input, AffectedPlugsContainer &outputs ) co
 		outputs.push_back( outPlug()->transformPlug() );
 	}
 
-	if( input == instancesPlug()->objectPlug() )
+	if(
+		input->parent() == instancesPlug() ||
+		input == enginePlug() ||
+		input == instanceChildNamesPlug() ||
+		input == encapsulateInstanceGroupsPlug()
+	)
 	{
+		// The capsules created by `encapsulateInstanceGroups` depend
+		// on everything in the instances scene, as well as on the
+		// engine.
 		outputs.push_back( outPlug()->objectPlug() );
 	}
 
+	if( input == encapsulateInstanceGroupsPlug() )
+	{
+		outputs.push_back( outPlug()->setPlug() );
+	}
+
 	if(
 		input == instancesPlug()->attributesPlug() ||
 		input == enginePlug()
@@ -585,33 +1009,35 @@ void Instancer::compute( Gaffer::ValuePlug *output, const Gaffer::Context *conte
 		ConstEngineDataPtr engine = boost::static_pointer_cast<const EngineData>( enginePlug()->getValue() );
 		ConstInternedStringVectorDataPtr instanceNames = instancesPlug()->childNames( ScenePath() );
 
-		vector<vector<size_t>> indexedInstanceChildIds;
+		// We store the ids for each instance as integers rather than
+		// as names, as this is much more compact. The names are only
+		// created when they are needed, in `computeBranchChildNames()`.
+		vector<IntVectorDataPtr> indexedInstanceChildIds;
 
 		int numInstanceTypes = instanceNames->readable().size();
 		if( numInstanceTypes )
 		{
-			indexedInstanceChildIds.resize( numInstanceTypes );
+			indexedInstanceChildIds.reserve( numInstanceTypes );
+			for( int i = 0; i < numInstanceTypes; ++i )
+			{
+				indexedInstanceChildIds.push_back( new IntVectorData );
+			}
 			for( size_t i = 0, e = engine->numPoints(); i < e; ++i )
 			{
 				size_t instanceIndex = engine->instanceIndex( i ) % numInstanceTypes;
-				indexedInstanceChildIds[instanceIndex].push_back( engine->instanceId( i ) );
+				indexedInstanceChildIds[instanceIndex]->writable().push_back( engine->instanceId( i ) );
 			}
 		}
 
 		CompoundDataPtr result = new CompoundData;
 		for( int i = 0; i < numInstanceTypes; i++ )
 		{
-			// Sort and uniquify ids before converting to string			
-			std::sort( indexedInstanceChildIds[i].begin(), indexedInstanceChildIds[i].end() );
-			auto last = std::unique( indexedInstanceChildIds[i].begin(), indexedInstanceChildIds[i].end() );
-			indexedInstanceChildIds[i].erase( last, indexedInstanceChildIds[i].end() ); 
-
-			InternedStringVectorDataPtr instanceChildNames = new InternedStringVectorData;
-			for( size_t id : indexedInstanceChildIds[i] )
-			{
-				instanceChildNames->writable().push_back( InternedString( id ) );
-			}
-			result->writable()[instanceNames->readable()[i]] = instanceChildNames;
+			// Sort and uniquify ids. We compare as `size_t` because that
+			// is the type used to generate the names.
+			vector<int> &ids = indexedInstanceChildIds[i]->writable();
+			std::sort( ids.begin(), ids.end(), [] ( int a, int b ) { return (size_t)a < (size_t)b; } );
+			ids.erase( std::unique( ids.begin(), ids.end() ), ids.end() );
+			result->writable()[instanceNames->readable()[i]] = indexedInstanceChildIds[i];
 		}
 
 		static_cast<AtomicCompoundDataPlug *>( output )->setValue( result );
@@ -680,7 +1106,7 @@ Imath::Box3f Instancer::computeBranchBound( const ScenePath &parentPath, const S
 
 		ConstEngineDataPtr e = engine( parentPath, context );
 		ConstCompoundDataPtr ic = instanceChildNames( parentPath, context );
-		const vector<InternedString> &childNames = ic->member<InternedStringVectorData>( branchPath.back() )->readable();
+		const vector<int> &ids = ic->member<IntVectorData>( branchPath.back() )->readable();
 
 		M44f childTransform;
 		Box3f childBound;
@@ -690,17 +1116,17 @@ Imath::Box3f Instancer::computeBranchBound( const ScenePath &parentPath, const S
 			childBound = instancesPlug()->boundPlug()->getValue();
 		}
 
-		typedef vector<InternedString>::const_iterator Iterator;
+		typedef vector<int>::const_iterator Iterator;
 		typedef blocked_range<Iterator> Range;
 
 		task_group_context taskGroupContext( task_group_context::isolated );
 		return parallel_reduce(
-			Range( childNames.begin(), childNames.end() ),
+			Range( ids.begin(), ids.end() ),
 			Box3f(),
 			[ &e, &childBound, &childTransform ] ( const Range &r, Box3f u ) {
 				for( Iterator i = r.begin(); i != r.end(); ++i )
 				{
-					const size_t pointIndex = e->pointIndex( *i );
+					const size_t pointIndex = e->pointIndexForId( *i );
 					const M44f m = childTransform * e->instanceTransform( pointIndex );
 					const Box3f b = transform( childBound, m );
 					u.extendBy( b );
@@ -853,7 +1279,21 @@ IECore::ConstCompoundObjectPtr Instancer::computeBranchAttributes( const ScenePa
 
 void Instancer::hashBranchObject( const ScenePath &parentPath, const ScenePath &branchPath, const Gaffer::Context *context, IECore::MurmurHash &h ) const
 {
-	if( branchPath.size() <= 2 )
+	if( branchPath.size() == 2 && encapsulateInstanceGroupsPlug()->getValue() )
+	{
+		// "/instances/<instanceName>", encapsulated
+		BranchCreator::hashBranchObject( parentPath, branchPath, context, h );
+		// As in `Encapsulate::hashObject()`, we don't attempt to hash
+		// the entire prototype hierarchy. Instead we use our identity,
+		// the number of times we have been dirtied and the full context,
+		// along with the things we do have cheap access to.
+		h.append( reinterpret_cast<uint64_t>( this ) );
+		h.append( m_dirtyCount );
+		h.append( context->hash() );
+		engineHash( parentPath, context, h );
+		instanceChildNamesHash( parentPath, context, h );
+	}
+	else if( branchPath.size() <= 2 )
 	{
 		// "/" or "/instances" or "/instances/<instanceName>"
 		h = outPlug()->objectPlug()->defaultValue()->Object::hash();
@@ -868,7 +1308,18 @@ void Instancer::hashBranchObject( const ScenePath &parentPath, const ScenePath &
 
 IECore::ConstObjectPtr Instancer::computeBranchObject( const ScenePath &parentPath, const ScenePath &branchPath, const Gaffer::Context *context ) const
 {
-	if( branchPath.size() <= 2 )
+	if( branchPath.size() == 2 && encapsulateInstanceGroupsPlug()->getValue() )
+	{
+		// "/instances/<instanceName>", encapsulated
+		return new InstancerCapsule(
+			outPlug(),
+			context->get<ScenePath>( ScenePlug::scenePathContextName ),
+			*context,
+			outPlug()->objectPlug()->hash(),
+			outPlug()->boundPlug()->getValue()
+		);
+	}
+	else if( branchPath.size() <= 2 )
 	{
 		// "/" or "/instances" or "/instances/<instanceName>"
 		return outPlug()->objectPlug()->defaultValue();
@@ -897,6 +1348,11 @@ void Instancer::hashBranchChildNames( const ScenePath &parentPath, const ScenePa
 	else if( branchPath.size() == 2 )
 	{
 		// "/instances/<instanceName>"
+		if( encapsulateInstanceGroupsPlug()->getValue() )
+		{
+			h = outPlug()->childNamesPlug()->defaultValue()->Object::hash();
+			return;
+		}
 		BranchCreator::hashBranchChildNames( parentPath, branchPath, context, h );
 		instanceChildNamesHash( parentPath, context, h );
 		h.append( branchPath.back() );
@@ -931,8 +1387,26 @@ IECore::ConstInternedStringVectorDataPtr Instancer::computeBranchChildNames( con
 	else if( branchPath.size() == 2 )
 	{
 		// "/instances/<instanceName>"
+		if( encapsulateInstanceGroupsPlug()->getValue() )
+		{
+			return outPlug()->childNamesPlug()->defaultValue();
+		}
+
+		// The names are only generated here, on demand. They are cached
+		// by the compute cache in addition to the ids they are generated
+		// from, but bounds and sets never request them, and when the
+		// instances are not expanded they need never exist at all.
 		IECore::ConstCompoundDataPtr ic = instanceChildNames( parentPath, context );
-		return ic->member<InternedStringVectorData>( branchPath.back() );
+		const vector<int> &ids = ic->member<IntVectorData>( branchPath.back() )->readable();
+
+		InternedStringVectorDataPtr result = new InternedStringVectorData;
+		vector<InternedString> &childNames = result->writable();
+		childNames.reserve( ids.size() );
+		for( int id : ids )
+		{
+			childNames.push_back( InternedString( (size_t)id ) );
+		}
+		return result;
 	}
 	else
 	{
@@ -960,18 +1434,32 @@ void Instancer::hashBranchSet( const ScenePath &parentPath, const IECore::Intern
 	instanceChildNamesHash( parentPath, context, h );
 	instancesPlug()->setPlug()->hash( h );
 	namePlug()->hash( h );
+	encapsulateInstanceGroupsPlug()->hash( h );
 }
 
 IECore::ConstPathMatcherDataPtr Instancer::computeBranchSet( const ScenePath &parentPath, const IECore::InternedString &setName, const Gaffer::Context *context ) const
 {
+	if( encapsulateInstanceGroupsPlug()->getValue() )
+	{
+		// The instances only exist inside the capsules, so there
+		// are no locations to add to the set.
+		return outPlug()->setPlug()->defaultValue();
+	}
+
+	const std::string name = namePlug()->getValue();
+	if( name.empty() )
+	{
+		return outPlug()->setPlug()->defaultValue();
+	}
+
 	ConstInternedStringVectorDataPtr instanceNames = instancesPlug()->childNames( ScenePath() );
-	IECore::ConstCompoundDataPtr instanceChildNames = this->instanceChildNames( parentPath, context );
+	IECore::ConstCompoundDataPtr instanceChildIds = instanceChildNames( parentPath, context );
 	ConstPathMatcherDataPtr inputSet = instancesPlug()->setPlug()->getValue();
 
 	PathMatcherDataPtr outputSetData = new PathMatcherData;
 	PathMatcher &outputSet = outputSetData->writable();
 
-	vector<InternedString> branchPath( { namePlug()->getValue() } );
+	vector<InternedString> branchPath( { name } );
 	vector<InternedString> instancePath( 1 );
 
 	for( const auto &instanceName : instanceNames->readable() )
@@ -982,12 +1470,21 @@ IECore::ConstPathMatcherDataPtr Instancer::computeBranchSet( const ScenePath &pa
 
 		PathMatcher instanceSet = inputSet->readable().subTree( instancePath );
 
-		const vector<InternedString> &childNames = instanceChildNames->member<InternedStringVectorData>( instanceName )->readable();
+		if( instanceSet.isEmpty() )
+		{
+			continue;
+		}
+
+		// We work from the ids directly rather than pulling on
+		// `outPlug()->childNames()`, so that building a set neither
+		// needs the per-prototype name lists to be generated nor
+		// evaluates them with the set name in the context.
+		const vector<int> &ids = instanceChildIds->member<IntVectorData>( instanceName )->readable();
 
 		branchPath.push_back( InternedString() );
-		for( const auto &instanceChildName : childNames )
+		for( int id : ids )
 		{
-			branchPath.back() = instanceChildName;
+			branchPath.back() = InternedString( (size_t)id );
 			outputSet.addPaths( instanceSet, branchPath );
 		}
 	}
@@ -1019,6 +1516,14 @@ void Instancer::instanceChildNamesHash( const ScenePath &parentPath, const Gaffe
 	instanceChildNamesPlug()->hash( h );
 }
 
+void Instancer::plugDirtied( const Gaffer::Plug *plug )
+{
+	if( plug->parent() == outPlug() )
+	{
+		++m_dirtyCount;
+	}
+}
+
 Instancer::InstanceScope::InstanceScope( const Gaffer::Context *context, const ScenePath &branchPath )
 	:	EditableScope( context )
 {
@@ -36,6 +36,8 @@
 
 #include "GafferScene/MeshDistortion.h"
 
+#include "GafferScene/Private/IECoreScenePreview/MeshAlgo.h"
+
 #include "IECoreScene/MeshAlgo.h"
 #include "IECoreScene/MeshPrimitive.h"
 
@@ -58,6 +60,7 @@ MeshDistortion::MeshDistortion( const std::string &name )
 	addChild( new StringPlug( "uvSet", Plug::In, "uv" ) );
 	addChild( new StringPlug( "distortion", Plug::In, "distortion" ) );
 	addChild( new StringPlug( "uvDistortion", Plug::In, "uvDistortion" ) );
+	addChild( new BoolPlug( "parallel", Plug::In, true ) );
 
 	// Fast pass-throughs for things we don't modify
 	outPlug()->attributesPlug()->setInput( inPlug()->attributesPlug() );
@@ -119,6 +122,33 @@ const Gaffer::StringPlug *MeshDistortion::uvDistortionPlug() const
 	return getChild<StringPlug>( g_firstPlugIndex + 4 );
 }
 
+Gaffer::BoolPlug *MeshDistortion::parallelPlug()
+{
+	return getChild<BoolPlug>( g_firstPlugIndex + 5 );
+}
+
+const Gaffer::BoolPlug *MeshDistortion::parallelPlug() const
+{
+	return getChild<BoolPlug>( g_firstPlugIndex + 5 );
+}
+
+void MeshDistortion::affects( const Gaffer::Plug *input, AffectedPlugsContainer &outputs ) const
+{
+	SceneElementProcessor::affects( input, outputs );
+
+	if(
+		input == positionPlug() ||
+		input == referencePositionPlug() ||
+		input == uvSetPlug() ||
+		input == distortionPlug() ||
+		input == uvDistortionPlug() ||
+		input == parallelPlug()
+	)
+	{
+		outputs.push_back( outPlug()->objectPlug() );
+	}
+}
+
 bool MeshDistortion::processesObject() const
 {
 	return true;
@@ -131,6 +161,7 @@ void MeshDistortion::hashProcessedObject( const ScenePath &path, const Gaffer::C
 	uvSetPlug()->hash( h );
 	distortionPlug()->hash( h );
 	uvDistortionPlug()->hash( h );
+	parallelPlug()->hash( h );
 }
 
 IECore::ConstObjectPtr MeshDistortion::computeProcessedObject( const ScenePath &path, const Gaffer::Context *context, IECore::ConstObjectPtr inputObject ) const
@@ -156,12 +187,10 @@ IECore::ConstObjectPtr MeshDistortion::computeProcessedObject( const ScenePath &
 		return inputObject;
 	}
 
-	auto distortions = MeshAlgo::calculateDistortion(
-		mesh,
-		uvSet,
-		referencePosition,
-		position
-	);
+	auto distortions = parallelPlug()->getValue() ?
+		IECoreScenePreview::MeshAlgo::calculateDistortion( mesh, uvSet, referencePosition, position ) :
+		MeshAlgo::calculateDistortion( mesh, uvSet, referencePosition, position )
+	;
 
 	MeshPrimitivePtr result = mesh->copy();
 
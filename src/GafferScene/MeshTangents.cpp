@@ -36,6 +36,8 @@
 
 #include "GafferScene/MeshTangents.h"
 
+#include "GafferScene/Private/IECoreScenePreview/MeshAlgo.h"
+
 #include "IECoreScene/MeshAlgo.h"
 #include "IECoreScene/MeshPrimitive.h"
 
@@ -56,6 +58,7 @@ MeshTangents::MeshTangents( const std::string &name ) : SceneElementProcessor( n
 	addChild( new StringPlug( "uTangent", Plug::In, "uTangent" ) );
 	addChild( new StringPlug( "vTangent", Plug::In, "vTangent" ) );
 	addChild( new BoolPlug( "orthogonal", Plug::In, true ) );
+	addChild( new BoolPlug( "parallel", Plug::In, true ) );
 
 	// Fast pass-throughs for things we don't modify
 	outPlug()->attributesPlug()->setInput( inPlug()->attributesPlug() );
@@ -117,11 +120,21 @@ const Gaffer::BoolPlug *MeshTangents::orthogonalPlug() const
 	return getChild<BoolPlug>( g_firstPlugIndex + 4 );
 }
 
+Gaffer::BoolPlug *MeshTangents::parallelPlug()
+{
+	return getChild<BoolPlug>( g_firstPlugIndex + 5 );
+}
+
+const Gaffer::BoolPlug *MeshTangents::parallelPlug() const
+{
+	return getChild<BoolPlug>( g_firstPlugIndex + 5 );
+}
+
 void MeshTangents::affects( const Gaffer::Plug *input, AffectedPlugsContainer &outputs ) const
 {
 	SceneElementProcessor::affects( input, outputs );
 
-	if( input == uvSetPlug() || input == positionPlug() || input == orthogonalPlug() || input == uTangentPlug() || input == vTangentPlug() )
+	if( input == uvSetPlug() || input == positionPlug() || input == orthogonalPlug() || input == uTangentPlug() || input == vTangentPlug() || input == parallelPlug() )
 	{
 		outputs.push_back( outPlug()->objectPlug() );
 	}
@@ -139,6 +152,7 @@ void MeshTangents::hashProcessedObject( const ScenePath &path, const Gaffer::Con
 	orthogonalPlug()->hash( h );
 	uTangentPlug()->hash( h );
 	vTangentPlug()->hash( h );
+	parallelPlug()->hash( h );
 }
 
 IECore::ConstObjectPtr MeshTangents::computeProcessedObject( const ScenePath &path, const Gaffer::Context *context, IECore::ConstObjectPtr inputObject ) const
@@ -156,7 +170,11 @@ IECore::ConstObjectPtr MeshTangents::computeProcessedObject( const ScenePath &pa
 	std::string uTangent = uTangentPlug()->getValue();
 	std::string vTangent = vTangentPlug()->getValue();
 
-	std::pair<PrimitiveVariable, PrimitiveVariable> tangentPrimvars = MeshAlgo::calculateTangents( mesh, uvSet, ortho, position);
+	std::pair<PrimitiveVariable, PrimitiveVariable> tangentPrimvars = parallelPlug()->getValue() ?
+		IECoreScenePreview::MeshAlgo::calculateTangents( mesh, uvSet, ortho, position ) :
+		MeshAlgo::calculateTangents( mesh, uvSet, ortho, position )
+	;
+
 	MeshPrimitivePtr meshWithTangents = runTimeCast<MeshPrimitive>( mesh->copy() );
 
 	meshWithTangents->variables[uTangent] = tangentPrimvars.first;
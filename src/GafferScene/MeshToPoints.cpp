@@ -145,7 +145,9 @@ IECore::ConstObjectPtr MeshToPoints::computeProcessedObject( const ScenePath &pa
 				break;
 		}
 
-		result->variables[it->first] = PrimitiveVariable( interpolation, it->second.data );
+		// Share the data and indices with the input mesh rather than
+		// copying them. This is OK because the result is const upon return.
+		result->variables[it->first] = PrimitiveVariable( interpolation, it->second.data, it->second.indices );
 	}
 
 	result->variables["type"] = PrimitiveVariable( PrimitiveVariable::Constant, new StringData( typePlug()->getValue() ) );
@@ -76,6 +76,11 @@ OpenGLAttributes::OpenGLAttributes( const std::string &name )
 	attributes->addOptionalMember( "gl:curvesPrimitive:glLineWidth", new IECore::FloatData( 1.0 ), "curvesPrimitiveGLLineWidth", Gaffer::Plug::Default, false );
 	attributes->addOptionalMember( "gl:curvesPrimitive:ignoreBasis", new IECore::BoolData( false ), "curvesPrimitiveIgnoreBasis", Gaffer::Plug::Default, false );
 
+	// level of detail parameters
+
+	attributes->addOptionalMember( "gl:lod:vertexThreshold", new IECore::IntData( 1000000 ), "lodVertexThreshold", Gaffer::Plug::Default, false );
+	attributes->addOptionalMember( "gl:lod:proxyPoints", new IECore::IntData( 100000 ), "lodProxyPoints", Gaffer::Plug::Default, false );
+
 }
 
 OpenGLAttributes::~OpenGLAttributes()
@@ -58,8 +58,10 @@
 
 #include "boost/algorithm/string/predicate.hpp"
 #include "boost/filesystem.hpp"
+#include "boost/optional.hpp"
 
 #include "tbb/blocked_range.h"
+#include "tbb/parallel_for.h"
 #include "tbb/parallel_reduce.h"
 #include "tbb/task.h"
 
@@ -85,6 +87,67 @@ void motionTimes( size_t segments, const V2f &shutter, std::set<float> &times )
 	}
 }
 
+// Hashes `plug` at each of the specified times. Hashing is much cheaper
+// than computing, so we use the hashes to avoid computing the same value
+// more than once.
+template<typename PlugType>
+void sampleHashes( const PlugType *plug, const std::set<float> &times, std::vector<IECore::MurmurHash> &hashes )
+{
+	Context::EditableScope timeContext( Context::current() );
+	hashes.reserve( times.size() );
+	for( auto t : times )
+	{
+		timeContext.setFrame( t );
+		hashes.push_back( plug->hash() );
+	}
+}
+
+// Computes `plug` at each of the specified times, using `hashes` from
+// `sampleHashes()`. Each unique value is computed only once, and the unique
+// values are computed in parallel. Values already present in `values` are
+// reused rather than recomputed.
+template<typename PlugType, typename ValueType>
+void sampleValues( const PlugType *plug, const std::set<float> &times, const std::vector<IECore::MurmurHash> &hashes, std::vector<ValueType> &values )
+{
+	const vector<float> timesVector( times.begin(), times.end() );
+	values.resize( timesVector.size() );
+
+	// Find the first sample with each hash. Samples are
+	// few, so a linear search is fine.
+	vector<size_t> sources( hashes.size() );
+	vector<size_t> uniqueSamples;
+	for( size_t i = 0; i < hashes.size(); ++i )
+	{
+		sources[i] = find( hashes.begin(), hashes.begin() + i, hashes[i] ) - hashes.begin();
+		if( sources[i] == i && !values[i] )
+		{
+			uniqueSamples.push_back( i );
+		}
+	}
+
+	const Context *context = Context::current();
+	tbb::task_group_context taskGroupContext( tbb::task_group_context::isolated );
+	tbb::parallel_for(
+		tbb::blocked_range<size_t>( 0, uniqueSamples.size() ),
+		[&] ( const tbb::blocked_range<size_t> &r ) {
+			Context::EditableScope timeContext( context );
+			for( size_t i = r.begin(); i != r.end(); ++i )
+			{
+				const size_t sample = uniqueSamples[i];
+				timeContext.setFrame( timesVector[sample] );
+				values[sample] = plug->getValue( &hashes[sample] );
+			}
+		},
+		// Prevents outer tasks silently cancelling our tasks
+		taskGroupContext
+	);
+
+	for( size_t i = 0; i < values.size(); ++i )
+	{
+		values[i] = values[sources[i]];
+	}
+}
+
 } // namespace
 
 //////////////////////////////////////////////////////////////////////////
@@ -128,19 +191,33 @@ void transformSamples( const ScenePlug *scene, size_t segments, const Imath::V2f
 
 	motionTimes( segments, shutter, sampleTimes );
 
-	Context::EditableScope timeContext( Context::current() );
+	vector<MurmurHash> hashes;
+	sampleHashes( scene->transformPlug(), sampleTimes, hashes );
+
+	if( std::count( hashes.begin(), hashes.end(), hashes.front() ) == (int)hashes.size() )
+	{
+		// Static location. Only one evaluation required.
+		Context::EditableScope timeContext( Context::current() );
+		timeContext.setFrame( *sampleTimes.begin() );
+		samples.push_back( scene->transformPlug()->getValue( &hashes.front() ) );
+		sampleTimes.clear();
+		return;
+	}
+
+	// Wrap the matrices so that `sampleValues()` can tell which
+	// ones have been computed.
+	vector<boost::optional<M44f>> values;
+	sampleValues( scene->transformPlug(), sampleTimes, hashes, values );
 
 	bool moving = false;
-	samples.reserve( sampleTimes.size() );
-	for( std::set<float>::const_iterator it = sampleTimes.begin(), eIt = sampleTimes.end(); it != eIt; ++it )
+	samples.reserve( values.size() );
+	for( const auto &m : values )
 	{
-		timeContext.setFrame( *it );
-		const M44f m = scene->transformPlug()->getValue();
-		if( !moving && !samples.empty() && m != samples.front() )
+		if( !moving && !samples.empty() && *m != samples.front() )
 		{
 			moving = true;
 		}
-		samples.push_back( m );
+		samples.push_back( *m );
 	}
 
 	if( !moving )
@@ -169,49 +246,59 @@ void objectSamples( const ScenePlug *scene, size_t segments, const Imath::V2f &s
 
 	motionTimes( segments, shutter, sampleTimes );
 
-	Context::EditableScope timeContext( Context::current() );
+	vector<MurmurHash> hashes;
+	sampleHashes( scene->objectPlug(), sampleTimes, hashes );
 
-	bool moving = false;
-	MurmurHash lastHash;
-	samples.reserve( sampleTimes.size() );
-	for( std::set<float>::const_iterator it = sampleTimes.begin(), eIt = sampleTimes.end(); it != eIt; ++it )
+	// Compute the first sample on its own, since it
+	// determines whether or not we can take any more.
+
+	vector<ConstObjectPtr> objects( hashes.size() );
+	{
+		Context::EditableScope timeContext( Context::current() );
+		timeContext.setFrame( *sampleTimes.begin() );
+		objects[0] = scene->objectPlug()->getValue( &hashes.front() );
+	}
+
+	if( !runTimeCast<const Primitive>( objects[0].get() ) )
+	{
+		// We can't motion blur these chappies, so just take the one
+		// sample. And if we don't even know what they are, we don't
+		// take any samples at all.
+		if( const VisibleRenderable *renderable = runTimeCast<const VisibleRenderable>( objects[0].get() ) )
+		{
+			samples.push_back( renderable );
+		}
+		sampleTimes.clear();
+		return;
+	}
+
+	if( std::count( hashes.begin(), hashes.end(), hashes.front() ) == (int)hashes.size() )
 	{
-		timeContext.setFrame( *it );
+		// Not moving.
+		samples.push_back( static_cast<const Primitive *>( objects[0].get() ) );
+		sampleTimes.clear();
+		return;
+	}
 
-		const MurmurHash objectHash = scene->objectPlug()->hash();
-		ConstObjectPtr object = scene->objectPlug()->getValue( &objectHash );
+	sampleValues( scene->objectPlug(), sampleTimes, hashes, objects );
 
+	samples.reserve( objects.size() );
+	for( const auto &object : objects )
+	{
 		if( const Primitive *primitive = runTimeCast<const Primitive>( object.get() ) )
 		{
-			// We can support multiple samples for these, so check to see
-			// if we actually have something moving.
-			if( !moving && !samples.empty() && objectHash != lastHash )
-			{
-				moving = true;
-			}
 			samples.push_back( primitive );
-			lastHash = objectHash;
-		}
-		else if( const VisibleRenderable *renderable = runTimeCast< const VisibleRenderable >( object.get() ) )
-		{
-			// We can't motion blur these chappies, so just take the one
-			// sample.
-			samples.push_back( renderable );
-			break;
 		}
 		else
 		{
-			// We don't even know what these chappies are, so
-			// don't take any samples at all.
-			break;
+			// The object type changed during the shutter,
+			// so we can't blur it. Fall back to a single
+			// sample.
+			samples.resize( 1 );
+			sampleTimes.clear();
+			return;
 		}
 	}
-
-	if( !moving )
-	{
-		samples.resize( std::min<size_t>( samples.size(), 1 ) );
-		sampleTimes.clear();
-	}
 }
 
 } // namespace RendererAlgo
@@ -659,6 +746,16 @@ struct LocationOutput
 					*it = samples.front() * *it;
 				}
 			}
+			else if( m_transformTimes.size() == sampleTimes.size() && equal( m_transformTimes.begin(), m_transformTimes.end(), sampleTimes.begin() ) )
+			{
+				// Sample times match the parent's, which is the common
+				// case. Multiply directly without looking up or
+				// interpolating the parent samples.
+				for( size_t i = 0; i < samples.size(); ++i )
+				{
+					m_transformSamples[i] = samples[i] * m_transformSamples[i];
+				}
+			}
 			else
 			{
 				vector<M44f> updatedTransformSamples;
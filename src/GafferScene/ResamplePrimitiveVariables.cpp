@@ -36,6 +36,8 @@
 
 #include "GafferScene/ResamplePrimitiveVariables.h"
 
+#include "GafferScene/Private/IECoreScenePreview/MeshAlgo.h"
+
 #include "IECoreScene/CurvesAlgo.h"
 #include "IECoreScene/CurvesPrimitive.h"
 #include "IECoreScene/MeshAlgo.h"
@@ -59,6 +61,7 @@ ResamplePrimitiveVariables::ResamplePrimitiveVariables( const std::string &name
 	storeIndexOfNextChild( g_firstPlugIndex );
 
 	addChild( new IntPlug( "interpolation", Plug::In, PrimitiveVariable::Vertex, PrimitiveVariable::Constant, PrimitiveVariable::FaceVarying ) );
+	addChild( new BoolPlug( "parallel", Plug::In, true ) );
 }
 
 ResamplePrimitiveVariables::~ResamplePrimitiveVariables()
@@ -75,11 +78,21 @@ const Gaffer::IntPlug *ResamplePrimitiveVariables::interpolationPlug() const
 	return getChild<IntPlug>( g_firstPlugIndex );
 }
 
+Gaffer::BoolPlug *ResamplePrimitiveVariables::parallelPlug()
+{
+	return getChild<BoolPlug>( g_firstPlugIndex + 1 );
+}
+
+const Gaffer::BoolPlug *ResamplePrimitiveVariables::parallelPlug() const
+{
+	return getChild<BoolPlug>( g_firstPlugIndex + 1 );
+}
+
 void ResamplePrimitiveVariables::affects( const Gaffer::Plug *input, AffectedPlugsContainer &outputs ) const
 {
 	PrimitiveVariableProcessor::affects( input, outputs );
 
-	if( input == interpolationPlug() )
+	if( input == interpolationPlug() || input == parallelPlug() )
 	{
 		outputs.push_back( outPlug()->objectPlug() );
 	}
@@ -90,6 +103,7 @@ void ResamplePrimitiveVariables::hashProcessedObject( const ScenePath &path, con
 	PrimitiveVariableProcessor::hashProcessedObject( path, context, h );
 
 	interpolationPlug()->hash( h );
+	parallelPlug()->hash( h );
 }
 
 void ResamplePrimitiveVariables::processPrimitiveVariable( const ScenePath &path, const Gaffer::Context *context, IECoreScene::ConstPrimitivePtr inputGeometry, IECoreScene::PrimitiveVariable &variable ) const
@@ -98,7 +112,14 @@ void ResamplePrimitiveVariables::processPrimitiveVariable( const ScenePath &path
 
 	if( const MeshPrimitive *meshPrimitive = IECore::runTimeCast<const MeshPrimitive>( inputGeometry.get() ) )
 	{
-		MeshAlgo::resamplePrimitiveVariable( meshPrimitive, variable, interpolation );
+		if( parallelPlug()->getValue() )
+		{
+			IECoreScenePreview::MeshAlgo::resamplePrimitiveVariable( meshPrimitive, variable, interpolation );
+		}
+		else
+		{
+			MeshAlgo::resamplePrimitiveVariable( meshPrimitive, variable, interpolation );
+		}
 	}
 	else if( const CurvesPrimitive *curvesPrimitive = IECore::runTimeCast<const CurvesPrimitive>( inputGeometry.get() ) )
 	{
@@ -83,7 +83,10 @@ struct SceneFilterPathFilter::Remove
 		if( m_baseContext != pathContext )
 		{
 			m_baseContext = pathContext;
-			m_context = new Gaffer::Context( *pathContext );
+			// Inherit any canceller from the current context, so that
+			// background listings of the path can be cancelled.
+			const IECore::Canceller *canceller = Gaffer::Context::current()->canceller();
+			m_context = canceller ? new Gaffer::Context( *pathContext, *canceller ) : new Gaffer::Context( *pathContext );
 		}
 
 		// Set context up so we can evaluate the scene filter, and return
@@ -50,7 +50,7 @@ IE_CORE_DEFINERUNTIMETYPED( SceneNode );
 size_t SceneNode::g_firstPlugIndex = 0;
 
 SceneNode::SceneNode( const std::string &name )
-	:	ComputeNode( name )
+	:	ComputeNode( name ), m_fullScene( nullptr ), m_fullPlugsIndex( 0 )
 {
 	storeIndexOfNextChild( g_firstPlugIndex );
 	addChild( new ScenePlug( "out", Gaffer::Plug::Out ) );
@@ -81,6 +81,24 @@ const BoolPlug *SceneNode::enabledPlug() const
 	return getChild<BoolPlug>( g_firstPlugIndex + 1 );
 }
 
+void SceneNode::cacheFullTransformAndAttributes( const ScenePlug *scene )
+{
+	m_fullScene = scene;
+	m_fullPlugsIndex = children().size();
+	addChild( new M44fPlug( "__fullTransform", Gaffer::Plug::Out ) );
+	addChild( new CompoundObjectPlug( "__fullAttributes", Gaffer::Plug::Out, new CompoundObject ) );
+}
+
+const Gaffer::M44fPlug *SceneNode::fullTransformPlug() const
+{
+	return m_fullScene ? getChild<M44fPlug>( m_fullPlugsIndex ) : nullptr;
+}
+
+const Gaffer::CompoundObjectPlug *SceneNode::fullAttributesPlug() const
+{
+	return m_fullScene ? getChild<CompoundObjectPlug>( m_fullPlugsIndex + 1 ) : nullptr;
+}
+
 void SceneNode::affects( const Gaffer::Plug *input, AffectedPlugsContainer &outputs ) const
 {
 	ComputeNode::affects( input, outputs );
@@ -103,6 +121,17 @@ void SceneNode::affects( const Gaffer::Plug *input, AffectedPlugsContainer &outp
 
 void SceneNode::hash( const ValuePlug *output, const Context *context, IECore::MurmurHash &h ) const
 {
+	if( output == fullTransformPlug() )
+	{
+		hashFullTransform( context->get<ScenePath>( ScenePlug::scenePathContextName ), h );
+		return;
+	}
+	else if( output == fullAttributesPlug() )
+	{
+		hashFullAttributes( context->get<ScenePath>( ScenePlug::scenePathContextName ), h );
+		return;
+	}
+
 	const ScenePlug *scenePlug = output->parent<ScenePlug>();
 	if( scenePlug && enabledPlug()->getValue() )
 	{
@@ -226,6 +255,21 @@ void SceneNode::hashSet( const IECore::InternedString &setName, const Gaffer::Co
 
 void SceneNode::compute( ValuePlug *output, const Context *context ) const
 {
+	if( output == fullTransformPlug() )
+	{
+		static_cast<M44fPlug *>( output )->setValue(
+			computeFullTransform( context->get<ScenePath>( ScenePlug::scenePathContextName ) )
+		);
+		return;
+	}
+	else if( output == fullAttributesPlug() )
+	{
+		static_cast<CompoundObjectPlug *>( output )->setValue(
+			computeFullAttributes( context->get<ScenePath>( ScenePlug::scenePathContextName ) )
+		);
+		return;
+	}
+
 	ScenePlug *scenePlug = output->parent<ScenePlug>();
 	if( scenePlug )
 	{
@@ -309,6 +353,113 @@ void SceneNode::compute( ValuePlug *output, const Context *context ) const
 	}
 }
 
+// The full transform and attributes are computed purely from the values of
+// `m_fullScene`, so we assign directly to the hash rather than calling
+// `ComputeNode::hash()`. This means that all nodes caching the same scene
+// share the cached results for it. Note that we don't declare the dependency
+// of the internal plugs on `m_fullScene` via `affects()`, because it isn't
+// necessarily an input. This is harmless, as nothing observes the dirtiness
+// of the internal plugs, and all cached hashes are invalidated when any plug
+// is dirtied.
+//
+// As in `ScenePlug::fullTransform()` and `ScenePlug::fullAttributes()`, the
+// root location doesn't contribute to the results, so they are constant there.
+
+void SceneNode::hashFullTransform( const ScenePath &path, IECore::MurmurHash &h ) const
+{
+	if( path.empty() )
+	{
+		h = IECore::MurmurHash();
+		h.append( IECore::M44fData::staticTypeId() );
+		h.append( Imath::M44f() );
+		return;
+	}
+
+	h = m_fullScene->transformPlug()->hash();
+	if( path.size() > 1 )
+	{
+		ScenePath parentPath( path );
+		parentPath.pop_back();
+		ScenePlug::PathScope scope( Context::current(), parentPath );
+		fullTransformPlug()->hash( h );
+	}
+}
+
+Imath::M44f SceneNode::computeFullTransform( const ScenePath &path ) const
+{
+	if( path.empty() )
+	{
+		return M44f();
+	}
+
+	M44f result = m_fullScene->transformPlug()->getValue();
+	if( path.size() > 1 )
+	{
+		ScenePath parentPath( path );
+		parentPath.pop_back();
+		ScenePlug::PathScope scope( Context::current(), parentPath );
+		result = result * fullTransformPlug()->getValue();
+	}
+	return result;
+}
+
+void SceneNode::hashFullAttributes( const ScenePath &path, IECore::MurmurHash &h ) const
+{
+	if( path.empty() )
+	{
+		h = IECore::MurmurHash();
+		fullAttributesPlug()->defaultValue()->hash( h );
+		return;
+	}
+
+	h = m_fullScene->attributesPlug()->hash();
+	if( path.size() > 1 )
+	{
+		ScenePath parentPath( path );
+		parentPath.pop_back();
+		ScenePlug::PathScope scope( Context::current(), parentPath );
+		fullAttributesPlug()->hash( h );
+	}
+}
+
+IECore::ConstCompoundObjectPtr SceneNode::computeFullAttributes( const ScenePath &path ) const
+{
+	if( path.empty() )
+	{
+		return fullAttributesPlug()->defaultValue();
+	}
+
+	ConstCompoundObjectPtr attributes = m_fullScene->attributesPlug()->getValue();
+	if( path.size() == 1 )
+	{
+		return attributes;
+	}
+
+	ScenePath parentPath( path );
+	parentPath.pop_back();
+	ScenePlug::PathScope scope( Context::current(), parentPath );
+	ConstCompoundObjectPtr parentAttributes = fullAttributesPlug()->getValue();
+
+	if( parentAttributes->members().empty() )
+	{
+		return attributes;
+	}
+	else if( attributes->members().empty() )
+	{
+		return parentAttributes;
+	}
+
+	// Attributes at this location take precedence over
+	// those inherited from the parent.
+	CompoundObjectPtr result = new CompoundObject;
+	result->members() = parentAttributes->members();
+	for( const auto &attribute : attributes->members() )
+	{
+		result->members()[attribute.first] = attribute.second;
+	}
+	return result;
+}
+
 Imath::Box3f SceneNode::computeBound( const ScenePath &path, const Gaffer::Context *context, const ScenePlug *parent ) const
 {
 	throw IECore::NotImplementedException( string( typeName() ) + "::computeBound" );
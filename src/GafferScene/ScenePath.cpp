@@ -167,9 +167,30 @@ PathPtr ScenePath::copy() const
 	return new ScenePath( m_scene, m_context, names(), root(), const_cast<PathFilter *>( getFilter() ) );
 }
 
+PathPtr ScenePath::copyForBackgroundUse() const
+{
+	return new ScenePath( m_scene, new Context( *m_context ), names(), root(), const_cast<PathFilter *>( getFilter() ) );
+}
+
+const Gaffer::Plug *ScenePath::cancellationSubject() const
+{
+	return m_scene.get();
+}
+
 void ScenePath::doChildren( std::vector<PathPtr> &children ) const
 {
-	Context::Scope scopedContext( m_context.get() );
+	// When we're listed by a BackgroundTask, the current context carries
+	// its canceller. We must pass that on to the `childNames()` compute so
+	// that the task can be cancelled promptly. Copying the context is safe
+	// because paths used on background threads are made by
+	// `copyForBackgroundUse()`, and therefore own their context.
+	ConstContextPtr context = m_context;
+	if( const IECore::Canceller *canceller = Context::current()->canceller() )
+	{
+		context = new Context( *m_context, *canceller );
+	}
+
+	Context::Scope scopedContext( context.get() );
 	ConstInternedStringVectorDataPtr childNamesData = m_scene->childNames( names() );
 	const std::vector<InternedString> &childNames = childNamesData->readable();
 	ScenePlug::ScenePath childPath( names() );
@@ -38,6 +38,7 @@
 #include "GafferScene/ScenePlug.h"
 
 #include "GafferScene/Filter.h"
+#include "GafferScene/SceneNode.h"
 
 #include "Gaffer/Context.h"
 #include "Gaffer/ContextAlgo.h"
@@ -311,6 +312,14 @@ Imath::M44f ScenePlug::transform( const ScenePath &scenePath ) const
 
 Imath::M44f ScenePlug::fullTransform( const ScenePath &scenePath ) const
 {
+	// Use the cumulative plugs on our node if it has them.
+	const SceneNode *node = IECore::runTimeCast<const SceneNode>( this->node() );
+	if( node && node->m_fullScene == this )
+	{
+		PathScope scope( Context::current(), scenePath );
+		return node->fullTransformPlug()->getValue();
+	}
+
 	PathScope pathScope( Context::current() );
 
 	Imath::M44f result;
@@ -333,6 +342,18 @@ IECore::ConstCompoundObjectPtr ScenePlug::attributes( const ScenePath &scenePath
 
 IECore::CompoundObjectPtr ScenePlug::fullAttributes( const ScenePath &scenePath ) const
 {
+	// Use the cumulative plugs on our node if it has them.
+	const SceneNode *node = IECore::runTimeCast<const SceneNode>( this->node() );
+	if( node && node->m_fullScene == this )
+	{
+		PathScope scope( Context::current(), scenePath );
+		IECore::ConstCompoundObjectPtr attributes = node->fullAttributesPlug()->getValue();
+		// Shallow copy, since we return a non-const result.
+		IECore::CompoundObjectPtr result = new IECore::CompoundObject;
+		result->members() = attributes->members();
+		return result;
+	}
+
 	PathScope pathScope( Context::current() );
 
 	IECore::CompoundObjectPtr result = new IECore::CompoundObject;
@@ -400,6 +421,14 @@ IECore::MurmurHash ScenePlug::transformHash( const ScenePath &scenePath ) const
 
 IECore::MurmurHash ScenePlug::fullTransformHash( const ScenePath &scenePath ) const
 {
+	// Use the cumulative plugs on our node if it has them.
+	const SceneNode *node = IECore::runTimeCast<const SceneNode>( this->node() );
+	if( node && node->m_fullScene == this )
+	{
+		PathScope scope( Context::current(), scenePath );
+		return node->fullTransformPlug()->hash();
+	}
+
 	PathScope pathScope( Context::current() );
 
 	IECore::MurmurHash result;
@@ -422,6 +451,14 @@ IECore::MurmurHash ScenePlug::attributesHash( const ScenePath &scenePath ) const
 
 IECore::MurmurHash ScenePlug::fullAttributesHash( const ScenePath &scenePath ) const
 {
+	// Use the cumulative plugs on our node if it has them.
+	const SceneNode *node = IECore::runTimeCast<const SceneNode>( this->node() );
+	if( node && node->m_fullScene == this )
+	{
+		PathScope scope( Context::current(), scenePath );
+		return node->fullAttributesPlug()->hash();
+	}
+
 	PathScope pathScope( Context::current() );
 
 	IECore::MurmurHash result;
@@ -34,6 +34,10 @@
 //
 //////////////////////////////////////////////////////////////////////////
 
+// `tbb::this_task_arena::isolate()` is a preview feature in older versions
+// of TBB. This must be defined before any TBB header is included.
+#define TBB_PREVIEW_TASK_ISOLATION 1
+
 #include "GafferScene/SceneReader.h"
 
 #include "Gaffer/Context.h"
@@ -44,9 +48,20 @@
 #include "IECoreScene/SharedSceneInterfaces.h"
 
 #include "IECore/InternedString.h"
+#include "IECore/LRUCache.h"
 #include "IECore/StringAlgo.h"
 
 #include "boost/bind.hpp"
+#include "boost/functional/hash.hpp"
+
+#include "tbb/concurrent_unordered_map.h"
+#include "tbb/parallel_for.h"
+#include "tbb/task_arena.h"
+
+#include <algorithm>
+#include <array>
+#include <atomic>
+#include <mutex>
 
 using namespace std;
 using namespace Imath;
@@ -59,6 +74,336 @@ typedef boost::tokenizer<boost::char_separator<char> > Tokenizer;
 
 IE_CORE_DEFINERUNTIMETYPED( SceneReader );
 
+//////////////////////////////////////////////////////////////////////////
+// Scene cache
+//////////////////////////////////////////////////////////////////////////
+
+namespace
+{
+
+MurmurHash pathHash( const SceneInterface::Path &path )
+{
+	MurmurHash h;
+	h.append( (uint64_t)path.size() );
+	for( SceneInterface::Path::const_iterator it = path.begin(), eIt = path.end(); it != eIt; ++it )
+	{
+		h.append( *it );
+	}
+	return h;
+}
+
+std::atomic<size_t> g_sceneCacheLookups( 0 );
+std::atomic<size_t> g_sceneCacheMisses( 0 );
+
+// Key used to look up the SceneInterface for a location within a file.
+// The cache is keyed by the hash of the path, but the getter needs the
+// path itself.
+struct LocationCacheGetterKey
+{
+
+	LocationCacheGetterKey()
+		:	path( nullptr )
+	{
+	}
+
+	LocationCacheGetterKey( const SceneInterface::Path &path )
+		:	path( &path ), hash( pathHash( path ) )
+	{
+	}
+
+	operator const IECore::MurmurHash & () const
+	{
+		return hash;
+	}
+
+	const SceneInterface::Path *path;
+	MurmurHash hash;
+
+};
+
+// The SceneInterfaces for the locations accessed within a single
+// file. Child SceneInterfaces keep their file open, so we hold them
+// per file and evict them along with the root, rather than letting
+// them keep files open independently of the limit imposed by
+// SharedSceneInterfaces. Within each file, the least recently used
+// locations are evicted so that memory use is bounded.
+class FileScenes : public IECore::RefCounted
+{
+
+	public :
+
+		FileScenes( const std::string &fileName )
+			:	m_root( SharedSceneInterfaces::get( fileName ) ),
+				m_scenes( boost::bind( &FileScenes::childScene, this, ::_1, ::_2 ), 10000 )
+		{
+		}
+
+		ConstSceneInterfacePtr scene( const SceneInterface::Path &path )
+		{
+			g_sceneCacheLookups++;
+			if( path.empty() )
+			{
+				return m_root;
+			}
+
+			return m_scenes.get( LocationCacheGetterKey( path ) );
+		}
+
+	private :
+
+		ConstSceneInterfacePtr childScene( const LocationCacheGetterKey &key, size_t &cost )
+		{
+			// Find the child from its parent, so that we
+			// don't need to traverse the whole hierarchy.
+			g_sceneCacheMisses++;
+			const SceneInterface::Path &path = *key.path;
+			const SceneInterface::Path parentPath( path.begin(), path.end() - 1 );
+			cost = 1;
+			return scene( parentPath )->child( path.back() );
+		}
+
+		ConstSceneInterfacePtr m_root;
+
+		// Cost is measured in locations.
+		typedef LRUCache<MurmurHash, ConstSceneInterfacePtr, LRUCachePolicy::Parallel, LocationCacheGetterKey> Scenes;
+		Scenes m_scenes;
+
+};
+
+IE_CORE_DECLAREPTR( FileScenes )
+
+FileScenesPtr fileScenesGetter( const std::string &fileName, size_t &cost )
+{
+	cost = 1;
+	return new FileScenes( fileName );
+}
+
+typedef LRUCache<std::string, FileScenesPtr, LRUCachePolicy::Parallel> FileScenesCache;
+
+// Cost is measured in files, and limited in the same way as
+// SharedSceneInterfaces so that we never hold more files open.
+FileScenesCache &fileScenesCache()
+{
+	static FileScenesCache *g_cache = new FileScenesCache( fileScenesGetter, SharedSceneInterfaces::getMaxScenes() );
+	return *g_cache;
+}
+
+ConstSceneInterfacePtr cachedScene( const std::string &fileName, const SceneInterface::Path &path )
+{
+	return fileScenesCache().get( fileName )->scene( path );
+}
+
+} // namespace
+
+//////////////////////////////////////////////////////////////////////////
+// Preloading
+//////////////////////////////////////////////////////////////////////////
+
+namespace
+{
+
+std::atomic<size_t> g_preloadBuilds( 0 );
+std::atomic<size_t> g_preloadHits( 0 );
+
+// An in-memory index of the hierarchy, bounds and transforms
+// for an entire file at a particular time.
+class PreloadedScene : public IECore::RefCounted
+{
+
+	public :
+
+		struct Location
+		{
+			InternedStringVectorDataPtr childNames;
+			bool hasBound;
+			Box3f bound;
+			M44f transform;
+			SceneInterface::NameList attributeNames;
+		};
+
+		PreloadedScene( const SceneInterface *root, double time )
+			:	m_animated( false )
+		{
+			tbb::task_group_context taskGroupContext( tbb::task_group_context::isolated );
+			loadWalk( root, SceneInterface::Path(), time, taskGroupContext );
+		}
+
+		size_t size() const
+		{
+			return m_locations.size();
+		}
+
+		// Returns true if any bound or transform in the file
+		// is animated, in which case the index is only valid
+		// for the time it was loaded at.
+		bool animated() const
+		{
+			return m_animated;
+		}
+
+		// Returns null if the location doesn't exist.
+		const Location *location( const SceneInterface::Path &path ) const
+		{
+			Locations::const_iterator it = m_locations.find( pathHash( path ) );
+			if( it == m_locations.end() )
+			{
+				return nullptr;
+			}
+			g_preloadHits++;
+			return &it->second;
+		}
+
+	private :
+
+		void loadWalk( const SceneInterface *scene, const SceneInterface::Path &path, double time, tbb::task_group_context &taskGroupContext )
+		{
+			// References to elements of a concurrent_unordered_map
+			// are not invalidated by concurrent insertions, so we
+			// can fill in the location after inserting it.
+			Location &location = m_locations[pathHash( path )];
+
+			location.childNames = new InternedStringVectorData;
+			scene->childNames( location.childNames->writable() );
+
+			location.hasBound = scene->hasBound();
+			if( location.hasBound )
+			{
+				const Box3d b = scene->readBound( time );
+				if( !b.isEmpty() )
+				{
+					location.bound = Box3f( b.min, b.max );
+				}
+			}
+
+			const M44d t = scene->readTransformAsMatrix( time );
+			location.transform = M44f(
+				t[0][0], t[0][1], t[0][2], t[0][3],
+				t[1][0], t[1][1], t[1][2], t[1][3],
+				t[2][0], t[2][1], t[2][2], t[2][3],
+				t[3][0], t[3][1], t[3][2], t[3][3]
+			);
+
+			scene->attributeNames( location.attributeNames );
+
+			if( scene->numBoundSamples() > 1 || scene->numTransformSamples() > 1 )
+			{
+				m_animated = true;
+			}
+
+			const vector<InternedString> &childNames = location.childNames->readable();
+			tbb::parallel_for(
+				tbb::blocked_range<size_t>( 0, childNames.size() ),
+				[&]( const tbb::blocked_range<size_t> &range ) {
+					SceneInterface::Path childPath( path );
+					childPath.push_back( InternedString() );
+					for( size_t i = range.begin(); i != range.end(); ++i )
+					{
+						childPath.back() = childNames[i];
+						ConstSceneInterfacePtr child = scene->child( childNames[i] );
+						loadWalk( child.get(), childPath, time, taskGroupContext );
+					}
+				},
+				taskGroupContext
+			);
+		}
+
+		typedef tbb::concurrent_unordered_map<MurmurHash, Location, boost::hash<MurmurHash>> Locations;
+		Locations m_locations;
+		std::atomic_bool m_animated;
+
+};
+
+IE_CORE_DECLAREPTR( PreloadedScene )
+
+ConstPreloadedScenePtr nullPreloadedSceneGetter( const MurmurHash &key, size_t &cost )
+{
+	cost = 0;
+	return nullptr;
+}
+
+// As in ValuePlug, we don't compute preloaded scenes in the getter, because
+// the parallel loading might steal an outer task which reenters the cache
+// with the same key. Instead we compute them outside the cache and use
+// `set()` to store them. Cost is measured in locations.
+typedef LRUCache<MurmurHash, ConstPreloadedScenePtr, LRUCachePolicy::Parallel> PreloadedSceneCache;
+PreloadedSceneCache g_preloadedSceneCache( nullPreloadedSceneGetter, 10000000 );
+
+// Mutexes used to serialise the loading of each preloaded scene, so that
+// concurrent queries wait for a single load rather than each performing
+// their own. Several files may share a mutex, which is safe because the
+// loads are performed in isolation - see below.
+std::array<std::mutex, 32> g_preloadMutexes;
+
+// Returns the preloaded scene for the current file and time,
+// or null if preloading is off or there is no file.
+ConstPreloadedScenePtr preloadedScene( const SceneReader *reader, const Context *context )
+{
+	if( !reader->preloadPlug()->getValue() )
+	{
+		return nullptr;
+	}
+
+	const std::string fileName = reader->fileNamePlug()->getValue();
+	if( fileName.empty() )
+	{
+		return nullptr;
+	}
+
+	// Scenes without animation are valid at all times,
+	// so are stored without the time in their key.
+	MurmurHash staticKey;
+	staticKey.append( fileName );
+
+	MurmurHash key = staticKey;
+	key.append( context->getTime() );
+
+	ConstPreloadedScenePtr result = g_preloadedSceneCache.get( staticKey );
+	if( !result )
+	{
+		result = g_preloadedSceneCache.get( key );
+	}
+
+	if( result )
+	{
+		return result;
+	}
+
+	// Only one thread loads any given file, while the others wait.
+	std::lock_guard<std::mutex> lock( g_preloadMutexes[staticKey.h1() % g_preloadMutexes.size()] );
+
+	result = g_preloadedSceneCache.get( staticKey );
+	if( !result )
+	{
+		result = g_preloadedSceneCache.get( key );
+	}
+
+	if( !result )
+	{
+		ConstSceneInterfacePtr root = cachedScene( fileName, SceneInterface::Path() );
+		// While waiting for the parallel load, this thread may steal other
+		// tasks. If it were to steal an outer task which waits for another
+		// mutex, held by a thread which in turn had stolen a task waiting for
+		// ours, we would deadlock. Isolation ensures that we only steal tasks
+		// belonging to the load itself, which never take the mutexes.
+		tbb::this_task_arena::isolate(
+			[&result, &root, context] {
+				result = new PreloadedScene( root.get(), context->getTime() );
+			}
+		);
+		g_preloadBuilds++;
+		// We clamp the cost so that very large scenes are still
+		// cached, rather than being reloaded for every query.
+		g_preloadedSceneCache.set(
+			result->animated() ? key : staticKey, result,
+			std::min( result->size(), g_preloadedSceneCache.getMaxCost() )
+		);
+	}
+
+	return result;
+}
+
+} // namespace
+
 //////////////////////////////////////////////////////////////////////////
 // SceneReader implementation
 //////////////////////////////////////////////////////////////////////////
@@ -75,6 +420,7 @@ SceneReader::SceneReader( const std::string &name )
 	addChild( new IntPlug( "refreshCount" ) );
 	addChild( new StringPlug( "tags" ) );
 	addChild( new TransformPlug( "transform" ) );
+	addChild( new BoolPlug( "preload" ) );
 	plugSetSignal().connect( boost::bind( &SceneReader::plugSet, this, ::_1 ) );
 }
 
@@ -122,6 +468,16 @@ const Gaffer::TransformPlug *SceneReader::transformPlug() const
 	return getChild<TransformPlug>( g_firstPlugIndex + 3 );
 }
 
+Gaffer::BoolPlug *SceneReader::preloadPlug()
+{
+	return getChild<BoolPlug>( g_firstPlugIndex + 4 );
+}
+
+const Gaffer::BoolPlug *SceneReader::preloadPlug() const
+{
+	return getChild<BoolPlug>( g_firstPlugIndex + 4 );
+}
+
 void SceneReader::affects( const Gaffer::Plug *input, AffectedPlugsContainer &outputs ) const
 {
 	SceneNode::affects( input, outputs );
@@ -185,25 +541,33 @@ void SceneReader::hashBound( const ScenePath &path, const Gaffer::Context *conte
 
 Imath::Box3f SceneReader::computeBound( const ScenePath &path, const Gaffer::Context *context, const ScenePlug *parent ) const
 {
-	ConstSceneInterfacePtr s = scene( path );
-	if( !s )
+	Box3f result;
+	ConstPreloadedScenePtr preloaded = preloadedScene( this, context );
+	if( const PreloadedScene::Location *location = preloaded ? preloaded->location( path ) : nullptr )
 	{
-		return Box3f();
+		result = location->hasBound ? location->bound : unionOfTransformedChildBounds( path, parent );
 	}
-
-	Box3f result;
-	if( s->hasBound() )
+	else
 	{
-		const Box3d b = s->readBound( context->getTime() );
-		if( b.isEmpty() )
+		ConstSceneInterfacePtr s = scene( path );
+		if( !s )
 		{
 			return Box3f();
 		}
-		result = Box3f( b.min, b.max );
-	}
-	else
-	{
-		result = unionOfTransformedChildBounds( path, parent );
+
+		if( s->hasBound() )
+		{
+			const Box3d b = s->readBound( context->getTime() );
+			if( b.isEmpty() )
+			{
+				return Box3f();
+			}
+			result = Box3f( b.min, b.max );
+		}
+		else
+		{
+			result = unionOfTransformedChildBounds( path, parent );
+		}
 	}
 
 	if( path.size() == 0 && !result.isEmpty() )
@@ -235,19 +599,28 @@ void SceneReader::hashTransform( const ScenePath &path, const Gaffer::Context *c
 
 Imath::M44f SceneReader::computeTransform( const ScenePath &path, const Gaffer::Context *context, const ScenePlug *parent ) const
 {
-	ConstSceneInterfacePtr s = scene( path );
-	if( !s )
+	M44f result;
+	ConstPreloadedScenePtr preloaded = preloadedScene( this, context );
+	if( const PreloadedScene::Location *location = preloaded ? preloaded->location( path ) : nullptr )
 	{
-		return M44f();
+		result = location->transform;
 	}
+	else
+	{
+		ConstSceneInterfacePtr s = scene( path );
+		if( !s )
+		{
+			return M44f();
+		}
 
-	const M44d t = s->readTransformAsMatrix( context->getTime() );
-	M44f result = M44f(
-		t[0][0], t[0][1], t[0][2], t[0][3],
-		t[1][0], t[1][1], t[1][2], t[1][3],
-		t[2][0], t[2][1], t[2][2], t[2][3],
-		t[3][0], t[3][1], t[3][2], t[3][3]
-	);
+		const M44d t = s->readTransformAsMatrix( context->getTime() );
+		result = M44f(
+			t[0][0], t[0][1], t[0][2], t[0][3],
+			t[1][0], t[1][1], t[1][2], t[1][3],
+			t[2][0], t[2][1], t[2][2], t[2][3],
+			t[3][0], t[3][1], t[3][2], t[3][3]
+		);
+	}
 
 	if( path.size() == 1 )
 	{
@@ -281,7 +654,15 @@ IECore::ConstCompoundObjectPtr SceneReader::computeAttributes( const ScenePath &
 
 	// read attributes
 	SceneInterface::NameList nameList;
-	s->attributeNames( nameList );
+	ConstPreloadedScenePtr preloaded = preloadedScene( this, context );
+	if( const PreloadedScene::Location *location = preloaded ? preloaded->location( path ) : nullptr )
+	{
+		nameList = location->attributeNames;
+	}
+	else
+	{
+		s->attributeNames( nameList );
+	}
 
 	CompoundObjectPtr result = new CompoundObject;
 
@@ -354,6 +735,18 @@ void SceneReader::hashChildNames( const ScenePath &path, const Gaffer::Context *
 
 IECore::ConstInternedStringVectorDataPtr SceneReader::computeChildNames( const ScenePath &path, const Gaffer::Context *context, const ScenePlug *parent ) const
 {
+	std::string tagsString = tagsPlug()->getValue();
+	if( tagsString.empty() )
+	{
+		// Filtering by tags requires access to the children themselves,
+		// so we only use the preloaded child names when there are no tags.
+		ConstPreloadedScenePtr preloaded = preloadedScene( this, context );
+		if( const PreloadedScene::Location *location = preloaded ? preloaded->location( path ) : nullptr )
+		{
+			return location->childNames;
+		}
+	}
+
 	ConstSceneInterfacePtr s = scene( path );
 	if( !s )
 	{
@@ -368,7 +761,6 @@ IECore::ConstInternedStringVectorDataPtr SceneReader::computeChildNames( const S
 
 	// filter out any which don't have the right tags
 
-	std::string tagsString = tagsPlug()->getValue();
 	if( !tagsString.empty() )
 	{
 		Tokenizer tagsTokenizer( tagsString, boost::char_separator<char>( " " ) );
@@ -494,6 +886,8 @@ void SceneReader::plugSet( Gaffer::Plug *plug )
 	if( plug == refreshCountPlug() )
 	{
 		SharedSceneInterfaces::clear();
+		fileScenesCache().clear();
+		g_preloadedSceneCache.clear();
 		m_lastScene.clear();
 	}
 }
@@ -507,25 +901,37 @@ ConstSceneInterfacePtr SceneReader::scene( const ScenePath &path ) const
 	}
 
 	LastScene &lastScene = m_lastScene.local();
-	if( lastScene.fileName == fileName )
+	if( lastScene.fileName == fileName && lastScene.path == path )
 	{
-		if( lastScene.path == path )
-		{
-			return lastScene.pathScene;
-		}
-		else
-		{
-			lastScene.pathScene = lastScene.fileNameScene->scene( path );
-			lastScene.path = path;
-			return lastScene.pathScene;
-		}
+		return lastScene.pathScene;
 	}
 
-	lastScene.fileNameScene = SharedSceneInterfaces::get( fileName );
+	lastScene.pathScene = cachedScene( fileName, path );
 	lastScene.fileName = fileName;
-
-	lastScene.pathScene = lastScene.fileNameScene->scene( path );
 	lastScene.path = path;
 
 	return lastScene.pathScene;
 }
+
+size_t SceneReader::sceneCacheLookups()
+{
+	return g_sceneCacheLookups;
+}
+
+size_t SceneReader::sceneCacheHits()
+{
+	// Every miss is preceded by a lookup, so reading the misses
+	// first guarantees that we never report a negative number.
+	const size_t misses = g_sceneCacheMisses;
+	return g_sceneCacheLookups - misses;
+}
+
+size_t SceneReader::preloadBuilds()
+{
+	return g_preloadBuilds;
+}
+
+size_t SceneReader::preloadHits()
+{
+	return g_preloadHits;
+}
@@ -37,9 +37,21 @@
 
 #include "GafferScene/Seeds.h"
 
+#include "GafferScene/Private/IECoreScenePreview/MeshAlgo.h"
+
+#include "GafferImage/ImagePlug.h"
+#include "GafferImage/Sampler.h"
+
 #include "Gaffer/StringPlug.h"
 
-#include "IECoreScene/MeshAlgo.h"
+#include "IECoreScene/MeshPrimitive.h"
+
+#include "OpenEXR/ImathFun.h"
+
+#include "boost/format.hpp"
+
+#include "tbb/blocked_range.h"
+#include "tbb/parallel_for.h"
 
 using namespace std;
 using namespace Imath;
@@ -48,6 +60,73 @@ using namespace IECoreScene;
 using namespace Gaffer;
 using namespace GafferScene;
 
+//////////////////////////////////////////////////////////////////////////
+// Internal utilities
+//////////////////////////////////////////////////////////////////////////
+
+namespace
+{
+
+const std::string g_densityImagePrimitiveVariableName( "__seedsDensityImage" );
+
+// Samples the density image at the UVs of the mesh, returning a primitive
+// variable suitable for use as a density mask. Only the unique UV values
+// are sampled, with the UV indices being reused for the result. Tiles are
+// fetched on demand by the Samplers, so only the tiles that are actually
+// needed are computed.
+PrimitiveVariable sampleDensityImage( const MeshPrimitive *mesh, const GafferImage::ImagePlug *image, const std::string &channelName )
+{
+	auto it = mesh->variables.find( "uv" );
+	const V2fVectorData *uvData = it != mesh->variables.end() ? runTimeCast<const V2fVectorData>( it->second.data.get() ) : nullptr;
+	if( !uvData )
+	{
+		throw IECore::Exception( "Seeds : Mesh has no V2f \"uv\" primitive variable to sample the density image with" );
+	}
+	const vector<V2f> &uvs = uvData->readable();
+
+	ConstStringVectorDataPtr channelNamesData = image->channelNames();
+	const vector<string> &channelNames = channelNamesData->readable();
+	if( std::find( channelNames.begin(), channelNames.end(), channelName ) == channelNames.end() )
+	{
+		throw IECore::Exception( boost::str( boost::format( "Seeds : Density image has no channel named \"%1%\"" ) % channelName ) );
+	}
+
+	const Box2i displayWindow = image->format().getDisplayWindow();
+	const V2f displayMin( displayWindow.min );
+	const V2f displaySize( displayWindow.size() );
+	const V2f displayMax( displayWindow.max );
+
+	FloatVectorDataPtr densityData = new FloatVectorData;
+	vector<float> &density = densityData->writable();
+	density.resize( uvs.size() );
+
+	const Context *context = Context::current();
+	tbb::task_group_context taskGroupContext( tbb::task_group_context::isolated );
+	tbb::parallel_for(
+		tbb::blocked_range<size_t>( 0, uvs.size(), 10000 ),
+		[&]( const tbb::blocked_range<size_t> &range ) {
+			Context::Scope scopedContext( context );
+			GafferImage::Sampler sampler( image, channelName, displayWindow, GafferImage::Sampler::Clamp );
+			for( size_t i = range.begin(); i < range.end(); ++i )
+			{
+				V2f p = displayMin + uvs[i] * displaySize;
+				p.x = Imath::clamp( p.x, displayMin.x, displayMax.x );
+				p.y = Imath::clamp( p.y, displayMin.y, displayMax.y );
+				density[i] = sampler.sample( p.x, p.y );
+			}
+		},
+		taskGroupContext // Prevents outer tasks silently cancelling our tasks
+	);
+
+	return PrimitiveVariable( it->second.interpolation, densityData, it->second.indices );
+}
+
+} // namespace
+
+//////////////////////////////////////////////////////////////////////////
+// Seeds
+//////////////////////////////////////////////////////////////////////////
+
 IE_CORE_DEFINERUNTIMETYPED( Seeds );
 
 size_t Seeds::g_firstPlugIndex = 0;
@@ -60,6 +139,8 @@ Seeds::Seeds( const std::string &name )
 	addChild( new FloatPlug( "density", Plug::In, 1.0f, 0.0f ) );
 	addChild( new StringPlug( "densityPrimitiveVariable" ) );
 	addChild( new StringPlug( "pointType", Plug::In, "gl:point" ) );
+	addChild( new GafferImage::ImagePlug( "densityImage" ) );
+	addChild( new StringPlug( "densityImageChannel", Plug::In, "R" ) );
 }
 
 Seeds::~Seeds()
@@ -106,11 +187,34 @@ const Gaffer::StringPlug *Seeds::pointTypePlug() const
 	return getChild<StringPlug>( g_firstPlugIndex + 3 );
 }
 
+GafferImage::ImagePlug *Seeds::densityImagePlug()
+{
+	return getChild<GafferImage::ImagePlug>( g_firstPlugIndex + 4 );
+}
+
+const GafferImage::ImagePlug *Seeds::densityImagePlug() const
+{
+	return getChild<GafferImage::ImagePlug>( g_firstPlugIndex + 4 );
+}
+
+Gaffer::StringPlug *Seeds::densityImageChannelPlug()
+{
+	return getChild<StringPlug>( g_firstPlugIndex + 5 );
+}
+
+const Gaffer::StringPlug *Seeds::densityImageChannelPlug() const
+{
+	return getChild<StringPlug>( g_firstPlugIndex + 5 );
+}
+
 void Seeds::affects( const Plug *input, AffectedPlugsContainer &outputs ) const
 {
 	BranchCreator::affects( input, outputs );
 
-	if( input == densityPlug() || input == densityPrimitiveVariablePlug() || input == pointTypePlug() )
+	if(
+		input == densityPlug() || input == densityPrimitiveVariablePlug() || input == pointTypePlug() ||
+		input->parent<GafferImage::ImagePlug>() == densityImagePlug() || input == densityImageChannelPlug()
+	)
 	{
 		outputs.push_back( outPlug()->objectPlug() );
 	}
@@ -168,6 +272,16 @@ void Seeds::hashBranchObject( const ScenePath &parentPath, const ScenePath &bran
 		densityPlug()->hash( h );
 		densityPrimitiveVariablePlug()->hash( h );
 		pointTypePlug()->hash( h );
+		if( densityImagePlug()->getInput<GafferImage::ImagePlug>() )
+		{
+			densityImageChannelPlug()->hash( h );
+			// The image doesn't depend on the scene location,
+			// so we remove it from the context to avoid
+			// redundant hashing of the image for each mesh.
+			Context::EditableScope imageScope( context );
+			imageScope.remove( ScenePlug::scenePathContextName );
+			h.append( densityImagePlug()->imageHash() );
+		}
 		return;
 	}
 
@@ -185,12 +299,26 @@ IECore::ConstObjectPtr Seeds::computeBranchObject( const ScenePath &parentPath,
 			return outPlug()->objectPlug()->defaultValue();
 		}
 
-		PointsPrimitivePtr result = MeshAlgo::distributePoints(
+		std::string densityPrimitiveVariable = densityPrimitiveVariablePlug()->getValue();
+		if( densityImagePlug()->getInput<GafferImage::ImagePlug>() )
+		{
+			const std::string channelName = densityImageChannelPlug()->getValue();
+			Context::EditableScope imageScope( context );
+			imageScope.remove( ScenePlug::scenePathContextName );
+
+			MeshPrimitivePtr meshWithDensity = runTimeCast<MeshPrimitive>( mesh->copy() );
+			meshWithDensity->variables[g_densityImagePrimitiveVariableName] = sampleDensityImage( mesh.get(), densityImagePlug(), channelName );
+			mesh = meshWithDensity;
+			densityPrimitiveVariable = g_densityImagePrimitiveVariableName;
+		}
+
+		PointsPrimitivePtr result = IECoreScenePreview::MeshAlgo::distributePoints(
 			mesh.get(),
 			densityPlug()->getValue(),
 			V2f( 0 ),
-			densityPrimitiveVariablePlug()->getValue()
+			densityPrimitiveVariable
 		);
+		result->variables.erase( g_densityImagePrimitiveVariableName );
 		result->variables["type"] = PrimitiveVariable( PrimitiveVariable::Constant, new StringData( pointTypePlug()->getValue() ) );
 
 		return result;
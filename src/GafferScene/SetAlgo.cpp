@@ -40,6 +40,9 @@
 
 #include "GafferScene/SetAlgo.h"
 
+#include "Gaffer/Context.h"
+
+#include "IECore/LRUCache.h"
 #include "IECore/MessageHandler.h"
 
 #include "boost/algorithm/string/predicate.hpp"
@@ -50,6 +53,12 @@
 #include "boost/variant/apply_visitor.hpp"
 #include "boost/variant/recursive_variant.hpp"
 
+#include "tbb/parallel_for.h"
+
+#include <algorithm>
+#include <memory>
+#include <unordered_map>
+
 using namespace IECore;
 using namespace Gaffer;
 using namespace GafferScene;
@@ -217,14 +226,16 @@ struct AstEvaluator
 {
 	typedef PathMatcher result_type;
 
-	AstEvaluator( const ScenePlug *scene )
+	typedef std::unordered_map<std::string, ConstPathMatcherDataPtr> SetMap;
+
+	AstEvaluator( const SetMap &sets )
+		:	m_sets( sets )
 	{
-		m_scene = scene;
 	}
 
 	result_type operator()( const SetName &set ) const
 	{
-		return m_scene->set( set.name )->readable();
+		return m_sets.at( set.name )->readable();
 	}
 
 	result_type operator()( const ObjectName &object ) const
@@ -273,7 +284,48 @@ struct AstEvaluator
 		}
 	}
 
-	const ScenePlug *m_scene;
+	const SetMap &m_sets;
+
+};
+
+// Collecting the set names used by the AST
+// -----------------------------------------
+struct AstSetNameCollector
+{
+	typedef void result_type;
+
+	AstSetNameCollector( std::vector<std::string> &setNames ) : m_setNames( setNames )
+	{
+	}
+
+	void operator()( const ObjectName &n )
+	{
+	}
+
+	void operator()( const SetName &n )
+	{
+		if( std::find( m_setNames.begin(), m_setNames.end(), n.name ) == m_setNames.end() )
+		{
+			m_setNames.push_back( n.name );
+		}
+	}
+
+	void operator()( const ExpressionAst &ast )
+	{
+		boost::apply_visitor( *this, ast.expr );
+	}
+
+	void operator()( const BinaryOp &expr )
+	{
+		boost::apply_visitor( *this, expr.left.expr );
+		boost::apply_visitor( *this, expr.right.expr );
+	}
+
+	void operator()( const Nil &nil )
+	{
+	}
+
+	std::vector<std::string> &m_setNames;
 
 };
 
@@ -432,6 +484,27 @@ void expressionToAST( const std::string &setExpression, ExpressionAst &ast)
 	}
 }
 
+// Caching the AST
+// ---------------
+//
+// The same expressions are typically evaluated and hashed many
+// times over (once per location that references them), so we
+// cache the parsed AST rather than rerun the grammar every time.
+
+typedef std::shared_ptr<const ExpressionAst> ConstExpressionAstPtr;
+
+ConstExpressionAstPtr expressionAstGetter( const std::string &setExpression, size_t &cost )
+{
+	cost = 1;
+	std::shared_ptr<ExpressionAst> ast( new ExpressionAst );
+	expressionToAST( setExpression, *ast );
+	return ast;
+}
+
+typedef LRUCache<std::string, ConstExpressionAstPtr, LRUCachePolicy::Parallel> ExpressionAstCache;
+// Cost is measured in expressions.
+ExpressionAstCache g_expressionAstCache( expressionAstGetter, 10000 );
+
 } // namespace
 
 BOOST_FUSION_ADAPT_STRUCT(
@@ -452,20 +525,47 @@ namespace SetAlgo
 
 PathMatcher evaluateSetExpression( const std::string &setExpression, const ScenePlug *scene )
 {
-	ExpressionAst ast;
-	expressionToAST( setExpression, ast );
+	ConstExpressionAstPtr ast = g_expressionAstCache.get( setExpression );
+
+	std::vector<std::string> setNames;
+	AstSetNameCollector collector( setNames );
+	collector( *ast );
+
+	// Compute all the sets up front, so that sets referenced more
+	// than once are only fetched once, and so that independent sets
+	// can be computed in parallel.
+
+	std::vector<ConstPathMatcherDataPtr> sets( setNames.size() );
+	const Context *context = Context::current();
+	tbb::task_group_context taskGroupContext( tbb::task_group_context::isolated ); // Prevents outer tasks silently cancelling our tasks
+	tbb::parallel_for(
+		tbb::blocked_range<size_t>( 0, setNames.size() ),
+		[&]( const tbb::blocked_range<size_t> &range ) {
+			Context::Scope scopedContext( context );
+			for( size_t i = range.begin(); i != range.end(); ++i )
+			{
+				sets[i] = scene->set( setNames[i] );
+			}
+		},
+		taskGroupContext
+	);
+
+	AstEvaluator::SetMap setMap;
+	for( size_t i = 0; i < setNames.size(); ++i )
+	{
+		setMap[setNames[i]] = sets[i];
+	}
 
-	AstEvaluator eval( scene );
-	return eval( ast );
+	AstEvaluator eval( setMap );
+	return eval( *ast );
 }
 
 void setExpressionHash( const std::string &setExpression, const ScenePlug* scene, IECore::MurmurHash &h )
 {
-	ExpressionAst ast;
-	expressionToAST( setExpression, ast );
+	ConstExpressionAstPtr ast = g_expressionAstCache.get( setExpression );
 
 	AstHasher hasher = AstHasher( scene, h );
-	hasher(ast);
+	hasher( *ast );
 }
 
 IECore::MurmurHash setExpressionHash( const std::string &setExpression, const ScenePlug* scene)
@@ -47,6 +47,7 @@
 
 #include "IECoreScene/ShaderNetwork.h"
 
+#include "IECore/NullObject.h"
 #include "IECore/VectorTypedData.h"
 
 #include "boost/algorithm/string/predicate.hpp"
@@ -218,6 +219,33 @@ class Shader::NetworkBuilder
 			return m_network;
 		}
 
+		// Used to compute `Shader::outShaderPlug()`, which caches the parameter
+		// values for a single shader, without any of its connections. This
+		// allows the network to be rebuilt without revisiting the parameters
+		// of any shaders which haven't changed.
+		void shaderValuesHash( const Shader *shaderNode, IECore::MurmurHash &h )
+		{
+			shaderNode->namePlug()->hash( h );
+			shaderNode->typePlug()->hash( h );
+
+			shaderNode->nodeNamePlug()->hash( h );
+			shaderNode->nodeColorPlug()->hash( h );
+
+			hashParameterWalk( shaderNode->parametersPlug(), h, /* connections = */ false );
+		}
+
+		IECoreScene::ShaderPtr shaderValues( const Shader *shaderNode )
+		{
+			IECoreScene::ShaderPtr shader = new IECoreScene::Shader( shaderNode->namePlug()->getValue(), shaderNode->typePlug()->getValue() );
+
+			shader->blindData()->writable()["gaffer:nodeName"] = new IECore::StringData( shaderNode->nodeNamePlug()->getValue() );
+			shader->blindData()->writable()["gaffer:nodeColor"] = new IECore::Color3fData( shaderNode->nodeColorPlug()->getValue() );
+
+			addParameterWalk( shaderNode->parametersPlug(), IECore::InternedString(), shader.get(), nullptr );
+
+			return shader;
+		}
+
 	private :
 
 		// Returns the effective shader parameter that should be used taking into account
@@ -287,14 +315,8 @@ class Shader::NetworkBuilder
 				return handleAndHash.hash;
 			}
 
-			handleAndHash.hash.append( shaderNode->typeId() );
-			shaderNode->namePlug()->hash( handleAndHash.hash );
-			shaderNode->typePlug()->hash( handleAndHash.hash );
-
-			shaderNode->nodeNamePlug()->hash( handleAndHash.hash );
-			shaderNode->nodeColorPlug()->hash( handleAndHash.hash );
-
-			hashParameterWalk( shaderNode->parametersPlug(), handleAndHash.hash );
+			shaderNode->outShaderPlug()->hash( handleAndHash.hash );
+			hashParameterWalk( shaderNode->parametersPlug(), handleAndHash.hash, /* connections = */ true );
 
 			return handleAndHash.hash;
 		}
@@ -312,7 +334,15 @@ class Shader::NetworkBuilder
 				return handleAndHash.handle;
 			}
 
-			std::string type = shaderNode->typePlug()->getValue();
+			// The parameter values come from the compute cache, so we only
+			// need to visit the parameters again to find the connections.
+			// Copying is cheap, because the parameter data is shared until
+			// it is modified.
+			IECoreScene::ShaderPtr shader = boost::static_pointer_cast<const IECoreScene::Shader>(
+				shaderNode->outShaderPlug()->getValue()
+			)->copy();
+
+			std::string type = shader->getType();
 			if( shaderNode != m_output->node() && !boost::ends_with( type, "shader" ) )
 			{
 				// Some renderers (Arnold for one) allow surface shaders to be connected
@@ -328,18 +358,13 @@ class Shader::NetworkBuilder
 				{
 					type = "shader";
 				}
+				shader->setType( type );
 			}
 
-			IECoreScene::ShaderPtr shader = new IECoreScene::Shader( shaderNode->namePlug()->getValue(), type );
-
-			const std::string nodeName = shaderNode->nodeNamePlug()->getValue();
-			shader->blindData()->writable()["gaffer:nodeName"] = new IECore::StringData( nodeName );
-			shader->blindData()->writable()["gaffer:nodeColor"] = new IECore::Color3fData( shaderNode->nodeColorPlug()->getValue() );
-
 			vector<IECoreScene::ShaderNetwork::Connection> inputConnections;
-			addParameterWalk( shaderNode->parametersPlug(), IECore::InternedString(), shader.get(), inputConnections );
+			addParameterWalk( shaderNode->parametersPlug(), IECore::InternedString(), nullptr, &inputConnections );
 
-			handleAndHash.handle = m_network->addShader( nodeName, std::move( shader ) );
+			handleAndHash.handle = m_network->addShader( shaderNode->nodeNamePlug()->getValue(), std::move( shader ) );
 			for( const auto &c : inputConnections )
 			{
 				m_network->addConnection( { c.source, { handleAndHash.handle, c.destination.name } } );
@@ -348,14 +373,18 @@ class Shader::NetworkBuilder
 			return handleAndHash.handle;
 		}
 
-		void hashParameterWalk( const Gaffer::Plug *parameter, IECore::MurmurHash &h )
+		// The parameter walks either visit the parameter values or the connections,
+		// depending on the `connections` argument. The former are used to compute
+		// `outShaderPlug()` and the latter to build the network.
+
+		void hashParameterWalk( const Gaffer::Plug *parameter, IECore::MurmurHash &h, bool connections )
 		{
 			if( !isLeafParameter( parameter ) || parameter->parent<Node>() )
 			{
 				// Compound parameter - recurse
 				for( InputPlugIterator it( parameter ); !it.done(); ++it )
 				{
-					hashParameterWalk( it->get(), h );
+					hashParameterWalk( it->get(), h, connections );
 				}
 			}
 			else if( const Gaffer::ArrayPlug *arrayParameter = IECore::runTimeCast<const Gaffer::ArrayPlug>( parameter ) )
@@ -363,17 +392,17 @@ class Shader::NetworkBuilder
 				// Array parameter
 				for( InputPlugIterator it( arrayParameter ); !it.done(); ++it )
 				{
-					hashParameter( it->get(), h );
+					hashParameter( it->get(), h, connections );
 				}
 			}
 			else
 			{
 				// Leaf parameter
-				hashParameter( parameter, h );
+				hashParameter( parameter, h, connections );
 			}
 		}
 
-		void addParameterWalk( const Gaffer::Plug *parameter, const IECore::InternedString &parameterName, IECoreScene::Shader *shader, vector<IECoreScene::ShaderNetwork::Connection> &connections )
+		void addParameterWalk( const Gaffer::Plug *parameter, const IECore::InternedString &parameterName, IECoreScene::Shader *shader, vector<IECoreScene::ShaderNetwork::Connection> *connections )
 		{
 			if( !isLeafParameter( parameter ) || parameter->parent<Node>() )
 			{
@@ -408,33 +437,53 @@ class Shader::NetworkBuilder
 			}
 		}
 
-		void hashParameter( const Gaffer::Plug *parameter, IECore::MurmurHash &h )
+		void hashParameter( const Gaffer::Plug *parameter, IECore::MurmurHash &h, bool connections )
 		{
 			const Gaffer::Plug *effectiveParameter = this->effectiveParameter( parameter );
 			if( !effectiveParameter )
 			{
+				if( !connections )
+				{
+					// No value. Hash a placeholder so that the hashes of the
+					// following parameters can't be mistaken for ours.
+					h.append( IECore::MurmurHash() );
+				}
 				return;
 			}
 
 			const Shader *effectiveShader = static_cast<const Shader *>( effectiveParameter->node() );
 			if( isInputParameter( effectiveParameter ) )
 			{
-				effectiveShader->parameterHash( effectiveParameter, h );
-				hashParameterComponentConnections( parameter, h );
+				if( connections )
+				{
+					hashParameterComponentConnections( parameter, h );
+				}
+				else
+				{
+					effectiveShader->parameterHash( effectiveParameter, h );
+				}
 			}
 			else
 			{
 				assert( isOutputParameter( effectiveParameter ) );
-				h.append( shaderHash( effectiveShader ) );
-				if( effectiveShader->outPlug()->isAncestorOf( effectiveParameter ) )
+				if( connections )
 				{
-					h.append( effectiveParameter->relativeName( effectiveShader->outPlug() ) );
+					h.append( parameter->relativeName( parameter->node() ) );
+					h.append( shaderHash( effectiveShader ) );
+					if( effectiveShader->outPlug()->isAncestorOf( effectiveParameter ) )
+					{
+						h.append( effectiveParameter->relativeName( effectiveShader->outPlug() ) );
+					}
+				}
+				else
+				{
+					// No value, as above.
+					h.append( IECore::MurmurHash() );
 				}
-				return;
 			}
 		}
 
-		void addParameter( const Gaffer::Plug *parameter, const IECore::InternedString &parameterName, IECoreScene::Shader *shader, vector<IECoreScene::ShaderNetwork::Connection> &connections )
+		void addParameter( const Gaffer::Plug *parameter, const IECore::InternedString &parameterName, IECoreScene::Shader *shader, vector<IECoreScene::ShaderNetwork::Connection> *connections )
 		{
 			const Gaffer::Plug *effectiveParameter = this->effectiveParameter( parameter );
 			if( !effectiveParameter )
@@ -445,20 +494,26 @@ class Shader::NetworkBuilder
 			const Shader *effectiveShader = static_cast<const Shader *>( effectiveParameter->node() );
 			if( isInputParameter( effectiveParameter ) )
 			{
-				if( IECore::DataPtr value = effectiveShader->parameterValue( effectiveParameter ) )
+				if( shader )
 				{
-					shader->parameters()[parameterName] = value;
+					if( IECore::DataPtr value = effectiveShader->parameterValue( effectiveParameter ) )
+					{
+						shader->parameters()[parameterName] = value;
+					}
+				}
+				if( connections )
+				{
+					addParameterComponentConnections( parameter, parameterName, *connections );
 				}
-				addParameterComponentConnections( parameter, parameterName, connections );
 			}
-			else
+			else if( connections )
 			{
 				IECore::InternedString outputName;
 				if( effectiveShader->outPlug()->isAncestorOf( effectiveParameter ) )
 				{
 					outputName = effectiveParameter->relativeName( effectiveShader->outPlug() );
 				}
-				connections.push_back( {
+				connections->push_back( {
 					{ this->handle( effectiveShader ), outputName },
 					{ IECore::InternedString(), parameterName }
 				} );
@@ -482,7 +537,7 @@ class Shader::NetworkBuilder
 					{
 						h.append( effectiveParameter->relativeName( effectiveShader->outPlug() ) );
 					}
-					h.append( (*it)->getName() );
+					h.append( (*it)->relativeName( parameter->node() ) );
 				}
 			}
 		}
@@ -553,6 +608,7 @@ Shader::Shader( const std::string &name )
 	addChild( new Color3fPlug( "__nodeColor", Gaffer::Plug::In, Color3f( 0.0f ) ) );
 	nodeColorPlug()->setFlags( Plug::Serialisable | Plug::AcceptsInputs, false );
 	addChild( new CompoundObjectPlug( "__outAttributes", Plug::Out, new IECore::CompoundObject ) );
+	addChild( new ObjectPlug( "__outShader", Plug::Out, IECore::NullObject::defaultNullObject() ) );
 
 	nameChangedSignal().connect( boost::bind( &Shader::nameChanged, this ) );
 	Metadata::nodeValueChangedSignal().connect( boost::bind( &Shader::nodeMetadataChanged, this, ::_1, ::_2, ::_3 ) );
@@ -654,6 +710,16 @@ const Gaffer::CompoundObjectPlug *Shader::outAttributesPlug() const
 	return getChild<CompoundObjectPlug>( g_firstPlugIndex + 7 );
 }
 
+Gaffer::ObjectPlug *Shader::outShaderPlug()
+{
+	return getChild<ObjectPlug>( g_firstPlugIndex + 8 );
+}
+
+const Gaffer::ObjectPlug *Shader::outShaderPlug() const
+{
+	return getChild<ObjectPlug>( g_firstPlugIndex + 8 );
+}
+
 IECore::MurmurHash Shader::attributesHash() const
 {
 	return outAttributesPlug()->hash();
@@ -725,6 +791,7 @@ void Shader::affects( const Gaffer::Plug *input, AffectedPlugsContainer &outputs
 			}
 		}
 		outputs.push_back( outAttributesPlug() );
+		outputs.push_back( outShaderPlug() );
 	}
 }
 
@@ -759,6 +826,13 @@ void Shader::hash( const Gaffer::ValuePlug *output, const Gaffer::Context *conte
 		attributesHash( outputParameter, h );
 		return;
 	}
+	else if( output == outShaderPlug() )
+	{
+		ComputeNode::hash( output, context, h );
+		NetworkBuilder networkBuilder( outPlug() );
+		networkBuilder.shaderValuesHash( this, h );
+		return;
+	}
 	else if( const Plug *o = outPlug() )
 	{
 		if( output == o || o->isAncestorOf( output ) )
@@ -785,6 +859,12 @@ void Shader::compute( Gaffer::ValuePlug *output, const Gaffer::Context *context
 		static_cast<CompoundObjectPlug *>( output )->setValue( attributes( outputParameter ) );
 		return;
 	}
+	else if( output == outShaderPlug() )
+	{
+		NetworkBuilder networkBuilder( outPlug() );
+		static_cast<ObjectPlug *>( output )->setValue( networkBuilder.shaderValues( this ) );
+		return;
+	}
 	else if( const Plug *o = outPlug() )
 	{
 		if( output == o || o->isAncestorOf( output ) )
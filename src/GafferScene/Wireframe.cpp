@@ -36,17 +36,13 @@
 
 #include "GafferScene/Wireframe.h"
 
+#include "GafferScene/Private/IECoreScenePreview/MeshAlgo.h"
+
 #include "Gaffer/StringPlug.h"
 
 #include "IECoreScene/MeshPrimitive.h"
 #include "IECoreScene/CurvesPrimitive.h"
 
-#include "IECore/DataAlgo.h"
-
-#include "boost/functional/hash.hpp"
-
-#include <unordered_set>
-
 using namespace std;
 using namespace Imath;
 using namespace IECore;
@@ -54,139 +50,6 @@ using namespace IECoreScene;
 using namespace Gaffer;
 using namespace GafferScene;
 
-//////////////////////////////////////////////////////////////////////////
-// Internal utilities
-//////////////////////////////////////////////////////////////////////////
-
-namespace
-{
-
-struct MakeWireframe
-{
-
-	CurvesPrimitivePtr operator() ( const V2fVectorData *data, const MeshPrimitive *mesh, const string &name, const PrimitiveVariable &primitiveVariable )
-	{
-		return makeWireframe<V2fVectorData>( data, mesh, name, primitiveVariable );
-	}
-
-	CurvesPrimitivePtr operator() ( const V3fVectorData *data, const MeshPrimitive *mesh, const string &name, const PrimitiveVariable &primitiveVariable )
-	{
-		return makeWireframe<V3fVectorData>( data, mesh, name, primitiveVariable );
-	}
-
-	CurvesPrimitivePtr operator() ( const Data *data, const MeshPrimitive *mesh, const string &name, const PrimitiveVariable &primitiveVariable )
-	{
-		throw IECore::Exception( boost::str(
-			boost::format( "PrimitiveVariable \"%1%\" has unsupported type \"%2%\"" ) % name % data->typeName()
-		) );
-	}
-
-	private :
-
-		template<typename T>
-		CurvesPrimitivePtr makeWireframe( const T *data, const MeshPrimitive *mesh, const string &name, const PrimitiveVariable &primitiveVariable )
-		{
-			using Vec = typename T::ValueType::value_type;
-			using DataView = PrimitiveVariable::IndexedView<Vec>;
-
-			DataView dataView;
-			const vector<int> *vertexIds = nullptr;
-			switch( primitiveVariable.interpolation )
-			{
-				case PrimitiveVariable::Vertex :
-				case PrimitiveVariable::Varying :
-					vertexIds = &mesh->vertexIds()->readable();
-					dataView = DataView( primitiveVariable );
-					break;
-				case PrimitiveVariable::FaceVarying :
-					vertexIds = primitiveVariable.indices ? &primitiveVariable.indices->readable() : nullptr;
-					dataView = DataView( data->readable(), nullptr );
-					break;
-				default :
-					throw IECore::Exception( boost::str(
-						boost::format( "Primitive variable \"%1%\" must have Vertex, Varying or FaceVarying interpolation" ) % name
-					) );
-			}
-
-			IECore::V3fVectorDataPtr pData = new V3fVectorData;
-			pData->setInterpretation( GeometricData::Point );
-			vector<V3f> &p = pData->writable();
-			// We don't know upfront how many edges we will generate.
-			// `mesh->variableSize( PrimitiveVariable::FaceVarying )` gives us
-			// an upper bound, but edges can be shared by faces in which case
-			// we only add the edge once. For a fully closed mesh without border
-			// edges, we will only generate half of the edges from this upper bound.
-			// (For non-manifold meshes we could generate even fewer, but we assume
-			// we will not be given those).
-			const size_t minExpectedEdges = mesh->variableSize( PrimitiveVariable::FaceVarying ) / 2;
-			// Each edge we add will add 2 points to `p`.
-			p.reserve( minExpectedEdges * 2 );
-
-			using Edge = std::pair<int, int>;
-			using EdgeSet = unordered_set<Edge, boost::hash<Edge>>;
-			EdgeSet edgesVisited;
-			edgesVisited.reserve( mesh->variableSize( PrimitiveVariable::FaceVarying ) );
-
-			int vertexIdsIndex = 0;
-			for( int numVertices : mesh->verticesPerFace()->readable() )
-			{
-				for( int i = 0; i < numVertices; ++i )
-				{
-					int index0 = vertexIdsIndex + i;
-					int index1 = vertexIdsIndex + (i + 1) % numVertices;
-					if( vertexIds )
-					{
-						index0 = (*vertexIds)[index0];
-						index1 = (*vertexIds)[index1];
-					}
-
-					Edge edge( min( index0, index1 ), max( index0, index1 ) );
-					if( edgesVisited.insert( edge ).second )
-					{
-						p.push_back( v3f( dataView[index0] ) );
-						p.push_back( v3f( dataView[index1] ) );
-					}
-				}
-				vertexIdsIndex += numVertices;
-			}
-
-			IECore::IntVectorDataPtr vertsPerCurveData = new IntVectorData;
-			vertsPerCurveData->writable().resize( p.size() / 2, 2 );
-
-			CurvesPrimitivePtr result = new CurvesPrimitive( vertsPerCurveData );
-			result->variables["P"] = PrimitiveVariable( PrimitiveVariable::Vertex, pData );
-			return result;
-		}
-
-		V3f v3f( const Imath::V3f &v )
-		{
-			return v;
-		}
-
-		V3f v3f( const Imath::V2f &v )
-		{
-			return V3f( v.x, v.y, 0.0f );
-		}
-
-};
-
-/// \todo Perhaps this could go in IECoreScene::MeshAlgo
-CurvesPrimitivePtr wireframe( const MeshPrimitive *mesh, const std::string &position )
-{
-	auto it = mesh->variables.find( position );
-	if( it == mesh->variables.end() )
-	{
-		throw IECore::Exception( boost::str(
-			boost::format( "MeshPrimitive has no primitive variable named \"%1%\"" ) % position
-		) );
-	}
-
-	CurvesPrimitivePtr result = dispatch( it->second.data.get(), MakeWireframe(), mesh, it->first, it->second );
-	return result;
-}
-
-} // namespace
-
 //////////////////////////////////////////////////////////////////////////
 // Wireframe
 //////////////////////////////////////////////////////////////////////////
@@ -283,7 +146,7 @@ IECore::ConstObjectPtr Wireframe::computeProcessedObject( const ScenePath &path,
 		return inputObject;
 	}
 
-	CurvesPrimitivePtr result = wireframe( mesh, positionPlug()->getValue() );
+	CurvesPrimitivePtr result = IECoreScenePreview::MeshAlgo::wireframe( mesh, positionPlug()->getValue() );
 	for( const auto &pv : mesh->variables )
 	{
 		if( pv.second.interpolation == PrimitiveVariable::Constant )
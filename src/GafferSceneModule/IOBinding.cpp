@@ -72,6 +72,14 @@ void GafferSceneModule::bindIO()
 	GafferBindings::DependencyNodeClass<SceneReader>()
 		.def( "supportedExtensions", &supportedExtensions )
 		.staticmethod( "supportedExtensions" )
+		.def( "sceneCacheLookups", &SceneReader::sceneCacheLookups )
+		.staticmethod( "sceneCacheLookups" )
+		.def( "sceneCacheHits", &SceneReader::sceneCacheHits )
+		.staticmethod( "sceneCacheHits" )
+		.def( "preloadBuilds", &SceneReader::preloadBuilds )
+		.staticmethod( "preloadBuilds" )
+		.def( "preloadHits", &SceneReader::preloadHits )
+		.staticmethod( "preloadHits" )
 	;
 
 	typedef GafferDispatchBindings::TaskNodeWrapper<SceneWriter> SceneWriterWrapper;
@@ -40,6 +40,7 @@
 
 #include "GafferScene/InteractiveRender.h"
 #include "GafferScene/OpenGLRender.h"
+#include "GafferScene/Private/IECoreScenePreview/CapturingRenderer.h"
 #include "GafferScene/Private/IECoreScenePreview/Geometry.h"
 #include "GafferScene/Private/IECoreScenePreview/Procedural.h"
 #include "GafferScene/Private/IECoreScenePreview/Renderer.h"
@@ -52,6 +53,8 @@
 
 #include "Gaffer/Context.h"
 
+#include "IECorePython/ScopedGILRelease.h"
+
 using namespace boost::python;
 
 using namespace Imath;
@@ -126,6 +129,9 @@ const char *rendererName( Renderer &renderer )
 
 IECoreScenePreview::Renderer::ObjectInterfacePtr rendererObject1( Renderer &renderer, const std::string &name, const IECore::Object *object, const Renderer::AttributesInterface *attributes )
 {
+	// Renderers may block until they have capacity for
+	// more edits, so we must allow other threads to run.
+	IECorePython::ScopedGILRelease gilRelease;
 	return renderer.object( name, object, attributes );
 }
 
@@ -140,6 +146,42 @@ IECoreScenePreview::Renderer::ObjectInterfacePtr rendererObject2( Renderer &rend
 	return renderer.object( name, samples, times, attributes );
 }
 
+void instancesArguments( object pythonInstanceNames, object pythonInstanceTransforms, object pythonInstanceAttributes, std::vector<std::string> &instanceNames, std::vector<Imath::M44f> &instanceTransforms, std::vector<const Renderer::AttributesInterface *> &instanceAttributes )
+{
+	container_utils::extend_container( instanceNames, pythonInstanceNames );
+	container_utils::extend_container( instanceTransforms, pythonInstanceTransforms );
+	for( size_t i = 0, e = len( pythonInstanceAttributes ); i < e; ++i )
+	{
+		instanceAttributes.push_back( extract<const Renderer::AttributesInterface *>( pythonInstanceAttributes[i] )() );
+	}
+}
+
+IECoreScenePreview::Renderer::ObjectInterfacePtr rendererInstances1( Renderer &renderer, const IECore::Object *object, object pythonInstanceNames, object pythonInstanceTransforms, object pythonInstanceAttributes )
+{
+	std::vector<std::string> instanceNames;
+	std::vector<Imath::M44f> instanceTransforms;
+	std::vector<const Renderer::AttributesInterface *> instanceAttributes;
+	instancesArguments( pythonInstanceNames, pythonInstanceTransforms, pythonInstanceAttributes, instanceNames, instanceTransforms, instanceAttributes );
+
+	return renderer.instances( object, instanceNames, instanceTransforms, instanceAttributes );
+}
+
+IECoreScenePreview::Renderer::ObjectInterfacePtr rendererInstances2( Renderer &renderer, object pythonSamples, object pythonTimes, object pythonInstanceNames, object pythonInstanceTransforms, object pythonInstanceAttributes )
+{
+	std::vector<const IECore::Object *> samples;
+	container_utils::extend_container( samples, pythonSamples );
+
+	std::vector<float> times;
+	container_utils::extend_container( times, pythonTimes );
+
+	std::vector<std::string> instanceNames;
+	std::vector<Imath::M44f> instanceTransforms;
+	std::vector<const Renderer::AttributesInterface *> instanceAttributes;
+	instancesArguments( pythonInstanceNames, pythonInstanceTransforms, pythonInstanceAttributes, instanceNames, instanceTransforms, instanceAttributes );
+
+	return renderer.instances( samples, times, instanceNames, instanceTransforms, instanceAttributes );
+}
+
 object rendererCommand( Renderer &renderer, const IECore::InternedString name, const IECore::CompoundDataMap &parameters = IECore::CompoundDataMap() )
 {
 	return dataToPython(
@@ -163,6 +205,67 @@ void objectInterfaceTransform2( Renderer::ObjectInterface &objectInterface, obje
 	return objectInterface.transform( samples, times );
 }
 
+CapturingRenderer::CapturedObjectPtr capturedObject( const CapturingRenderer &renderer, const std::string &name )
+{
+	return const_cast<CapturingRenderer::CapturedObject *>( renderer.capturedObject( name ) );
+}
+
+list capturedObjectNames( const CapturingRenderer &renderer )
+{
+	list result;
+	for( const auto &name : renderer.capturedObjectNames() )
+	{
+		result.append( name );
+	}
+	return result;
+}
+
+IECore::CompoundObjectPtr capturedAttributesAttributes( const CapturingRenderer::CapturedAttributes &attributes )
+{
+	return attributes.attributes()->copy();
+}
+
+list capturedSamples( const CapturingRenderer::CapturedObject &object )
+{
+	list result;
+	for( const auto &s : object.capturedSamples() )
+	{
+		result.append( s->copy() );
+	}
+	return result;
+}
+
+template<typename T>
+list vectorToList( const std::vector<T> &v )
+{
+	list result;
+	for( const auto &x : v )
+	{
+		result.append( x );
+	}
+	return result;
+}
+
+list capturedSampleTimes( const CapturingRenderer::CapturedObject &object )
+{
+	return vectorToList( object.capturedSampleTimes() );
+}
+
+list capturedTransforms( const CapturingRenderer::CapturedObject &object )
+{
+	return vectorToList( object.capturedTransforms() );
+}
+
+list capturedTransformTimes( const CapturingRenderer::CapturedObject &object )
+{
+	return vectorToList( object.capturedTransformTimes() );
+}
+
+CapturingRenderer::CapturedAttributesPtr capturedAttributes( const CapturingRenderer::CapturedObject &object )
+{
+	return const_cast<CapturingRenderer::CapturedAttributes *>( object.capturedAttributes() );
+}
+
 class ProceduralWrapper : public IECorePython::RunTimeTypedWrapper<IECoreScenePreview::Procedural>
 {
 
@@ -279,6 +382,8 @@ void GafferSceneModule::bindRender()
 
 			.def( "object", &rendererObject1 )
 			.def( "object", &rendererObject2 )
+			.def( "instances", &rendererInstances1 )
+			.def( "instances", &rendererInstances2 )
 
 			.def( "render", &Renderer::render )
 			.def( "pause", &Renderer::pause )
@@ -286,6 +391,27 @@ void GafferSceneModule::bindRender()
 
 		;
 
+		{
+			scope capturingRendererScope = IECorePython::RefCountedClass<CapturingRenderer, Renderer>( "CapturingRenderer" )
+				.def( init<Renderer::RenderType, const std::string &>( ( arg( "renderType" ) = Renderer::Batch, arg( "fileName" ) = "" ) ) )
+				.def( "capturedObject", &capturedObject )
+				.def( "capturedObjectNames", &capturedObjectNames )
+			;
+
+			IECorePython::RefCountedClass<CapturingRenderer::CapturedAttributes, Renderer::AttributesInterface>( "CapturedAttributes" )
+				.def( "attributes", &capturedAttributesAttributes )
+			;
+
+			IECorePython::RefCountedClass<CapturingRenderer::CapturedObject, Renderer::ObjectInterface>( "CapturedObject" )
+				.def( "capturedName", &CapturingRenderer::CapturedObject::capturedName, return_value_policy<copy_const_reference>() )
+				.def( "capturedSamples", &capturedSamples )
+				.def( "capturedSampleTimes", &capturedSampleTimes )
+				.def( "capturedTransforms", &capturedTransforms )
+				.def( "capturedTransformTimes", &capturedTransformTimes )
+				.def( "capturedAttributes", &capturedAttributes )
+			;
+		}
+
 		CompoundDataMapFromDict();
 
 		IECorePython::RunTimeTypedClass<IECoreScenePreview::Procedural, ProceduralWrapper>()
@@ -42,6 +42,7 @@
 #include "GafferScene/SceneProcessor.h"
 
 #include "IECorePython/ScopedGILLock.h"
+#include "IECorePython/ScopedGILRelease.h"
 
 using namespace boost::python;
 using namespace GafferScene;
@@ -75,6 +76,54 @@ void registerAdaptorWrapper( const std::string &name, object adaptor )
 	RendererAlgo::registerAdaptor( name, AdaptorWrapper( adaptor ) );
 }
 
+tuple transformSamplesWrapper( const ScenePlug &scene, size_t segments, const Imath::V2f &shutter )
+{
+	std::vector<Imath::M44f> samples;
+	std::set<float> sampleTimes;
+	{
+		IECorePython::ScopedGILRelease gilRelease;
+		RendererAlgo::transformSamples( &scene, segments, shutter, samples, sampleTimes );
+	}
+
+	list pythonSamples;
+	for( const auto &s : samples )
+	{
+		pythonSamples.append( s );
+	}
+
+	list pythonSampleTimes;
+	for( auto t : sampleTimes )
+	{
+		pythonSampleTimes.append( t );
+	}
+
+	return make_tuple( pythonSamples, pythonSampleTimes );
+}
+
+tuple objectSamplesWrapper( const ScenePlug &scene, size_t segments, const Imath::V2f &shutter )
+{
+	std::vector<IECoreScene::ConstVisibleRenderablePtr> samples;
+	std::set<float> sampleTimes;
+	{
+		IECorePython::ScopedGILRelease gilRelease;
+		RendererAlgo::objectSamples( &scene, segments, shutter, samples, sampleTimes );
+	}
+
+	list pythonSamples;
+	for( const auto &s : samples )
+	{
+		pythonSamples.append( boost::static_pointer_cast<IECoreScene::VisibleRenderable>( s->copy() ) );
+	}
+
+	list pythonSampleTimes;
+	for( auto t : sampleTimes )
+	{
+		pythonSampleTimes.append( t );
+	}
+
+	return make_tuple( pythonSamples, pythonSampleTimes );
+}
+
 } // namespace
 
 namespace GafferSceneModule
@@ -86,6 +135,8 @@ void bindRendererAlgo()
 	def( "registerAdaptor", &registerAdaptorWrapper );
 	def( "deregisterAdaptor", &RendererAlgo::deregisterAdaptor );
 	def( "createAdaptors", &RendererAlgo::createAdaptors );
+	def( "transformSamples", &transformSamplesWrapper );
+	def( "objectSamples", &objectSamplesWrapper );
 
 }
 
@@ -88,6 +88,11 @@ SceneGadget::SceneGadget()
 	} );
 	setOpenGLOptions( openGLOptions.get() );
 
+	// Stream edits to the renderer, so that large scenes are displayed
+	// progressively and with bounded memory usage.
+	m_renderer->option( "gl:streaming:maxPendingEdits", new IntData( 10000 ) );
+	m_renderer->option( "gl:streaming:timeBudget", new FloatData( 0.05f ) );
+
 	m_controller.updateRequiredSignal().connect(
 		boost::bind( &SceneGadget::requestRender, this )
 	);
@@ -208,7 +213,12 @@ void SceneGadget::waitForCompletion()
 	updateRenderer();
 	if( m_updateTask )
 	{
-		m_updateTask->wait();
+		// The update may be waiting for us to process edits,
+		// so we must do that while we wait.
+		while( !m_updateTask->waitFor( 0.01 ) )
+		{
+			m_renderer->command( "gl:processQueue" );
+		}
 	}
 }
 
@@ -524,6 +534,22 @@ void SceneGadget::renderScene() const
 		return;
 	}
 	m_renderer->render();
+
+	// The renderer may not have had time to process all edits,
+	// in which case we need another render to show the rest.
+	DataPtr editsPending = m_renderer->command( "gl:queryEditsPending" );
+	SceneGadget *mutableThis = const_cast<SceneGadget *>( this );
+	if( static_cast<BoolData *>( editsPending.get() )->readable() && !mutableThis->m_renderRequestPending.exchange( true ) )
+	{
+		// Must hold a reference to stop us dying before our UI thread call is scheduled.
+		SceneGadgetPtr thisRef = mutableThis;
+		ParallelAlgo::callOnUIThread(
+			[thisRef] {
+				thisRef->m_renderRequestPending = false;
+				thisRef->requestRender();
+			}
+		);
+	}
 }
 
 void SceneGadget::visibilityChanged()
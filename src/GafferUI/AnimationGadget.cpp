@@ -1284,23 +1284,43 @@ void AnimationGadget::renderCurve( const Animation::CurvePlug *curvePlug, const
 	const ViewportGadget *viewportGadget = ancestor<ViewportGadget>();
 	ViewportGadget::RasterScope rasterScope( viewportGadget );
 
-	Animation::ConstKeyPtr previousKey = nullptr;
+	// Only segments overlapping the visible time range need to be drawn.
+	const float minTime = viewportGadget->rasterToWorldSpace( V2f( 0 ) ).p0.x;
+	const float maxTime = viewportGadget->rasterToWorldSpace( V2f( viewportGadget->getViewport().x, 0 ) ).p0.x;
+
+	const Animation::Key *previousKey = nullptr;
 	V2f previousKeyPosition = V2f( 0 );
 
 	bool isHighlighted = curvePlug == m_highlightedCurve;
 
+	Imath::Color3f userColor( 1.0 ); // curves render white per default
+	colorFromName( drivenPlugName( curvePlug ), userColor );
+
 	for( const auto &key : *curvePlug )
 	{
+		if( key.getTime() < minTime )
+		{
+			previousKey = &key;
+			continue;
+		}
+
+		if( previousKey && previousKey->getTime() > maxTime )
+		{
+			break;
+		}
+
 		V2f keyPosition = viewportGadget->worldToRasterSpace( V3f( key.getTime(), key.getValue(), 0 ) );
 
 		if( previousKey )
 		{
+			if( previousKey->getTime() < minTime )
+			{
+				previousKeyPosition = viewportGadget->worldToRasterSpace( V3f( previousKey->getTime(), previousKey->getValue(), 0 ) );
+			}
+
 			// \todo: needs tangent computation/hand-off as soon as we support more interpolation modes
 			//        consider passing interpolation into renderCurveSegment to handle all drawing there
 
-			Imath::Color3f userColor( 1.0 ); // curves render white per default
-			colorFromName( drivenPlugName( curvePlug ), userColor );
-
 			if( key.getType() == Gaffer::Animation::Linear )
 			{
 				style->renderAnimationCurve( previousKeyPosition, keyPosition, /* inTangent */ V2f( 0 ), /* outTangent */ V2f( 0 ), isHighlighted ? Style::HighlightedState : Style::NormalState, &userColor );
@@ -38,7 +38,10 @@
 
 #include "PathListingWidgetBinding.h"
 
+#include "Gaffer/BackgroundTask.h"
+#include "Gaffer/Context.h"
 #include "Gaffer/FileSystemPath.h"
+#include "Gaffer/ParallelAlgo.h"
 #include "Gaffer/Path.h"
 
 #include "IECorePython/RefCountedBinding.h"
@@ -52,6 +55,7 @@
 #include "IECore/SearchPath.h"
 #include "IECore/SimpleTypedData.h"
 
+#include "boost/bind.hpp"
 #include "boost/date_time/posix_time/conversion.hpp"
 #include "boost/python/suite/indexing/container_utils.hpp"
 
@@ -60,6 +64,9 @@
 #include "QtCore/QModelIndex"
 #include "QtCore/QVariant"
 
+#include <algorithm>
+#include <memory>
+
 #if QT_VERSION >= 0x050000
 	#include "QtWidgets/QTreeView"
 	#include "QtWidgets/QFileIconProvider"
@@ -77,6 +84,11 @@ namespace
 
 IECore::InternedString g_namePropertyName( "name" );
 
+// Rows are made available to the view in pages of this size, so
+// that expanding a location with a huge number of children doesn't
+// require the view to lay out and query every one of them.
+const size_t g_childItemsPageSize = 1000;
+
 // Abstract class for extracting QVariants from Path objects
 // in order to populate columns in the PathMode. Column
 // objects only do the extraction, they are not responsible
@@ -335,10 +347,54 @@ class FileIconColumn : public Column
 
 IE_CORE_DECLAREPTR( FileIconColumn )
 
+// Background tasks which are no longer needed by a PathModel. We cancel
+// these but don't wait for them, because the UI thread may be holding the
+// GIL that a Python path needs in order to finish. Instead they are
+// destroyed the next time we find they have finished.
+typedef std::vector<std::unique_ptr<BackgroundTask>> BackgroundTasks;
+
+BackgroundTasks &orphanedTasks()
+{
+	// Deliberately leaked, so that we never wait for a task during shutdown.
+	static BackgroundTasks *tasks = new BackgroundTasks;
+	return *tasks;
+}
+
+void orphanTask( std::unique_ptr<BackgroundTask> task )
+{
+	BackgroundTasks &tasks = orphanedTasks();
+	tasks.erase(
+		std::remove_if(
+			tasks.begin(), tasks.end(),
+			[]( const std::unique_ptr<BackgroundTask> &t ) {
+				switch( t->status() )
+				{
+					case BackgroundTask::Completed :
+					case BackgroundTask::Cancelled :
+					case BackgroundTask::Errored :
+						return true;
+					default :
+						return false;
+				}
+			}
+		),
+		tasks.end()
+	);
+
+	task->cancel();
+	tasks.push_back( std::move( task ) );
+}
+
 // A QAbstractItemModel for the navigation of Gaffer::Paths.
 // This allows us to view Paths in QTreeViews. This forms part
 // of the internal implementation of PathListingWidget, the rest
 // of which is implemented in Python.
+//
+// Child items are listed on a background thread when the view first
+// asks for them, and are inserted into the model when they are ready.
+// This keeps the UI responsive when listing is slow or there are a
+// great many children. The methods which map between paths and indices
+// can't wait for that, so they list children synchronously instead.
 class PathModel : public QAbstractItemModel
 {
 
@@ -362,6 +418,7 @@ class PathModel : public QAbstractItemModel
 
 		~PathModel() override
 		{
+			m_pathChangedConnection.disconnect();
 			delete m_rootItem;
 		}
 
@@ -391,6 +448,15 @@ class PathModel : public QAbstractItemModel
 			delete m_rootItem;
 			m_rootItem = new Item( root, 0, nullptr );
 			endResetModel();
+
+			// Background listings work on snapshots of the path, so we must
+			// restart them if it changes. Changes to the root are representative
+			// of changes to all items, because they are all derived from it.
+			m_pathChangedConnection.disconnect();
+			if( root )
+			{
+				m_pathChangedConnection = root->pathChangedSignal().connect( boost::bind( &PathModel::pathChanged, this ) );
+			}
 		}
 
 		void setFlat( bool flat )
@@ -443,12 +509,14 @@ class PathModel : public QAbstractItemModel
 			for( size_t i = rootPath->names().size(); i < path.size(); ++i )
 			{
 				bool foundNextItem = false;
-				const std::vector<Item *> &childItems = item->childItems( this );
+				const std::vector<Item *> &childItems = item->listChildItems( this );
 				for( std::vector<Item *>::const_iterator it = childItems.begin(), eIt = childItems.end(); it != eIt; ++it )
 				{
 					if( (*it)->path()->names()[i] == path[i] )
 					{
-						result = index( it - childItems.begin(), 0, result );
+						const int row = it - childItems.begin();
+						fetchTo( item, result, row );
+						result = index( row, 0, result );
 						item = *it;
 						foundNextItem = true;
 						break;
@@ -468,6 +536,14 @@ class PathModel : public QAbstractItemModel
 			return indexForPath( path->names() );
 		}
 
+		// Lists the children of `index` immediately, rather than
+		// waiting for them to be listed in the background.
+		void listChildren( const QModelIndex &index )
+		{
+			Item *item = index.isValid() ? static_cast<Item *>( index.internalPointer() ) : m_rootItem;
+			item->listChildItems( this );
+		}
+
 		std::vector<QModelIndex> indicesForPaths( const IECore::PathMatcher &paths )
 		{
 			std::vector<QModelIndex> result;
@@ -508,9 +584,9 @@ class PathModel : public QAbstractItemModel
 		QModelIndex index( int row, int column, const QModelIndex &parentIndex = QModelIndex() ) const override
 		{
 			Item *item = parentIndex.isValid() ? static_cast<Item *>( parentIndex.internalPointer() ) : m_rootItem;
-			if( row >=0 and row < (int)item->childItems( this ).size() and column >=0 and column < (int)m_columns.size() )
+			if( row >=0 and row < (int)item->numFetchedChildItems() and column >=0 and column < (int)m_columns.size() )
 			{
-				return createIndex( row, column, item->childItems( this )[row] );
+				return createIndex( row, column, item->childItems()[row] );
 			}
 			else
 			{
@@ -539,11 +615,44 @@ class PathModel : public QAbstractItemModel
 			Item *item = parentIndex.isValid() ? static_cast<Item *>( parentIndex.internalPointer() ) : m_rootItem;
 			if( item == m_rootItem || !m_flat )
 			{
-				return item->childItems( this ).size();
+				// The view is interested in the children, so start
+				// listing them if we haven't already. They'll be
+				// inserted as rows when they're ready.
+				item->requestChildItems( const_cast<PathModel *>( this ) );
+				return item->numFetchedChildItems();
 			}
 			return 0;
 		}
 
+		// The default implementation calls `rowCount()`, which would
+		// launch a listing for every item the view draws, just so
+		// it can decide whether or not to show an expansion arrow.
+		bool hasChildren( const QModelIndex &parentIndex = QModelIndex() ) const override
+		{
+			Item *item = parentIndex.isValid() ? static_cast<Item *>( parentIndex.internalPointer() ) : m_rootItem;
+			if( item == m_rootItem || !m_flat )
+			{
+				return item->mayHaveChildItems();
+			}
+			return false;
+		}
+
+		bool canFetchMore( const QModelIndex &parentIndex ) const override
+		{
+			Item *item = parentIndex.isValid() ? static_cast<Item *>( parentIndex.internalPointer() ) : m_rootItem;
+			if( item == m_rootItem || !m_flat )
+			{
+				return item->numFetchedChildItems() < item->childItems().size();
+			}
+			return false;
+		}
+
+		void fetchMore( const QModelIndex &parentIndex ) override
+		{
+			Item *item = parentIndex.isValid() ? static_cast<Item *>( parentIndex.internalPointer() ) : m_rootItem;
+			fetchTo( item, parentIndex, item->numFetchedChildItems() + g_childItemsPageSize - 1 );
+		}
+
 		int columnCount( const QModelIndex &parent = QModelIndex() ) const override
 		{
 			return m_columns.size();
@@ -577,12 +686,18 @@ class PathModel : public QAbstractItemModel
 		{
 
 			Item( Gaffer::PathPtr path, int row, Item *parent )
-				:	m_path( path ), m_parent( parent ), m_row( row ), m_dataDone( false ), m_childItemsDone( false )
+				:	m_path( path ), m_parent( parent ), m_row( row ), m_displayDataDone( false ), m_decorationDataDone( false ),
+					m_childItemsState( ChildItemsState::Unrequested ), m_numFetchedChildItems( g_childItemsPageSize )
 			{
 			}
 
 			~Item()
 			{
+				if( m_childItemsTask )
+				{
+					orphanTask( std::move( m_childItemsTask ) );
+				}
+
 				for( std::vector<Item *>::const_iterator it = m_childItems.begin(), eIt = m_childItems.end(); it != eIt; ++it )
 				{
 					delete *it;
@@ -609,85 +724,142 @@ class PathModel : public QAbstractItemModel
 			// the results of these queries internally.
 			QVariant data( int column, int role, const std::vector<ColumnPtr> &columns )
 			{
-				// We generate data for all columns and roles at once, on the assumption
-				// that access to one is likely to indicate upcoming accesses to the others.
-				ensureData( columns );
-
 				switch( role )
 				{
 					case Qt::DisplayRole :
+						ensureDisplayData( columns );
 						return m_displayData[column];
 					case Qt::DecorationRole :
+						ensureDecorationData( columns );
 						return m_decorationData[column];
 					default :
 						return QVariant();
 				}
 			}
 
-			std::vector<Item *> &childItems( const PathModel *model )
+			// Returns the child items listed so far. This is empty until the
+			// items requested by `requestChildItems()` have been delivered, or
+			// `listChildItems()` has been called.
+			std::vector<Item *> &childItems()
+			{
+				return m_childItems;
+			}
+
+			// Launches a background task to list the child items, if that
+			// hasn't been done already. The items are inserted into the
+			// model on the UI thread when they are ready.
+			void requestChildItems( PathModel *model )
 			{
-				if( !m_childItemsDone && m_path )
+				if( m_childItemsState != ChildItemsState::Unrequested || !m_path )
 				{
-					std::vector<Gaffer::PathPtr> children;
-					try
-					{
-						m_path->children( children );
-					}
-					catch( const std::exception &e )
-					{
-						IECore::msg( IECore::Msg::Error, "PathListingWidget", e.what() );
+					return;
+				}
+
+				m_childItemsState = ChildItemsState::Requested;
+
+				// The task works on copies, so that it shares nothing with
+				// the UI thread and can outlive us if necessary.
+				Gaffer::ConstPathPtr path = m_path->copyForBackgroundUse();
+				const std::vector<ColumnPtr> columns = model->getColumns();
+				m_handle = std::make_shared<Item *>( this );
+				std::weak_ptr<Item *> handle = m_handle;
+
+				m_childItemsTask = ParallelAlgo::callOnBackgroundThread(
+					path->cancellationSubject(),
+					[path, columns, handle, model] {
+						ChildItemsPtr childItems = buildChildItems( path.get(), columns, Context::current()->canceller() );
+						ParallelAlgo::callOnUIThread(
+							[childItems, handle, model] {
+								// If the handle has expired, we were destroyed or
+								// listed our children synchronously in the meantime.
+								if( auto item = handle.lock() )
+								{
+									(*item)->setChildItems( model, *childItems );
+								}
+							}
+						);
 					}
+				);
+			}
 
-					for( std::vector<Gaffer::PathPtr>::const_iterator it = children.begin(), eIt = children.end(); it != eIt; ++it )
+			// Cancels any listing in progress, and starts it again with a
+			// fresh snapshot of the path. Listings which have already
+			// completed are left for the PathListingWidget to update.
+			void restartChildItems( PathModel *model )
+			{
+				if( m_childItemsState == ChildItemsState::Requested )
+				{
+					if( m_childItemsTask )
 					{
-						m_childItems.push_back( new Item( *it, it - children.begin(), this ) );
+						orphanTask( std::move( m_childItemsTask ) );
 					}
-					// If the model is sorted, then we need to apply that same
-					// sorting to the new items - see comment for PathModel::sort().
-					sort( model );
+					m_handle.reset();
+					m_childItemsState = ChildItemsState::Unrequested;
+					requestChildItems( model );
+				}
+
+				for( auto childItem : m_childItems )
+				{
+					childItem->restartChildItems( model );
 				}
-				m_childItemsDone = true;
-				return m_childItems;
 			}
 
-			void sort( const PathModel *model )
+			// Returns false only if we know there are no child items,
+			// without listing them if they are not available already.
+			bool mayHaveChildItems()
 			{
-				if( model->m_sortColumn < 0 || model->m_sortColumn >= model->columnCount() )
+				if( !m_path )
 				{
-					return;
+					return false;
 				}
+				if( m_childItemsState == ChildItemsState::Done )
+				{
+					return !m_childItems.empty();
+				}
+				return !m_path->isLeaf();
+			}
 
-				if( !m_childItems.size() )
+			// Lists the child items immediately if they are not available
+			// already, abandoning any background task started by
+			// `requestChildItems()`.
+			std::vector<Item *> &listChildItems( PathModel *model )
+			{
+				if( m_childItemsState == ChildItemsState::Done || !m_path )
 				{
-					return;
+					return m_childItems;
 				}
 
-				SortableItems sortableChildren;
-				sortableChildren.reserve( m_childItems.size() );
-				for( int i = 0, e = m_childItems.size(); i < e; ++i )
+				if( m_childItemsTask )
 				{
-					m_childItems[i]->ensureData( model->getColumns() );
-					sortableChildren.push_back( SortableItem( m_childItems[i], i ) );
+					orphanTask( std::move( m_childItemsTask ) );
 				}
+				m_handle.reset();
+
+				ChildItemsPtr childItems = buildChildItems( m_path.get(), model->getColumns(), nullptr );
+				setChildItems( model, *childItems );
+				return m_childItems;
+			}
 
-				std::sort( sortableChildren.begin(), sortableChildren.end(), Less( model->m_sortColumn ) );
+			// Returns the number of child items which have been made
+			// available to the view. This is always at most `childItems().size()`.
+			size_t numFetchedChildItems()
+			{
+				return std::min( m_numFetchedChildItems, m_childItems.size() );
+			}
+
+			void setNumFetchedChildItems( size_t numFetchedChildItems )
+			{
+				m_numFetchedChildItems = numFetchedChildItems;
+			}
 
-				const bool reverse = model->m_sortOrder == Qt::DescendingOrder;
+			void sort( const PathModel *model )
+			{
 				QModelIndexList changedPersistentIndexesFrom, changedPersistentIndexesTo;
-				for( int i = 0, e = sortableChildren.size(); i < e; ++i )
+				if( sortChildItems( model, &changedPersistentIndexesFrom, &changedPersistentIndexesTo ) )
 				{
-					int fromRow = sortableChildren[i].second;
-					int toRow = reverse ? e - i - 1 : i;
-					m_childItems[toRow] = sortableChildren[i].first;
-					for( int c = 0, ce = model->getColumns().size(); c < ce; ++c )
-					{
-						changedPersistentIndexesFrom.append( model->createIndex( fromRow, c, sortableChildren[i].first ) );
-						changedPersistentIndexesTo.append( model->createIndex( toRow, c, sortableChildren[i].first ) );
-					}
+					const_cast<PathModel *>( model )->changePersistentIndexList( changedPersistentIndexesFrom, changedPersistentIndexesTo );
 				}
 
-				const_cast<PathModel *>( model )->changePersistentIndexList( changedPersistentIndexesFrom, changedPersistentIndexesTo );
-
 				for( std::vector<Item *>::const_iterator it = m_childItems.begin(), eIt = m_childItems.end(); it != eIt; ++it )
 				{
 					(*it)->sort( model );
@@ -699,40 +871,186 @@ class PathModel : public QAbstractItemModel
 				typedef std::pair<Item *, size_t> SortableItem;
 				typedef std::vector<SortableItem> SortableItems;
 
-				void ensureData( const std::vector<ColumnPtr> &columns )
+				// Owns any items it still contains when destroyed.
+				typedef std::shared_ptr<std::vector<Item *>> ChildItemsPtr;
+
+				// Creates items for the children of `path`, along with the display
+				// data needed to sort them. This is called on a background thread
+				// by `requestChildItems()`, so must not touch the model or any
+				// existing items. Decoration data is left to be generated on demand
+				// by `data()`, since icons may only be created on the UI thread.
+				static ChildItemsPtr buildChildItems( const Gaffer::Path *path, const std::vector<ColumnPtr> &columns, const IECore::Canceller *canceller )
+				{
+					ChildItemsPtr result(
+						new std::vector<Item *>,
+						[]( std::vector<Item *> *items ) {
+							for( auto item : *items )
+							{
+								delete item;
+							}
+							delete items;
+						}
+					);
+
+					std::vector<Gaffer::PathPtr> children;
+					try
+					{
+						path->children( children );
+					}
+					catch( const std::exception &e )
+					{
+						IECore::msg( IECore::Msg::Error, "PathListingWidget", e.what() );
+					}
+
+					result->reserve( children.size() );
+					for( std::vector<Gaffer::PathPtr>::const_iterator it = children.begin(), eIt = children.end(); it != eIt; ++it )
+					{
+						IECore::Canceller::check( canceller );
+						result->push_back( new Item( *it, it - children.begin(), nullptr ) );
+						result->back()->ensureDisplayData( columns );
+					}
+
+					return result;
+				}
+
+				// Called on the UI thread to take ownership of the items built
+				// by `buildChildItems()`, and to tell the view about them.
+				void setChildItems( PathModel *model, std::vector<Item *> &childItems )
 				{
-					if( m_dataDone )
+					// The task has done its work, but may still be unwinding,
+					// so we can't destroy it here.
+					if( m_childItemsTask )
+					{
+						orphanTask( std::move( m_childItemsTask ) );
+					}
+					m_childItemsState = ChildItemsState::Done;
+
+					if( childItems.empty() )
 					{
 						return;
 					}
 
-					m_displayData.reserve( columns.size() );
-					m_decorationData.reserve( columns.size() );
-					for( int i = 0, e = columns.size(); i < e; ++i )
+					for( auto childItem : childItems )
 					{
-						QVariant displayData;
-						QVariant decorationData;
-						try
-						{
-							displayData = columns[i]->data( m_path.get(), Qt::DisplayRole );
-							decorationData = columns[i]->data( m_path.get(), Qt::DecorationRole );
-						}
-						catch( const std::exception &e )
-						{
-							// Qt doesn't use exceptions for error handling,
-							// so we must suppress them.
-							IECore::msg( IECore::Msg::Warning, "PathListingWidget", e.what() );
-						}
-						catch( ... )
+						childItem->m_parent = this;
+					}
+
+					// Rows below non-root items aren't visible to the
+					// view in flat mode, so there's nothing to tell it.
+					const bool notify = this == model->m_rootItem || !model->m_flat;
+					if( notify )
+					{
+						const QModelIndex index = this == model->m_rootItem ? QModelIndex() : model->createIndex( m_row, 0, this );
+						model->beginInsertRows( index, 0, std::min( m_numFetchedChildItems, childItems.size() ) - 1 );
+					}
+
+					m_childItems.swap( childItems );
+					// If the model is sorted, then we need to apply that same
+					// sorting to the new items - see comment for PathModel::sort().
+					// The view doesn't know about the rows yet, so there are no
+					// persistent indexes to update.
+					sortChildItems( model );
+
+					if( notify )
+					{
+						model->endInsertRows();
+					}
+				}
+
+				// Reorders the child items using the model's sort column and order,
+				// returning false if the model isn't sorted. If requested, the indexes
+				// that have moved are returned in `changedFrom` and `changedTo`.
+				bool sortChildItems( const PathModel *model, QModelIndexList *changedFrom = nullptr, QModelIndexList *changedTo = nullptr )
+				{
+					if( model->m_sortColumn < 0 || model->m_sortColumn >= model->columnCount() )
+					{
+						return false;
+					}
+
+					if( !m_childItems.size() )
+					{
+						return false;
+					}
+
+					SortableItems sortableChildren;
+					sortableChildren.reserve( m_childItems.size() );
+					for( int i = 0, e = m_childItems.size(); i < e; ++i )
+					{
+						m_childItems[i]->ensureDisplayData( model->getColumns() );
+						sortableChildren.push_back( SortableItem( m_childItems[i], i ) );
+					}
+
+					std::sort( sortableChildren.begin(), sortableChildren.end(), Less( model->m_sortColumn ) );
+
+					const bool reverse = model->m_sortOrder == Qt::DescendingOrder;
+					for( int i = 0, e = sortableChildren.size(); i < e; ++i )
+					{
+						int fromRow = sortableChildren[i].second;
+						int toRow = reverse ? e - i - 1 : i;
+						m_childItems[toRow] = sortableChildren[i].first;
+						m_childItems[toRow]->m_row = toRow;
+						if( changedFrom )
 						{
-							IECore::msg( IECore::Msg::Warning, "PathListingWidget", "Unknown error" );
+							for( int c = 0, ce = model->getColumns().size(); c < ce; ++c )
+							{
+								changedFrom->append( model->createIndex( fromRow, c, sortableChildren[i].first ) );
+								changedTo->append( model->createIndex( toRow, c, sortableChildren[i].first ) );
+							}
 						}
+					}
+
+					return true;
+				}
+
+				void ensureDisplayData( const std::vector<ColumnPtr> &columns )
+				{
+					if( m_displayDataDone )
+					{
+						return;
+					}
+
+					m_displayData.reserve( columns.size() );
+					for( int i = 0, e = columns.size(); i < e; ++i )
+					{
+						m_displayData.push_back( columnData( columns[i].get(), Qt::DisplayRole ) );
+					}
 
-						m_displayData.push_back( displayData );
-						m_decorationData.push_back( decorationData );
+					m_displayDataDone = true;
+				}
+
+				void ensureDecorationData( const std::vector<ColumnPtr> &columns )
+				{
+					if( m_decorationDataDone )
+					{
+						return;
+					}
+
+					m_decorationData.reserve( columns.size() );
+					for( int i = 0, e = columns.size(); i < e; ++i )
+					{
+						m_decorationData.push_back( columnData( columns[i].get(), Qt::DecorationRole ) );
 					}
 
-					m_dataDone = true;
+					m_decorationDataDone = true;
+				}
+
+				QVariant columnData( const Column *column, int role )
+				{
+					try
+					{
+						return column->data( m_path.get(), role );
+					}
+					catch( const std::exception &e )
+					{
+						// Qt doesn't use exceptions for error handling,
+						// so we must suppress them.
+						IECore::msg( IECore::Msg::Warning, "PathListingWidget", e.what() );
+					}
+					catch( ... )
+					{
+						IECore::msg( IECore::Msg::Warning, "PathListingWidget", "Unknown error" );
+					}
+					return QVariant();
 				}
 
 				struct Less
@@ -785,15 +1103,57 @@ class PathModel : public QAbstractItemModel
 				Item *m_parent;
 				int m_row;
 
-				bool m_dataDone;
+				bool m_displayDataDone;
+				bool m_decorationDataDone;
 				std::vector<QVariant> m_displayData;
 				std::vector<QVariant> m_decorationData;
 
-				bool m_childItemsDone;
+				enum class ChildItemsState
+				{
+					Unrequested,
+					Requested,
+					Done
+				};
+
+				ChildItemsState m_childItemsState;
 				std::vector<Item *> m_childItems;
+				size_t m_numFetchedChildItems;
+				std::unique_ptr<BackgroundTask> m_childItemsTask;
+				// Referenced weakly by the `requestChildItems()` task, so that
+				// it can tell whether its results are still wanted. Reset when
+				// they are not.
+				std::shared_ptr<Item *> m_handle;
 
 		};
 
+		// Ensures that rows up to and including `row` are available to the view.
+		void fetchTo( Item *item, const QModelIndex &itemIndex, size_t row )
+		{
+			const size_t numFetched = item->numFetchedChildItems();
+			if( row < numFetched )
+			{
+				return;
+			}
+
+			const size_t newNumFetched = std::min( row + 1, item->childItems().size() );
+			if( newNumFetched <= numFetched )
+			{
+				return;
+			}
+
+			if( item != m_rootItem && m_flat )
+			{
+				// Rows aren't visible to the view,
+				// so there's nothing to tell it.
+				item->setNumFetchedChildItems( newNumFetched );
+				return;
+			}
+
+			beginInsertRows( itemIndex, numFetched, newNumFetched - 1 );
+			item->setNumFetchedChildItems( newNumFetched );
+			endInsertRows();
+		}
+
 		void indicesForPathsWalk( Item *item, const QModelIndex &itemIndex, const IECore::PathMatcher &paths, std::vector<QModelIndex> &indices )
 		{
 			const unsigned match = paths.match( item->path()->names() );
@@ -808,14 +1168,27 @@ class PathModel : public QAbstractItemModel
 			}
 
 			size_t row = 0;
-			for( const auto &childItem : item->childItems( this ) )
+			for( const auto &childItem : item->listChildItems( this ) )
 			{
-				const QModelIndex childIndex = index( row++, 0, itemIndex );
-				indicesForPathsWalk( childItem, childIndex, paths, indices );
+				// Only fetch the rows we need, so that we don't
+				// defeat the paging of large numbers of children.
+				if( paths.match( childItem->path()->names() ) != IECore::PathMatcher::NoMatch )
+				{
+					fetchTo( item, itemIndex, row );
+					const QModelIndex childIndex = index( row, 0, itemIndex );
+					indicesForPathsWalk( childItem, childIndex, paths, indices );
+				}
+				row++;
 			}
 		}
 
+		void pathChanged()
+		{
+			m_rootItem->restartChildItems( this );
+		}
+
 		Item *m_rootItem;
+		boost::signals::connection m_pathChangedConnection;
 		bool m_flat;
 		std::vector<ColumnPtr> m_columns;
 		int m_sortColumn;
@@ -914,6 +1287,10 @@ IECore::PathMatcher getExpansion( uint64_t treeViewAddress )
 
 void propagateExpandedWalk( QTreeView *treeView, PathModel *model, QModelIndex index, bool expanded, int numLevels )
 {
+	if( expanded )
+	{
+		model->listChildren( index );
+	}
 	for( int i = 0, e = model->rowCount( index ); i < e; ++i )
 	{
 		QModelIndex childIndex = model->index( i, 0, index );